@@ -3,6 +3,10 @@
 
 """
 
+import importlib
+import sys
+import typing
+
 __title__ = 'openeo'
 __author__ = 'Jeroen Dries'
 
@@ -12,10 +16,52 @@ class BaseOpenEoException(Exception):
 
 
 from openeo._version import __version__
-from openeo.imagecollection import ImageCollection
-from openeo.rest.datacube import DataCube, UDF
-from openeo.rest.connection import connect, session, Connection
-from openeo.rest.job import BatchJob, RESTJob
+
+# Public API, lazy loaded on first access (see `__getattr__`) to keep `import openeo` fast.
+_LAZY_IMPORTS = {
+    "ImageCollection": "openeo.imagecollection",
+    "DataCube": "openeo.rest.datacube",
+    "UDF": "openeo.rest.datacube",
+    "connect": "openeo.rest.connection",
+    "session": "openeo.rest.connection",
+    "Connection": "openeo.rest.connection",
+    "BatchJob": "openeo.rest.job",
+    "RESTJob": "openeo.rest.job",
+}
+
+# Subpackages/modules that are available as attribute of the top level package, without explicit import.
+_LAZY_SUBMODULES = {
+    "api", "capabilities", "config", "extra", "internal", "local", "metadata", "processes", "rest", "udf", "util"
+}
+
+if typing.TYPE_CHECKING:
+    # Imports for type checking and IDE support only.
+    from openeo.imagecollection import ImageCollection
+    from openeo.rest.datacube import DataCube, UDF
+    from openeo.rest.connection import connect, session, Connection
+    from openeo.rest.job import BatchJob, RESTJob
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f"openeo.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache as regular module attribute to avoid `__getattr__` overhead on next access.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _LAZY_SUBMODULES)
+
+
+if sys.version_info < (3, 7):
+    # No support for module level `__getattr__` (PEP 562): fall back on eager loading.
+    for _name in _LAZY_IMPORTS:
+        globals()[_name] = __getattr__(_name)
 
 
 def client_version() -> str:
@@ -0,0 +1,104 @@
+"""
+Shared base for running and tracking a set of batch jobs,
+with a bounded number of concurrently running jobs
+(see :py:mod:`openeo.extra.tiling` and :py:mod:`openeo.extra.stages`).
+
+.. versionadded:: 0.13.1
+"""
+import logging
+import time
+from typing import Callable, List, Optional
+
+import requests
+
+from openeo.rest import OpenEoApiError, OpenEoClientException
+from openeo.rest.job import JOB_STATUSES_RUNNING, BatchJob, SoftErrorCounter, soft_error_message
+
+logger = logging.getLogger(__name__)
+
+
+class RunnerJob:
+    """Batch job (status) of a single item (e.g. tile or stage) in a job runner run."""
+
+    __slots__ = ("job", "status", "error")
+
+    def __init__(self):
+        self.job: Optional[BatchJob] = None
+        # Batch job status, "not_started" (not submitted yet), or "error" (also for creation/start/polling failures)
+        self.status = "not_started"
+        self.error: Optional[str] = None
+
+    @property
+    def name(self):
+        """Name of the item, e.g. to use in the job title."""
+        raise NotImplementedError
+
+    def __repr__(self):
+        job_id = self.job.job_id if self.job else None
+        return f"<{type(self).__name__} {self.name!r} job={job_id!r} status={self.status!r}>"
+
+
+class JobRunnerBase:
+    """
+    Base class for job runners: creating, starting and polling batch jobs,
+    while recording failures (e.g. job creation errors, failed jobs or status polling errors) per job,
+    so that they don't stop the other jobs.
+    Which jobs to start when is up to the subclass.
+
+    :param max_running_jobs: maximum number of concurrently running batch jobs
+    :param poll_interval: number of seconds to sleep between status polls of the running jobs
+    :param on_status: callback that is called with the :py:class:`RunnerJob` on each status change
+    :param soft_error_max: maximum number of soft errors (e.g. temporary connection glitches) to allow
+    """
+
+    _RUNNING_STATUSES = JOB_STATUSES_RUNNING
+
+    def __init__(
+            self, max_running_jobs: int = 2, poll_interval: float = 60,
+            on_status: Optional[Callable[[RunnerJob], None]] = None, soft_error_max: int = 10,
+    ):
+        if max_running_jobs < 1:
+            raise ValueError(f"Invalid max_running_jobs {max_running_jobs!r}.")
+        self.max_running_jobs = max_running_jobs
+        self.poll_interval = poll_interval
+        self.on_status = on_status
+        self.soft_error_max = soft_error_max
+        self.jobs: List[RunnerJob] = []
+
+    def _set_status(self, runner_job: RunnerJob, status: str, error: Optional[str] = None):
+        if status != runner_job.status or error:
+            runner_job.status = status
+            runner_job.error = error
+            logger.info(f"{runner_job!r}" + (f": {error}" if error else ""))
+            if self.on_status:
+                self.on_status(runner_job)
+
+    def _start(self, runner_job: RunnerJob, create_job: Callable[[], BatchJob]):
+        """Create (with given callable) and start the batch job (unless it's a reused, finished job)."""
+        try:
+            runner_job.job = create_job()
+            if not runner_job.job.is_reused():
+                runner_job.job.start_job()
+        except (OpenEoApiError, OpenEoClientException, requests.RequestException) as e:
+            self._set_status(runner_job, "error", error=f"Failed to start job: {e!r}")
+        else:
+            self._set_status(runner_job, "queued")
+
+    def _poll(self, running: List[RunnerJob], soft_errors: SoftErrorCounter):
+        """Sleep and update the status of the running jobs, removing the jobs that are no longer running."""
+        time.sleep(self.poll_interval)
+        for runner_job in list(running):
+            try:
+                status = runner_job.job.status()
+            except (requests.ConnectionError, OpenEoApiError) as e:
+                message = soft_error_message(e)
+                if message is None:
+                    self._set_status(runner_job, "error", error=f"Failed to get job status: {e!r}")
+                    running.remove(runner_job)
+                else:
+                    soft_errors.add()
+                    logger.warning(f"{runner_job!r}: {message}")
+                continue
+            self._set_status(runner_job, status)
+            if status not in self._RUNNING_STATUSES:
+                running.remove(runner_job)
@@ -0,0 +1,234 @@
+"""
+Sharded ``aggregate_spatial`` (zonal statistics) over very large feature collections:
+the features are split in spatially coherent shards (ordered along a Hilbert curve or a grid),
+which are processed in parallel (synchronously or as batch jobs),
+and the results are merged into a single pandas DataFrame (see :py:func:`~openeo.rest.conversions.timeseries_json_to_pandas`).
+
+Usage example::
+
+    cube = connection.load_collection("SENTINEL2_L2A", temporal_extent=["2022-06-01", "2022-07-01"], bands=["B04"])
+    df = sharded_aggregate_spatial(cube, parcels, reducer="mean", max_features=2000, max_workers=4)
+
+.. versionadded:: 0.13.1
+"""
+import concurrent.futures
+import logging
+import typing
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+import numpy as np
+
+from openeo.rest.datacube import DataCube
+from openeo.util import BBoxDict, is_shapely_geometry
+
+if typing.TYPE_CHECKING:
+    # Imports for type checking only (slow import at runtime).
+    import pandas
+
+_log = logging.getLogger(__name__)
+
+# Number of bits per axis of the (Hilbert curve or grid) ordering.
+_ORDER_BITS = 16
+
+
+class Shard(NamedTuple):
+    """Subset of the features of a feature collection."""
+    # Indices of the features in the original feature collection
+    indices: List[int]
+    # Feature collection with the features of the shard (in order of ``indices``)
+    features: dict
+    # Bounding box of the features
+    bbox: BBoxDict
+
+
+def _extend_bounds(coordinates: Any, bounds: List[float]):
+    """Extend bounds (west, south, east, north) with (nested lists of) positions."""
+    if coordinates and isinstance(coordinates[0], (int, float)):
+        x, y = coordinates[0], coordinates[1]
+        bounds[0], bounds[1] = min(bounds[0], x), min(bounds[1], y)
+        bounds[2], bounds[3] = max(bounds[2], x), max(bounds[3], y)
+    else:
+        for c in coordinates:
+            _extend_bounds(c, bounds)
+
+
+def _geometry_bounds(geometry: Optional[dict]) -> List[float]:
+    bounds = [np.inf, np.inf, -np.inf, -np.inf]
+    if geometry is None:
+        return bounds
+    if geometry.get("type") == "GeometryCollection":
+        for g in geometry["geometries"]:
+            b = _geometry_bounds(g)
+            bounds = [min(bounds[0], b[0]), min(bounds[1], b[1]), max(bounds[2], b[2]), max(bounds[3], b[3])]
+    else:
+        _extend_bounds(geometry.get("coordinates", []), bounds)
+    return bounds
+
+
+def _hilbert_index(x: np.ndarray, y: np.ndarray, bits: int = _ORDER_BITS) -> np.ndarray:
+    """Position along a Hilbert curve of integer grid coordinates (in range ``[0, 2**bits)``), vectorized."""
+    x, y = x.astype(np.int64), y.astype(np.int64)
+    d = np.zeros_like(x)
+    s = 1 << (bits - 1)
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx) ^ ry)
+        # Rotate quadrant
+        flip = ~ry & rx
+        x = np.where(flip, s - 1 - x, x)
+        y = np.where(flip, s - 1 - y, y)
+        swap = ~ry
+        x, y = np.where(swap, y, x), np.where(swap, x, y)
+        s >>= 1
+    return d
+
+
+def _as_feature_collection(geometries: Union[dict, List[Any]]) -> dict:
+    if isinstance(geometries, dict) and geometries.get("type") == "FeatureCollection":
+        return geometries
+    if isinstance(geometries, (list, tuple)):
+        features = []
+        for g in geometries:
+            if is_shapely_geometry(g):
+                import shapely.geometry
+
+                g = shapely.geometry.mapping(g)
+            if g.get("type") != "Feature":
+                g = {"type": "Feature", "geometry": g, "properties": {}}
+            features.append(g)
+        return {"type": "FeatureCollection", "features": features}
+    raise ValueError(f"Expected a FeatureCollection or list of geometries, but got {type(geometries)}.")
+
+
+def shard_features(
+        geometries: Union[dict, List[Any]], max_features: int = 1000, ordering: str = "hilbert"
+) -> List[Shard]:
+    """
+    Split a feature collection in spatially coherent shards of at most ``max_features`` features:
+    the features are ordered by the center of their bounding box along a space-filling curve
+    and split in consecutive chunks.
+
+    :param geometries: GeoJSON ``FeatureCollection``, or list of GeoJSON geometries/features or shapely geometries
+    :param max_features: maximum number of features per shard
+    :param ordering: "hilbert" (Hilbert curve) or "grid" (row by row in a grid)
+    :return: list of shards
+    """
+    if ordering not in {"hilbert", "grid"}:
+        raise ValueError(f"Invalid ordering {ordering!r}")
+    if max_features < 1:
+        raise ValueError(f"Invalid max_features {max_features!r}")
+    collection = _as_feature_collection(geometries)
+    features = collection["features"]
+    if not features:
+        return []
+    bounds = np.array([_geometry_bounds(f.get("geometry")) for f in features], dtype=float)
+    empty = ~np.isfinite(bounds).all(axis=1)
+    bounds[empty] = 0
+    cx, cy = (bounds[:, 0] + bounds[:, 2]) / 2, (bounds[:, 1] + bounds[:, 3]) / 2
+
+    # Normalize centers to integer grid coordinates
+    n = (1 << _ORDER_BITS) - 1
+    x0, y0 = cx.min(), cy.min()
+    size = max(cx.max() - x0, cy.max() - y0) or 1
+    gx = np.round((cx - x0) / size * n).astype(np.int64)
+    gy = np.round((cy - y0) / size * n).astype(np.int64)
+    if ordering == "hilbert":
+        keys = _hilbert_index(gx, gy)
+    else:
+        keys = gy * (n + 1) + gx
+    order = np.argsort(keys, kind="stable")
+
+    shards = []
+    for start in range(0, len(order), max_features):
+        indices = [int(i) for i in order[start:start + max_features]]
+        shard_bounds = bounds[indices][~empty[indices]]
+        if len(shard_bounds):
+            bbox = BBoxDict(
+                west=float(shard_bounds[:, 0].min()), south=float(shard_bounds[:, 1].min()),
+                east=float(shard_bounds[:, 2].max()), north=float(shard_bounds[:, 3].max()),
+            )
+        else:
+            bbox = BBoxDict(west=0, south=0, east=0, north=0)
+        shard_collection = {k: v for k, v in collection.items() if k != "features"}
+        shard_collection["features"] = [features[i] for i in indices]
+        shards.append(Shard(indices=indices, features=shard_collection, bbox=bbox))
+    return shards
+
+
+def merge_timeseries(results: List[dict], shards: List[Shard], feature_count: int) -> dict:
+    """
+    Merge ``aggregate_spatial`` timeseries results (date -> list of values per polygon) of shards
+    into a single timeseries with the polygons in their original order.
+    """
+    dates = sorted(set(d for r in results for d in r))
+    merged = {date: [[] for _ in range(feature_count)] for date in dates}
+    for result, shard in zip(results, shards):
+        for date, polygon_data in result.items():
+            if len(polygon_data) != len(shard.indices):
+                raise ValueError(
+                    f"Shard result has {len(polygon_data)} polygons for date {date!r}"
+                    f" (expected {len(shard.indices)})."
+                )
+            target = merged[date]
+            for index, data in zip(shard.indices, polygon_data):
+                target[index] = data
+    return merged
+
+
+def _execute_sync(cube: DataCube) -> dict:
+    return cube.execute()
+
+
+def _execute_batch(cube: DataCube) -> dict:
+    job = cube.create_job(out_format="JSON")
+    job.start_and_wait(print=_log.info)
+    return job.get_results().get_asset().load_json()
+
+
+def sharded_aggregate_spatial(
+        cube: DataCube,
+        geometries: Union[dict, List[Any]],
+        reducer: Union[str, Callable],
+        max_features: int = 1000,
+        ordering: str = "hilbert",
+        mode: str = "sync",
+        max_workers: int = 4,
+        index: str = "date",
+        auto_collapse: bool = True,
+) -> "pandas.DataFrame":
+    """
+    Run ``aggregate_spatial`` over a (very) large feature collection, split in spatially coherent shards
+    (see :py:func:`shard_features`) that are processed in parallel,
+    and merge the results into a single DataFrame with the original polygon indices.
+
+    :param cube: data cube to aggregate
+    :param geometries: GeoJSON ``FeatureCollection``, or list of GeoJSON geometries/features or shapely geometries
+    :param reducer: reducer for ``aggregate_spatial`` (e.g. "mean")
+    :param max_features: maximum number of features per shard
+    :param ordering: "hilbert" or "grid" ordering of the features (see :py:func:`shard_features`)
+    :param mode: "sync" (synchronous requests) or "batch" (batch jobs)
+    :param max_workers: maximum number of shards to process concurrently
+    :param index: which dimension to use as DataFrame index: "date" or "polygon"
+        (see :py:func:`~openeo.rest.conversions.timeseries_json_to_pandas`)
+    :param auto_collapse: simplify single band or single polygon cases
+    :return: pandas DataFrame (or Series)
+    """
+    from openeo.rest.conversions import timeseries_json_to_pandas
+
+    execute = {"sync": _execute_sync, "batch": _execute_batch}.get(mode)
+    if execute is None:
+        raise ValueError(f"Invalid mode {mode!r}")
+    collection = _as_feature_collection(geometries)
+    shards = shard_features(collection, max_features=max_features, ordering=ordering)
+    cubes = [cube.aggregate_spatial(geometries=shard.features, reducer=reducer) for shard in shards]
+    _log.info(f"Running aggregate_spatial over {len(collection['features'])} features in {len(shards)} shards")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results: Dict[int, dict] = {}
+        futures = {executor.submit(execute, c): i for i, c in enumerate(cubes)}
+        for future in concurrent.futures.as_completed(futures):
+            results[futures[future]] = future.result()
+    merged = merge_timeseries(
+        [results[i] for i in range(len(shards))], shards=shards, feature_count=len(collection["features"])
+    )
+    return timeseries_json_to_pandas(merged, index=index, auto_collapse=auto_collapse)
@@ -1,12 +1,33 @@
+import ast
+import copy
+import functools
 import json
+import operator
 import pkg_resources
-from typing import Dict, List
+import sys
+import typing
+from types import CodeType
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 
 from openeo.processes import ProcessBuilder, array_modify, array_create
 from openeo.rest.datacube import DataCube
 
+# numexpr is optional dependency for fused evaluation of index formulas in local computation
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+if typing.TYPE_CHECKING:
+    # Imports for type checking only (slow import at runtime).
+    import xarray
+    from openeo.udf import XarrayDataCube
+
+# Number of pixels to evaluate the index formulas on at once in local computation (to limit memory usage)
+LOCAL_CHUNK_SIZE = 1024 * 1024
+
 BAND_MAPPING_LANDSAT457 = {
     "B1": "B", "B2": "G", "B3": "R", "B4": "N", "B5": "S1", "B6": "T1", "B7": "S2"
 }
@@ -25,33 +46,44 @@ BAND_MAPPING_SENTINEL2 = {
 }
 
 
-def _get_expression_map(cube: DataCube, x: ProcessBuilder) -> Dict[str, ProcessBuilder]:
-    """Build mapping of formula variable names to `array_element` nodes."""
+def _get_band_mapping(collection_id: str) -> Dict[str, str]:
+    """Get mapping of band names to formula variable names for the satellite platform of given collection."""
     # TODO: more robust way of figuring out the satellite platform?
-    collection_id = cube.metadata.get("id").upper()
+    collection_id = (collection_id or "").upper()
     # TODO: See if we can use common band names from collections instead of hardcoded mapping
     if "LANDSAT8" in collection_id:
-        band_mapping = BAND_MAPPING_LANDSAT8
+        return BAND_MAPPING_LANDSAT8
     elif "LANDSAT" in collection_id:
-        band_mapping = BAND_MAPPING_LANDSAT457
+        return BAND_MAPPING_LANDSAT457
     elif "MODIS" in collection_id:
-        band_mapping = BAND_MAPPING_MODIS
+        return BAND_MAPPING_MODIS
     elif "PROBAV" in collection_id:
-        band_mapping = BAND_MAPPING_PROBAV
+        return BAND_MAPPING_PROBAV
     elif "TERRASCOPE_S2" in collection_id or "SENTINEL2" in collection_id:
-        band_mapping = BAND_MAPPING_SENTINEL2
+        return BAND_MAPPING_SENTINEL2
     else:
         raise ValueError("Could not detect supported satellite platform from {cid!r} for index computation!".format(
             cid=collection_id
         ))
 
-    cube_bands = [band.replace("0", "").upper() for band in cube.metadata.band_names]
+
+def _get_band_variables(band_names: List[str], collection_id: str) -> Dict[str, int]:
+    """Build mapping of formula variable names to band index."""
+    band_mapping = _get_band_mapping(collection_id)
+    cube_bands = [str(band).replace("0", "").upper() for band in band_names]
+    return {band_mapping[b]: i for i, b in enumerate(cube_bands) if b in band_mapping}
+
+
+def _get_expression_map(cube: DataCube, x: ProcessBuilder) -> Dict[str, ProcessBuilder]:
+    """Build mapping of formula variable names to `array_element` nodes."""
     # TODO: use `label` parameter from `array_element` to avoid index based band references.
-    return {band_mapping[b]: x.array_element(i) for i, b in enumerate(cube_bands) if b in band_mapping}
+    variables = _get_band_variables(cube.metadata.band_names, collection_id=cube.metadata.get("id"))
+    return {name: x.array_element(i) for name, i in variables.items()}
 
 
-def load_indices() -> Dict[str, dict]:
-    """Load set of supported spectral indices."""
+@functools.lru_cache(maxsize=1)
+def _load_index_specs() -> Dict[str, dict]:
+    """Load (and cache) set of supported spectral indices. Result should not be modified."""
     specs = {}
 
     for path in [
@@ -64,10 +96,82 @@ def load_indices() -> Dict[str, dict]:
     return specs
 
 
+def load_indices() -> Dict[str, dict]:
+    """Load set of supported spectral indices."""
+    return copy.deepcopy(_load_index_specs())
+
+
 def list_indices() -> List[str]:
     """List names of supported spectral indices"""
-    specs = load_indices()
-    return list(specs.keys())
+    return list(_load_index_specs().keys())
+
+
+# Supported formula operators (for compilation to an expression tree)
+_OPERATORS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv,
+    ast.Pow: operator.pow, ast.USub: operator.neg, ast.UAdd: operator.pos,
+}
+
+# Numeric literals are parsed as `ast.Num` (instead of `ast.Constant`) on Python < 3.8
+_AST_NUM = ast.Num if sys.version_info < (3, 8) else ()
+
+
+def _expression_tree(node: ast.AST) -> tuple:
+    """
+    Convert parsed formula to a (hashable) expression tree of nested tuples:
+    ``("var", name)``, ``("const", type, value)`` or ``(operator, operand, ...)``.
+    """
+    if isinstance(node, ast.Expression):
+        return _expression_tree(node.body)
+    elif isinstance(node, ast.Name):
+        return ("var", node.id)
+    elif isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return ("const", type(node.value), node.value)
+    elif isinstance(node, _AST_NUM) and type(node.n) in (int, float):
+        return ("const", type(node.n), node.n)
+    elif isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+        return (_OPERATORS[type(node.op)], _expression_tree(node.left), _expression_tree(node.right))
+    elif isinstance(node, ast.UnaryOp) and type(node.op) in _OPERATORS:
+        return (_OPERATORS[type(node.op)], _expression_tree(node.operand))
+    raise ValueError(node)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_formula(formula: str) -> Union[tuple, CodeType]:
+    """
+    Compile (and cache) index formula:
+    to an expression tree if it only consists of basic arithmetic, otherwise to a code object to `eval`.
+    """
+    parsed = ast.parse(formula, mode="eval")
+    try:
+        return _expression_tree(parsed)
+    except ValueError:
+        return compile(parsed, "<spectral index formula>", "eval")
+
+
+def _evaluate_formula(formula: str, variables: Dict[str, Any], memo: Dict[tuple, Any]) -> Any:
+    """
+    Evaluate index formula with given variables (e.g. `array_element` builders).
+    Sub-expressions are looked up in (and added to) given memo dictionary,
+    so that sub-expressions common to multiple formulas (e.g. "N - R") are only built once.
+    """
+    compiled = _compile_formula(formula)
+    if isinstance(compiled, CodeType):
+        return eval(compiled, dict(variables))
+
+    def evaluate(tree: tuple) -> Any:
+        if tree not in memo:
+            if tree[0] == "var":
+                if tree[1] not in variables:
+                    raise NameError(f"name {tree[1]!r} is not defined")
+                memo[tree] = variables[tree[1]]
+            elif tree[0] == "const":
+                memo[tree] = tree[2]
+            else:
+                memo[tree] = tree[0](*(evaluate(t) for t in tree[1:]))
+        return memo[tree]
+
+    return evaluate(compiled)
 
 
 def _check_params(item,params):
@@ -108,9 +212,10 @@ def _callback(x: ProcessBuilder, index_dict: dict, datacube: DataCube, index_spe
     x_res = x
 
     idx_data = _get_expression_map(datacube, x)
+    memo = {}
     # TODO: user might want to control order of indices, which is tricky through a dictionary.
     for index, params in index_dict["indices"].items():
-        index_result = eval(index_specs[index]["formula"], idx_data)
+        index_result = _evaluate_formula(index_specs[index]["formula"], variables=idx_data, memo=memo)
         if params["input_range"] is not None:
             index_result = index_result.linear_scale_range(*params["input_range"], *params["output_range"])
         index_values.append(index_result)
@@ -122,11 +227,97 @@ def _callback(x: ProcessBuilder, index_dict: dict, datacube: DataCube, index_spe
         return array_create(data=index_values)
 
 
-def compute_and_rescale_indices(datacube: DataCube, index_dict: dict, append=False) -> DataCube:
+def _formula_variables(tree: tuple) -> set:
+    """Variable names used in given formula expression tree."""
+    if tree[0] == "var":
+        return {tree[1]}
+    elif tree[0] == "const":
+        return set()
+    return set().union(*(_formula_variables(t) for t in tree[1:]))
+
+
+def _evaluate_formula_local(formula: str, variables: Dict[str, np.ndarray], memo: Dict[tuple, Any]) -> np.ndarray:
+    """Evaluate index formula on (in-memory) arrays of band values."""
+    compiled = _compile_formula(formula)
+    if isinstance(compiled, CodeType):
+        # Formula with function calls: evaluate its process graph with the local process implementations.
+        from openeo.local import LocalExecutor
+
+        placeholders = {name: ProcessBuilder({"from_parameter": name}) for name in variables}
+        result = eval(compiled, placeholders)
+        return LocalExecutor().evaluate(result.pgnode, parameters=variables)
+    if numexpr is not None:
+        missing = _formula_variables(compiled).difference(variables)
+        if missing:
+            raise NameError(f"name {sorted(missing)[0]!r} is not defined")
+        # Fused evaluation, without full size temporary arrays for each operation.
+        return numexpr.evaluate(formula, local_dict=variables)
+    return _evaluate_formula(formula, variables=variables, memo=memo)
+
+
+def _compute_and_rescale_indices_local(
+        array: "xarray.DataArray", index_dict: dict, index_specs: dict, append: bool, collection_id: str,
+        chunk_size: int = LOCAL_CHUNK_SIZE,
+) -> "xarray.DataArray":
+    """Compute spectral indices on an in-memory array with a "bands" dimension."""
+    import xarray
+    from openeo.local.processes import get_process
+
+    process = get_process("linear_scale_range")
+
+    def linear_scale_range(x, input_range: list, output_range: list):
+        return process(x=x, inputMin=input_range[0], inputMax=input_range[1],
+                       outputMin=output_range[0], outputMax=output_range[1])
+
+    if "bands" not in array.dims:
+        raise ValueError(f"Array has no 'bands' dimension (dimensions: {list(array.dims)}).")
+    variables = _get_band_variables(list(array.indexes["bands"]), collection_id=collection_id)
+    other_dims = [d for d in array.dims if d != "bands"]
+
+    # Band values as (bands, pixels) matrix
+    values = array.transpose("bands", *other_dims).values
+    shape = values.shape[1:]
+    values = values.reshape((values.shape[0], -1))
+    dtype = np.result_type(values.dtype, np.float32)
+    indices = list(index_dict["indices"].items())
+    result = np.empty((len(indices), values.shape[1]), dtype=dtype)
+    for start in range(0, values.shape[1], chunk_size):
+        chunk = values[:, start:start + chunk_size].astype(dtype, copy=False)
+        chunk_variables = {name: chunk[i] for name, i in variables.items()}
+        # Share sub-expressions between the indices
+        memo = {}
+        for i, (index, params) in enumerate(indices):
+            index_result = _evaluate_formula_local(index_specs[index]["formula"], chunk_variables, memo=memo)
+            if params["input_range"] is not None:
+                index_result = linear_scale_range(index_result, params["input_range"], params["output_range"])
+            result[i, start:start + chunk_size] = index_result
+
+    coords = {k: v for k, v in array.coords.items() if "bands" not in v.dims}
+    coords["bands"] = [index for index, _ in indices]
+    result = xarray.DataArray(
+        result.reshape((len(indices),) + shape), dims=["bands"] + other_dims, coords=coords, name=array.name,
+        attrs=array.attrs,
+    ).transpose(*array.dims)
+    if append:
+        original = array
+        if index_dict["collection"]["input_range"] is not None:
+            original = linear_scale_range(
+                array, index_dict["collection"]["input_range"], index_dict["collection"]["output_range"]
+            )
+        result = xarray.concat([original.astype(result.dtype), result], dim="bands")
+    return result
+
+
+def compute_and_rescale_indices(
+        datacube: Union[DataCube, "XarrayDataCube", "xarray.DataArray"], index_dict: dict, append=False,
+        collection_id: Optional[str] = None,
+) -> Union[DataCube, "XarrayDataCube", "xarray.DataArray"]:
     """
     Computes a list of indices from a data cube
 
-    :param datacube: input data cube
+    :param datacube: input data cube: a (remote) :py:class:`~openeo.rest.datacube.DataCube`,
+        or an in-memory :py:class:`~openeo.udf.xarraydatacube.XarrayDataCube` or ``xarray.DataArray``
+        with a "bands" dimension, in which case the indices are computed locally (vectorized, without back-end).
     :param index_dict: a dictionary that contains the input- and output range of the collection on which you calculate the indices
         as well as the indices that you want to calculate with their responding input- and output ranges
         It follows the following format::
@@ -148,13 +339,32 @@ def compute_and_rescale_indices(datacube: DataCube, index_dict: dict, append=Fal
 
         See `list_indices()` for supported indices.
 
-    :return: the datacube with the indices attached as bands
+    :param collection_id: collection id to determine the band name mapping for in-memory data
+        (default: name of the array). Remote data cubes use the collection id from their metadata.
+    :return: the datacube with the indices attached as bands (same type as the input data cube)
 
     .. warning:: this "rescaled" index helper uses an experimental API (e.g. `index_dict` argument) that is subject to change.
+
+    .. versionchanged:: 0.13.1 support for local computation on in-memory data.
     """
-    index_specs = load_indices()
+    index_specs = _load_index_specs()
 
     _check_validity_index_dict(index_dict, index_specs)
+    if not isinstance(datacube, DataCube):
+        from openeo.udf import XarrayDataCube
+        import xarray
+
+        if isinstance(datacube, XarrayDataCube):
+            array = datacube.get_array()
+        elif isinstance(datacube, xarray.DataArray):
+            array = datacube
+        else:
+            raise ValueError(f"Unsupported data cube type {type(datacube)}.")
+        result = _compute_and_rescale_indices_local(
+            array, index_dict=index_dict, index_specs=index_specs, append=append,
+            collection_id=collection_id or array.name,
+        )
+        return XarrayDataCube(result) if isinstance(datacube, XarrayDataCube) else result
     res = datacube.apply_dimension(dimension="bands",process=lambda x: _callback(x, index_dict, datacube, index_specs, append))
     if append:
         return res.rename_labels('bands',target=datacube.metadata.band_names + list(index_dict["indices"].keys()))
@@ -162,7 +372,10 @@ def compute_and_rescale_indices(datacube: DataCube, index_dict: dict, append=Fal
         return res.rename_labels('bands',target=list(index_dict["indices"].keys()))
 
 
-def append_and_rescale_indices(datacube: DataCube, index_dict: dict) -> DataCube:
+def append_and_rescale_indices(
+        datacube: Union[DataCube, "XarrayDataCube", "xarray.DataArray"], index_dict: dict,
+        collection_id: Optional[str] = None,
+) -> Union[DataCube, "XarrayDataCube", "xarray.DataArray"]:
     """
     Computes a list of indices from a datacube and appends them to the existing datacube
 
@@ -186,19 +399,28 @@ def append_and_rescale_indices(datacube: DataCube, index_dict: dict) -> DataCube
 
         See `list_indices()` for supported indices.
 
+    :param collection_id: collection id to determine the band name mapping for in-memory data
+        (see :py:func:`compute_and_rescale_indices`).
     :return: data cube with appended indices
 
     .. warning:: this "rescaled" index helper uses an experimental API (e.g. `index_dict` argument) that is subject to change.
     """
-    return compute_and_rescale_indices(datacube=datacube, index_dict=index_dict, append=True)
+    return compute_and_rescale_indices(
+        datacube=datacube, index_dict=index_dict, append=True, collection_id=collection_id
+    )
 
 
-def compute_indices(datacube: DataCube, indices: List[str], append: bool = False) -> DataCube:
+def compute_indices(
+        datacube: Union[DataCube, "XarrayDataCube", "xarray.DataArray"], indices: List[str], append: bool = False,
+        collection_id: Optional[str] = None,
+) -> Union[DataCube, "XarrayDataCube", "xarray.DataArray"]:
     """
     Compute multiple spectral indices from the given data cube.
 
     :param datacube: input data cube
     :param indices: list of names of the indices to compute and append. See `list_indices()` for supported indices.
+    :param collection_id: collection id to determine the band name mapping for in-memory data
+        (see :py:func:`compute_and_rescale_indices`).
     :return: data cube containing the indices as bands
     """
     # TODO: it's bit weird to have to specify all these None's in this structure
@@ -211,39 +433,56 @@ def compute_indices(datacube: DataCube, indices: List[str], append: bool = False
             index: {"input_range": None, "output_range": None} for index in indices
         }
     }
-    return compute_and_rescale_indices(datacube=datacube, index_dict=index_dict, append=append)
+    return compute_and_rescale_indices(
+        datacube=datacube, index_dict=index_dict, append=append, collection_id=collection_id
+    )
 
 
-def append_indices(datacube: DataCube, indices: List[str]) -> DataCube:
+def append_indices(
+        datacube: Union[DataCube, "XarrayDataCube", "xarray.DataArray"], indices: List[str],
+        collection_id: Optional[str] = None,
+) -> Union[DataCube, "XarrayDataCube", "xarray.DataArray"]:
     """
     Compute multiple spectral indices and append them to the given data cube.
 
     :param datacube: input data cube
     :param indices: list of names of the indices to compute and append. See `list_indices()` for supported indices.
+    :param collection_id: collection id to determine the band name mapping for in-memory data
+        (see :py:func:`compute_and_rescale_indices`).
     :return: data cube with appended indices
     """
 
-    return compute_indices(datacube=datacube, indices=indices, append=True)
+    return compute_indices(datacube=datacube, indices=indices, append=True, collection_id=collection_id)
 
 
-def compute_index(datacube: DataCube, index: str) -> DataCube:
+def compute_index(
+        datacube: Union[DataCube, "XarrayDataCube", "xarray.DataArray"], index: str,
+        collection_id: Optional[str] = None,
+) -> Union[DataCube, "XarrayDataCube", "xarray.DataArray"]:
     """
     Compute a single spectral index from a data cube.
 
     :param datacube: input data cube
     :param index: name of the index to compute. See `list_indices()` for supported indices.
+    :param collection_id: collection id to determine the band name mapping for in-memory data
+        (see :py:func:`compute_and_rescale_indices`).
     :return: data cube containing the index as band
     """
     # TODO: option to compute the index with `reduce_dimension` instead of `apply_dimension`?
-    return compute_indices(datacube=datacube, indices=[index], append=False)
+    return compute_indices(datacube=datacube, indices=[index], append=False, collection_id=collection_id)
 
 
-def append_index(datacube: DataCube, index: str) -> DataCube:
+def append_index(
+        datacube: Union[DataCube, "XarrayDataCube", "xarray.DataArray"], index: str,
+        collection_id: Optional[str] = None,
+) -> Union[DataCube, "XarrayDataCube", "xarray.DataArray"]:
     """
     Compute a single spectral index and append it to the given data cube.
 
     :param cube: input data cube
     :param index: name of the index to compute and append. See `list_indices()` for supported indices.
+    :param collection_id: collection id to determine the band name mapping for in-memory data
+        (see :py:func:`compute_and_rescale_indices`).
     :return: data cube with appended index
     """
-    return compute_indices(datacube=datacube, indices=[index], append=True)
+    return compute_indices(datacube=datacube, indices=[index], append=True, collection_id=collection_id)
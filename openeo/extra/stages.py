@@ -0,0 +1,316 @@
+"""
+Split a (very) large process graph in checkpointed stages:
+each stage is run as its own batch job (ending with ``save_result``),
+and downstream stages load the results of their predecessors with ``load_result``.
+A failed stage can be resumed without recomputing the upstream stages
+and independent stages (branches) run in parallel.
+
+Usage example::
+
+    cube = connection.load_collection("SENTINEL2_L2A", ...)
+    composite = cube.reduce_dimension(dimension="t", reducer="median")
+    result = composite.apply(udf).ndvi()
+    stages = plan_stages(result, checkpoints=[composite], auto=True)
+    runner = StagedJobRunner(poll_interval=30)
+    runner.run(connection, stages, title="Composite NDVI")
+    # After fixing a problem with a failed stage: only rerun the unfinished stages.
+    runner.run(connection, stages, title="Composite NDVI")
+
+.. versionadded:: 0.13.1
+"""
+import logging
+from typing import Dict, Iterable, List, Optional, Union
+
+from openeo.extra.job_runner import JobRunnerBase, RunnerJob
+from openeo.internal.graph_building import PGNode
+from openeo.internal.optimizer.base import (
+    get_node,
+    iter_callbacks,
+    iter_node_references,
+    reference_counts,
+    rewrite_graph,
+)
+from openeo.rest import OpenEoClientException
+from openeo.rest.connection import Connection
+from openeo.rest.datacube import DataCube
+from openeo.rest.job import BatchJob, SoftErrorCounter
+
+logger = logging.getLogger(__name__)
+
+# Processes that are cheap to (re)compute: not worth a checkpoint.
+_CHEAP_PROCESSES = {
+    "load_collection", "load_result", "filter_bbox", "filter_temporal", "filter_bands", "filter_spatial",
+}
+
+# Reductions over the temporal dimension (typically a large reduction in data volume).
+_TEMPORAL_REDUCTIONS = {"aggregate_temporal", "aggregate_temporal_period"}
+_TEMPORAL_DIMENSIONS = {"t", "time", "temporal"}
+
+
+class Stage:
+    """
+    Stage of a process graph: the part of the graph that computes the stage's result node,
+    up to (not including) the result nodes of its input stages.
+    """
+
+    __slots__ = ("name", "node", "inputs")
+
+    def __init__(self, name: str, node: PGNode, inputs: Dict[int, "Stage"]):
+        self.name = name
+        # Result node of the stage
+        self.node = node
+        # Input stages, keyed on (Python) id of their result node
+        self.inputs = inputs
+
+    def __repr__(self):
+        return f"<Stage {self.name!r} {self.node.process_id!r} inputs={[s.name for s in self.dependencies]!r}>"
+
+    @property
+    def dependencies(self) -> List["Stage"]:
+        """Input stages (that have to finish before this stage can start)."""
+        return list(self.inputs.values())
+
+    def build(self, job_ids: Dict[str, str], format: str = "GTiff", options: Optional[dict] = None) -> PGNode:
+        """
+        Build the process graph of the stage: input stages are replaced by ``load_result`` nodes
+        and a ``save_result`` node is added (if there is none yet).
+
+        :param job_ids: mapping of stage name to (finished) batch job id, for all input stages
+        :param format: output format of the stage
+        :param options: output format options
+        :return: result node of the stage graph
+        """
+        missing = [s.name for s in self.dependencies if s.name not in job_ids]
+        if missing:
+            raise OpenEoClientException(f"No job ids for input stages {missing!r} of stage {self.name!r}")
+
+        def rewrite(rebuilt: PGNode, original: PGNode):
+            stage = self.inputs.get(id(original))
+            if stage is not None:
+                return PGNode(process_id="load_result", arguments={"id": job_ids[stage.name]})
+            return rebuilt
+
+        node = rewrite_graph(self.node, rewrite=rewrite)
+        if node.process_id != "save_result":
+            node = PGNode(
+                process_id="save_result",
+                arguments={"data": {"from_node": node}, "format": format, "options": options or {}},
+            )
+        return node
+
+
+def _result_node(x: Union[DataCube, PGNode]) -> PGNode:
+    return x if isinstance(x, PGNode) else x.result_node()
+
+
+def _is_cheap(node: PGNode) -> bool:
+    """Whether the graph of given node only consists of cheap processes (loading and filtering)."""
+    return all(n.process_id in _CHEAP_PROCESSES for n, _ in reference_counts(node).values())
+
+
+def _runs_udf(node: PGNode) -> bool:
+    """Whether given node has a callback that runs a UDF."""
+    for callback in iter_callbacks(node.arguments):
+        if any(n.process_id == "run_udf" for n, _ in reference_counts(callback, callbacks=True).values()):
+            return True
+    return False
+
+
+def _is_temporal_reduction(node: PGNode) -> bool:
+    if node.process_id in _TEMPORAL_REDUCTIONS:
+        return True
+    return node.process_id == "reduce_dimension" and node.arguments.get("dimension") in _TEMPORAL_DIMENSIONS
+
+
+def auto_checkpoints(node: PGNode) -> List[PGNode]:
+    """
+    Automatically choose checkpoints in the graph of given result node:
+    the inputs of processes that run a UDF (expensive, and a typical source of failures)
+    and the results of reductions over the temporal dimension (large reduction in data volume).
+    Checkpoints that are cheap to recompute (e.g. just ``load_collection`` and filters) are skipped.
+
+    :param node: result node of the process graph
+    :return: list of checkpoint nodes
+    """
+    # The result node (or the data of a final `save_result`) is the final stage anyway.
+    final = {id(node)}
+    if node.process_id == "save_result" and get_node(node.arguments.get("data")) is not None:
+        final.add(id(get_node(node.arguments["data"])))
+
+    checkpoints = []
+    for n, _ in reference_counts(node).values():
+        candidates = []
+        if _runs_udf(n) and get_node(n.arguments.get("data")) is not None:
+            candidates.append(get_node(n.arguments["data"]))
+        if _is_temporal_reduction(n):
+            candidates.append(n)
+        for c in candidates:
+            if id(c) not in final and not _is_cheap(c) and all(c is not x for x in checkpoints):
+                checkpoints.append(c)
+    return checkpoints
+
+
+def plan_stages(
+        cube: Union[DataCube, PGNode], checkpoints: Optional[Iterable[Union[DataCube, PGNode]]] = None,
+        auto: bool = False,
+) -> List[Stage]:
+    """
+    Split the process graph of given cube in stages, cut at given (and/or automatically chosen) checkpoints.
+
+    :param cube: the (final) data cube or its result node
+    :param checkpoints: intermediate data cubes (or their result nodes) in the graph of ``cube``
+        to store as batch job results
+    :param auto: automatically add checkpoints (see :py:func:`auto_checkpoints`)
+    :return: list of stages in dependency order (the final stage is last)
+    """
+    root = _result_node(cube)
+    nodes = reference_counts(root)
+    cuts = {}
+    for checkpoint in checkpoints or []:
+        node = _result_node(checkpoint)
+        if id(node) not in nodes:
+            raise ValueError(f"Checkpoint {node!r} is not part of the process graph.")
+        cuts[id(node)] = node
+    if auto:
+        cuts.update((id(n), n) for n in auto_checkpoints(root))
+    cuts.pop(id(root), None)
+
+    stages: Dict[int, Stage] = {}
+    ordered: List[Stage] = []
+
+    def build(node: PGNode) -> Stage:
+        if id(node) not in stages:
+            inputs = {}
+            seen = {id(node)}
+            stack = [node]
+            while stack:
+                for ref in iter_node_references(stack.pop().arguments):
+                    if id(ref) in cuts:
+                        inputs[id(ref)] = build(ref)
+                    elif id(ref) not in seen:
+                        seen.add(id(ref))
+                        stack.append(ref)
+            stage = Stage(name="", node=node, inputs=inputs)
+            stages[id(node)] = stage
+            ordered.append(stage)
+        return stages[id(node)]
+
+    build(root)
+    for i, stage in enumerate(ordered):
+        stage.name = f"stage{i + 1}"
+    return ordered
+
+
+class StageJob(RunnerJob):
+    """
+    Batch job (status) of a single stage in a :py:class:`StagedJobRunner` run.
+    Besides the batch job statuses, the status can also be "skipped" (an input stage failed).
+    """
+
+    __slots__ = ("stage",)
+
+    def __init__(self, stage: Stage):
+        super().__init__()
+        self.stage = stage
+
+    @property
+    def name(self) -> str:
+        return self.stage.name
+
+
+class StagedJobRunner(JobRunnerBase):
+    """
+    Run the stages of a process graph (see :py:func:`plan_stages`) as batch jobs:
+    a stage is started as soon as its input stages are finished,
+    with at most ``max_running_jobs`` jobs running at the same time.
+
+    When a stage fails, its downstream stages are skipped, but independent stages continue.
+    Running again (with the same runner, or with ``job_ids`` of finished stages)
+    only reruns the stages that did not finish yet.
+
+    :param max_running_jobs: maximum number of concurrently running batch jobs
+    :param poll_interval: number of seconds to sleep between status polls of the running jobs
+    :param on_status: callback that is called with the :py:class:`StageJob` on each status change
+    :param soft_error_max: maximum number of soft errors (e.g. temporary connection glitches) to allow
+    """
+
+    def job_ids(self) -> Dict[str, str]:
+        """Batch job ids of the finished stages of the last run (e.g. to resume in another session)."""
+        return {j.stage.name: j.job.job_id for j in self.jobs if j.status == "finished"}
+
+    def _create_job(
+            self, connection: Connection, stage_job: StageJob, title: Optional[str], format: str, options: dict,
+            job_options: Optional[dict],
+    ) -> BatchJob:
+        node = stage_job.stage.build(job_ids=self.job_ids(), format=format, options=options)
+        name = stage_job.stage.name
+        return connection.create_job(
+            process_graph=node, title=f"{title} ({name})" if title else name, additional=job_options
+        )
+
+    def run(
+            self, connection: Connection, stages: List[Stage], title: Optional[str] = None,
+            out_format: str = "GTiff", intermediate_format: str = "GTiff", format_options: Optional[dict] = None,
+            job_options: Optional[dict] = None, job_ids: Optional[Dict[str, str]] = None,
+    ) -> List[StageJob]:
+        """
+        Create, start and track a batch job for each stage (in dependency order) until all are finished or failed.
+
+        :param connection: connection to create the jobs with
+        :param stages: stages from :py:func:`plan_stages` (in dependency order)
+        :param title: job title (the stage name is appended to it)
+        :param out_format: output format of the final stage (if it has no ``save_result`` yet)
+        :param intermediate_format: output format of the intermediate stages
+            (must be loadable with ``load_result`` on the back-end)
+        :param format_options: output format options
+        :param job_options: additional job options to pass to the back-end
+        :param job_ids: batch job ids of already finished stages (by stage name) to resume from.
+            By default: the finished stages of the previous run of this runner.
+        :return: list of stage jobs (also available as ``jobs`` attribute)
+        """
+        if job_ids is None:
+            job_ids = self.job_ids()
+        final = stages[-1] if stages else None
+        self.jobs = [StageJob(stage=s) for s in stages]
+        by_name = {j.stage.name: j for j in self.jobs}
+        for name, job_id in job_ids.items():
+            if name in by_name:
+                by_name[name].job = connection.job(job_id)
+                self._set_status(by_name[name], "finished")
+
+        running: List[StageJob] = []
+        soft_errors = SoftErrorCounter(max_count=self.soft_error_max)
+        pending_statuses = self._RUNNING_STATUSES | {"not_started"}
+        while True:
+            progress = False
+            for stage_job in self.jobs:
+                if stage_job.status != "not_started":
+                    continue
+                inputs = [by_name[s.name].status for s in stage_job.stage.dependencies]
+                if any(s != "finished" and s not in pending_statuses for s in inputs):
+                    # Failed, canceled, skipped or unknown status: input will not become available.
+                    self._set_status(stage_job, "skipped", error="Input stage failed")
+                    progress = True
+                elif all(s == "finished" for s in inputs) and len(running) < self.max_running_jobs:
+                    self._start(stage_job, create_job=lambda: self._create_job(
+                        connection, stage_job, title=title,
+                        format=out_format if stage_job.stage is final else intermediate_format,
+                        options=format_options, job_options=job_options,
+                    ))
+                    if stage_job.status != "error":
+                        running.append(stage_job)
+                    progress = True
+            if not running:
+                not_started = [j.stage.name for j in self.jobs if j.status == "not_started"]
+                if not_started and not progress:
+                    raise OpenEoClientException(f"Can not make progress with stages {not_started}.")
+                if not_started:
+                    # Stages that became ready or skipped after the last status update.
+                    continue
+                break
+            self._poll(running, soft_errors=soft_errors)
+        return self.jobs
+
+    def status(self) -> Dict[str, str]:
+        """Status per stage (name) of the last run."""
+        return {stage_job.stage.name: stage_job.status for stage_job in self.jobs}
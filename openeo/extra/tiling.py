@@ -0,0 +1,264 @@
+"""
+Split a large area of interest (AOI) in a grid of tiles
+and process these tiles as a batch of jobs, with a bounded number of concurrently running jobs.
+
+Usage example::
+
+    cube = connection.load_collection("SENTINEL2_L2A", temporal_extent=["2022-06-01", "2022-07-01"], bands=["B04"])
+    tiles = plan_tiles(aoi, pixel_budget=4096 * 4096, metadata=cube.metadata, utm=True, overlap=320)
+    runner = TiledJobRunner(max_running_jobs=5)
+    runner.run(tile_cubes(cube, tiles), out_format="GTiff")
+    print(runner.status())
+
+.. versionadded:: 0.13.1
+"""
+import logging
+import math
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from openeo.extra.job_runner import JobRunnerBase, RunnerJob
+from openeo.metadata import CollectionMetadata, SpatialDimension
+from openeo.rest import OpenEoClientException
+from openeo.rest.datacube import DataCube
+from openeo.rest.job import SoftErrorCounter
+from openeo.util import BBoxDict, _normalize_crs, is_shapely_geometry
+
+logger = logging.getLogger(__name__)
+
+
+class Tile(NamedTuple):
+    """Tile of a tiling grid."""
+
+    # Column and row index in the (global) tiling grid
+    col: int
+    row: int
+    # Processing extent: core extent extended with the overlap
+    bbox: BBoxDict
+    # Extent of the tile itself, clipped to the bounding box of the AOI
+    core: BBoxDict
+
+    @property
+    def name(self) -> str:
+        return f"tile_{self.col}_{self.row}"
+
+    def __hash__(self):
+        # Bounding box dictionaries are not hashable: hash on grid position, e.g. to use tiles as dictionary keys.
+        return hash((self.col, self.row, self.core.get("crs")))
+
+
+def utm_crs(lon: float, lat: float) -> int:
+    """EPSG code of the UTM zone (WGS 84) that contains given location."""
+    zone = min(int((lon + 180) // 6) + 1, 60)
+    return (32600 if lat >= 0 else 32700) + zone
+
+
+def _is_utm(crs: Union[str, int]) -> bool:
+    crs = _normalize_crs(crs)
+    return isinstance(crs, int) and (32601 <= crs <= 32660 or 32701 <= crs <= 32760)
+
+
+def tile_size_from_budget(metadata: CollectionMetadata, pixel_budget: int, crs: Union[str, int] = 4326) -> float:
+    """
+    Size (in units of given CRS) of square tiles that do not exceed given pixel budget,
+    based on the resolution (step of the spatial "x" dimension) and number of bands of the collection.
+
+    :param metadata: collection metadata (e.g. ``cube.metadata``)
+    :param pixel_budget: maximum number of pixel values (pixels times bands) per tile and observation
+    :param crs: CRS of the tiling grid, which should match the CRS of the collection resolution
+        (any UTM zone is fine for collections with a resolution in a UTM CRS).
+    :return: tile size, a multiple of the collection resolution
+    """
+    dimensions = [d for d in metadata.spatial_dimensions if d.name == "x"] or metadata.spatial_dimensions
+    if not dimensions or not dimensions[0].step:
+        raise ValueError("No spatial resolution in collection metadata: specify the tile size explicitly.")
+    dimension: SpatialDimension = dimensions[0]
+    if _normalize_crs(dimension.crs) != _normalize_crs(crs) and not (_is_utm(dimension.crs) and _is_utm(crs)):
+        raise ValueError(
+            f"Collection resolution CRS {dimension.crs!r} does not match tiling CRS {crs!r}:"
+            f" specify the tile size explicitly."
+        )
+    band_count = len(metadata.band_names) if metadata.has_band_dimension() else 1
+    pixels = int(math.sqrt(pixel_budget / band_count))
+    if pixels < 1:
+        raise ValueError(f"Pixel budget {pixel_budget} too small for {band_count} bands.")
+    return pixels * dimension.step
+
+
+def _aoi_geometry(aoi: Any) -> Tuple[Optional[Any], BBoxDict]:
+    """Normalize AOI to (shapely geometry or None) and bounding box."""
+    if isinstance(aoi, dict) and "type" in aoi:
+        import shapely.geometry
+
+        if aoi["type"] == "FeatureCollection":
+            aoi = shapely.geometry.GeometryCollection(
+                [shapely.geometry.shape(f["geometry"]) for f in aoi["features"]]
+            )
+        elif aoi["type"] == "Feature":
+            aoi = shapely.geometry.shape(aoi["geometry"])
+        else:
+            aoi = shapely.geometry.shape(aoi)
+    if is_shapely_geometry(aoi):
+        return aoi, BBoxDict.from_sequence(aoi.bounds)
+    return None, BBoxDict.from_any(aoi)
+
+
+def _transform_to(geometry: Optional[Any], bbox: BBoxDict, crs: Union[str, int], target: int):
+    """Transform AOI (geometry and bounding box) to given EPSG code (requires pyproj)."""
+    try:
+        import pyproj
+    except ImportError:
+        raise OpenEoClientException("UTM aligned tiling requires the `pyproj` package.")
+    source = _normalize_crs(crs)
+    transformer = pyproj.Transformer.from_crs(
+        f"EPSG:{source}" if isinstance(source, int) else source, f"EPSG:{target}", always_xy=True
+    )
+    if geometry is not None:
+        import shapely.ops
+
+        geometry = shapely.ops.transform(transformer.transform, geometry)
+        return geometry, BBoxDict.from_sequence(geometry.bounds)
+    bounds = transformer.transform_bounds(bbox["west"], bbox["south"], bbox["east"], bbox["north"], densify_pts=21)
+    return None, BBoxDict.from_sequence(bounds)
+
+
+def plan_tiles(
+        aoi: Any,
+        *,
+        tile_size: Optional[float] = None,
+        pixel_budget: Optional[int] = None,
+        metadata: Optional[CollectionMetadata] = None,
+        overlap: float = 0,
+        crs: Union[str, int, None] = None,
+        utm: bool = False,
+) -> List[Tile]:
+    """
+    Split an area of interest in a grid of square tiles.
+
+    Grid lines are at multiples of the tile size (in the tiling CRS),
+    so that tiles of different runs (or AOIs) line up.
+    Tiles are clipped to the bounding box of the AOI,
+    and tiles that do not intersect an AOI geometry are skipped.
+
+    :param aoi: area of interest: bounding box (dictionary or west-south-east-north list/tuple),
+        shapely geometry or GeoJSON dictionary (geometry, ``Feature`` or ``FeatureCollection``)
+    :param tile_size: tile size in units of the tiling CRS
+    :param pixel_budget: alternative for ``tile_size``: maximum number of pixel values (pixels times bands)
+        per tile (and observation), based on the resolution and number of bands in ``metadata``
+        (see :py:func:`tile_size_from_budget`)
+    :param metadata: collection metadata (e.g. ``cube.metadata``) to derive the tile size from a pixel budget
+    :param overlap: distance (in units of the tiling CRS) to extend each tile with on all sides
+    :param crs: CRS of the AOI (default: from the AOI bounding box dictionary or EPSG:4326).
+    :param utm: whether to use a grid in the UTM zone of the AOI center (tile bounding boxes are in that CRS).
+        Requires the ``pyproj`` package.
+    :return: list of tiles, by row and column
+    """
+    geometry, bbox = _aoi_geometry(aoi)
+    crs = crs or bbox.get("crs") or 4326
+    if utm:
+        target = utm_crs(
+            lon=(bbox["west"] + bbox["east"]) / 2, lat=(bbox["south"] + bbox["north"]) / 2
+        ) if _normalize_crs(crs) == 4326 else _normalize_crs(crs)
+        if not _is_utm(target):
+            raise ValueError(f"UTM aligned tiling requires an AOI in EPSG:4326 or a UTM CRS, but got {crs!r}.")
+        if target != _normalize_crs(crs):
+            geometry, bbox = _transform_to(geometry, bbox, crs=crs, target=target)
+        crs = target
+    if tile_size is None:
+        if pixel_budget is None or metadata is None:
+            raise ValueError("Either `tile_size` or `pixel_budget` and `metadata` must be specified.")
+        tile_size = tile_size_from_budget(metadata=metadata, pixel_budget=pixel_budget, crs=crs)
+    if tile_size <= 0 or overlap < 0:
+        raise ValueError(f"Invalid tile size {tile_size!r} or overlap {overlap!r}.")
+    crs = f"EPSG:{crs}" if isinstance(crs, int) else crs
+
+    if geometry is not None:
+        import shapely.geometry
+        import shapely.prepared
+
+        prepared = shapely.prepared.prep(geometry)
+
+    tiles = []
+    for row in range(math.floor(bbox["south"] / tile_size), math.ceil(bbox["north"] / tile_size)):
+        for col in range(math.floor(bbox["west"] / tile_size), math.ceil(bbox["east"] / tile_size)):
+            core = BBoxDict(
+                west=max(bbox["west"], col * tile_size), south=max(bbox["south"], row * tile_size),
+                east=min(bbox["east"], (col + 1) * tile_size), north=min(bbox["north"], (row + 1) * tile_size),
+                crs=crs,
+            )
+            if core["west"] >= core["east"] or core["south"] >= core["north"]:
+                continue
+            if geometry is not None:
+                box = shapely.geometry.box(core["west"], core["south"], core["east"], core["north"])
+                # Skip tiles that don't intersect or just touch the AOI geometry
+                if not prepared.intersects(box) or prepared.touches(box):
+                    continue
+            extended = BBoxDict(
+                west=core["west"] - overlap, south=core["south"] - overlap,
+                east=core["east"] + overlap, north=core["north"] + overlap, crs=crs,
+            )
+            tiles.append(Tile(col=col, row=row, bbox=extended, core=core))
+    return tiles
+
+
+def tile_cubes(cube: DataCube, tiles: List[Tile]) -> Dict[Tile, DataCube]:
+    """Build a data cube for each tile by filtering given data cube on the tile's (overlap extended) bounding box."""
+    return {tile: cube.filter_bbox(bbox=tile.bbox) for tile in tiles}
+
+
+class TileJob(RunnerJob):
+    """Batch job (status) of a single tile in a :py:class:`TiledJobRunner` run."""
+
+    __slots__ = ("tile", "cube")
+
+    def __init__(self, tile: Any, cube: DataCube):
+        super().__init__()
+        self.tile = tile
+        self.cube = cube
+
+    @property
+    def name(self):
+        return getattr(self.tile, "name", self.tile)
+
+
+class TiledJobRunner(JobRunnerBase):
+    """
+    Run a batch job per tile (or any other key), with at most ``max_running_jobs`` jobs running at the same time:
+    a new job is only created and started when another one has finished.
+
+    Failures (e.g. job creation errors or failed jobs) are recorded per tile and don't stop the other tiles.
+
+    :param max_running_jobs: maximum number of concurrently running batch jobs
+    :param poll_interval: number of seconds to sleep between status polls of the running jobs
+    :param on_status: callback that is called with the :py:class:`TileJob` on each status change
+    :param soft_error_max: maximum number of soft errors (e.g. temporary connection glitches) to allow
+    """
+
+    def run(self, cubes: Dict[Any, DataCube], title: Optional[str] = None, **create_job_kwargs) -> List[TileJob]:
+        """
+        Create, start and track a batch job for each data cube until all of them are finished (or failed).
+
+        :param cubes: mapping of tile (or other key) to data cube, e.g. from :py:func:`tile_cubes`
+        :param title: job title (the tile name is appended to it)
+        :param create_job_kwargs: additional arguments for :py:meth:`DataCube.create_job`
+            (e.g. ``out_format``, ``job_options``)
+        :return: list of tile jobs (also available as ``jobs`` attribute)
+        """
+        self.jobs = [TileJob(tile=tile, cube=cube) for tile, cube in cubes.items()]
+        pending = list(self.jobs)
+        running: List[TileJob] = []
+        soft_errors = SoftErrorCounter(max_count=self.soft_error_max)
+        while pending or running:
+            while pending and len(running) < self.max_running_jobs:
+                tile_job = pending.pop(0)
+                self._start(tile_job, create_job=lambda: tile_job.cube.create_job(
+                    title=f"{title} ({tile_job.name})" if title else str(tile_job.name), **create_job_kwargs
+                ))
+                if tile_job.status != "error":
+                    running.append(tile_job)
+            if running:
+                self._poll(running, soft_errors=soft_errors)
+        return self.jobs
+
+    def status(self) -> Dict[Any, str]:
+        """Status per tile (key) of the last run."""
+        return {tile_job.tile: tile_job.status for tile_job in self.jobs}
@@ -0,0 +1,160 @@
+"""
+Simple inter-process (advisory) file locking.
+"""
+
+import hashlib
+import logging
+import os
+import stat
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Union
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+_log = logging.getLogger(__name__)
+
+
+class FileLock:
+    """
+    Exclusive advisory lock based on a lock file,
+    to coordinate access to a shared resource between processes (on the same host).
+
+    Within a process, the lock is thread-safe and reentrant.
+    Uses ``fcntl.flock`` where available, ``msvcrt.locking`` on Windows
+    and falls back to in-process locking only otherwise.
+
+    Usage example::
+
+        with get_file_lock(path):
+            ...
+
+    :param path: path of the lock file (will be created if necessary)
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self._path = Path(path)
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def acquire(self):
+        self._thread_lock.acquire()
+        try:
+            if self._depth == 0:
+                self._fd = self._lock_file()
+            self._depth += 1
+        except BaseException:
+            self._thread_lock.release()
+            raise
+
+    def release(self):
+        try:
+            self._depth -= 1
+            if self._depth == 0:
+                fd, self._fd = self._fd, None
+                self._unlock_file(fd)
+        finally:
+            self._thread_lock.release()
+
+    def _lock_file(self) -> int:
+        self._path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(str(self._path), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            elif msvcrt:
+                while True:
+                    try:
+                        # Note: blocking mode `LK_LOCK` gives up (with OSError) after 10 seconds.
+                        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        _log.debug(f"Still waiting for lock on {self._path}")
+        except BaseException:
+            os.close(fd)
+            raise
+        return fd
+
+    def _unlock_file(self, fd: int):
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            elif msvcrt:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {str(self._path)!r}>"
+
+
+# Lock registry, to make sure there is only one lock object (per process) for a given lock file.
+_locks: Dict[Path, FileLock] = {}
+_locks_lock = threading.Lock()
+
+
+def _is_private_dir(directory: Path) -> bool:
+    """
+    Create given directory if necessary and check that it is private:
+    a real directory (not a symlink), owned by the current user and not accessible by others.
+    """
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = directory.lstat()
+    except OSError as e:
+        _log.warning(f"Failed to create lock directory {directory}: {e!r}")
+        return False
+    if not stat.S_ISDIR(st.st_mode):
+        return False
+    if hasattr(os, "getuid"):
+        return st.st_uid == os.getuid() and stat.S_IMODE(st.st_mode) & 0o077 == 0
+    return True
+
+
+def get_lock_path(path: Union[str, Path]) -> Path:
+    """
+    Get (user specific) lock file path in temp dir to use for locking given file.
+
+    Lock files are kept in a separate location to avoid cluttering the folder of the file to lock.
+    If that (shared) location is not private to the user (e.g. created by another user),
+    a hidden lock file next to the file to lock is used instead.
+    """
+    path = Path(path).absolute()
+    user = str(os.getuid()) if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    name = path.name + "." + hashlib.sha256(str(path).encode("utf-8")).hexdigest()[:16] + ".lock"
+    directory = Path(tempfile.gettempdir()) / f"openeo-locks-{user}"
+    if not _is_private_dir(directory):
+        _log.warning(f"Lock directory {directory} is not private: using lock file next to {path} instead.")
+        return path.parent / ("." + name)
+    return directory / name
+
+
+def get_file_lock(path: Union[str, Path]) -> FileLock:
+    """Get lock object for given file (using a lock file in a separate location)."""
+    lock_path = get_lock_path(path)
+    with _locks_lock:
+        if lock_path not in _locks:
+            _locks[lock_path] = FileLock(lock_path)
+        return _locks[lock_path]
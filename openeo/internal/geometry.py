@@ -0,0 +1,177 @@
+"""
+Helpers to shrink GeoJSON payloads (e.g. geometries embedded in process graphs):
+coordinate quantization, simplification and dropping of feature properties.
+"""
+import math
+from typing import Any, List, Optional, Union
+
+# Approximate length (in meter) of a degree of latitude.
+METERS_PER_DEGREE = 111320
+
+
+def meters_per_degree(latitude: float = 0) -> float:
+    """
+    Approximate length (in meter) of a degree of longitude at given latitude
+    (at latitude 0: also roughly the length of a degree of latitude),
+    for rough conversions between degrees and meters.
+    """
+    return METERS_PER_DEGREE * max(math.cos(math.radians(latitude)), 0.01)
+
+
+def _round_positions(coordinates: Any, decimals: int) -> Any:
+    """Round (nested lists of) positions, dropping consecutive duplicate positions in lines and rings."""
+    if not coordinates:
+        return coordinates
+    if isinstance(coordinates[0], (int, float)):
+        return [round(c, decimals) for c in coordinates]
+    rounded = [_round_positions(c, decimals) for c in coordinates]
+    if isinstance(rounded[0], list) and rounded[0] and isinstance(rounded[0][0], (int, float)):
+        # Sequence of positions (line or ring): drop consecutive duplicates, unless that breaks validity.
+        deduplicated = [p for i, p in enumerate(rounded) if i == 0 or p != rounded[i - 1]]
+        closed = rounded[0] == rounded[-1]
+        if len(deduplicated) >= (4 if closed else 2):
+            return deduplicated
+    return rounded
+
+
+def quantize_coordinates(geojson: dict, decimals: int) -> dict:
+    """
+    Round the coordinates of a GeoJSON object (geometry, ``Feature`` or ``FeatureCollection``)
+    to given number of decimals (e.g. 6 decimals is about 10cm precision in lon/lat).
+
+    :return: new GeoJSON object (input is not modified)
+    """
+    return _map_geometries(geojson, lambda g: dict(g, coordinates=_round_positions(g["coordinates"], decimals)))
+
+
+def simplify_geometries(geojson: dict, tolerance: float) -> dict:
+    """
+    Topology-preserving simplification (Douglas-Peucker) of the geometries of a GeoJSON object:
+    vertices are removed as long as the result stays within given tolerance (in coordinate units).
+
+    :return: new GeoJSON object (input is not modified)
+    """
+    import shapely.geometry
+
+    def simplify(geometry: dict) -> dict:
+        shape = shapely.geometry.shape(geometry)
+        simplified = shapely.geometry.mapping(shape.simplify(tolerance, preserve_topology=True))
+        # `mapping` produces (nested) tuples: convert to lists for JSON-style output.
+        result = _listify(simplified)
+        for k, v in geometry.items():
+            if k not in ("type", "coordinates", "geometries"):
+                result[k] = v
+        return result
+
+    return _map_geometries(geojson, simplify, whole_collections=True)
+
+
+def drop_properties(geojson: dict, keep: Optional[List[str]] = None) -> dict:
+    """
+    Drop the properties (except the ones in ``keep``) of the features of a GeoJSON object.
+
+    :return: new GeoJSON object (input is not modified)
+    """
+    keep = set(keep or [])
+    if geojson.get("type") == "FeatureCollection":
+        return dict(geojson, features=[drop_properties(f, keep=list(keep)) for f in geojson["features"]])
+    elif geojson.get("type") == "Feature":
+        properties = geojson.get("properties") or {}
+        return dict(geojson, properties={k: v for k, v in properties.items() if k in keep})
+    return geojson
+
+
+def _listify(x: Any) -> Any:
+    if isinstance(x, (list, tuple)):
+        return [_listify(v) for v in x]
+    elif isinstance(x, dict):
+        return {k: _listify(v) for k, v in x.items()}
+    return x
+
+
+def _map_geometries(geojson: dict, f, whole_collections: bool = False) -> dict:
+    """Apply function to the (coordinate based) geometries of a GeoJSON object."""
+    t = geojson.get("type")
+    if t == "FeatureCollection":
+        return dict(geojson, features=[_map_geometries(x, f, whole_collections) for x in geojson["features"]])
+    elif t == "Feature":
+        if geojson.get("geometry") is None:
+            return geojson
+        return dict(geojson, geometry=_map_geometries(geojson["geometry"], f, whole_collections))
+    elif t == "GeometryCollection":
+        if whole_collections:
+            return f(geojson)
+        return dict(geojson, geometries=[_map_geometries(x, f, whole_collections) for x in geojson["geometries"]])
+    elif "coordinates" in geojson:
+        return f(geojson)
+    return geojson
+
+
+class GeometryShrinking:
+    """
+    Options to shrink GeoJSON geometries that are embedded in process graphs
+    (e.g. for ``aggregate_spatial``, ``mask_polygon``, ``filter_spatial``),
+    to reduce request sizes and back-end parse times.
+    All options are disabled by default.
+
+    Usage example::
+
+        connection.geometry_shrinking = GeometryShrinking(decimals=6, simplify="resolution", drop_properties=True)
+
+    :param decimals: number of decimals to round coordinates to
+    :param simplify: tolerance (in coordinate units) for topology-preserving simplification,
+        or "resolution" for half the spatial resolution of the data cube
+        (as far as known from the collection metadata)
+    :param drop_properties: drop all feature properties (``True``),
+        or only keep the properties with given names (list)
+
+    .. versionadded:: 0.13.1
+    """
+
+    RESOLUTION = "resolution"
+
+    def __init__(
+            self, decimals: Optional[int] = None, simplify: Union[None, float, str] = None,
+            drop_properties: Union[bool, List[str]] = False,
+    ):
+        if simplify is not None and simplify != self.RESOLUTION and not isinstance(simplify, (int, float)):
+            raise ValueError(f"Invalid simplify option {simplify!r}")
+        self.decimals = decimals
+        self.simplify = simplify
+        self.drop_properties = drop_properties
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(decimals={self.decimals!r}, simplify={self.simplify!r},"
+            f" drop_properties={self.drop_properties!r})"
+        )
+
+    @staticmethod
+    def resolution_tolerance(step: Optional[float], step_degrees: bool, geometry_degrees: bool, latitude: float = 0):
+        """Half pixel tolerance, in coordinate units of the geometry."""
+        if not step:
+            return None
+        tolerance = step / 2
+        if geometry_degrees and not step_degrees:
+            tolerance /= meters_per_degree(latitude)
+        elif step_degrees and not geometry_degrees:
+            tolerance *= meters_per_degree()
+        return tolerance
+
+    def apply(self, geojson: dict, resolution_tolerance: Optional[float] = None) -> dict:
+        """
+        Shrink given GeoJSON object.
+
+        :param resolution_tolerance: simplification tolerance to use for ``simplify="resolution"``
+            (no simplification if not known).
+        :return: shrunk GeoJSON object (input is not modified)
+        """
+        if self.drop_properties:
+            keep = self.drop_properties if isinstance(self.drop_properties, list) else None
+            geojson = drop_properties(geojson, keep=keep)
+        tolerance = resolution_tolerance if self.simplify == self.RESOLUTION else self.simplify
+        if tolerance:
+            geojson = simplify_geometries(geojson, tolerance=tolerance)
+        if self.decimals is not None:
+            geojson = quantize_coordinates(geojson, decimals=self.decimals)
+        return geojson
@@ -5,7 +5,7 @@ Functionality for abstracting, building, manipulating and processing openEO proc
 import abc
 import collections
 from pathlib import Path
-from typing import Union, Dict, Any, Optional
+from typing import Union, Dict, Any, List, Optional
 
 from openeo.api.process import Parameter
 from openeo.internal.process_graph_visitor import ProcessGraphVisitor, ProcessGraphUnflattener, \
@@ -236,6 +236,20 @@ class GraphFlattener(ProcessGraphVisitor):
         self._flattened[self._last_node_id]["result"] = True
         return self._flattened
 
+    def flatten_multiple(self, nodes: List[PGNode]) -> dict:
+        """
+        Consume given nested process graphs (e.g. multiple ``save_result`` nodes) and return a single flat dict
+        representation, in which nodes shared between the graphs only occur once.
+        The last node is flagged as result node.
+        """
+        if not nodes:
+            raise ValueError("No nodes to flatten")
+        for node in nodes:
+            self.accept_node(node)
+            assert len(self._argument_stack) == 0
+        self._flattened[self._last_node_id]["result"] = True
+        return self._flattened
+
     def accept_node(self, node: PGNode):
         # Process reused nodes only first time and remember node id.
         node_id = id(node)
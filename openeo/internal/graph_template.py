@@ -0,0 +1,148 @@
+"""
+Pre-serialized ("compiled") process graph templates for fast mass instantiation.
+"""
+import json
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from openeo.api.process import Parameter
+from openeo.rest import OpenEoClientException
+
+
+class GraphTemplate:
+    """
+    JSON document (e.g. a process graph or a full request body with a process graph)
+    with parameter placeholders (``{"from_parameter": ...}`` or :py:class:`~openeo.api.process.Parameter` objects),
+    that is serialized only once, so that concrete instances can be produced
+    by directly substituting JSON-encoded parameter values in the serialized form.
+
+    Like parameter substitution of :py:class:`~openeo.internal.graph_building.PGNodeGraphUnflattener`,
+    parameter references inside child process graphs (callbacks) are not substituted:
+    these can also refer to parameters of the callback itself (e.g. ``x`` of ``apply``).
+
+    Usage example::
+
+        bbox = Parameter("bbox", schema="object")
+        cube = connection.load_collection("S2", spatial_extent=bbox, temporal_extent=["2021-06-01", "2021-09-01"])
+        template = GraphTemplate(cube.flat_graph(), parameters=[bbox])
+        for bbox in bboxes:
+            process_graph_json = template.render(bbox=bbox)
+
+    :param document: JSON-compatible document: flat process graph, ``{"process_graph": ...}`` wrapper
+        or request body with a ``"process"`` or ``"process_graph"`` field.
+    :param parameters: template parameters (names or :py:class:`~openeo.api.process.Parameter` objects,
+        the latter optionally with default value).
+        If not given: all (non-callback) parameter references are template parameters (without default).
+
+    .. versionadded:: 0.13.1
+    """
+
+    def __init__(self, document: dict, parameters: Optional[Iterable[Union[str, Parameter]]] = None):
+        self._defaults: Dict[str, Any] = {}
+        if parameters is None:
+            self._names = None
+        else:
+            self._names = set()
+            for p in parameters:
+                if isinstance(p, Parameter):
+                    self._names.add(p.name)
+                    if p.default is not Parameter._DEFAULT_UNDEFINED:
+                        self._defaults[p.name] = p.default
+                else:
+                    self._names.add(p)
+        # Serialized document as alternating literal chunks and parameter names: len(chunks) == len(slots) + 1
+        self._chunks: List[str] = [""]
+        self._slots: List[str] = []
+        if "process_graph" in document or "process" in document:
+            self._compile(document, in_graph=False)
+        else:
+            self._compile_flat_graph(document)
+        if self._names is None:
+            self._names = set(self._slots)
+
+    @property
+    def parameters(self) -> List[str]:
+        """Names of the template parameters."""
+        return sorted(self._names)
+
+    def _emit(self, literal: str):
+        self._chunks[-1] += literal
+
+    def _compile(self, value: Any, in_graph: bool):
+        """Serialize given value (like `json.dumps`) into the literal chunks and parameter slots."""
+        name = self._placeholder(value)
+        if name is not None:
+            self._slots.append(name)
+            self._chunks.append("")
+        elif isinstance(value, dict):
+            if "process_graph" in value and in_graph:
+                # Child process graph (callback): keep as is.
+                self._emit(json.dumps(value))
+                return
+            self._emit("{")
+            for i, (k, v) in enumerate(value.items()):
+                self._emit((", " if i else "") + json.dumps(str(k)) + ": ")
+                if k == "process_graph" and not in_graph and isinstance(v, dict):
+                    self._compile_flat_graph(v)
+                else:
+                    self._compile(v, in_graph=in_graph)
+            self._emit("}")
+        elif isinstance(value, (list, tuple)):
+            self._emit("[")
+            for i, v in enumerate(value):
+                if i:
+                    self._emit(", ")
+                self._compile(v, in_graph=in_graph)
+            self._emit("]")
+        else:
+            self._emit(json.dumps(value))
+
+    def _compile_flat_graph(self, flat_graph: dict):
+        """Serialize a flat process graph: mapping of node ids to nodes."""
+        self._emit("{")
+        for i, (node_id, node) in enumerate(flat_graph.items()):
+            self._emit((", " if i else "") + json.dumps(str(node_id)) + ": ")
+            self._compile(node, in_graph=True)
+        self._emit("}")
+
+    def _placeholder(self, value: Any) -> Optional[str]:
+        """Get template parameter name if given value is a placeholder for it."""
+        if isinstance(value, Parameter):
+            name = value.name
+        elif isinstance(value, dict) and len(value) == 1 and isinstance(value.get("from_parameter"), str):
+            name = value["from_parameter"]
+        else:
+            return None
+        if self._names is not None and name not in self._names:
+            if isinstance(value, Parameter):
+                raise OpenEoClientException(f"Parameter {name!r} is not a template parameter.")
+            return None
+        return name
+
+    def render(self, **values) -> str:
+        """
+        Produce JSON-serialized instance of the template, with given parameter values.
+
+        :param values: parameter values (JSON-compatible)
+        :return: JSON string
+        """
+        unknown = values.keys() - self._names
+        if unknown:
+            raise OpenEoClientException(f"Unknown template parameter(s): {sorted(unknown)}.")
+        encoded = {}
+        for name in set(self._slots):
+            if name in values:
+                encoded[name] = json.dumps(values[name])
+            elif name in self._defaults:
+                encoded[name] = json.dumps(self._defaults[name])
+            else:
+                raise OpenEoClientException(f"No value for template parameter {name!r}.")
+        chunks = self._chunks
+        parts = [chunks[0]]
+        for i, name in enumerate(self._slots):
+            parts.append(encoded[name])
+            parts.append(chunks[i + 1])
+        return "".join(parts)
+
+    def render_dict(self, **values) -> dict:
+        """Produce (JSON-decoded) instance of the template, with given parameter values."""
+        return json.loads(self.render(**values))
@@ -0,0 +1,325 @@
+"""
+Rewrite passes for math processes: constant folding, algebraic simplification,
+common subexpression elimination and flattening of associative chains.
+"""
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from openeo.internal.graph_building import PGNode
+from openeo.internal.optimizer.base import (
+    GraphPass, NodeRewritePass, get_node, is_number, reference_counts, rewrite_graph, with_arguments
+)
+
+# Largest integer that can be represented exactly as double precision float
+_MAX_EXACT_INT = 2 ** 53
+
+
+def _linear_scale_range(x, inputMin, inputMax, outputMin=0, outputMax=1):
+    x = min(max(x, inputMin), inputMax)
+    return ((x - inputMin) / (inputMax - inputMin)) * (outputMax - outputMin) + outputMin
+
+
+def _clip(x, min, max):
+    if min > max:
+        raise ValueError(min, max)
+    return min if x < min else max if x > max else x
+
+
+def _log(x, base):
+    if x <= 0 or base <= 0 or base == 1:
+        raise ValueError(x, base)
+    return math.log(x, base)
+
+
+# Foldable processes: process id -> (parameter names (with optional ones last), number of required parameters, function)
+_FOLDABLE: Dict[str, Tuple[Tuple[str, ...], int, Callable]] = {
+    "add": (("x", "y"), 2, lambda x, y: x + y),
+    "subtract": (("x", "y"), 2, lambda x, y: x - y),
+    "multiply": (("x", "y"), 2, lambda x, y: x * y),
+    "divide": (("x", "y"), 2, lambda x, y: x / y),
+    "power": (("base", "p"), 2, lambda base, p: base ** p),
+    "absolute": (("x",), 1, lambda x: abs(x)),
+    "sgn": (("x",), 1, lambda x: (x > 0) - (x < 0)),
+    "sqrt": (("x",), 1, lambda x: math.sqrt(x)),
+    "exp": (("p",), 1, lambda p: math.exp(p)),
+    "ln": (("x",), 1, lambda x: math.log(x)),
+    "log": (("x", "base"), 2, _log),
+    "sin": (("x",), 1, lambda x: math.sin(x)),
+    "cos": (("x",), 1, lambda x: math.cos(x)),
+    "tan": (("x",), 1, lambda x: math.tan(x)),
+    "floor": (("x",), 1, lambda x: math.floor(x)),
+    "ceil": (("x",), 1, lambda x: math.ceil(x)),
+    "int": (("x",), 1, lambda x: math.trunc(x)),
+    "clip": (("x", "min", "max"), 3, _clip),
+    "linear_scale_range": (("x", "inputMin", "inputMax", "outputMin", "outputMax"), 3, _linear_scale_range),
+    "pi": ((), 0, lambda: math.pi),
+    "e": ((), 0, lambda: math.e),
+}
+
+
+class ConstantFolding(NodeRewritePass):
+    """
+    Evaluate math processes with only constant (number) arguments client-side,
+    e.g. replace ``divide(1, 10000)`` with ``0.0001``.
+
+    Processes that would fail or give non-finite results (e.g. division by zero) are left untouched,
+    so that error handling stays with the back-end.
+    """
+
+    def rewrite_node(self, node: PGNode) -> Any:
+        value = self.evaluate(node)
+        return node if value is None else value
+
+    @staticmethod
+    def evaluate(node: PGNode) -> Optional[float]:
+        """Evaluate given node if possible, return None otherwise."""
+        if node.namespace is not None or node.process_id not in _FOLDABLE:
+            return None
+        parameters, required, function = _FOLDABLE[node.process_id]
+        arguments = node.arguments
+        if not set(parameters[:required]).issubset(arguments) or not set(arguments).issubset(parameters):
+            return None
+        if not all(is_number(v) for v in arguments.values()):
+            return None
+        try:
+            result = function(**arguments)
+        except (ArithmeticError, ValueError, TypeError):
+            return None
+        if not is_number(result):
+            return None
+        if isinstance(result, float) and not math.isfinite(result):
+            return None
+        if isinstance(result, int) and abs(result) > _MAX_EXACT_INT:
+            return None
+        return result
+
+
+class AlgebraicSimplification(NodeRewritePass):
+    """
+    Algebraic simplifications of math processes:
+
+    - identity operations: ``add(x, 0)``, ``subtract(x, 0)``, ``multiply(x, 1)``, ``divide(x, 1)``,
+      ``power(x, 1)`` become just ``x``
+    - double negation: ``multiply(multiply(x, -1), -1)`` becomes ``x``
+    - chained ``linear_scale_range``: a ``linear_scale_range`` of which the input range matches the output range
+      of another ``linear_scale_range`` is merged into a single one.
+    """
+
+    def rewrite_node(self, node: PGNode) -> Any:
+        if node.namespace is not None:
+            return node
+        method = getattr(self, "_rewrite_" + node.process_id, None)
+        return method(node) if method else node
+
+    @staticmethod
+    def _binary(node: PGNode) -> Optional[Tuple[Any, Any]]:
+        arguments = node.arguments
+        if set(arguments) != {"x", "y"}:
+            return None
+        return arguments["x"], arguments["y"]
+
+    def _rewrite_add(self, node: PGNode) -> Any:
+        xy = self._binary(node)
+        if xy:
+            x, y = xy
+            if is_number(y) and y == 0:
+                return x
+            if is_number(x) and x == 0:
+                return y
+        return node
+
+    def _rewrite_subtract(self, node: PGNode) -> Any:
+        xy = self._binary(node)
+        if xy and is_number(xy[1]) and xy[1] == 0:
+            return xy[0]
+        return node
+
+    def _rewrite_multiply(self, node: PGNode) -> Any:
+        xy = self._binary(node)
+        if xy:
+            x, y = xy
+            if is_number(y) and y == 1:
+                return x
+            if is_number(x) and x == 1:
+                return y
+            if is_number(y) and y == -1:
+                inner = get_node(x)
+                if inner and inner.process_id == "multiply" and inner.namespace is None:
+                    inner_xy = self._binary(inner)
+                    if inner_xy and is_number(inner_xy[1]) and inner_xy[1] == -1:
+                        return inner_xy[0]
+        return node
+
+    def _rewrite_divide(self, node: PGNode) -> Any:
+        xy = self._binary(node)
+        if xy and is_number(xy[1]) and xy[1] == 1:
+            return xy[0]
+        return node
+
+    def _rewrite_power(self, node: PGNode) -> Any:
+        arguments = node.arguments
+        if set(arguments) == {"base", "p"} and is_number(arguments["p"]) and arguments["p"] == 1:
+            return arguments["base"]
+        return node
+
+    def _rewrite_linear_scale_range(self, node: PGNode) -> Any:
+        outer = self._linear_scale_range_arguments(node)
+        inner_node = get_node(node.arguments.get("x"))
+        if outer is None or inner_node is None or inner_node.process_id != "linear_scale_range":
+            return node
+        if inner_node.namespace is not None:
+            return node
+        inner = self._linear_scale_range_arguments(inner_node)
+        if inner is None:
+            return node
+        # Input range of outer transformation should be the output range of the inner one.
+        # (Which makes the clipping of the outer one a no-op.)
+        if (outer["inputMin"], outer["inputMax"]) != (inner["outputMin"], inner["outputMax"]):
+            return node
+        return with_arguments(node, {
+            "x": inner_node.arguments["x"],
+            "inputMin": inner["inputMin"],
+            "inputMax": inner["inputMax"],
+            "outputMin": outer["outputMin"],
+            "outputMax": outer["outputMax"],
+        })
+
+    @staticmethod
+    def _linear_scale_range_arguments(node: PGNode) -> Optional[dict]:
+        """Get (normalized) range arguments if they are all number constants with non-degenerate ranges."""
+        arguments = {"outputMin": 0, "outputMax": 1, **node.arguments}
+        if set(arguments) != {"x", "inputMin", "inputMax", "outputMin", "outputMax"}:
+            return None
+        ranges = {k: v for k, v in arguments.items() if k != "x"}
+        if not all(is_number(v) for v in ranges.values()):
+            return None
+        if not (ranges["inputMin"] < ranges["inputMax"] and ranges["outputMin"] < ranges["outputMax"]):
+            return None
+        return ranges
+
+
+# Side effect free processes (without callbacks) that can be evaluated once and reused
+_PURE = set(_FOLDABLE) | {
+    "array_element", "sum", "product", "mean", "median", "min", "max", "sd", "variance", "normalized_difference",
+    "eq", "neq", "gt", "gte", "lt", "lte", "between", "and", "or", "xor", "not", "if", "is_nodata", "is_nan",
+}
+
+
+def _signature(value: Any) -> tuple:
+    """Hashable representation of an argument value (with nodes by identity)."""
+    node = get_node(value)
+    if node is not None:
+        return ("node", id(node))
+    elif isinstance(value, dict):
+        if "process_graph" in value:
+            raise TypeError("Callbacks are not supported")
+        return ("dict", tuple(sorted((k, _signature(v)) for k, v in value.items())))
+    elif isinstance(value, (list, tuple)):
+        return ("list", tuple(_signature(v) for v in value))
+    elif value is None or isinstance(value, (str, int, float, bool)):
+        return (type(value).__name__, value)
+    raise TypeError(value)
+
+
+class CommonSubexpressionElimination(GraphPass):
+    """
+    Reuse a single node for identical invocations of side effect free (math) processes,
+    e.g. repeated ``array_element`` lookups of the same band in "band math" expressions
+    like ``(B08 - B04) / (B08 + B04)``.
+    """
+
+    def run(self, node: PGNode) -> PGNode:
+        known: Dict[tuple, PGNode] = {}
+
+        def rewrite(rebuilt: PGNode, original: PGNode) -> PGNode:
+            if rebuilt.namespace is not None or rebuilt.process_id not in _PURE:
+                return rebuilt
+            try:
+                key = (rebuilt.process_id, _signature(rebuilt.arguments))
+            except TypeError:
+                return rebuilt
+            return known.setdefault(key, rebuilt)
+
+        return rewrite_graph(node, rewrite=rewrite)
+
+
+# Associative and commutative binary processes and their counterpart operating on an array.
+_NARY = {"add": "sum", "multiply": "product"}
+
+
+class AssociativeFlattening(GraphPass):
+    """
+    Flatten chains of ``add`` (or ``multiply``) processes into a single ``sum`` (or ``product``)
+    over an array, e.g. ``add(add(add(a, b), c), d)`` becomes ``sum([a, b, c, d])``,
+    and combine the number constants in the chain.
+
+    The ``ignore_nodata`` argument is set to false to preserve the no-data handling of ``add``/``multiply``.
+    Intermediate results that are used elsewhere too are not flattened (to avoid calculating them twice).
+    """
+
+    def run(self, node: PGNode) -> PGNode:
+        # Reference counting requires the callbacks as PGNodes.
+        normalized = rewrite_graph(node, rewrite=lambda rebuilt, original: rebuilt, unflatten_callbacks=True)
+        counts = reference_counts(normalized, callbacks=True)
+
+        def rewrite(rebuilt: PGNode, original: PGNode) -> Any:
+            nary = self._nary_process(rebuilt)
+            if nary is None:
+                return rebuilt
+            operands = []
+            changed = False
+            for value, original_value in zip(self._operands(rebuilt), self._operands(original)):
+                child = get_node(value)
+                original_child = get_node(original_value)
+                if (
+                        child is not None and self._nary_process(child) == nary
+                        and counts.get(id(original_child), [None, 0])[1] == 1
+                ):
+                    operands.extend(self._operands(child))
+                    changed = True
+                else:
+                    operands.append(value)
+            binary = "add" if nary == "sum" else "multiply"
+            operands, combined = self._combine_constants(operands, binary=binary)
+            if not (changed or combined) or len(operands) < 2:
+                return rebuilt
+            if len(operands) == 2:
+                return PGNode(binary, x=operands[0], y=operands[1])
+            return PGNode(nary, data=operands, ignore_nodata=False)
+
+        result = rewrite_graph(normalized, rewrite=rewrite)
+        return node if result is normalized else result
+
+    @staticmethod
+    def _nary_process(node: PGNode) -> Optional[str]:
+        """Get n-ary process ("sum" or "product") corresponding with given node, or None if not applicable."""
+        if node.namespace is not None:
+            return None
+        arguments = node.arguments
+        if node.process_id in _NARY and set(arguments) == {"x", "y"}:
+            return _NARY[node.process_id]
+        if (
+                node.process_id in _NARY.values() and set(arguments) == {"data", "ignore_nodata"}
+                and arguments["ignore_nodata"] is False and isinstance(arguments["data"], list)
+        ):
+            return node.process_id
+        return None
+
+    @staticmethod
+    def _operands(node: PGNode) -> List[Any]:
+        if node.process_id in _NARY:
+            return [node.arguments["x"], node.arguments["y"]]
+        return node.arguments["data"]
+
+    @staticmethod
+    def _combine_constants(operands: List[Any], binary: str) -> Tuple[List[Any], bool]:
+        """Combine number constants (if safe) and put them last."""
+        numbers = [v for v in operands if is_number(v)]
+        if len(numbers) < 2:
+            return operands, False
+        combined = numbers[0]
+        for number in numbers[1:]:
+            combined = ConstantFolding.evaluate(PGNode(binary, x=combined, y=number))
+            if combined is None:
+                return operands, False
+        return [v for v in operands if not is_number(v)] + [combined], True
@@ -0,0 +1,316 @@
+"""
+Framework for process graph optimization through (pluggable) rewrite passes over :py:class:`PGNode` graphs.
+
+Rewrite passes never modify given nodes in-place (nodes can be shared between multiple
+:py:class:`~openeo.rest.datacube.DataCube` objects): rewritten nodes are shallow copies.
+"""
+import abc
+import copy
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from openeo.internal.graph_building import PGNode
+from openeo.internal.process_graph_visitor import ProcessGraphVisitException
+
+_log = logging.getLogger(__name__)
+
+
+def with_arguments(node: PGNode, arguments: dict) -> PGNode:
+    """Get (shallow) copy of given node, with new arguments (preserving node class and other attributes)."""
+    if arguments is node.arguments:
+        return node
+    new = copy.copy(node)
+    new._arguments = arguments
+    return new
+
+
+def get_node(value: Any) -> Optional[PGNode]:
+    """Get node referenced by given argument value (``{"from_node": PGNode}`` or ``PGNode``), or None."""
+    if isinstance(value, PGNode):
+        return value
+    if isinstance(value, dict) and isinstance(value.get("from_node"), PGNode):
+        return value["from_node"]
+    return None
+
+
+def get_callback(value: Any) -> Optional[PGNode]:
+    """
+    Get result node of callback argument value (``{"process_graph": ...}`` with a PGNode or flat graph), or None.
+    """
+    if not isinstance(value, dict) or "process_graph" not in value:
+        return None
+    pg = value["process_graph"]
+    if isinstance(pg, PGNode):
+        return pg
+    if isinstance(pg, dict) and all(isinstance(n, dict) for n in pg.values()):
+        try:
+            return PGNode.from_flat_graph(pg)
+        except ProcessGraphVisitException as e:
+            _log.warning(f"Failed to unflatten callback process graph, skipping it: {e!r}")
+    return None
+
+
+def iter_node_references(value: Any) -> Iterator[PGNode]:
+    """Iterate over the nodes referenced in given argument value (excluding callbacks)."""
+    node = get_node(value)
+    if node is not None:
+        yield node
+    elif isinstance(value, dict):
+        if "process_graph" in value or "from_parameter" in value:
+            return
+        for v in value.values():
+            yield from iter_node_references(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            yield from iter_node_references(v)
+
+
+def iter_callbacks(value: Any) -> Iterator[PGNode]:
+    """Iterate over the result nodes of the (non-flat) callbacks in given argument value."""
+    if isinstance(value, dict):
+        if isinstance(value.get("process_graph"), PGNode):
+            yield value["process_graph"]
+        elif "from_node" not in value and "from_parameter" not in value:
+            for v in value.values():
+                yield from iter_callbacks(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            yield from iter_callbacks(v)
+
+
+def reference_counts(root: PGNode, callbacks: bool = False) -> Dict[int, list]:
+    """
+    Build mapping of node id to ``[node, number of references to it]``
+    for all nodes in graph of given result node (which counts as referenced).
+
+    :param callbacks: whether to include the nodes of (non-flat) callbacks
+        (of which the result node counts as referenced).
+    """
+    counts = {}
+    stack = []
+
+    def add(node: PGNode):
+        if id(node) in counts:
+            counts[id(node)][1] += 1
+        else:
+            counts[id(node)] = [node, 1]
+            stack.append(node)
+
+    add(root)
+    while stack:
+        node = stack.pop()
+        for ref in iter_node_references(node.arguments):
+            add(ref)
+        if callbacks:
+            for callback in iter_callbacks(node.arguments):
+                add(callback)
+    return counts
+
+
+def is_number(value: Any) -> bool:
+    """Check if given (argument) value is a number literal."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class GraphPass(metaclass=abc.ABCMeta):
+    """
+    Base class for process graph rewrite passes.
+    """
+
+    @property
+    def name(self) -> str:
+        return type(self).__name__
+
+    @abc.abstractmethod
+    def run(self, node: PGNode) -> PGNode:
+        """
+        Rewrite process graph, given as its result node.
+
+        :return: new result node, or the given node itself if nothing changed.
+        """
+        ...
+
+
+class NodeRewritePass(GraphPass):
+    """
+    Base class for bottom-up, node-by-node rewrite passes (including callbacks).
+    Subclasses just have to implement :py:meth:`rewrite_node`.
+    """
+
+    @abc.abstractmethod
+    def rewrite_node(self, node: PGNode) -> Any:
+        """
+        Rewrite a single node (of which the arguments are already rewritten).
+
+        :return: the node itself (no change), a replacement node,
+            or an argument value to replace all references to the node with
+            (e.g. a constant, or a ``{"from_parameter": ...}``/``{"from_node": ...}`` reference).
+        """
+        ...
+
+    def run(self, node: PGNode) -> PGNode:
+        return rewrite_graph(node, rewrite=lambda rebuilt, original: self.rewrite_node(rebuilt))
+
+
+def rewrite_graph(
+        node: PGNode, rewrite: Callable[[PGNode, PGNode], Any], unflatten_callbacks: bool = False
+) -> PGNode:
+    """
+    Rewrite graph (given as result node) bottom-up, including callbacks.
+
+    :param rewrite: callable ``(rebuilt, original) -> Any`` to rewrite a node,
+        given the node with rewritten arguments and the original node
+        (return value semantics as for :py:meth:`NodeRewritePass.rewrite_node`).
+    :param unflatten_callbacks: whether to replace flat graph callbacks with their PGNode representation
+        (even if they are not rewritten otherwise).
+    :return: new result node, or the given node itself if nothing changed.
+    """
+    return _BottomUpRewriter(rewrite=rewrite, unflatten_callbacks=unflatten_callbacks).rewrite_root(node)
+
+
+class _BottomUpRewriter:
+    """Helper to rewrite a graph of PGNodes bottom-up, with memoization to preserve node reuse."""
+
+    def __init__(self, rewrite: Callable[[PGNode, PGNode], Any], unflatten_callbacks: bool = False):
+        self._rewrite = rewrite
+        self._unflatten_callbacks = unflatten_callbacks
+        # Rebuilt nodes (original arguments replaced with rewritten arguments) and rewrite results, keyed on node id.
+        self._rebuilt: Dict[int, PGNode] = {}
+        self._results: Dict[int, Any] = {}
+        # Keep references to (temporary) nodes, to guarantee that node ids are not reused.
+        self._seen: List[PGNode] = []
+
+    def rewrite_root(self, node: PGNode) -> PGNode:
+        result = self._rewrite_node(node)
+        # The result of a (sub)graph must be a node: don't replace root with a constant or parameter reference.
+        result_node = get_node(result)
+        return result_node if result_node is not None else self._rebuilt[id(node)]
+
+    def _rewrite_node(self, node: PGNode) -> Any:
+        key = id(node)
+        if key not in self._results:
+            self._seen.append(node)
+            arguments = self._rewrite_value(node.arguments)
+            rebuilt = with_arguments(node, arguments)
+            self._rebuilt[key] = rebuilt
+            self._results[key] = self._rewrite(rebuilt, node)
+        return self._results[key]
+
+    def _rewrite_value(self, value: Any) -> Any:
+        if isinstance(value, PGNode):
+            result = self._rewrite_node(value)
+            return get_node(result) or value
+        elif isinstance(value, dict):
+            if isinstance(value.get("from_node"), PGNode):
+                node = value["from_node"]
+                result = self._rewrite_node(node)
+                if result is node:
+                    return value
+                return {"from_node": result} if isinstance(result, PGNode) else result
+            elif "process_graph" in value:
+                return self._rewrite_callback(value)
+            elif "from_parameter" in value:
+                return value
+            new = {k: self._rewrite_value(v) for k, v in value.items()}
+            return value if all(new[k] is value[k] for k in value) else new
+        elif isinstance(value, (list, tuple)):
+            new = [self._rewrite_value(v) for v in value]
+            return value if all(n is v for n, v in zip(new, value)) else type(value)(new)
+        return value
+
+    def _rewrite_callback(self, value: dict) -> dict:
+        node = get_callback(value)
+        if node is None:
+            return value
+        self._seen.append(node)
+        new = self.rewrite_root(node)
+        if new is node and (value["process_graph"] is node or not self._unflatten_callbacks):
+            return value
+        return {**value, "process_graph": new}
+
+
+class GraphOptimizer:
+    """
+    Process graph optimizer: runs a sequence of rewrite passes (repeatedly, until there are no more changes).
+
+    Usage example::
+
+        optimizer = GraphOptimizer()
+        optimized = optimizer.optimize(cube.flat_graph())
+
+    :param passes: rewrite passes to run (in order).
+        By default: :py:class:`~openeo.internal.optimizer.arithmetic.ConstantFolding`,
+        :py:class:`~openeo.internal.optimizer.arithmetic.AlgebraicSimplification`,
+        :py:class:`~openeo.internal.optimizer.pushdown.FilterPushdown`,
+        :py:class:`~openeo.internal.optimizer.fusion.CallbackFusion`,
+        :py:class:`~openeo.internal.optimizer.arithmetic.CommonSubexpressionElimination`
+        and :py:class:`~openeo.internal.optimizer.arithmetic.AssociativeFlattening`.
+    :param max_rounds: maximum number of times to run all passes.
+    """
+
+    def __init__(self, passes: Optional[Iterable[GraphPass]] = None, max_rounds: int = 5):
+        if passes is None:
+            passes = self.default_passes()
+        self.passes: List[GraphPass] = list(passes)
+        self.max_rounds = max_rounds
+
+    @staticmethod
+    def default_passes() -> List[GraphPass]:
+        # TODO: eliminate local import (due to circular dependency)?
+        from openeo.internal.optimizer.arithmetic import (
+            AlgebraicSimplification, AssociativeFlattening, CommonSubexpressionElimination, ConstantFolding
+        )
+        from openeo.internal.optimizer.fusion import CallbackFusion
+        from openeo.internal.optimizer.pushdown import FilterPushdown
+        return [
+            ConstantFolding(), AlgebraicSimplification(), FilterPushdown(), CallbackFusion(),
+            CommonSubexpressionElimination(), AssociativeFlattening(),
+        ]
+
+    def optimize_node(self, node: PGNode) -> PGNode:
+        """Optimize process graph, given as result node."""
+        for _ in range(self.max_rounds):
+            result = node
+            for graph_pass in self.passes:
+                result = graph_pass.run(result)
+            if result is node:
+                break
+            node = result
+        return node
+
+    def optimize(self, graph: Union[PGNode, dict]) -> Union[PGNode, dict]:
+        """
+        Optimize given process graph.
+
+        :param graph: :py:class:`PGNode` (result node of graph), flat graph dictionary,
+            or dictionary with (flat) graph under "process_graph" key.
+        :return: optimized graph (in same representation as input).
+            Note that node ids of a flat graph will be regenerated if something changed.
+        """
+        if isinstance(graph, PGNode):
+            return self.optimize_node(graph)
+        if isinstance(graph.get("process_graph"), dict) and "process_id" not in graph["process_graph"]:
+            optimized = self.optimize(graph["process_graph"])
+            return graph if optimized is graph["process_graph"] else {**graph, "process_graph": optimized}
+        try:
+            node = PGNode.from_flat_graph(graph)
+        except ProcessGraphVisitException as e:
+            # Leave reporting of invalid graphs to the back-end.
+            _log.warning(f"Skipping optimization of invalid process graph: {e!r}")
+            return graph
+        if len(reference_counts(node)) < len(graph):
+            # Nodes that are not reachable from the result node (e.g. multiple `save_result` outputs)
+            # would be lost when rebuilding the flat graph.
+            _log.info("Skipping optimization of process graph with multiple output nodes")
+            return graph
+        optimized = self.optimize_node(node)
+        return graph if optimized is node else optimized.flat_graph()
+
+
+def get_optimizer(optimize: Union[bool, GraphOptimizer, None]) -> Optional[GraphOptimizer]:
+    """Normalize an "optimize" option (bool or optimizer instance) to an optimizer instance (or None)."""
+    if isinstance(optimize, GraphOptimizer):
+        return optimize
+    if isinstance(optimize, str):
+        optimize = optimize.strip().lower() in {"1", "true", "yes", "on"}
+    return GraphOptimizer() if optimize else None
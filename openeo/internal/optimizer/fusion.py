@@ -0,0 +1,177 @@
+"""
+Rewrite pass to fuse consecutive callback based processes (``apply``, ``apply_dimension``, ``reduce_dimension``)
+into a single one with a composed callback, so that back-ends don't have to materialize intermediate cubes.
+"""
+from typing import Any, Dict, Optional, Set
+
+from openeo.internal.graph_building import PGNode
+from openeo.internal.optimizer.base import (
+    GraphPass, get_callback, get_node, reference_counts, rewrite_graph, with_arguments
+)
+
+# Supported arguments (other arguments, like "context" or "target_dimension", block fusion)
+_ARGUMENTS = {
+    "apply": {"data", "process"},
+    "apply_dimension": {"data", "process", "dimension"},
+    "reduce_dimension": {"data", "reducer", "dimension"},
+}
+
+# Name of callback argument and of the callback parameters
+_CALLBACK_ARGUMENT = {"apply": "process", "apply_dimension": "process", "reduce_dimension": "reducer"}
+_CALLBACK_PARAMETERS = {"apply": {"x", "context"}, "apply_dimension": {"data", "context"},
+                        "reduce_dimension": {"data", "context"}}
+# Callback parameter that holds the input data
+_CALLBACK_INPUT = {"apply": "x", "apply_dimension": "data", "reduce_dimension": "data"}
+
+# Fusable (outer process, inner process) pairs and which one the fused node is based on.
+_FUSIONS = {
+    # Element-wise after element-wise.
+    ("apply", "apply"): "outer",
+    # Reduce an array that is calculated along the same dimension.
+    ("reduce_dimension", "apply_dimension"): "outer",
+    # Element-wise operation on the result of a reducer (e.g. band math result).
+    ("apply", "reduce_dimension"): "inner",
+}
+
+
+def _parameter_references(node: PGNode, seen: Optional[Set[int]] = None) -> Set[str]:
+    """Names of all parameters referenced in graph of given result node (including nested callbacks)."""
+    seen = set() if seen is None else seen
+    names = set()
+
+    def collect(value: Any):
+        node = get_node(value)
+        if node is not None:
+            if id(node) not in seen:
+                seen.add(id(node))
+                collect(node.arguments)
+        elif isinstance(value, dict):
+            if "from_parameter" in value:
+                names.add(value["from_parameter"])
+            elif "process_graph" in value:
+                callback = get_callback(value)
+                if callback is not None:
+                    names.update(_parameter_references(callback, seen=seen))
+            else:
+                for v in value.values():
+                    collect(v)
+        elif isinstance(value, (list, tuple)):
+            for v in value:
+                collect(v)
+
+    collect(node)
+    return names
+
+
+def compose(outer: PGNode, parameter: str, inner: PGNode) -> Optional[PGNode]:
+    """
+    Compose two callbacks (given as result nodes):
+    replace references to given parameter in the outer callback with the result of the inner callback.
+
+    :return: result node of the composed callback, or None if not possible
+        (the parameter is also used in a nested callback of the outer callback).
+    """
+    replacement = {"from_node": inner}
+    rebuilt: Dict[int, PGNode] = {}
+
+    class _NotComposable(Exception):
+        pass
+
+    def substitute(value: Any) -> Any:
+        node = get_node(value)
+        if node is not None:
+            new = substitute_node(node)
+            if isinstance(value, PGNode):
+                return new
+            return value if new is node else {"from_node": new}
+        elif isinstance(value, dict):
+            if value.get("from_parameter") == parameter:
+                return replacement
+            elif "from_parameter" in value:
+                return value
+            elif "process_graph" in value:
+                callback = get_callback(value)
+                if callback is None or parameter in _parameter_references(callback):
+                    raise _NotComposable
+                return value
+            new = {k: substitute(v) for k, v in value.items()}
+            return value if all(new[k] is value[k] for k in value) else new
+        elif isinstance(value, (list, tuple)):
+            new = [substitute(v) for v in value]
+            return value if all(n is v for n, v in zip(new, value)) else type(value)(new)
+        return value
+
+    def substitute_node(node: PGNode) -> PGNode:
+        if id(node) not in rebuilt:
+            rebuilt[id(node)] = with_arguments(node, substitute(node.arguments))
+        return rebuilt[id(node)]
+
+    try:
+        return substitute_node(outer)
+    except _NotComposable:
+        return None
+
+
+class CallbackFusion(GraphPass):
+    """
+    Fuse consecutive callback based processes into a single process with a composed callback:
+
+    - ``apply(apply(data, f), g)`` becomes ``apply(data, g(f(x)))``
+    - ``reduce_dimension(apply_dimension(data, f, dimension=d), g, dimension=d)``
+      becomes ``reduce_dimension(data, g(f(data)), dimension=d)``
+    - ``apply(reduce_dimension(data, f, dimension=d), g)`` becomes ``reduce_dimension(data, g(f(data)), dimension=d)``,
+      e.g. to merge an ``apply`` into the reducer of "band math" (``DataCube.band(...)`` arithmetic).
+
+    Nodes are only fused if the inner one is not used elsewhere in the graph
+    and neither of them has additional arguments like "context" or "target_dimension".
+
+    Note that consecutive ``apply_dimension`` processes are not fused:
+    the dimension labels are reset if the callback changes the number of values,
+    which can not be detected client-side.
+    """
+
+    def run(self, node: PGNode) -> PGNode:
+        counts = reference_counts(node)
+
+        def rewrite(rebuilt: PGNode, original: PGNode) -> Any:
+            inner_original = get_node(original.arguments.get("data"))
+            inner = get_node(rebuilt.arguments.get("data"))
+            if inner is None or counts.get(id(inner_original), [None, 0])[1] != 1:
+                return rebuilt
+            return self.fuse(rebuilt, inner) or rebuilt
+
+        return rewrite_graph(node, rewrite=rewrite)
+
+    @staticmethod
+    def fuse(outer: PGNode, inner: PGNode) -> Optional[PGNode]:
+        """Fuse given outer node with its (inner) data node if possible, or return None."""
+        base = _FUSIONS.get((outer.process_id, inner.process_id))
+        if base is None or outer.namespace is not None or inner.namespace is not None:
+            return None
+        if any(set(n.arguments) != _ARGUMENTS[n.process_id] for n in [outer, inner]):
+            return None
+        if "dimension" in outer.arguments and outer.arguments["dimension"] != inner.arguments["dimension"]:
+            return None
+        outer_callback = get_callback(outer.arguments[_CALLBACK_ARGUMENT[outer.process_id]])
+        inner_callback = get_callback(inner.arguments[_CALLBACK_ARGUMENT[inner.process_id]])
+        if outer_callback is None or inner_callback is None:
+            return None
+
+        fused = outer if base == "outer" else inner
+        # Parameter references should keep their meaning in the fused callback.
+        fused_parameters = _CALLBACK_PARAMETERS[fused.process_id]
+        input_parameter = _CALLBACK_INPUT[outer.process_id]
+        outer_references = _parameter_references(outer_callback) - {input_parameter}
+        inner_references = _parameter_references(inner_callback)
+        if (outer_references & fused_parameters) - _CALLBACK_PARAMETERS[outer.process_id]:
+            return None
+        if (inner_references & fused_parameters) - _CALLBACK_PARAMETERS[inner.process_id]:
+            return None
+
+        composed = compose(outer_callback, parameter=input_parameter, inner=inner_callback)
+        if composed is None:
+            return None
+        arguments = {**fused.arguments, _CALLBACK_ARGUMENT[fused.process_id]: {"process_graph": composed}}
+        if base == "outer":
+            arguments["data"] = inner.arguments["data"]
+        return with_arguments(fused, arguments)
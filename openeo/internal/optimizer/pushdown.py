@@ -0,0 +1,126 @@
+"""
+Rewrite pass to push filter processes (``filter_bbox``, ``filter_temporal``, ``filter_bands``)
+into the originating ``load_collection``, so that back-ends don't have to load more data than necessary.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from openeo.internal.graph_building import PGNode
+from openeo.internal.optimizer.base import GraphPass, get_node, reference_counts, rewrite_graph, with_arguments
+from openeo.util import intersect_bboxes, intersect_temporal_extents
+
+# Processes that work pixel-by-pixel and preserve all dimension labels:
+# a spatial, temporal or band filter can be applied before or after them with the same result.
+_PIXELWISE = {"apply", "mask_polygon", "filter_bbox", "filter_temporal", "filter_bands"}
+
+# Filter process -> processes (along "data" argument) it can be moved through
+_TRANSPARENT = {
+    "filter_bbox": _PIXELWISE,
+    # Processes working on a spatial neighborhood (and resampling) don't care about other timesteps or bands.
+    "filter_temporal": _PIXELWISE | {"apply_kernel", "resample_spatial"},
+    "filter_bands": _PIXELWISE | {"apply_kernel", "resample_spatial"},
+}
+
+
+class FilterPushdown(GraphPass):
+    """
+    Push ``filter_bbox``, ``filter_temporal`` and ``filter_bands`` into the
+    ``spatial_extent``, ``temporal_extent`` and ``bands`` arguments of the ``load_collection`` they originate from,
+    possibly through pixel-wise processes like ``apply`` (e.g. ``filter_bbox(apply(load_collection(...)))``).
+
+    A filter is only pushed down when that does not change the result:
+
+    - the ``load_collection`` node and all intermediate nodes are not used elsewhere in the graph
+    - the filter values are literals (no parameters) that can be merged with the existing ``load_collection``
+      arguments: intersection of bounding boxes in the same CRS and of temporal extents,
+      subset of the already selected bands.
+    """
+
+    def run(self, node: PGNode) -> PGNode:
+        consumers = reference_counts(node)
+
+        # Find filters that can be moved down to a load_collection node
+        candidates: List[Tuple[int, PGNode, PGNode]] = []
+        for n, _ in consumers.values():
+            if n.process_id in _TRANSPARENT and n.namespace is None:
+                source = self._find_source(n, consumers=consumers)
+                if source:
+                    candidates.append((source[1], n, source[0]))
+
+        # Merge filters into load_collection arguments, starting from the ones closest to the load_collection.
+        # Stop at first filter that can not be merged: filters above it can not be moved through it safely.
+        updates: Dict[int, dict] = {}
+        blocked = set()
+        removed = set()
+        for _, filter_node, load_node in sorted(candidates, key=lambda c: c[0]):
+            if id(load_node) in blocked:
+                continue
+            arguments = {**load_node.arguments, **updates.get(id(load_node), {})}
+            update = self._merge(filter_node, arguments)
+            if update is None:
+                blocked.add(id(load_node))
+                continue
+            updates.setdefault(id(load_node), {}).update(update)
+            removed.add(id(filter_node))
+
+        if not updates:
+            return node
+
+        def rewrite(rebuilt: PGNode, original: PGNode) -> Any:
+            if id(original) in removed:
+                return rebuilt.arguments["data"]
+            if id(original) in updates:
+                return with_arguments(rebuilt, {**rebuilt.arguments, **updates[id(original)]})
+            return rebuilt
+
+        return rewrite_graph(node, rewrite=rewrite)
+
+    @staticmethod
+    def _find_source(filter_node: PGNode, consumers: Dict[int, list]) -> Optional[Tuple[PGNode, int]]:
+        """Find load_collection node (and its distance) that filter node can be pushed into."""
+        transparent = _TRANSPARENT[filter_node.process_id]
+        distance = 1
+        node = get_node(filter_node.arguments.get("data"))
+        while node is not None and consumers[id(node)][1] == 1 and node.namespace is None:
+            if node.process_id == "load_collection":
+                return node, distance
+            if node.process_id not in transparent:
+                break
+            node = get_node(node.arguments.get("data"))
+            distance += 1
+        return None
+
+    @staticmethod
+    def _merge(filter_node: PGNode, arguments: dict) -> Optional[dict]:
+        """Get load_collection argument updates to apply given filter, or None if not possible."""
+        filter_arguments = filter_node.arguments
+        if filter_node.process_id == "filter_bbox":
+            if set(filter_arguments) != {"data", "extent"}:
+                return None
+            extent = filter_arguments["extent"]
+            current = arguments.get("spatial_extent")
+            try:
+                spatial_extent = intersect_bboxes(current or extent, extent)
+            except ValueError:
+                return None
+            return None if spatial_extent is None else {"spatial_extent": dict(spatial_extent)}
+        elif filter_node.process_id == "filter_temporal":
+            if set(filter_arguments) != {"data", "extent"}:
+                return None
+            extent = filter_arguments["extent"]
+            current = arguments.get("temporal_extent")
+            try:
+                temporal_extent = intersect_temporal_extents(current or [None, None], extent)
+            except ValueError:
+                return None
+            return None if temporal_extent is None else {"temporal_extent": temporal_extent}
+        elif filter_node.process_id == "filter_bands":
+            bands = filter_arguments.get("bands")
+            if set(filter_arguments) != {"data", "bands"} or not isinstance(bands, list):
+                return None
+            if not bands or not all(isinstance(b, str) for b in bands):
+                return None
+            current = arguments.get("bands")
+            if current is not None and not (isinstance(current, list) and set(bands).issubset(current)):
+                return None
+            return {"bands": list(bands)}
+        return None
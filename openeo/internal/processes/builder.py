@@ -1,6 +1,10 @@
+import functools
 import inspect
 import logging
-from typing import Union, Callable, List, Optional, Any
+import threading
+import types
+import weakref
+from typing import Union, Callable, List, Optional, Any, Dict, Tuple
 
 from openeo.internal.graph_building import PGNode, _FromNodeMixin
 from openeo.rest import OpenEoClientException
@@ -70,6 +74,86 @@ def get_parameter_names(process: Callable) -> List[str]:
     ]
 
 
+# Types of values that can not change in place (as far as callback evaluation is concerned).
+# Note that modules and classes are not included: their attributes (e.g. configuration values) can be reassigned.
+_IMMUTABLE_TYPES = (
+    type(None), bool, int, float, complex, str, bytes, range,
+    types.BuiltinFunctionType,
+)
+
+
+def _is_openeo_api(value: Any) -> bool:
+    """Is given value a module or class of the openeo package itself (e.g. `openeo.processes`)?"""
+    if isinstance(value, types.ModuleType):
+        name = value.__name__
+    elif isinstance(value, type):
+        name = value.__module__
+    else:
+        return False
+    return name == "openeo" or name.startswith("openeo.")
+
+# Cache of converted callbacks: callable -> {parent parameters: (referenced values, result node)}
+_callback_cache: "weakref.WeakKeyDictionary[Callable, Dict[Optional[tuple], Tuple[tuple, PGNode]]]" = (
+    weakref.WeakKeyDictionary()
+)
+_callback_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1024)
+def _code_names(code: types.CodeType) -> Tuple[str, ...]:
+    """Global (or attribute) names used in given code object, including nested functions, lambdas, comprehensions."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.update(_code_names(const))
+    return tuple(sorted(names))
+
+
+def _referenced_values(callback: Callable, _seen: Optional[set] = None) -> Optional[tuple]:
+    """
+    Get the values a plain Python function refers to outside of its arguments
+    (closure variables, globals and default argument values, recursively for referenced functions),
+    or None when one of these could change in place (e.g. a list or a data cube),
+    or when given callable is not a plain function.
+
+    As long as these values are the same objects, evaluating the function with the same arguments
+    gives the same result.
+    """
+    if not isinstance(callback, types.FunctionType):
+        return None
+    seen = set() if _seen is None else _seen
+    if id(callback) in seen:
+        return ()
+    seen.add(id(callback))
+
+    try:
+        values = [c.cell_contents for c in callback.__closure__ or ()]
+    except ValueError:
+        # Empty cell
+        return None
+    values.extend(callback.__defaults__ or ())
+    values.extend((callback.__kwdefaults__ or {}).values())
+    namespace = callback.__globals__
+    values.extend(namespace[n] for n in _code_names(callback.__code__) if n in namespace)
+
+    referenced = []
+    stack = list(values)
+    while stack:
+        value = stack.pop()
+        if isinstance(value, tuple):
+            stack.extend(value)
+            continue
+        if isinstance(value, types.FunctionType):
+            nested = _referenced_values(value, _seen=seen)
+            if nested is None:
+                return None
+            referenced.extend(nested)
+        elif not isinstance(value, _IMMUTABLE_TYPES) and not _is_openeo_api(value):
+            return None
+        referenced.append(value)
+    return tuple(referenced)
+
+
 def convert_callable_to_pgnode(callback: Callable, parent_parameters: Optional[List[str]] = None) -> PGNode:
     """
     Convert given process callback to a PGNode.
@@ -79,7 +163,27 @@ def convert_callable_to_pgnode(callback: Callable, parent_parameters: Optional[L
         >>> result.flat_graph()
         {"add1": {"process_id": "add", "arguments": {"x": {"from_parameter": "x"}, "y": 5}, "result": True}}
 
+    Conversion results of plain functions (e.g. lambdas) that only refer to immutable values
+    are cached per callable and parent parameters:
+    the returned (shared) node should not be modified in place.
     """
+    key = None if parent_parameters is None else tuple(parent_parameters)
+    referenced = _referenced_values(callback)
+    if referenced is None:
+        return _convert_callable_to_pgnode(callback=callback, parent_parameters=parent_parameters)
+
+    with _callback_cache_lock:
+        cached = _callback_cache.get(callback, {}).get(key)
+    if cached and len(cached[0]) == len(referenced) and all(a is b for a, b in zip(cached[0], referenced)):
+        return cached[1]
+
+    pgnode = _convert_callable_to_pgnode(callback=callback, parent_parameters=parent_parameters)
+    with _callback_cache_lock:
+        _callback_cache.setdefault(callback, {})[key] = (referenced, pgnode)
+    return pgnode
+
+
+def _convert_callable_to_pgnode(callback: Callable, parent_parameters: Optional[List[str]] = None) -> PGNode:
     # TODO: eliminate local import (due to circular dependency)?
     from openeo.processes import ProcessBuilder
 
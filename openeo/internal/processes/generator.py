@@ -105,85 +105,104 @@ def collect_processes(sources: List[Union[Path, str]]) -> List[Process]:
     return processes
 
 
+# Operator overloading and other "magic" of the `ProcessBuilder` class (shared by all generator modes)
+_PROCESS_BUILDER_BODY = """
+    _ITERATION_LIMIT = 100
+
+    def __add__(self, other) -> 'ProcessBuilder':
+        return self.add(other)
+
+    def __radd__(self, other) -> 'ProcessBuilder':
+        return add(other, self)
+
+    def __sub__(self, other) -> 'ProcessBuilder':
+        return self.subtract(other)
+
+    def __rsub__(self, other) -> 'ProcessBuilder':
+        return subtract(other, self)
+
+    def __mul__(self, other) -> 'ProcessBuilder':
+        return self.multiply(other)
+
+    def __rmul__(self, other) -> 'ProcessBuilder':
+        return multiply(other, self)
+
+    def __truediv__(self, other) -> 'ProcessBuilder':
+        return self.divide(other)
+
+    def __rtruediv__(self, other) -> 'ProcessBuilder':
+        return divide(other, self)
+
+    def __neg__(self) -> 'ProcessBuilder':
+        return self.multiply(-1)
+
+    def __pow__(self, other) -> 'ProcessBuilder':
+        return self.power(other)
+
+    def __getitem__(self, key) -> 'ProcessBuilder':
+        if isinstance(key, builtins.int):
+            if key > self._ITERATION_LIMIT:
+                raise RuntimeError(
+                    "Exceeded ProcessBuilder iteration limit. "
+                    "Are you mistakenly using a Python builtin like `sum()` or `all()` in a callback "
+                    "instead of the appropriate helpers from the `openeo.processes` module?"
+                )
+            return self.array_element(index=key)
+        else:
+            return self.array_element(label=key)
+
+    def __eq__(self, other) -> 'ProcessBuilder':
+        return eq(self, other)
+
+    def __ne__(self, other) -> 'ProcessBuilder':
+        return neq(self, other)
+
+    def __lt__(self, other) -> 'ProcessBuilder':
+        return lt(self, other)
+
+    def __le__(self, other) -> 'ProcessBuilder':
+        return lte(self, other)
+
+    def __ge__(self, other) -> 'ProcessBuilder':
+        return gte(self, other)
+
+    def __gt__(self, other) -> 'ProcessBuilder':
+        return gt(self, other)
+
+"""
+
+_PROCESS_SHORTCUTS = """
+# Public shortcut
+process = ProcessBuilder.process
+# Private shortcut that has lower chance to collide with a process argument named `process`
+_process = ProcessBuilder.process
+"""
+
+# Processes used in the `ProcessBuilder` operator overloading
+_OPERATOR_PROCESSES = ["add", "subtract", "multiply", "divide", "eq", "neq", "lt", "lte", "gt", "gte"]
+
+
+def _write_header(output, argv=None):
+    output.write(textwrap.dedent("""
+        # Do not edit this file directly.
+        # It is automatically generated.
+    """))
+    if argv:
+        output.write(textwrap.dedent("""\
+            # Used command line arguments:
+            #    {cli}
+        """.format(cli=" ".join(argv))))
+
+
 def generate_process_py(processes: List[Process], output=sys.stdout, argv=None):
     oo_src = textwrap.dedent("""
         import builtins
         from openeo.internal.processes.builder import ProcessBuilderBase, UNSET
-        
-        
+
+
         class ProcessBuilder(ProcessBuilderBase):
-        
-            _ITERATION_LIMIT = 100
-
-            def __add__(self, other) -> 'ProcessBuilder':
-                return self.add(other)
-
-            def __radd__(self, other) -> 'ProcessBuilder':
-                return add(other, self)
-
-            def __sub__(self, other) -> 'ProcessBuilder':
-                return self.subtract(other)
-
-            def __rsub__(self, other) -> 'ProcessBuilder':
-                return subtract(other, self)
-            
-            def __mul__(self, other) -> 'ProcessBuilder':
-                return self.multiply(other)
-
-            def __rmul__(self, other) -> 'ProcessBuilder':
-                return multiply(other, self)
-
-            def __truediv__(self, other) -> 'ProcessBuilder':
-                return self.divide(other)
-
-            def __rtruediv__(self, other) -> 'ProcessBuilder':
-                return divide(other, self)
-
-            def __neg__(self) -> 'ProcessBuilder':
-                return self.multiply(-1)
-
-            def __pow__(self, other) -> 'ProcessBuilder':
-                return self.power(other)
-
-            def __getitem__(self, key) -> 'ProcessBuilder':
-                if isinstance(key, builtins.int):
-                    if key > self._ITERATION_LIMIT:
-                        raise RuntimeError(
-                            "Exceeded ProcessBuilder iteration limit. "
-                            "Are you mistakenly using a Python builtin like `sum()` or `all()` in a callback "
-                            "instead of the appropriate helpers from the `openeo.processes` module?"
-                        )
-                    return self.array_element(index=key)
-                else:
-                    return self.array_element(label=key)
-
-            def __eq__(self, other) -> 'ProcessBuilder':
-                return eq(self, other)
-
-            def __ne__(self, other) -> 'ProcessBuilder':
-                return neq(self, other)
-
-            def __lt__(self, other) -> 'ProcessBuilder':
-                return lt(self, other)
-
-            def __le__(self, other) -> 'ProcessBuilder':
-                return lte(self, other)
-
-            def __ge__(self, other) -> 'ProcessBuilder':
-                return gte(self, other)
-
-            def __gt__(self, other) -> 'ProcessBuilder':
-                return gt(self, other)
-
-    """)
-    fun_src = textwrap.dedent("""
-        # Public shortcut
-        process = ProcessBuilder.process
-        # Private shortcut that has lower chance to collide with a process argument named `process`
-        _process = ProcessBuilder.process
-        
-        
-    """)
+    """) + _PROCESS_BUILDER_BODY
+    fun_src = _PROCESS_SHORTCUTS + "\n\n"
     fun_renderer = PythonRenderer(
         body_template="return _process({id!r}, {args})",
         optional_default="UNSET",
@@ -198,22 +217,87 @@ def generate_process_py(processes: List[Process], output=sys.stdout, argv=None):
     for p in processes:
         fun_src += fun_renderer.render_process(p) + "\n\n\n"
         oo_src += oo_renderer.render_process(p) + "\n\n"
-    output.write(textwrap.dedent("""
-        # Do not edit this file directly.
-        # It is automatically generated.
-    """))
-    if argv:
-        output.write(textwrap.dedent("""\
-            # Used command line arguments:
-            #    {cli}
-        """.format(cli=" ".join(argv))))
+    _write_header(output, argv=argv)
     output.write(oo_src)
     output.write(fun_src)
 
 
+def render_process_spec(process: Process, indent: str = "    ") -> str:
+    """Render process as compact spec tuple (see `openeo.internal.processes.table.ProcessSpec`)"""
+    params = []
+    for param in process.parameters:
+        if param.optional:
+            default = ", UNSET"
+        elif param.has_default():
+            default = ", {d!r}".format(d=param.default)
+        else:
+            default = ""
+        params.append("({n!r}, {d!r}{default}),".format(n=param.name, d=param.description, default=default))
+    lines = [
+        "(",
+        indent + "{id!r},".format(id=process.id),
+        indent + "{s!r},".format(s=process.summary),
+        indent + "(" + "".join("\n" + indent * 2 + p for p in params) + ("\n" + indent if params else "") + "),",
+        indent + "{r!r},".format(r=process.returns.description),
+        "),",
+    ]
+    return "\n".join(lines)
+
+
+def generate_process_table_py(processes: List[Process], output=sys.stdout, argv=None):
+    """
+    Generate compact variant of the `processes.py` module:
+    a table of process specs from which the process functions and `ProcessBuilder` methods
+    are created lazily on first access (instead of defining them all explicitly).
+    """
+    src = textwrap.dedent("""
+        import builtins
+        import sys
+
+        from openeo.internal.processes.builder import ProcessBuilderBase, UNSET
+        from openeo.internal.processes.table import ProcessTable, LazyProcessMethods
+
+
+        class ProcessBuilder(ProcessBuilderBase, LazyProcessMethods):
+    """) + _PROCESS_BUILDER_BODY + _PROCESS_SHORTCUTS
+    src += "\n\n# Process specs: (process id, summary, ((parameter name, description[, default]), ...), return description)\n"
+    src += "_PROCESSES = (\n"
+    src += "".join(textwrap.indent(render_process_spec(p), prefix="    ") + "\n" for p in processes)
+    src += ")\n"
+    src += textwrap.dedent("""
+        _table = ProcessTable(_PROCESSES, process=_process, module=__name__, return_annotation=ProcessBuilder)
+        ProcessBuilder._process_table = _table
+
+        # Process functions that are used directly in `ProcessBuilder` (operator overloading).
+        {operators} = map(_table.get_function, {operator_names!r})
+
+        __all__ = ["ProcessBuilder", "process"] + _table.names()
+
+
+        def __getattr__(name: str):
+            if name not in _table:
+                raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+            # Cache as regular module attribute to avoid `__getattr__` overhead on next access.
+            function = globals()[name] = _table.get_function(name)
+            return function
+
+
+        def __dir__():
+            return sorted(set(globals()) | set(_table.names()))
+
+
+        if sys.version_info < (3, 7):
+            # No support for module level `__getattr__` (PEP 562): fall back on eager function creation.
+            for _name in _table.names():
+                globals()[_name] = _table.get_function(_name)
+    """).format(operators=", ".join(_OPERATOR_PROCESSES), operator_names=tuple(_OPERATOR_PROCESSES))
+    _write_header(output, argv=argv)
+    output.write(src)
+
+
 def main():
     # Usage example (from project root, assuming the `openeo-process` repo is checked out as well):
-    #     python openeo/internal/processes/generator.py  ../openeo-processes  --output openeo/processes.py
+    #     python openeo/internal/processes/generator.py  ../openeo-processes  --mode table --output openeo/processes.py
 
     argv = sys.argv
     arg_parser = argparse.ArgumentParser()
@@ -221,6 +305,10 @@ def main():
         "source", nargs="+",
         help="""Source directories or files containing openEO process definitions in JSON format""")
     arg_parser.add_argument("--output", help="Path to output 'processes.py' file")
+    arg_parser.add_argument(
+        "--mode", choices=["functions", "table"], default="functions",
+        help="Generate explicit function/method definitions or a compact process spec table (lazy loading)"
+    )
 
     arguments = arg_parser.parse_args(argv[1:])
     sources = arguments.source
@@ -228,7 +316,8 @@ def main():
 
     processes = collect_processes(sources)
     with (open(output, "w", encoding="utf-8") if output else sys.stdout) as f:
-        generate_process_py(processes, output=f, argv=argv)
+        generate = {"functions": generate_process_py, "table": generate_process_table_py}[arguments.mode]
+        generate(processes, output=f, argv=argv)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,118 @@
+"""
+Client side registry of process metadata (as listed by a back-end),
+indexed for fast lookup by (namespace, process id).
+"""
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+from openeo.rest import OpenEoClientException, OpenEoApiError
+from openeo.util import LazyLoadCache
+
+_log = logging.getLogger(__name__)
+
+
+class ProcessNotFoundException(OpenEoClientException):
+    """Process is not listed/available in the requested namespace."""
+    pass
+
+
+class ProcessRegistry:
+    """
+    Index of process metadata, keyed on ``(namespace, process_id)``.
+
+    Process listings are loaded lazily (per namespace) with the ``load_listing`` callable.
+    Namespaced processes that are not covered by an already loaded listing can also be
+    fetched individually with the (optional) ``load_process`` callable,
+    which avoids downloading the whole namespace listing to just describe a single process.
+
+    Failures to load are not cached.
+
+    :param load_listing: callable ``(namespace) -> list of process dicts``,
+        where namespace ``None`` is the back-end's set of predefined processes.
+    :param load_process: (optional) callable ``(namespace, process_id) -> process dict``
+        to fetch a single process from a (non-``None``) namespace.
+    """
+
+    def __init__(
+            self,
+            load_listing: Callable[[Optional[str]], List[dict]],
+            load_process: Optional[Callable[[str, str], dict]] = None,
+    ):
+        self._load_listing = load_listing
+        self._load_process = load_process
+        self._listings = LazyLoadCache()
+        self._index: Dict[Tuple[Optional[str], str], dict] = {}
+
+    def _listing_key(self, namespace: Optional[str]) -> tuple:
+        return ("processes", "backend" if namespace is None else namespace)
+
+    def _index_listing(self, namespace: Optional[str]) -> List[dict]:
+        processes = self._load_listing(namespace)
+        for process in processes:
+            if "id" in process:
+                self._index[(namespace, process["id"])] = process
+        return processes
+
+    def list_processes(self, namespace: Optional[str] = None) -> List[dict]:
+        """List all processes of given namespace (``None``: predefined back-end processes)."""
+        return self._listings.get(
+            key=self._listing_key(namespace), load=lambda: self._index_listing(namespace)
+        )
+
+    def _has_listing(self, namespace: Optional[str]) -> bool:
+        return self._listing_key(namespace) in self._listings
+
+    def get_process(self, process_id: str, namespace: Optional[str] = None) -> dict:
+        """
+        Get metadata of a single process.
+
+        :param process_id: the id of the process
+        :param namespace: the namespace of the process (``None``: predefined back-end processes)
+        :return: process metadata dictionary
+        """
+        key = (namespace, process_id)
+        if key in self._index:
+            return self._index[key]
+
+        if namespace is not None and self._load_process is not None and not self._has_listing(namespace):
+            try:
+                process = self._load_process(namespace, process_id)
+            except OpenEoApiError as e:
+                if e.http_status_code not in (400, 404):
+                    raise
+                _log.debug(f"Failed to fetch {process_id!r} from namespace {namespace!r}: {e!r}")
+            else:
+                self._index[key] = process
+                return process
+
+        if not self._has_listing(namespace):
+            self.list_processes(namespace=namespace)
+        if key in self._index:
+            return self._index[key]
+        raise ProcessNotFoundException(
+            f"Process does not exist: {process_id!r}" + (f" (namespace {namespace!r})" if namespace else "")
+        )
+
+    def has_process(self, process_id: str, namespace: Optional[str] = None) -> bool:
+        """Check whether given process is available."""
+        try:
+            self.get_process(process_id=process_id, namespace=namespace)
+            return True
+        except ProcessNotFoundException:
+            return False
+
+    def get_parameters(self, process_id: str, namespace: Optional[str] = None) -> List[dict]:
+        """Get the parameter definitions (list of dicts with "name", "schema", ...) of a process."""
+        return self.get_process(process_id=process_id, namespace=namespace).get("parameters", [])
+
+    def get_parameter_schemas(self, process_id: str, namespace: Optional[str] = None) -> Dict[str, dict]:
+        """Get mapping of parameter name to its JSON schema."""
+        return {
+            p["name"]: p.get("schema", {})
+            for p in self.get_parameters(process_id=process_id, namespace=namespace)
+        }
+
+    def clear(self):
+        """Clear all cached listings and process metadata."""
+        self._listings.clear()
+        self._index.clear()
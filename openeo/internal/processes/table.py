@@ -0,0 +1,229 @@
+"""
+Compact, table based representation of openEO processes,
+from which Python functions (and builder methods) are created lazily on first use.
+"""
+import abc
+import keyword
+import textwrap
+import threading
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Tuple, Union
+
+from openeo.internal.processes.builder import UNSET
+
+
+def safe_name(name: str) -> str:
+    """Python-safe variant of given process (or parameter) name (e.g. "and" -> "and_")."""
+    if keyword.iskeyword(name):
+        name += "_"
+    return name
+
+
+class ProcessSpec(NamedTuple):
+    """
+    Compact process description: just enough to build a Python function with proper signature and docstring.
+
+    Parameters are tuples ``(name, description)`` or ``(name, description, default)``,
+    where default ``UNSET`` means the parameter is optional.
+    """
+    id: str
+    summary: str
+    parameters: Tuple[tuple, ...]
+    returns: str
+
+    @classmethod
+    def from_metadata(cls, data: dict) -> "ProcessSpec":
+        """Build from openEO process metadata (e.g. as listed by ``Connection.list_processes()``)."""
+        parameters = []
+        for p in data.get("parameters", []):
+            param = (p["name"], p.get("description", ""))
+            if p.get("optional", False):
+                param += (UNSET,)
+            elif "default" in p:
+                param += (p["default"],)
+            parameters.append(param)
+        return cls(
+            id=data["id"],
+            summary=data.get("summary") or data.get("description", ""),
+            parameters=tuple(parameters),
+            returns=data.get("returns", {}).get("description", ""),
+        )
+
+    def python_name(self) -> str:
+        return safe_name(self.id)
+
+    def arg_names(self, oo_mode: bool = False) -> List[str]:
+        """Names of the arguments in the Python function (or method in ``oo_mode``)."""
+        arg_names = [safe_name(p[0]) for p in self.parameters]
+        if oo_mode:
+            arg_names = ["self"] + arg_names[1:]
+        return arg_names
+
+    def render_docstring(self, oo_mode: bool = False, width: int = 100) -> str:
+        doc = "\n\n".join(textwrap.fill(d, width=width) for d in self.summary.split("\n\n"))
+        params = [
+            textwrap.fill(f":param {arg}: {p[1]}", width=width, subsequent_indent="    ")
+            for arg, p in zip(self.arg_names(oo_mode=oo_mode), self.parameters)
+        ]
+        returns = textwrap.fill(f":return: {self.returns}", width=width, subsequent_indent="    ")
+        return doc + "\n\n" + "\n".join(params + ["", returns]).strip()
+
+
+def build_function(
+        spec: ProcessSpec, process: Callable, oo_mode: bool = False,
+        module: str = None, qualname_prefix: str = "", return_annotation: Any = None,
+) -> Callable:
+    """
+    Build Python function (with introspectable signature) that calls given ``process`` callable
+    (e.g. ``ProcessBuilder.process``) with the process id and arguments.
+
+    :param spec: process spec
+    :param process: callable to invoke as ``process(process_id, **arguments)``
+    :param oo_mode: build a method (first argument renamed to ``self``)
+    :param module: value to use for ``__module__``
+    :param qualname_prefix: prefix for ``__qualname__`` (e.g. class name)
+    :param return_annotation: optional return type annotation
+    """
+    name = spec.python_name()
+    par_names = [safe_name(p[0]) for p in spec.parameters]
+    arg_names = spec.arg_names(oo_mode=oo_mode)
+    namespace = {"_process": process}
+    args = []
+    for i, (arg, param) in enumerate(zip(arg_names, spec.parameters)):
+        if len(param) > 2:
+            namespace[f"_default{i}"] = param[2]
+            args.append(f"{arg}=_default{i}")
+        else:
+            args.append(arg)
+    if oo_mode and not args:
+        args.append("self")
+    call_args = ", ".join(f"{p}={a}" for p, a in zip(par_names, arg_names))
+    src = f"def {name}({', '.join(args)}):\n    return _process({spec.id!r}, {call_args})\n"
+    exec(src, namespace)
+    function = namespace[name]
+    function.__doc__ = spec.render_docstring(oo_mode=oo_mode)
+    function.__qualname__ = qualname_prefix + name
+    if module:
+        function.__module__ = module
+    if return_annotation is not None:
+        function.__annotations__["return"] = return_annotation
+    return function
+
+
+class ProcessTable:
+    """
+    Table of process specs (keyed on Python name),
+    with lazy (and cached) creation of the corresponding functions and methods.
+
+    :param specs: process specs (:py:class:`ProcessSpec` or plain tuples with the same fields)
+    :param process: callable to invoke as ``process(process_id, **arguments)``
+    :param module: module name to assign to the created functions
+    :param class_name: class name to use in the ``__qualname__`` of the created methods
+    :param return_annotation: return type annotation of the created functions/methods
+    """
+
+    def __init__(
+            self, specs: Iterable[Union[ProcessSpec, tuple]], process: Callable,
+            module: str = None, class_name: str = "ProcessBuilder", return_annotation: Any = None,
+    ):
+        self._specs: Dict[str, ProcessSpec] = {}
+        self._process = process
+        self._module = module
+        self._class_name = class_name
+        self._return_annotation = return_annotation
+        self._functions: Dict[str, Callable] = {}
+        self._methods: Dict[str, Callable] = {}
+        self._lock = threading.Lock()
+        self.add(specs)
+
+    def add(self, specs: Iterable[Union[ProcessSpec, tuple]]):
+        """Add (or override) process specs."""
+        with self._lock:
+            for spec in specs:
+                if not isinstance(spec, ProcessSpec):
+                    spec = ProcessSpec(*spec)
+                name = spec.python_name()
+                self._specs[name] = spec
+                self._functions.pop(name, None)
+                self._methods.pop(name, None)
+
+    def add_from_metadata(self, processes: Iterable[dict]):
+        """Add process specs from openEO process metadata (e.g. from ``Connection.list_processes()``)."""
+        self.add(
+            ProcessSpec.from_metadata(p)
+            for p in processes
+            if p.get("id", "").isidentifier() and all(q["name"].isidentifier() for q in p.get("parameters", []))
+        )
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def names(self) -> List[str]:
+        """Python names of all processes in the table."""
+        return list(self._specs.keys())
+
+    def get_spec(self, name: str) -> ProcessSpec:
+        return self._specs[name]
+
+    def _get(self, cache: Dict[str, Callable], name: str, oo_mode: bool) -> Callable:
+        with self._lock:
+            if name not in cache:
+                cache[name] = build_function(
+                    spec=self._specs[name], process=self._process, oo_mode=oo_mode,
+                    module=self._module, qualname_prefix=self._class_name + "." if oo_mode else "",
+                    return_annotation=self._return_annotation,
+                )
+            return cache[name]
+
+    def get_function(self, name: str) -> Callable:
+        """Get function for process with given Python name (``KeyError`` if unknown)."""
+        return self._get(self._functions, name, oo_mode=False)
+
+    def get_method(self, name: str) -> Callable:
+        """Get (unbound) method for process with given Python name (``KeyError`` if unknown)."""
+        return self._get(self._methods, name, oo_mode=True)
+
+
+def _find_process_table(cls: type) -> Union[ProcessTable, None]:
+    for klass in cls.__mro__:
+        if "_process_table" in klass.__dict__:
+            return klass.__dict__["_process_table"]
+    return None
+
+
+def _resolve_method(cls: type, name: str) -> Callable:
+    table = _find_process_table(cls)
+    if name.startswith("_") or table is None or name not in table:
+        raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}")
+    method = table.get_method(name)
+    # Cache as regular class attribute, to avoid the lookup overhead on next access.
+    setattr(cls, name, method)
+    return method
+
+
+class LazyProcessMethodsMeta(abc.ABCMeta):
+    """Metaclass to resolve process methods (from ``_process_table`` class attribute) on class level access."""
+
+    def __getattr__(cls, name: str):
+        return _resolve_method(cls, name)
+
+    def __dir__(cls):
+        table = _find_process_table(cls)
+        return sorted(set(super().__dir__()) | set(table.names() if table else []))
+
+
+class LazyProcessMethods(metaclass=LazyProcessMethodsMeta):
+    """
+    Mixin for classes that get process methods lazily from a :py:class:`ProcessTable`
+    set as ``_process_table`` class attribute.
+    """
+
+    _process_table: ProcessTable = None
+
+    def __getattr__(self, name: str):
+        return _resolve_method(type(self), name).__get__(self, type(self))
+
+    def __dir__(self):
+        return dir(type(self)) + list(self.__dict__.keys())
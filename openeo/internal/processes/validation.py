@@ -0,0 +1,245 @@
+"""
+Client-side ("offline") validation of flat process graphs
+against process metadata (as listed by a back-end), without a round trip to the ``/validation`` endpoint.
+"""
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
+from openeo.internal.processes.registry import ProcessNotFoundException
+
+# Mapping of JSON schema types to Python types (note: `bool` is handled separately, because it's a subclass of `int`)
+_JSON_SCHEMA_TYPES = {
+    "string": (str,),
+    "number": (int, float),
+    "integer": (int,),
+    "boolean": (bool,),
+    "array": (list, tuple),
+    "object": (dict,),
+    "null": (type(None),),
+}
+
+# Argument (dict) values that are references, resolved at process graph evaluation time
+_REFERENCE_KEYS = ("from_node", "from_parameter", "process_graph")
+
+
+class _ParameterSpec(NamedTuple):
+    required: bool
+    schema: Union[dict, list]
+
+
+class _ProcessSignature(NamedTuple):
+    parameters: Dict[str, _ParameterSpec]
+
+    @classmethod
+    def from_metadata(cls, process: dict) -> "_ProcessSignature":
+        return cls(parameters={
+            p["name"]: _ParameterSpec(
+                required=not p.get("optional", False) and "default" not in p,
+                schema=p.get("schema", {}),
+            )
+            for p in process.get("parameters", [])
+        })
+
+
+def _schemas(schema: Union[dict, list]) -> List[dict]:
+    """Flatten (list/anyOf/oneOf) schema alternatives to list of plain schemas."""
+    if isinstance(schema, list):
+        return [s for alternative in schema for s in _schemas(alternative)]
+    if isinstance(schema, dict):
+        for key in ("anyOf", "oneOf"):
+            if key in schema:
+                return [s for alternative in schema[key] for s in _schemas(alternative)]
+        return [schema]
+    return []
+
+
+def _type_matches(value, json_type: str) -> bool:
+    if json_type not in _JSON_SCHEMA_TYPES:
+        # Unknown type: be permissive
+        return True
+    if isinstance(value, bool) and json_type != "boolean":
+        return False
+    return isinstance(value, _JSON_SCHEMA_TYPES[json_type])
+
+
+def _value_matches_schema(value, schema: Union[dict, list]) -> bool:
+    """Basic JSON schema "type" check (other schema constraints are not checked)."""
+    alternatives = _schemas(schema)
+    if not alternatives:
+        return True
+    for s in alternatives:
+        types = s.get("type")
+        if types is None:
+            return True
+        if isinstance(types, str):
+            types = [types]
+        if any(_type_matches(value, t) for t in types):
+            return True
+    return False
+
+
+def _callback_parameters(schema: Union[dict, list]) -> Optional[Set[str]]:
+    """Get names of the parameters a callback ("process-graph" subtype schema) gets."""
+    names = None
+    for s in _schemas(schema):
+        if s.get("subtype") == "process-graph" and "parameters" in s:
+            names = (names or set()) | set(p["name"] for p in s["parameters"])
+    return names
+
+
+class ProcessGraphValidator:
+    """
+    Offline validator of flat process graphs against process metadata,
+    for example from a :py:class:`~openeo.internal.processes.registry.ProcessRegistry`.
+
+    Checks:
+
+    - all nodes have a process id and there is exactly one result node
+    - processes are known (``ProcessUnsupported``)
+    - all required arguments are given (``ProcessArgumentRequired``)
+    - no unknown arguments are given (``ProcessArgumentUnsupported``)
+    - literal argument values match the JSON schema type (``ProcessArgumentInvalid``)
+    - "from_node" references point to existing nodes (``ProcessGraphInvalid``)
+    - "from_parameter" references are defined (``ProcessParameterUndefined``),
+      if the available parameters are known
+    - callbacks ("process_graph" arguments) recursively
+
+    Process metadata lookups are cached, so that validating (a lot of) graphs
+    only costs a fraction of a millisecond per node once the process listing is loaded.
+
+    :param get_process: callable ``(process_id, namespace) -> process metadata dict``
+        that raises :py:class:`~openeo.internal.processes.registry.ProcessNotFoundException` for unknown processes.
+    """
+
+    def __init__(self, get_process: Callable[[str, Optional[str]], dict]):
+        self._get_process = get_process
+        self._signatures: Dict[Tuple[Optional[str], str], Tuple[dict, _ProcessSignature]] = {}
+
+    def _get_signature(self, process_id: str, namespace: Optional[str]) -> _ProcessSignature:
+        process = self._get_process(process_id, namespace)
+        key = (namespace, process_id)
+        cached = self._signatures.get(key)
+        if cached is None or cached[0] is not process:
+            cached = self._signatures[key] = (process, _ProcessSignature.from_metadata(process))
+        return cached[1]
+
+    def validate(self, process_graph: dict, parameters: Optional[Iterable[str]] = None) -> List[dict]:
+        """
+        Validate given process graph.
+
+        :param process_graph: flat process graph dictionary,
+            or a (user-defined) process dictionary with "process_graph" (and "parameters") fields
+        :param parameters: names of the parameters that the process graph can use (with "from_parameter").
+            If not given (and not specified in the process dictionary), parameter references are not checked.
+        :return: list of errors (dictionaries with "code" and "message" fields), empty if valid.
+        """
+        if "process_graph" in process_graph and isinstance(process_graph["process_graph"], dict):
+            if parameters is None and "parameters" in process_graph:
+                parameters = [p["name"] for p in process_graph["parameters"] or []]
+            process_graph = process_graph["process_graph"]
+        errors = []
+        self._validate_graph(
+            process_graph, parameters=None if parameters is None else set(parameters), errors=errors, path=""
+        )
+        return errors
+
+    def _validate_graph(self, flat_graph: dict, parameters: Optional[Set[str]], errors: List[dict], path: str):
+        if not isinstance(flat_graph, dict) or not flat_graph:
+            errors.append({"code": "ProcessGraphInvalid", "message": f"Invalid or empty process graph{path}."})
+            return
+        result_nodes = [node_id for node_id, node in flat_graph.items() if node.get("result")]
+        if len(result_nodes) != 1:
+            errors.append({
+                "code": "ProcessGraphInvalid",
+                "message": f"Process graph{path} should have exactly one result node, but found {len(result_nodes)}.",
+            })
+        for node_id, node in flat_graph.items():
+            self._validate_node(node_id, node, flat_graph, parameters=parameters, errors=errors, path=path)
+
+    def _validate_node(
+            self, node_id: str, node: dict, flat_graph: dict, parameters: Optional[Set[str]], errors: List[dict],
+            path: str
+    ):
+        where = f"node {node_id!r}{path}"
+        process_id = node.get("process_id")
+        if not process_id:
+            errors.append({"code": "ProcessGraphInvalid", "message": f"Missing process id in {where}."})
+            return
+        namespace = node.get("namespace")
+        arguments = node.get("arguments", {})
+
+        try:
+            signature = self._get_signature(process_id, namespace)
+        except ProcessNotFoundException:
+            errors.append({
+                "code": "ProcessUnsupported",
+                "message": f"Process {process_id!r}" + (f" (namespace {namespace!r})" if namespace else "")
+                           + f" is not supported ({where}).",
+            })
+            signature = None
+
+        if signature:
+            for name, spec in signature.parameters.items():
+                if spec.required and name not in arguments:
+                    errors.append({
+                        "code": "ProcessArgumentRequired",
+                        "message": f"Process {process_id!r} parameter {name!r} is required ({where}).",
+                    })
+            for name in arguments:
+                if name not in signature.parameters:
+                    errors.append({
+                        "code": "ProcessArgumentUnsupported",
+                        "message": f"Process {process_id!r} does not support argument {name!r} ({where}).",
+                    })
+
+        for name, value in arguments.items():
+            spec = signature.parameters.get(name) if signature else None
+            self._validate_value(
+                value, spec=spec, flat_graph=flat_graph, parameters=parameters, errors=errors,
+                where=f"argument {name!r} of {where}", path=f"{path} (callback {name!r} of node {node_id!r})",
+                check_type=True,
+            )
+
+    def _validate_value(
+            self, value, spec: Optional[_ParameterSpec], flat_graph: dict, parameters: Optional[Set[str]],
+            errors: List[dict], where: str, path: str, check_type: bool = False
+    ):
+        if isinstance(value, dict) and any(k in value for k in _REFERENCE_KEYS):
+            if "from_node" in value:
+                if value["from_node"] not in flat_graph:
+                    errors.append({
+                        "code": "ProcessGraphInvalid",
+                        "message": f"Reference to non-existing node {value['from_node']!r} in {where}.",
+                    })
+            elif "from_parameter" in value:
+                if parameters is not None and value["from_parameter"] not in parameters:
+                    errors.append({
+                        "code": "ProcessParameterUndefined",
+                        "message": f"Reference to undefined parameter {value['from_parameter']!r} in {where}.",
+                    })
+            elif "process_graph" in value:
+                callback_parameters = _callback_parameters(spec.schema) if spec else None
+                if parameters is None or callback_parameters is None:
+                    # Incomplete information: don't check parameter references in the callback.
+                    child_parameters = None
+                else:
+                    child_parameters = parameters | callback_parameters
+                self._validate_graph(value["process_graph"], parameters=child_parameters, errors=errors, path=path)
+            return
+
+        if check_type and spec and not _value_matches_schema(value, spec.schema):
+            errors.append({
+                "code": "ProcessArgumentInvalid",
+                "message": f"Invalid value type {type(value).__name__!r} for {where}.",
+            })
+
+        # Look for (nested) references
+        if isinstance(value, dict):
+            items = value.values()
+        elif isinstance(value, (list, tuple)):
+            items = value
+        else:
+            return
+        for item in items:
+            self._validate_value(
+                item, spec=None, flat_graph=flat_graph, parameters=parameters, errors=errors, where=where, path=path
+            )
@@ -0,0 +1,208 @@
+"""
+Client-side estimation of the data volume a process graph will load (from its ``load_collection`` nodes).
+"""
+import datetime as dt
+import logging
+import math
+import re
+from typing import Callable, NamedTuple, Optional, Tuple
+
+from openeo.internal.geometry import meters_per_degree
+from openeo.internal.graph_building import PGNode
+from openeo.internal.optimizer.base import GraphOptimizer, is_number, reference_counts
+from openeo.internal.optimizer.pushdown import FilterPushdown
+from openeo.metadata import CollectionMetadata, MetadataException
+from openeo.rest import OpenEoClientException
+from openeo.util import _normalize_crs, deep_get, rfc3339
+
+_log = logging.getLogger(__name__)
+
+# Default threshold (in estimated bytes to load) to switch from synchronous processing to batch jobs.
+DEFAULT_SYNC_MAX_BYTES = 1024 * 1024 * 1024
+
+# Assumed number of days between observations if the collection metadata doesn't specify a temporal step.
+DEFAULT_REVISIT_DAYS = 5
+
+# Assumed number of bytes per pixel value if the collection metadata doesn't specify data types.
+DEFAULT_BYTES_PER_VALUE = 4
+
+_DATA_TYPE_SIZES = {
+    "int8": 1, "uint8": 1, "int16": 2, "uint16": 2, "int32": 4, "uint32": 4, "float32": 4,
+    "int64": 8, "uint64": 8, "float64": 8, "cint16": 4, "cint32": 8, "cfloat32": 8, "cfloat64": 16,
+}
+
+
+class VolumeEstimate(NamedTuple):
+    """Estimated data volume."""
+    # Number of pixels (spatial pixels times observations)
+    pixels: int
+    # Number of pixel values (pixels times bands)
+    values: int
+    # Number of bytes
+    bytes: int
+
+    def __add__(self, other: "VolumeEstimate") -> "VolumeEstimate":
+        return VolumeEstimate(*(a + b for a, b in zip(self, other)))
+
+
+class VolumeEstimationException(OpenEoClientException):
+    """Data volume can not be estimated (e.g. parameterized extents or missing resolution metadata)."""
+
+
+def _spatial_extent(arguments: dict, metadata: CollectionMetadata) -> Tuple[float, float, float, float, object]:
+    """Spatial extent (west, south, east, north, crs) to load."""
+    extent = arguments.get("spatial_extent")
+    if extent is None:
+        dimensions = {d.name: d for d in metadata.spatial_dimensions}
+        if "x" in dimensions and "y" in dimensions and dimensions["x"].extent and dimensions["y"].extent:
+            (west, east), (south, north) = dimensions["x"].extent, dimensions["y"].extent
+            return west, south, east, north, dimensions["x"].crs
+        bbox = deep_get(metadata.get("extent", default={}), "spatial", "bbox", default=None)
+        if not bbox:
+            raise VolumeEstimationException("No spatial extent")
+        return (*bbox[0][:4], 4326)
+    if isinstance(extent, dict) and "type" in extent:
+        import shapely.geometry
+
+        geometry = extent if extent["type"] != "Feature" else extent["geometry"]
+        if geometry.get("type") == "FeatureCollection":
+            shape = shapely.geometry.GeometryCollection(
+                [shapely.geometry.shape(f["geometry"]) for f in geometry["features"]]
+            )
+        else:
+            shape = shapely.geometry.shape(geometry)
+        # GeoJSON is in WGS84 lon/lat
+        return (*shape.bounds, 4326)
+    if isinstance(extent, dict) and all(is_number(extent.get(k)) for k in ["west", "south", "east", "north"]):
+        return extent["west"], extent["south"], extent["east"], extent["north"], extent.get("crs")
+    raise VolumeEstimationException(f"Unsupported spatial extent {extent!r}")
+
+
+def _spatial_size(arguments: dict, metadata: CollectionMetadata) -> int:
+    """Number of pixels of one observation of one band."""
+    west, south, east, north, crs = _spatial_extent(arguments, metadata)
+    dimensions = {d.name: d for d in metadata.spatial_dimensions}
+    if not dimensions.get("x") or not dimensions["x"].step:
+        raise VolumeEstimationException("No spatial resolution")
+    x, y = dimensions["x"], dimensions.get("y", dimensions["x"])
+    step_x, step_y = x.step, y.step or x.step
+    width, height = max(east - west, 0), max(north - south, 0)
+    extent_degrees = _normalize_crs(crs) == 4326
+    resolution_degrees = _normalize_crs(x.crs) == 4326
+    # Rough conversion between degrees and meters (assuming a projected CRS in meter).
+    if extent_degrees and not resolution_degrees:
+        width *= meters_per_degree((south + north) / 2)
+        height *= meters_per_degree()
+    elif resolution_degrees and not extent_degrees:
+        width, height = width / meters_per_degree(), height / meters_per_degree()
+    return math.ceil(width / step_x) * math.ceil(height / step_y)
+
+
+def _parse_days(duration: str) -> Optional[float]:
+    """Number of days in simple ISO 8601 duration (e.g. "P1D", "PT12H", "P2W")."""
+    m = re.match(r"^P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?)?$", duration or "")
+    if not m or not any(m.groups()):
+        return None
+    weeks, days, hours = (int(g or 0) for g in m.groups())
+    return 7 * weeks + days + hours / 24
+
+
+def _observations(arguments: dict, metadata: CollectionMetadata, default_revisit_days: float) -> int:
+    """Number of observations (timesteps)."""
+    if not metadata.has_temporal_dimension():
+        return 1
+    dimension = metadata.temporal_dimension
+    extent = arguments.get("temporal_extent") or [None, None]
+    if not isinstance(extent, (list, tuple)) or len(extent) != 2:
+        raise VolumeEstimationException(f"Unsupported temporal extent {extent!r}")
+    extent = list(extent)
+    for i in range(2):
+        if extent[i] is None and dimension.extent:
+            extent[i] = dimension.extent[i]
+    if extent[0] is None:
+        raise VolumeEstimationException("No temporal extent")
+
+    def parse(d) -> dt.datetime:
+        if d is None:
+            return dt.datetime.utcnow()
+        if not isinstance(d, str):
+            raise VolumeEstimationException(f"Unsupported temporal extent {d!r}")
+        d = rfc3339.parse_date_or_datetime(d)
+        return d.replace(tzinfo=None) if isinstance(d, dt.datetime) else dt.datetime.combine(d, dt.time())
+
+    days = (parse(extent[1]) - parse(extent[0])).total_seconds() / (24 * 3600)
+    step = _parse_days(deep_get(metadata.get("cube:dimensions", default={}), dimension.name, "step", default=None))
+    return max(1, math.ceil(days / (step or default_revisit_days)))
+
+
+def _bytes_per_value(metadata: CollectionMetadata, bands: Optional[list]) -> int:
+    """Largest data type size of the bands to load (according to "raster:bands" summaries)."""
+    raster_bands = metadata.get("summaries", "raster:bands", default=None) or []
+    sizes = [
+        _DATA_TYPE_SIZES.get(b.get("data_type"))
+        for b in raster_bands
+        if isinstance(b, dict) and (bands is None or b.get("name") in bands)
+    ]
+    sizes = [s for s in sizes if s]
+    return max(sizes) if sizes else DEFAULT_BYTES_PER_VALUE
+
+
+def estimate_load_collection(
+        arguments: dict, metadata: CollectionMetadata, default_revisit_days: float = DEFAULT_REVISIT_DAYS
+) -> VolumeEstimate:
+    """
+    Estimate the data volume loaded by a ``load_collection`` process with given arguments.
+
+    :param arguments: ``load_collection`` arguments (``spatial_extent``, ``temporal_extent``, ``bands``)
+    :param metadata: collection metadata, with spatial resolution (``step`` of the "x" and "y" dimensions)
+    :param default_revisit_days: number of days between observations
+        if the temporal dimension metadata doesn't specify a ``step``
+    :raises VolumeEstimationException: if the data volume can not be estimated
+    """
+    bands = arguments.get("bands")
+    if bands is not None and not (isinstance(bands, list) and all(isinstance(b, str) for b in bands)):
+        raise VolumeEstimationException(f"Unsupported bands {bands!r}")
+    if bands is not None:
+        band_count = len(bands)
+    else:
+        try:
+            band_count = len(metadata.band_names)
+        except MetadataException:
+            band_count = 1
+    pixels = _spatial_size(arguments, metadata) * _observations(arguments, metadata, default_revisit_days)
+    values = pixels * band_count
+    return VolumeEstimate(pixels=pixels, values=values, bytes=values * _bytes_per_value(metadata, bands))
+
+
+def estimate_volume(
+        node: PGNode, get_metadata: Callable[[str], CollectionMetadata],
+        default_revisit_days: float = DEFAULT_REVISIT_DAYS,
+) -> VolumeEstimate:
+    """
+    Estimate the data volume loaded by the ``load_collection`` nodes in the graph of given result node,
+    after pushing down filters (``filter_bbox``, ...) into them (see :py:class:`FilterPushdown`).
+
+    This is a rough estimate of the input data (e.g. it does not take masking or cloud cover into account),
+    that can be used to decide between synchronous processing and a batch job.
+
+    :param node: result node of the process graph
+    :param get_metadata: function to get collection metadata from collection id
+    :param default_revisit_days: number of days between observations
+        if the temporal dimension metadata doesn't specify a ``step``
+    :raises VolumeEstimationException: if the data volume can not be estimated
+    """
+    node = GraphOptimizer(passes=[FilterPushdown()]).optimize_node(node)
+    total = VolumeEstimate(pixels=0, values=0, bytes=0)
+    for n, _ in reference_counts(node).values():
+        if n.process_id == "load_collection" and n.namespace is None:
+            collection_id = n.arguments.get("id")
+            if not isinstance(collection_id, str):
+                raise VolumeEstimationException(f"Unsupported collection id {collection_id!r}")
+            estimate = estimate_load_collection(
+                n.arguments, metadata=get_metadata(collection_id), default_revisit_days=default_revisit_days
+            )
+            _log.debug(f"Volume estimate for load_collection {collection_id!r}: {estimate}")
+            total += estimate
+        elif n.process_id in {"load_result", "load_uploaded_files", "load_ml_model"}:
+            raise VolumeEstimationException(f"Can not estimate data volume of {n.process_id!r}")
+    return total
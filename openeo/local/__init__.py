@@ -0,0 +1,8 @@
+"""
+Local evaluation of (small) process graphs with NumPy/xarray, without an openEO back-end.
+
+.. versionadded:: 0.13.1
+"""
+
+from openeo.local.executor import LocalExecutor
+from openeo.local.processes import LocalProcessingException, LabeledArray, list_processes
@@ -0,0 +1,148 @@
+"""
+Evaluate process graphs locally with the NumPy/xarray process implementations of :py:mod:`openeo.local.processes`.
+"""
+import inspect
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import xarray
+
+from openeo.internal.graph_building import as_flat_graph
+from openeo.internal.process_graph_visitor import ProcessGraphUnflattener
+from openeo.local.processes import LocalProcessingException, get_process
+from openeo.udf.xarraydatacube import XarrayDataCube
+
+# Collection data: in-memory array or path to a (NetCDF or JSON) file.
+CollectionData = Union[xarray.DataArray, XarrayDataCube, str, Path]
+
+
+class _Callback:
+    """Callable wrapper of a child process graph (e.g. the reducer of ``reduce_dimension``)."""
+
+    def __init__(self, flat_graph: dict, executor: "LocalExecutor", parameters: Dict[str, Any]):
+        self._flat_graph = flat_graph
+        self._executor = executor
+        self._parameters = parameters
+
+    def __call__(self, **kwargs) -> Any:
+        return _GraphEvaluator.unflatten(
+            flat_graph=self._flat_graph, executor=self._executor, parameters={**self._parameters, **kwargs}
+        )
+
+
+class _GraphEvaluator(ProcessGraphUnflattener):
+    """Evaluate a flat process graph: "unflatten" it to the result of each node."""
+
+    def __init__(self, flat_graph: dict, executor: "LocalExecutor", parameters: Dict[str, Any]):
+        super().__init__(flat_graph=flat_graph)
+        self._executor = executor
+        self._parameters = parameters
+
+    def _process_node(self, node: dict) -> Any:
+        if node.get("namespace") not in (None, "backend"):
+            raise LocalProcessingException(
+                f"Process {node['process_id']!r} from namespace {node['namespace']!r} is not supported."
+            )
+        arguments = {}
+        for name, value in self._process_value(value=node.get("arguments", {})).items():
+            if isinstance(value, dict) and "process_graph" in value:
+                value = _Callback(value["process_graph"], executor=self._executor, parameters=self._parameters)
+            arguments[name] = value
+        return self._executor.run_process(node["process_id"], arguments)
+
+    def _process_from_node(self, key: str, node: dict) -> Any:
+        return self.get_node(key=key)
+
+    def _process_from_parameter(self, name: str) -> Any:
+        if name not in self._parameters:
+            raise LocalProcessingException(f"No value for parameter {name!r}.")
+        return self._parameters[name]
+
+
+class LocalExecutor:
+    """
+    Evaluate process graphs (e.g. of a :py:class:`~openeo.rest.datacube.DataCube`) locally,
+    with vectorized NumPy/xarray implementations of a core subset of openEO processes
+    (see :py:func:`openeo.local.list_processes`): math, comparison, ``array_element``,
+    ``apply``, ``apply_dimension``, ``reduce_dimension``, ``filter_bbox``, ``filter_temporal``, ``filter_bands``,
+    ``merge_cubes``, ``linear_scale_range``, ...
+
+    Collections (for ``load_collection``) are provided as :py:class:`xarray.DataArray`
+    (or :py:class:`~openeo.udf.xarraydatacube.XarrayDataCube`) with dimensions ``x``, ``y``, ``t`` and/or ``bands``,
+    or as path to a file that can be loaded with :py:meth:`~openeo.udf.xarraydatacube.XarrayDataCube.from_file`.
+
+    Usage example::
+
+        cube = connection.load_collection("SENTINEL2", bands=["B04", "B08"])
+        red = cube.band("B04")
+        nir = cube.band("B08")
+        ndvi = (nir - red) / (nir + red)
+
+        executor = LocalExecutor(collections={"SENTINEL2": "data/s2.nc"})
+        result = executor.evaluate(ndvi)
+
+    :param collections: mapping of collection id to collection data
+
+    .. versionadded:: 0.13.1
+    """
+
+    def __init__(self, collections: Optional[Dict[str, CollectionData]] = None):
+        self._collections: Dict[str, CollectionData] = dict(collections or {})
+        self._loaded: Dict[str, xarray.DataArray] = {}
+
+    def add_collection(self, collection_id: str, data: CollectionData):
+        """Add (or replace) collection data."""
+        self._collections[collection_id] = data
+        self._loaded.pop(collection_id, None)
+
+    def get_collection(self, collection_id: str) -> xarray.DataArray:
+        """Get the (full) data of given collection."""
+        if collection_id not in self._loaded:
+            if collection_id not in self._collections:
+                raise LocalProcessingException(f"Collection {collection_id!r} is not available locally.")
+            data = self._collections[collection_id]
+            if isinstance(data, (str, Path)):
+                data = XarrayDataCube.from_file(data)
+            if isinstance(data, XarrayDataCube):
+                data = data.get_array()
+            self._loaded[collection_id] = data
+        return self._loaded[collection_id]
+
+    def load_collection(
+            self, id: str, spatial_extent: Optional[dict] = None, temporal_extent: Optional[list] = None,
+            bands: Optional[list] = None, properties: Optional[dict] = None,
+    ) -> xarray.DataArray:
+        """Implementation of the ``load_collection`` process."""
+        if properties:
+            raise LocalProcessingException("load_collection: filtering on properties is not supported.")
+        data = self.get_collection(id)
+        if spatial_extent is not None:
+            data = get_process("filter_bbox")(data=data, extent=spatial_extent)
+        if temporal_extent is not None:
+            data = get_process("filter_temporal")(data=data, extent=temporal_extent)
+        if bands is not None:
+            data = get_process("filter_bands")(data=data, bands=bands)
+        return data
+
+    def run_process(self, process_id: str, arguments: Dict[str, Any]) -> Any:
+        """Run a single process with given (evaluated) arguments."""
+        function = self.load_collection if process_id == "load_collection" else get_process(process_id)
+        try:
+            inspect.signature(function).bind(**arguments)
+        except TypeError as e:
+            raise LocalProcessingException(f"Invalid arguments for process {process_id!r}: {e}") from e
+        return function(**arguments)
+
+    def evaluate(self, graph: Union[dict, Any], parameters: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Evaluate given process graph and return the result of the result node.
+
+        :param graph: data cube, :py:class:`~openeo.internal.graph_building.PGNode`, (flat) process graph dict,
+            or JSON resource (string, path or URL) of a process graph
+        :param parameters: values for parameters used in the process graph
+        :return: result: usually an :py:class:`xarray.DataArray` (data cube)
+        """
+        flat_graph = as_flat_graph(graph)
+        if "process_graph" in flat_graph:
+            flat_graph = flat_graph["process_graph"]
+        return _GraphEvaluator.unflatten(flat_graph=flat_graph, executor=self, parameters=dict(parameters or {}))
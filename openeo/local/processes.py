@@ -0,0 +1,386 @@
+"""
+Vectorized NumPy/xarray implementations of a core subset of openEO processes, for local evaluation.
+
+Data cubes are represented as :py:class:`xarray.DataArray` objects with openEO style dimension names
+(``x``, ``y``, ``t`` and ``bands``, like :py:class:`~openeo.udf.xarraydatacube.XarrayDataCube`).
+Callbacks are evaluated only once, on the full arrays:
+the ``x`` parameter of ``apply`` is the whole cube
+and the ``data`` parameter of ``reduce_dimension`` or ``apply_dimension`` is a :py:class:`LabeledArray`
+(the cube with the dimension to process).
+"""
+import functools
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy
+import pandas
+import xarray
+
+from openeo.rest import OpenEoClientException
+
+
+class LocalProcessingException(OpenEoClientException):
+    """Failure to evaluate a process locally."""
+    pass
+
+
+class LabeledArray:
+    """
+    Array argument of a callback (e.g. of ``reduce_dimension``):
+    the values along given dimension, for all positions along the other dimensions at once.
+    """
+
+    def __init__(self, array: xarray.DataArray, dimension: str):
+        self.array = array
+        self.dimension = dimension
+
+    def __repr__(self):
+        return f"<{type(self).__name__} dimension:{self.dimension!r} shape:{self.array.shape}>"
+
+    def __len__(self):
+        return self.array.sizes[self.dimension]
+
+
+def _to_labeled_array(data: Union[LabeledArray, list, tuple]) -> LabeledArray:
+    """Get array argument as a LabeledArray (e.g. to reduce it)."""
+    if isinstance(data, LabeledArray):
+        return data
+    elif isinstance(data, (list, tuple)):
+        items = xarray.broadcast(*[v if isinstance(v, xarray.DataArray) else xarray.DataArray(v) for v in data])
+        dimension = "__array__"
+        return LabeledArray(xarray.concat(items, dim=dimension), dimension=dimension)
+    raise LocalProcessingException(f"Expected an array, but got {type(data).__name__}.")
+
+
+def _elementwise(function: Callable) -> Callable:
+    """
+    Decorator for element-wise process implementations:
+    unwrap :py:class:`LabeledArray` arguments (and wrap the result again).
+    """
+
+    @functools.wraps(function)
+    def wrapper(**kwargs):
+        dimension = None
+        for k, v in kwargs.items():
+            if isinstance(v, LabeledArray):
+                if dimension is not None and v.dimension != dimension:
+                    raise LocalProcessingException("Incompatible array dimensions.")
+                dimension = v.dimension
+                kwargs[k] = v.array
+        result = function(**kwargs)
+        return result if dimension is None else LabeledArray(result, dimension=dimension)
+
+    return wrapper
+
+
+def _reducer(function: Callable[[xarray.DataArray, str, bool], Any]) -> Callable:
+    """Decorator for process implementations that reduce an array (e.g. ``mean``)."""
+
+    def wrapper(data, ignore_nodata: bool = True):
+        labeled = _to_labeled_array(data)
+        return function(labeled.array, labeled.dimension, ignore_nodata)
+
+    return wrapper
+
+
+def _null_as_nan(x):
+    return numpy.nan if x is None else x
+
+
+def _linear_scale_range(x, inputMin, inputMax, outputMin=0, outputMax=1):
+    return (numpy.clip(x, inputMin, inputMax) - inputMin) / (inputMax - inputMin) * (outputMax - outputMin) + outputMin
+
+
+def _log(x, base):
+    return numpy.log(x) / numpy.log(base)
+
+
+def _if(value, accept, reject=None):
+    return xarray.where(value, accept, _null_as_nan(reject))
+
+
+def _between(x, min, max, exclude_max=False):
+    return (x >= min) & ((x < max) if exclude_max else (x <= max))
+
+
+def _count(data: xarray.DataArray, dimension: str, ignore_nodata: bool):
+    if ignore_nodata:
+        return data.count(dim=dimension)
+    return xarray.full_like(data.isel({dimension: 0}, drop=True), fill_value=data.sizes[dimension], dtype=int)
+
+
+def _datetime64(value: str) -> numpy.datetime64:
+    """Parse date or date-time string (naive or UTC)."""
+    timestamp = pandas.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+    return timestamp.to_datetime64()
+
+
+_PROCESSES: Dict[str, Callable] = {
+    # Math
+    "add": _elementwise(lambda x, y: x + y),
+    "subtract": _elementwise(lambda x, y: x - y),
+    "multiply": _elementwise(lambda x, y: x * y),
+    "divide": _elementwise(lambda x, y: x / y),
+    "power": _elementwise(lambda base, p: base ** p),
+    "mod": _elementwise(lambda x, y: numpy.mod(x, y)),
+    "absolute": _elementwise(lambda x: numpy.abs(x)),
+    "sgn": _elementwise(lambda x: numpy.sign(x)),
+    "sqrt": _elementwise(lambda x: numpy.sqrt(x)),
+    "exp": _elementwise(lambda p: numpy.exp(p)),
+    "ln": _elementwise(lambda x: numpy.log(x)),
+    "log": _elementwise(_log),
+    "sin": _elementwise(lambda x: numpy.sin(x)),
+    "cos": _elementwise(lambda x: numpy.cos(x)),
+    "tan": _elementwise(lambda x: numpy.tan(x)),
+    "arcsin": _elementwise(lambda x: numpy.arcsin(x)),
+    "arccos": _elementwise(lambda x: numpy.arccos(x)),
+    "arctan": _elementwise(lambda x: numpy.arctan(x)),
+    "arctan2": _elementwise(lambda y, x: numpy.arctan2(y, x)),
+    "floor": _elementwise(lambda x: numpy.floor(x)),
+    "ceil": _elementwise(lambda x: numpy.ceil(x)),
+    "int": _elementwise(lambda x: numpy.trunc(x)),
+    "round": _elementwise(lambda x, p=0: numpy.round(x, p)),
+    "clip": _elementwise(lambda x, min, max: numpy.clip(x, min, max)),
+    "linear_scale_range": _elementwise(_linear_scale_range),
+    "normalized_difference": _elementwise(lambda x, y: (x - y) / (x + y)),
+    "pi": lambda: numpy.pi,
+    "e": lambda: numpy.e,
+    # Comparison and logic
+    "eq": _elementwise(lambda x, y: x == y),
+    "neq": _elementwise(lambda x, y: x != y),
+    "gt": _elementwise(lambda x, y: x > y),
+    "gte": _elementwise(lambda x, y: x >= y),
+    "lt": _elementwise(lambda x, y: x < y),
+    "lte": _elementwise(lambda x, y: x <= y),
+    "between": _elementwise(_between),
+    "and": _elementwise(lambda x, y: numpy.logical_and(x, y)),
+    "or": _elementwise(lambda x, y: numpy.logical_or(x, y)),
+    "xor": _elementwise(lambda x, y: numpy.logical_xor(x, y)),
+    "not": _elementwise(lambda x: numpy.logical_not(x)),
+    "if": _elementwise(_if),
+    "is_nan": _elementwise(lambda x: numpy.isnan(x)),
+    "is_nodata": _elementwise(lambda x: numpy.isnan(x)),
+    "is_valid": _elementwise(lambda x: numpy.isfinite(x)),
+    # Reducers
+    "sum": _reducer(lambda a, d, skip: a.sum(dim=d, skipna=skip)),
+    "product": _reducer(lambda a, d, skip: a.prod(dim=d, skipna=skip)),
+    "mean": _reducer(lambda a, d, skip: a.mean(dim=d, skipna=skip)),
+    "median": _reducer(lambda a, d, skip: a.median(dim=d, skipna=skip)),
+    "min": _reducer(lambda a, d, skip: a.min(dim=d, skipna=skip)),
+    "max": _reducer(lambda a, d, skip: a.max(dim=d, skipna=skip)),
+    "sd": _reducer(lambda a, d, skip: a.std(dim=d, skipna=skip, ddof=1)),
+    "variance": _reducer(lambda a, d, skip: a.var(dim=d, skipna=skip, ddof=1)),
+    "count": _reducer(_count),
+}
+
+
+def _register(process_id: str) -> Callable:
+    """Decorator to register a process implementation."""
+
+    def decorate(function: Callable) -> Callable:
+        _PROCESSES[process_id] = function
+        return function
+
+    return decorate
+
+
+def get_process(process_id: str) -> Callable:
+    """Get implementation of given process."""
+    if process_id not in _PROCESSES:
+        raise LocalProcessingException(f"Process {process_id!r} is not supported for local processing.")
+    return _PROCESSES[process_id]
+
+
+def list_processes() -> List[str]:
+    """List ids of the processes that are supported for local processing."""
+    return sorted(_PROCESSES.keys())
+
+
+# Arrays
+
+
+@_register("array_element")
+def array_element(data, index: Optional[int] = None, label: Optional[str] = None, return_nodata: bool = False):
+    if (index is None) == (label is None):
+        raise LocalProcessingException("array_element: either `index` or `label` must be specified.")
+    if isinstance(data, (list, tuple)):
+        if label is not None:
+            raise LocalProcessingException("array_element: array has no labels.")
+        if 0 <= index < len(data):
+            return data[index]
+    elif isinstance(data, LabeledArray):
+        array, dimension = data.array, data.dimension
+        if label is not None:
+            if label in array.indexes.get(dimension, []):
+                return array.sel({dimension: label}, drop=True)
+        elif 0 <= index < array.sizes[dimension]:
+            return array.isel({dimension: index}, drop=True)
+    else:
+        raise LocalProcessingException(f"array_element: expected an array, but got {type(data).__name__}.")
+    if return_nodata:
+        return numpy.nan
+    raise LocalProcessingException(f"array_element: array has no element with index {index} or label {label!r}.")
+
+
+@_register("array_create")
+def array_create(data: Optional[list] = None, repeat: int = 1):
+    return list(data or []) * repeat
+
+
+@_register("array_modify")
+def array_modify(data, values: list, index: int, length: int = 0):
+    if isinstance(data, LabeledArray):
+        # Only support appending (e.g. of spectral indices) to avoid dimension label ambiguity.
+        if index != len(data) or length != 0:
+            raise LocalProcessingException("array_modify: only appending values is supported.")
+        template = data.array.isel({data.dimension: 0}, drop=True)
+        items = [xarray.broadcast(v if isinstance(v, xarray.DataArray) else xarray.DataArray(v), template)[0]
+                 for v in values]
+        labels = list(data.array.indexes.get(data.dimension, range(len(data))))
+        labels += [None] * len(items)
+        appended = xarray.concat([data.array] + items, dim=data.dimension, coords="minimal")
+        return LabeledArray(appended.assign_coords({data.dimension: labels}), dimension=data.dimension)
+    data = list(data)
+    return data[:index] + list(values) + data[index + length:]
+
+
+# Data cubes
+
+
+def _check_dimension(data: xarray.DataArray, dimension: str) -> str:
+    if dimension not in data.dims:
+        raise LocalProcessingException(f"Dimension {dimension!r} does not exist (dimensions: {list(data.dims)}).")
+    return dimension
+
+
+def _to_labeled_dimension(array: xarray.DataArray, result: Any, dimension: str) -> xarray.DataArray:
+    """Convert result of an apply_dimension callback back to a data cube with given dimension."""
+    if isinstance(result, (list, tuple)):
+        result = _to_labeled_array(result)
+        return result.array.rename({result.dimension: dimension})
+    elif isinstance(result, LabeledArray):
+        return result.array.rename({result.dimension: dimension}) if result.dimension != dimension else result.array
+    elif isinstance(result, xarray.DataArray) and dimension in result.dims:
+        return result
+    # Callback result without the dimension: broadcast it over the original dimension labels.
+    result = result if isinstance(result, xarray.DataArray) else xarray.DataArray(result)
+    return xarray.broadcast(result, array)[0].transpose(*array.dims)
+
+
+@_register("apply")
+def apply(data: xarray.DataArray, process: Callable, context=None):
+    result = process(x=data, context=context)
+    if not isinstance(result, xarray.DataArray):
+        result = xarray.full_like(data, fill_value=result, dtype=numpy.result_type(result))
+    return result.transpose(*data.dims)
+
+
+@_register("reduce_dimension")
+def reduce_dimension(data: xarray.DataArray, reducer: Callable, dimension: str, context=None):
+    _check_dimension(data, dimension)
+    result = reducer(data=LabeledArray(data, dimension=dimension), context=context)
+    if isinstance(result, LabeledArray) or (isinstance(result, xarray.DataArray) and dimension in result.dims):
+        raise LocalProcessingException("reduce_dimension: reducer did not reduce the dimension to a single value.")
+    if not isinstance(result, xarray.DataArray):
+        result = xarray.full_like(data.isel({dimension: 0}, drop=True), fill_value=result, dtype=float)
+    return result
+
+
+@_register("apply_dimension")
+def apply_dimension(
+        data: xarray.DataArray, process: Callable, dimension: str, target_dimension: Optional[str] = None, context=None
+):
+    _check_dimension(data, dimension)
+    dims = list(data.dims)
+    result = process(data=LabeledArray(data, dimension=dimension), context=context)
+    result = _to_labeled_dimension(data, result, dimension=dimension)
+    if result.sizes[dimension] != data.sizes[dimension] or dimension not in result.indexes:
+        # Dimension labels are reset to zero-based indices when the number of values changes.
+        result = result.assign_coords({dimension: numpy.arange(result.sizes[dimension])})
+    elif result.indexes[dimension].isna().any():
+        # Labels of appended values (array_modify)
+        result = result.assign_coords({dimension: numpy.arange(result.sizes[dimension])})
+    result = result.transpose(*[d for d in dims if d in result.dims])
+    if target_dimension is not None and target_dimension != dimension:
+        result = result.rename({dimension: target_dimension})
+    return result
+
+
+@_register("rename_labels")
+def rename_labels(data: xarray.DataArray, dimension: str, target: list, source: Optional[list] = None):
+    _check_dimension(data, dimension)
+    if source:
+        mapping = dict(zip(source, target))
+        labels = [mapping.get(label, label) for label in data.indexes[dimension]]
+    else:
+        if len(target) != data.sizes[dimension]:
+            raise LocalProcessingException("rename_labels: number of labels does not match dimension size.")
+        labels = list(target)
+    return data.assign_coords({dimension: labels})
+
+
+@_register("filter_bands")
+def filter_bands(data: xarray.DataArray, bands: Optional[List[str]] = None, wavelengths=None):
+    if wavelengths:
+        raise LocalProcessingException("filter_bands: filtering on wavelengths is not supported.")
+    _check_dimension(data, "bands")
+    missing = set(bands or []).difference(data.indexes["bands"])
+    if missing:
+        raise LocalProcessingException(f"filter_bands: bands {sorted(missing)} not available.")
+    return data.sel(bands=list(bands or []))
+
+
+@_register("filter_bbox")
+def filter_bbox(data: xarray.DataArray, extent: dict):
+    """Filter on bounding box (assumed to be in the coordinate reference system of the data)."""
+    if not isinstance(extent, dict) or not {"west", "south", "east", "north"}.issubset(extent):
+        raise LocalProcessingException(f"filter_bbox: unsupported extent {extent!r}.")
+    x = _check_dimension(data, "x")
+    y = _check_dimension(data, "y")
+    xs = data[x].values
+    ys = data[y].values
+    return data.isel({
+        x: numpy.flatnonzero((xs >= extent["west"]) & (xs <= extent["east"])),
+        y: numpy.flatnonzero((ys >= extent["south"]) & (ys <= extent["north"])),
+    })
+
+
+@_register("filter_temporal")
+def filter_temporal(data: xarray.DataArray, extent: list, dimension: Optional[str] = None):
+    """Filter on left-closed temporal interval."""
+    dimension = _check_dimension(data, dimension or "t")
+    start, end = extent
+    times = data[dimension].values
+    mask = numpy.ones(times.shape, dtype=bool)
+    if start is not None:
+        mask &= times >= _datetime64(start)
+    if end is not None:
+        mask &= times < _datetime64(end)
+    return data.isel({dimension: numpy.flatnonzero(mask)})
+
+
+@_register("merge_cubes")
+def merge_cubes(cube1: xarray.DataArray, cube2: xarray.DataArray, overlap_resolver: Optional[Callable] = None,
+                context=None):
+    if (
+            "bands" in cube1.dims and "bands" in cube2.dims
+            and not set(cube1.indexes["bands"]).intersection(cube2.indexes["bands"])
+    ):
+        # Disjoint bands: just combine them.
+        return xarray.concat([cube1, cube2.transpose(*cube1.dims)], dim="bands", join="outer")
+    if overlap_resolver is None:
+        # Only allowed if there is no overlap: combine (non-overlapping) values.
+        aligned1, aligned2 = xarray.align(cube1, cube2, join="outer")
+        if (aligned1.notnull() & aligned2.notnull()).any():
+            raise LocalProcessingException("merge_cubes: overlapping cubes require an overlap resolver.")
+        return aligned1.fillna(aligned2)
+    aligned1, aligned2 = xarray.align(cube1, cube2, join="outer")
+    resolved = overlap_resolver(x=aligned1, y=aligned2, context=context)
+    return xarray.where(aligned1.isnull(), aligned2, xarray.where(aligned2.isnull(), aligned1, resolved))
+
+
+@_register("save_result")
+def save_result(data, format: str = None, options: Optional[dict] = None):
+    # Results are just returned.
+    return data
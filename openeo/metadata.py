@@ -1,8 +1,9 @@
+import math
 import warnings
 from collections import namedtuple
 from typing import List, Union, Tuple, Callable
 
-from openeo.util import deep_get
+from openeo.util import deep_get, intersect_bboxes, intersect_temporal_extents
 from openeo.internal.jupyter import render_component
 
 
@@ -372,6 +373,56 @@ class CollectionMetadata:
             for d in self._dimensions
         ])
 
+    def filter_temporal(self, start: Union[str, None], end: Union[str, None]) -> 'CollectionMetadata':
+        """
+        Create new `CollectionMetadata` with temporal dimension extent limited to given interval
+        (left unchanged if the extents can not be intersected, e.g. no temporal dimension or unsupported formats).
+
+        .. versionadded:: 0.13.1
+        """
+        if not self.has_temporal_dimension():
+            return self
+        dim = self.temporal_dimension
+        try:
+            extent = intersect_temporal_extents(dim.extent or [None, None], [start, end])
+        except ValueError:
+            return self
+        if extent is None:
+            return self
+        return self._clone_and_update(dimensions=[
+            TemporalDimension(name=d.name, extent=extent) if d is dim else d
+            for d in self._dimensions
+        ])
+
+    def filter_bbox(self, bbox: dict) -> 'CollectionMetadata':
+        """
+        Create new `CollectionMetadata` with extent of the "x" and "y" spatial dimensions limited to given
+        bounding box (left unchanged for spatial dimensions with a different or unknown CRS).
+
+        .. versionadded:: 0.13.1
+
+        :param bbox: dictionary with keys "west", "south", "east", "north" and optionally "crs"
+        """
+        bounds = {"x": ("west", "east"), "y": ("south", "north")}
+        dimensions = []
+        for d in self._dimensions:
+            if isinstance(d, SpatialDimension) and d.name in bounds and isinstance(d.crs, (str, int)):
+                low, high = bounds[d.name]
+                # Dimension extent as bounding box (unbounded in the other direction).
+                other = {"west": -math.inf, "south": -math.inf, "east": math.inf, "north": math.inf, "crs": d.crs}
+                if d.extent and len(d.extent) == 2 and None not in d.extent:
+                    other.update({low: d.extent[0], high: d.extent[1]})
+                try:
+                    intersection = intersect_bboxes(other, bbox)
+                except ValueError:
+                    intersection = None
+                if intersection:
+                    d = SpatialDimension(
+                        name=d.name, extent=[intersection[low], intersection[high]], crs=d.crs, step=d.step
+                    )
+            dimensions.append(d)
+        return self._clone_and_update(dimensions=dimensions)
+
     def append_band(self, band: Band) -> 'CollectionMetadata':
         """
         Create new `CollectionMetadata` with given band added to band dimension.
@@ -7,6 +7,7 @@ from typing import Optional, Union, Tuple
 
 from openeo.internal.compat import nullcontext
 from openeo.internal.graph_building import PGNode, _FromNodeMixin
+from openeo.internal.optimizer.base import GraphOptimizer, get_optimizer
 
 if typing.TYPE_CHECKING:
     # Imports for type checking only (circular import issue at runtime).
@@ -32,10 +33,13 @@ class _ProcessGraphAbstraction(_FromNodeMixin):
     def __str__(self):
         return "{t}({pg})".format(t=self.__class__.__name__, pg=self._pg)
 
-    def flat_graph(self) -> dict:
+    def flat_graph(self, optimize: Union[bool, GraphOptimizer] = False) -> dict:
         """
         Get the process graph in internal flat dict representation.
 
+        :param optimize: optimize the process graph (e.g. constant folding, algebraic simplification),
+            with a default or given :py:class:`~openeo.internal.optimizer.base.GraphOptimizer`.
+
         .. warning:: This method is mainly intended for internal use.
             It is not recommended for general use and is *subject to change*.
 
@@ -45,9 +49,14 @@ class _ProcessGraphAbstraction(_FromNodeMixin):
             See :ref:`process_graph_export` for more information.
         """
         # TODO: wrap in {"process_graph":...} by default/optionally?
-        return self._pg.flat_graph()
-
-    def to_json(self, *, indent: Union[int, None] = 2, separators: Optional[Tuple[str, str]] = None) -> str:
+        optimizer = get_optimizer(optimize)
+        pg = optimizer.optimize(self._pg) if optimizer else self._pg
+        return pg.flat_graph()
+
+    def to_json(
+            self, *, indent: Union[int, None] = 2, separators: Optional[Tuple[str, str]] = None,
+            optimize: Union[bool, GraphOptimizer] = False,
+    ) -> str:
         """
         Get interoperable JSON representation of the process graph.
 
@@ -58,12 +67,16 @@ class _ProcessGraphAbstraction(_FromNodeMixin):
 
         :param indent: JSON indentation level.
         :param separators: (optional) tuple of item/key separators.
+        :param optimize: optimize the process graph (see :py:meth:`flat_graph`).
         :return: JSON string
         """
-        pg = {"process_graph": self.flat_graph()}
+        pg = {"process_graph": self.flat_graph(optimize=optimize)}
         return json.dumps(pg, indent=indent, separators=separators)
 
-    def print_json(self, *, file=None, indent: Union[int, None] = 2, separators: Optional[Tuple[str, str]] = None):
+    def print_json(
+            self, *, file=None, indent: Union[int, None] = 2, separators: Optional[Tuple[str, str]] = None,
+            optimize: Union[bool, GraphOptimizer] = False,
+    ):
         """
         Print interoperable JSON representation of the process graph.
 
@@ -76,10 +89,11 @@ class _ProcessGraphAbstraction(_FromNodeMixin):
             Or a path (string or pathlib.Path) to a file to write to.
         :param indent: JSON indentation level.
         :param separators: (optional) tuple of item/key separators.
+        :param optimize: optimize the process graph (see :py:meth:`flat_graph`).
 
         .. versionadded:: 0.12.0
         """
-        pg = {"process_graph": self.flat_graph()}
+        pg = {"process_graph": self.flat_graph(optimize=optimize)}
         if isinstance(file, (str, Path)):
             # Create (new) file and automatically close it
             file_ctx = Path(file).open("w", encoding="utf8")
@@ -1,9 +1,18 @@
 import collections
-from typing import Optional
+import logging
+import threading
+import time
+from typing import Callable, Optional
 
+import requests
 from requests import Request
 from requests.auth import AuthBase
 
+from openeo.rest import OpenEoClientException
+from openeo.rest.auth.oidc import jwt_get_expiration
+
+_log = logging.getLogger(__name__)
+
 
 class OpenEoApiAuthBase(AuthBase):
     """
@@ -50,8 +59,74 @@ OidcRefreshInfo = collections.namedtuple("_OidcRefreshData", ["provider_id", "cl
 
 
 class OidcBearerAuth(BearerAuth):
-    """Bearer token for OIDC Auth (openEO API 1.0.0 style)"""
+    """
+    Bearer token for OIDC Auth (openEO API 1.0.0 style)
+
+    If a ``refresher`` callable (returning a new access token) is given,
+    the access token will be refreshed proactively shortly before it expires
+    (based on the "exp" claim of the access token, if it is a JWT).
+    Concurrent requests (e.g. from multiple threads sharing a connection)
+    share a single refresh.
+    """
 
-    def __init__(self, provider_id: str, access_token: str, refresh_data: Optional[OidcRefreshInfo] = None):
+    # Refresh access token this number of seconds before it expires.
+    DEFAULT_REFRESH_MARGIN = 60
+    # Minimum time (in seconds) between (failed) refresh attempts.
+    REFRESH_RETRY_INTERVAL = 30
+
+    # Clock function (overridable for testing)
+    _clock = time.time
+
+    def __init__(
+            self, provider_id: str, access_token: str, refresh_data: Optional[OidcRefreshInfo] = None,
+            refresher: Optional[Callable[[], str]] = None, refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+    ):
         super().__init__(bearer='oidc/{p}/{t}'.format(p=provider_id, t=access_token))
+        self.provider_id = provider_id
         self.refresh_data = refresh_data
+        self.access_token = access_token
+        self.expires_at = jwt_get_expiration(access_token)
+        self._refresher = refresher
+        self._refresh_margin = refresh_margin
+        self._next_refresh_attempt = 0
+        self._lock = threading.Lock()
+
+    def _set_access_token(self, access_token: str):
+        self.bearer = 'oidc/{p}/{t}'.format(p=self.provider_id, t=access_token)
+        self.access_token = access_token
+        self.expires_at = jwt_get_expiration(access_token)
+
+    def should_refresh(self) -> bool:
+        """Check whether access token is expired or about to expire (and can be refreshed)."""
+        if self._refresher is None or self.expires_at is None:
+            return False
+        now = self._clock()
+        return now >= self.expires_at - self._refresh_margin and now >= self._next_refresh_attempt
+
+    def refresh(self) -> bool:
+        """
+        Refresh the access token (single-flight: concurrent callers wait for one shared refresh).
+
+        :return: whether a new access token is available.
+        """
+        stale_token = self.access_token
+        with self._lock:
+            if self.access_token != stale_token:
+                # Another thread already refreshed while we were waiting for the lock.
+                return True
+            if not self.should_refresh():
+                return False
+            try:
+                access_token = self._refresher()
+            except (OpenEoClientException, requests.RequestException) as e:
+                _log.warning(f"Failed to proactively refresh OIDC access token: {e!r}")
+                self._next_refresh_attempt = self._clock() + self.REFRESH_RETRY_INTERVAL
+                return False
+            _log.info("Proactively refreshed OIDC access token (before expiry)")
+            self._set_access_token(access_token)
+            return True
+
+    def __call__(self, req: Request) -> Request:
+        if self.should_refresh():
+            self.refresh()
+        return super().__call__(req)
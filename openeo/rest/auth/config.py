@@ -6,16 +6,21 @@ from local config files.
 # TODO: also allow to set client_id, client_secret, refresh_token through env variables?
 
 
+import copy
 import json
 import logging
+import os
 import platform
 import stat
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Union, Tuple, Dict
+from typing import Union, Tuple, Dict, Optional
 
 from openeo import __version__
 from openeo.config import get_user_config_dir, get_user_data_dir
+from openeo.internal.filelock import get_file_lock, FileLock
+from openeo.rest.auth.oidc import jwt_get_expiration
 from openeo.util import rfc3339, deep_get, deep_set
 
 _PRIVATE_PERMS = stat.S_IRUSR | stat.S_IWUSR
@@ -49,6 +54,10 @@ def _normalize_url(url: str) -> str:
 class PrivateJsonFile:
     """
     Base class for private config/data files in JSON format.
+
+    Access is coordinated between threads and processes with an advisory file lock
+    (also see :py:meth:`lock` for atomic read-modify-write operations)
+    and parsed data is kept in memory as long as the file does not change.
     """
 
     DEFAULT_FILENAME = "private.json"
@@ -59,6 +68,8 @@ class PrivateJsonFile:
         if path.is_dir():
             path = path / self.DEFAULT_FILENAME
         self._path = path
+        # In-memory cache of file data, with file "signature" (to detect file changes).
+        self._cache: Optional[Tuple[tuple, dict]] = None
 
     @property
     def path(self) -> Path:
@@ -68,26 +79,42 @@ class PrivateJsonFile:
     def default_path(cls) -> Path:
         return get_user_config_dir(auto_create=True) / cls.DEFAULT_FILENAME
 
+    def lock(self) -> FileLock:
+        """
+        (Reentrant) inter-process lock, to be used as context manager,
+        e.g. to do multiple operations atomically.
+        """
+        return get_file_lock(self._path)
+
     def load(self, empty_on_file_not_found=True) -> dict:
         """Load all data from file"""
-        if not self._path.exists():
-            if empty_on_file_not_found:
-                return {}
-            raise FileNotFoundError(self._path)
-        assert_private_file(self._path)
-        log.debug("Loading private JSON file {p}".format(p=self._path))
-        # TODO: add file locking to avoid race conditions?
-        with self._path.open("r", encoding="utf8") as f:
-            return json.load(f)
+        with self.lock():
+            if not self._path.exists():
+                if empty_on_file_not_found:
+                    return {}
+                raise FileNotFoundError(self._path)
+            assert_private_file(self._path)
+            st = self._path.stat()
+            signature = (st.st_ino, st.st_size, st.st_mtime_ns)
+            if self._cache is None or self._cache[0] != signature:
+                log.debug("Loading private JSON file {p}".format(p=self._path))
+                with self._path.open("r", encoding="utf8") as f:
+                    self._cache = (signature, json.load(f))
+            return copy.deepcopy(self._cache[1])
 
     def _write(self, data: dict):
         """Write whole data to file."""
         log.debug("Writing private JSON file {p}".format(p=self._path))
-        # TODO: add file locking to avoid race conditions?
-        with self._path.open("w", encoding="utf8") as f:
-            json.dump(data, f, indent=2)
-        self._path.chmod(mode=_PRIVATE_PERMS)
-        assert_private_file(self._path)
+        with self.lock():
+            # Write to temp file first and move it in place, so that readers never see a partially written file.
+            tmp_path = self._path.with_name(self._path.name + ".tmp")
+            fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, _PRIVATE_PERMS)
+            with os.fdopen(fd, "w", encoding="utf8") as f:
+                json.dump(data, f, indent=2)
+            tmp_path.chmod(mode=_PRIVATE_PERMS)
+            os.replace(tmp_path, self._path)
+            assert_private_file(self._path)
+            self._cache = None
 
     def get(self, *keys, default=None) -> Union[dict, str, int]:
         """Load JSON file and do deep get with given keys."""
@@ -98,14 +125,17 @@ class PrivateJsonFile:
         return result
 
     def set(self, *keys, value):
-        data = self.load()
-        deep_set(data, *keys, value=value)
-        self._write(data)
+        with self.lock():
+            data = self.load()
+            deep_set(data, *keys, value=value)
+            self._write(data)
 
     def remove(self):
-        if self._path.exists():
-            log.debug(f"Removing {self._path}")
-            self._path.unlink()
+        with self.lock():
+            if self._path.exists():
+                log.debug(f"Removing {self._path}")
+                self._path.unlink()
+            self._cache = None
 
 
 class AuthConfig(PrivateJsonFile):
@@ -136,14 +166,15 @@ class AuthConfig(PrivateJsonFile):
         return username, password
 
     def set_basic_auth(self, backend: str, username: str, password: Union[str, None]):
-        data = self.load()
-        keys = ("backends", _normalize_url(backend), "basic",)
-        # TODO: support multiple basic auth credentials? (pick latest by default for example)
-        deep_set(data, *keys, "date", value=utcnow_rfc3339())
-        deep_set(data, *keys, "username", value=username)
-        if password:
-            deep_set(data, *keys, "password", value=password)
-        self._write(data)
+        with self.lock():
+            data = self.load()
+            keys = ("backends", _normalize_url(backend), "basic",)
+            # TODO: support multiple basic auth credentials? (pick latest by default for example)
+            deep_set(data, *keys, "date", value=utcnow_rfc3339())
+            deep_set(data, *keys, "username", value=username)
+            if password:
+                deep_set(data, *keys, "password", value=password)
+            self._write(data)
 
     def get_oidc_provider_configs(self, backend: str) -> Dict[str, dict]:
         """
@@ -166,24 +197,31 @@ class AuthConfig(PrivateJsonFile):
             self, backend: str, provider_id: str,
             client_id: Union[str, None], client_secret: Union[str, None] = None, issuer: Union[str, None] = None
     ):
-        data = self.load()
-        keys = ("backends", _normalize_url(backend), "oidc", "providers", provider_id)
-        # TODO: support multiple clients? (pick latest by default for example)
-        deep_set(data, *keys, "date", value=utcnow_rfc3339())
-        deep_set(data, *keys, "client_id", value=client_id)
-        deep_set(data, *keys, "client_secret", value=client_secret)
-        if issuer:
-            deep_set(data, *keys, "issuer", value=issuer)
-        self._write(data)
+        with self.lock():
+            data = self.load()
+            keys = ("backends", _normalize_url(backend), "oidc", "providers", provider_id)
+            # TODO: support multiple clients? (pick latest by default for example)
+            deep_set(data, *keys, "date", value=utcnow_rfc3339())
+            deep_set(data, *keys, "client_id", value=client_id)
+            deep_set(data, *keys, "client_secret", value=client_secret)
+            if issuer:
+                deep_set(data, *keys, "issuer", value=issuer)
+            self._write(data)
 
 
 class RefreshTokenStore(PrivateJsonFile):
     """
     Basic JSON-file based storage of refresh tokens.
+
+    Can also be used as a cache of (not yet expired) access tokens, shared between processes
+    (e.g. parallel workers on the same host), to avoid that each process has to do its own refresh token flow.
     """
 
     DEFAULT_FILENAME = "refresh-tokens.json"
 
+    # Default minimum remaining validity time (in seconds) for cached access tokens to be usable.
+    ACCESS_TOKEN_MIN_VALIDITY = 60
+
     @classmethod
     def default_path(cls) -> Path:
         return get_user_data_dir(auto_create=True) / cls.DEFAULT_FILENAME
@@ -192,10 +230,57 @@ class RefreshTokenStore(PrivateJsonFile):
         return self.get(_normalize_url(issuer), client_id, "refresh_token", default=None)
 
     def set_refresh_token(self, issuer: str, client_id: str, refresh_token: str):
-        data = self.load()
-        log.info("Storing refresh token for issuer {i!r} (client {c!r})".format(i=issuer, c=client_id))
-        deep_set(data, _normalize_url(issuer), client_id, value={
-            "date": utcnow_rfc3339(),
-            "refresh_token": refresh_token,
-        })
-        self._write(data)
+        with self.lock():
+            data = self.load()
+            log.info("Storing refresh token for issuer {i!r} (client {c!r})".format(i=issuer, c=client_id))
+            deep_set(data, _normalize_url(issuer), client_id, value={
+                "date": utcnow_rfc3339(),
+                "refresh_token": refresh_token,
+            })
+            self._write(data)
+
+    def get_access_token(
+            self, issuer: str, client_id: str, min_validity: float = ACCESS_TOKEN_MIN_VALIDITY
+    ) -> Union[str, None]:
+        """
+        Get cached access token, if it is still valid for at least `min_validity` seconds.
+        """
+        entry = self.get(_normalize_url(issuer), client_id, default=None) or {}
+        access_token = entry.get("access_token")
+        expires_at = entry.get("access_token_expires_at")
+        if access_token and expires_at and time.time() + min_validity < expires_at:
+            return access_token
+        return None
+
+    def set_access_token(self, issuer: str, client_id: str, access_token: str, expires_at: Optional[float] = None):
+        """
+        Cache access token (alongside refresh token).
+
+        :param expires_at: expiration time (epoch timestamp). By default, it is taken from the access token
+            (if it is a JWT with "exp" claim). Access tokens without known expiration time are not cached.
+        """
+        expires_at = expires_at or jwt_get_expiration(access_token)
+        if not expires_at:
+            log.debug("Not caching access token without known expiration time.")
+            return
+        with self.lock():
+            data = self.load()
+            log.debug("Caching access token for issuer {i!r} (client {c!r})".format(i=issuer, c=client_id))
+            keys = (_normalize_url(issuer), client_id)
+            deep_set(data, *keys, "access_token", value=access_token)
+            deep_set(data, *keys, "access_token_expires_at", value=expires_at)
+            self._write(data)
+
+    def discard_access_token(self, access_token: str):
+        """Remove given access token from cache (e.g. because it was rejected)."""
+        with self.lock():
+            data = self.load()
+            found = False
+            for clients in data.values():
+                for entry in (clients.values() if isinstance(clients, dict) else []):
+                    if isinstance(entry, dict) and entry.get("access_token") == access_token:
+                        del entry["access_token"]
+                        entry.pop("access_token_expires_at", None)
+                        found = True
+            if found:
+                self._write(data)
@@ -210,13 +210,26 @@ def jwt_decode(token: str) -> Tuple[dict, dict]:
     """
 
     def _decode(data: str) -> dict:
-        decoded = base64.b64decode(data + '=' * (4 - len(data) % 4)).decode('ascii')
+        # JWT segments are base64url encoded, without padding.
+        decoded = base64.urlsafe_b64decode(data + '=' * (-len(data) % 4)).decode('utf-8')
         return json.loads(decoded)
 
     header, payload, signature = token.split('.')
     return _decode(header), _decode(payload)
 
 
+def jwt_get_expiration(token: str) -> Union[float, None]:
+    """
+    Get expiration time (as epoch timestamp) from the "exp" claim of given token,
+    or None if it is not a (decodable) JWT or has no expiration claim.
+    """
+    try:
+        _, payload = jwt_decode(token)
+        return float(payload["exp"])
+    except Exception:
+        return None
+
+
 class DefaultOidcClientGrant(enum.Enum):
     """
     Enum with possible values for "grant_types" field of default OIDC clients provided by backend.
@@ -350,6 +363,10 @@ class OidcAuthenticator:
     def provider_info(self) -> OidcProviderInfo:
         return self._client_info.provider
 
+    @property
+    def client_info(self) -> OidcClientInfo:
+        return self._client_info
+
     def get_tokens(self, request_refresh_token: bool = False) -> AccessTokenResult:
         """Get access_token and possibly id_token+refresh_token."""
         result = self._do_token_post_request(post_data=self._get_token_endpoint_post_data())
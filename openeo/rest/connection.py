@@ -2,14 +2,17 @@
 This module provides a Connection object to manage and persist settings when interacting with the OpenEO API.
 """
 import datetime
+import gzip
 import json
 import logging
 import shlex
 import sys
+import typing
 import warnings
+import zlib
 from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Tuple, Union, Callable, Optional, Any, Iterator
+from typing import Dict, List, Tuple, Union, Callable, Optional, Any, Iterator, BinaryIO, Set
 from urllib.parse import urljoin
 
 import requests
@@ -19,9 +22,14 @@ from requests.auth import HTTPBasicAuth, AuthBase
 import openeo
 from openeo.capabilities import ApiVersionException, ComparableVersion
 from openeo.config import get_config_option, config_log
+from openeo.internal.geometry import GeometryShrinking
 from openeo.internal.graph_building import PGNode, as_flat_graph
+from openeo.internal.graph_template import GraphTemplate
 from openeo.internal.jupyter import VisualDict, VisualList
+from openeo.internal.optimizer.base import GraphOptimizer, get_optimizer
 from openeo.internal.processes.builder import ProcessBuilderBase
+from openeo.internal.processes.registry import ProcessNotFoundException, ProcessRegistry
+from openeo.internal.processes.validation import ProcessGraphValidator
 from openeo.internal.warnings import legacy_alias, deprecated
 from openeo.metadata import CollectionMetadata
 from openeo.rest import OpenEoClientException, OpenEoApiError, OpenEoRestError
@@ -30,18 +38,32 @@ from openeo.rest.auth.config import RefreshTokenStore, AuthConfig
 from openeo.rest.auth.oidc import OidcClientCredentialsAuthenticator, OidcAuthCodePkceAuthenticator, \
     OidcClientInfo, OidcAuthenticator, OidcRefreshTokenAuthenticator, OidcResourceOwnerPasswordAuthenticator, \
     OidcDeviceAuthenticator, OidcProviderInfo, OidcException, DefaultOidcClientGrant, GrantsChecker
-from openeo.rest.datacube import DataCube
-from openeo.rest.imagecollectionclient import ImageCollectionClient
 from openeo.rest.mlmodel import MlModel
 from openeo.rest.job import BatchJob, RESTJob
+from openeo.rest.jobindex import JobIndex, get_job_index, graph_hash
 from openeo.rest.rest_capabilities import RESTCapabilities
 from openeo.rest.service import Service
 from openeo.rest.udp import RESTUserDefinedProcess, Parameter
+from openeo.rest.userfile import GeometryStore, UserFile
 from openeo.util import ensure_list, dict_no_none, rfc3339, load_json_resource, LazyLoadCache, \
     ContextTimer, str_truncate
 
+if typing.TYPE_CHECKING:
+    # Imports for type checking only (heavy modules, which are imported lazily at runtime).
+    from openeo.rest.datacube import DataCube
+    from openeo.rest.imagecollectionclient import ImageCollectionClient
+
 _log = logging.getLogger(__name__)
 
+# Supported `Content-Encoding` compression schemes for request bodies.
+_REQUEST_BODY_COMPRESSORS = {
+    "gzip": gzip.compress,
+    "deflate": zlib.compress,
+}
+
+# Default chunk size (in bytes) for streaming downloads (bounded memory usage, also with decompression).
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def url_join(root_url: str, path: str):
     """Join a base url and sub path properly."""
@@ -54,6 +76,7 @@ class RestApiConnection:
     def __init__(
             self, root_url: str, auth: AuthBase = None, session: requests.Session = None,
             default_timeout: Optional[int] = None, slow_response_threshold: Optional[float] = None,
+            request_compression: Optional[str] = None, download_chunk_size: Optional[int] = None,
     ):
         self._root_url = root_url
         self.auth = auth or NullAuth()
@@ -67,6 +90,24 @@ class RestApiConnection:
             )
         }
         self.slow_response_threshold = slow_response_threshold
+        self.request_compression = self._normalize_request_compression(request_compression)
+        # Don't bother compressing small request bodies.
+        self.request_compression_min_size = 1024
+        self.download_chunk_size = download_chunk_size or DEFAULT_DOWNLOAD_CHUNK_SIZE
+
+    @staticmethod
+    def _normalize_request_compression(request_compression: Union[str, bool, None]) -> Optional[str]:
+        if request_compression in {None, False, "", "none", "None", "false", "False"}:
+            return None
+        if request_compression is True:
+            return "gzip"
+        request_compression = request_compression.lower()
+        if request_compression not in _REQUEST_BODY_COMPRESSORS:
+            raise OpenEoClientException(
+                f"Unsupported request compression {request_compression!r}."
+                f" Should be one of {sorted(_REQUEST_BODY_COMPRESSORS)}."
+            )
+        return request_compression
 
     @property
     def root_url(self):
@@ -170,8 +211,54 @@ class RestApiConnection:
         :param json: Data (as dictionary) to be posted with JSON encoding)
         :return: response: Response
         """
+        if json is not None:
+            response = self._post_compressed(path, body=_json_body(json), kwargs=kwargs)
+            if response is not None:
+                return response
         return self.request("post", path=path, json=json, allow_redirects=False, **kwargs)
 
+    def _post_json_body(self, path: str, body: bytes, **kwargs) -> Response:
+        """
+        Do POST request with an already JSON-encoded body (using request compression if enabled).
+
+        :param path: API path (without root url)
+        :param body: JSON-encoded request body
+        """
+        response = self._post_compressed(path, body=body, kwargs=kwargs)
+        if response is not None:
+            return response
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers["Content-Type"] = "application/json"
+        return self.request("post", path=path, data=body, headers=headers, allow_redirects=False, **kwargs)
+
+    def _post_compressed(self, path: str, body: bytes, kwargs: dict) -> Optional[Response]:
+        """
+        Try POST request of given JSON-encoded body with request compression.
+
+        :return: response, or None if request compression is disabled, not worthwhile (small body)
+            or not supported by the back-end (HTTP 415), in which case it is disabled for subsequent requests.
+        """
+        if not self.request_compression:
+            return None
+        compressed = _REQUEST_BODY_COMPRESSORS[self.request_compression](body)
+        if len(compressed) < self.request_compression_min_size:
+            return None
+        kwargs = dict(kwargs)
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers["Content-Type"] = "application/json"
+        headers["Content-Encoding"] = self.request_compression
+        try:
+            return self.request("post", path=path, data=compressed, headers=headers, allow_redirects=False, **kwargs)
+        except OpenEoApiError as e:
+            if e.http_status_code != 415:
+                raise
+            _log.warning(
+                f"Back-end does not support {self.request_compression!r} compressed request bodies (HTTP 415):"
+                f" disabling request compression and retrying uncompressed."
+            )
+            self.request_compression = None
+            return None
+
     def delete(self, path, **kwargs) -> Response:
         """
         Do DELETE request to REST API.
@@ -205,6 +292,11 @@ class RestApiConnection:
         return "<{c} to {r!r} with {a}>".format(c=type(self).__name__, r=self._root_url, a=type(self.auth).__name__)
 
 
+def _json_body(data: Any) -> bytes:
+    """JSON-encode given data as request body."""
+    return json.dumps(data).encode("utf-8")
+
+
 class Connection(RestApiConnection):
     """
     Connection to an openEO backend.
@@ -216,21 +308,66 @@ class Connection(RestApiConnection):
             self, url: str, auth: AuthBase = None, session: requests.Session = None, default_timeout: int = None,
             auth_config: AuthConfig = None, refresh_token_store: RefreshTokenStore = None,
             slow_response_threshold: Optional[float] = None,
+            request_compression: Union[str, bool, None] = None, download_chunk_size: Optional[int] = None,
+            optimize_process_graphs: Union[bool, GraphOptimizer, None] = None,
+            geometry_upload_min_size: Optional[int] = None,
+            geometry_shrinking: Optional[GeometryShrinking] = None,
+            job_index: Union[bool, str, JobIndex, None] = None,
     ):
         """
         Constructor of Connection, authenticates user.
 
         :param url: String Backend root url
+        :param request_compression: compression scheme ("gzip" or "deflate") to use
+            for (large) request bodies, e.g. process graphs with inline GeoJSON.
+            Disabled by default, unless configured with config option ``connection.request_compression``.
+        :param download_chunk_size: chunk size (in bytes) for streaming downloads.
+        :param optimize_process_graphs: optimize process graphs (e.g. constant folding, algebraic simplification)
+            before sending them to the back-end for processing (synchronous execution, batch jobs, services).
+            Can be a boolean or a custom :py:class:`~openeo.internal.optimizer.base.GraphOptimizer`.
+            Disabled by default, unless configured with config option ``connection.optimize_process_graphs``.
+        :param geometry_upload_min_size: minimum size (in bytes of serialized GeoJSON) of geometries
+            (e.g. for ``aggregate_spatial`` or ``mask_polygon``) to upload once to the user workspace
+            (see :py:attr:`geometry_store`) and load with ``read_vector``, instead of inlining them in the process graph.
+            Disabled by default, unless configured with config option ``connection.geometry_upload_min_size``.
+        :param geometry_shrinking: options to shrink geometries that are embedded in process graphs
+            (coordinate quantization, simplification, dropping of properties).
+            See :py:class:`~openeo.internal.geometry.GeometryShrinking`. Disabled by default.
+        :param job_index: reuse previously finished batch jobs with an identical process graph
+            (instead of creating a new job), based on a local index of process graph hashes.
+            Can be a boolean (in-memory index), a file path (persistent index)
+            or a custom :py:class:`~openeo.rest.jobindex.JobIndex`.
+            Disabled by default, unless configured with config option ``connection.job_index``.
         """
         if "://" not in url:
             url = "https://" + url
         self._orig_url = url
+        if request_compression is None:
+            request_compression = get_config_option("connection.request_compression")
+        if optimize_process_graphs is None:
+            optimize_process_graphs = get_config_option("connection.optimize_process_graphs")
+        self.graph_optimizer: Optional[GraphOptimizer] = get_optimizer(optimize_process_graphs)
+        if geometry_upload_min_size is None:
+            geometry_upload_min_size = get_config_option("connection.geometry_upload_min_size")
+        self.geometry_upload_min_size = int(geometry_upload_min_size) if geometry_upload_min_size else None
+        self._geometry_store: Optional[GeometryStore] = None
+        self.geometry_shrinking: Optional[GeometryShrinking] = geometry_shrinking
+        if job_index is None:
+            job_index = get_config_option("connection.job_index")
+        self.job_index: Optional[JobIndex] = get_job_index(job_index)
         super().__init__(
             root_url=self.version_discovery(url, session=session, timeout=default_timeout),
             auth=auth, session=session, default_timeout=default_timeout,
             slow_response_threshold=slow_response_threshold,
+            request_compression=request_compression, download_chunk_size=download_chunk_size,
         )
         self._capabilities_cache = LazyLoadCache()
+        self._process_registry = ProcessRegistry(
+            load_listing=self._load_process_listing, load_process=self._load_process
+        )
+        self._process_graph_validator = ProcessGraphValidator(get_process=self._get_process_for_validation)
+        # Process ids that are neither predefined nor (available as) user-defined processes.
+        self._validation_unknown_processes: Set[str] = set()
 
         # Initial API version check.
         if self._api_version.below(self._MINIMUM_API_VERSION):
@@ -412,20 +549,87 @@ class Connection(RestApiConnection):
                 refreshable = True
             else:
                 _log.warning("No OIDC refresh token to store.")
-        token = tokens.access_token
+        return self._set_oidc_bearer_auth(
+            access_token=tokens.access_token,
+            provider_id=provider_id,
+            client_info=authenticator.client_info,
+            refreshable=refreshable,
+            refresh_token=tokens.refresh_token or fallback_refresh_token_to_store,
+        )
+
+    def _set_oidc_bearer_auth(
+            self,
+            access_token: str,
+            *,
+            provider_id: str,
+            client_info: OidcClientInfo,
+            refreshable: bool = False,
+            refresh_token: Optional[str] = None,
+    ) -> 'Connection':
+        """Set up bearer token (based on OIDC access_token) for further requests."""
         if self._api_version.at_least("1.0.0"):
             if refreshable:
                 refresh_data = OidcRefreshInfo(
                     provider_id=provider_id,
-                    client_id=authenticator.client_id,
+                    client_id=client_info.client_id,
+                )
+                refresher = self._get_oidc_access_token_refresher(
+                    client_info=client_info,
+                    refresh_token=refresh_token,
                 )
             else:
-                refresh_data = None
-            self.auth = OidcBearerAuth(provider_id=provider_id, access_token=token, refresh_data=refresh_data)
+                refresh_data = refresher = None
+            self.auth = OidcBearerAuth(
+                provider_id=provider_id, access_token=access_token, refresh_data=refresh_data, refresher=refresher
+            )
         else:
-            self.auth = BearerAuth(bearer=token)
+            self.auth = BearerAuth(bearer=access_token)
         return self
 
+    def _get_oidc_access_token_refresher(
+            self, client_info: OidcClientInfo, refresh_token: Optional[str] = None
+    ) -> Callable[[], str]:
+        """
+        Build callable to obtain a new access token with the refresh token flow
+        (used for proactive refreshing in :py:class:`OidcBearerAuth`).
+        """
+
+        def refresh() -> str:
+            nonlocal refresh_token
+            refresh_token_store = self._get_refresh_token_store()
+            issuer, client_id = client_info.provider.issuer, client_info.client_id
+            with refresh_token_store.lock():
+                stored_refresh_token = refresh_token_store.get_refresh_token(issuer=issuer, client_id=client_id)
+                if stored_refresh_token:
+                    # Another process might have refreshed the access token already.
+                    access_token = refresh_token_store.get_access_token(
+                        issuer=issuer, client_id=client_id, min_validity=OidcBearerAuth.DEFAULT_REFRESH_MARGIN
+                    )
+                    if access_token:
+                        _log.info("Using cached OIDC access token from refresh token store.")
+                        return access_token
+                current_refresh_token = stored_refresh_token or refresh_token
+                if current_refresh_token is None:
+                    raise OpenEoClientException("No refresh token given or found")
+                authenticator = OidcRefreshTokenAuthenticator(
+                    client_info=client_info, refresh_token=current_refresh_token
+                )
+                tokens = authenticator.get_tokens()
+                if tokens.refresh_token:
+                    # Handle refresh token rotation.
+                    refresh_token = tokens.refresh_token
+                    if stored_refresh_token:
+                        refresh_token_store.set_refresh_token(
+                            issuer=issuer, client_id=client_id, refresh_token=tokens.refresh_token
+                        )
+                if stored_refresh_token:
+                    refresh_token_store.set_access_token(
+                        issuer=issuer, client_id=client_id, access_token=tokens.access_token
+                    )
+                return tokens.access_token
+
+        return refresh
+
     def authenticate_oidc_authorization_code(
             self,
             client_id: str = None,
@@ -497,22 +701,50 @@ class Connection(RestApiConnection):
             default_client_grant_check=[DefaultOidcClientGrant.REFRESH_TOKEN],
         )
 
-        if refresh_token is None:
-            refresh_token = self._get_refresh_token_store().get_refresh_token(
-                issuer=client_info.provider.issuer,
-                client_id=client_info.client_id
+        if refresh_token is not None:
+            authenticator = OidcRefreshTokenAuthenticator(client_info=client_info, refresh_token=refresh_token)
+            return self._authenticate_oidc(
+                authenticator,
+                provider_id=provider_id,
+                store_refresh_token=store_refresh_token,
+                fallback_refresh_token_to_store=refresh_token,
+                refreshable=True,
             )
+
+        # Refresh token from (shared) store: lock it to avoid concurrent refreshes (e.g. from parallel processes)
+        # and reuse a cached access token if possible.
+        refresh_token_store = self._get_refresh_token_store()
+        issuer = client_info.provider.issuer
+        with refresh_token_store.lock():
+            access_token = refresh_token_store.get_access_token(issuer=issuer, client_id=client_info.client_id)
+            if access_token:
+                _log.info("Using cached OIDC access token from refresh token store.")
+                return self._set_oidc_bearer_auth(
+                    access_token=access_token, provider_id=provider_id, client_info=client_info, refreshable=True
+                )
+
+            refresh_token = refresh_token_store.get_refresh_token(issuer=issuer, client_id=client_info.client_id)
             if refresh_token is None:
                 raise OpenEoClientException("No refresh token given or found")
 
-        authenticator = OidcRefreshTokenAuthenticator(client_info=client_info, refresh_token=refresh_token)
-        return self._authenticate_oidc(
-            authenticator,
-            provider_id=provider_id,
-            store_refresh_token=store_refresh_token,
-            fallback_refresh_token_to_store=refresh_token,
-            refreshable=True,
-        )
+            authenticator = OidcRefreshTokenAuthenticator(client_info=client_info, refresh_token=refresh_token)
+            self._authenticate_oidc(
+                authenticator,
+                provider_id=provider_id,
+                store_refresh_token=store_refresh_token,
+                fallback_refresh_token_to_store=refresh_token,
+                refreshable=True,
+            )
+            self._cache_oidc_access_token(client_info=client_info)
+            return self
+
+    def _cache_oidc_access_token(self, client_info: OidcClientInfo):
+        """Cache current OIDC access token in refresh token store (for reuse by other connections/processes)."""
+        if isinstance(self.auth, OidcBearerAuth):
+            self._get_refresh_token_store().set_access_token(
+                issuer=client_info.provider.issuer, client_id=client_info.client_id,
+                access_token=self.auth.access_token,
+            )
 
     def authenticate_oidc_device(
             self, client_id: str = None, client_secret: str = None, provider_id: str = None,
@@ -558,25 +790,38 @@ class Connection(RestApiConnection):
         )
 
         # Try refresh token first.
-        refresh_token = self._get_refresh_token_store().get_refresh_token(
-            issuer=client_info.provider.issuer,
-            client_id=client_info.client_id
-        )
-        if refresh_token:
-            try:
-                _log.info("Found refresh token: trying refresh token based authentication.")
-                authenticator = OidcRefreshTokenAuthenticator(client_info=client_info, refresh_token=refresh_token)
-                con = self._authenticate_oidc(
-                    authenticator,
-                    provider_id=provider_id,
-                    store_refresh_token=store_refresh_token,
-                    fallback_refresh_token_to_store=refresh_token,
+        # Lock the (shared) refresh token store to avoid concurrent refreshes (e.g. from parallel processes)
+        # and reuse a cached access token if possible.
+        refresh_token_store = self._get_refresh_token_store()
+        issuer = client_info.provider.issuer
+        with refresh_token_store.lock():
+            access_token = refresh_token_store.get_access_token(issuer=issuer, client_id=client_info.client_id)
+            if access_token:
+                _log.info("Found cached access token in refresh token store.")
+                con = self._set_oidc_bearer_auth(
+                    access_token=access_token, provider_id=provider_id, client_info=client_info, refreshable=True
                 )
-                # TODO: pluggable/jupyter-aware display function?
-                print("Authenticated using refresh token.")
+                print("Authenticated using cached access token.")
                 return con
-            except OidcException as e:
-                _log.info("Refresh token based authentication failed: {e}.".format(e=e))
+
+            refresh_token = refresh_token_store.get_refresh_token(issuer=issuer, client_id=client_info.client_id)
+            if refresh_token:
+                try:
+                    _log.info("Found refresh token: trying refresh token based authentication.")
+                    authenticator = OidcRefreshTokenAuthenticator(client_info=client_info, refresh_token=refresh_token)
+                    con = self._authenticate_oidc(
+                        authenticator,
+                        provider_id=provider_id,
+                        store_refresh_token=store_refresh_token,
+                        fallback_refresh_token_to_store=refresh_token,
+                    )
+                    if store_refresh_token:
+                        self._cache_oidc_access_token(client_info=client_info)
+                    # TODO: pluggable/jupyter-aware display function?
+                    print("Authenticated using refresh token.")
+                    return con
+                except OidcException as e:
+                    _log.info("Refresh token based authentication failed: {e}.".format(e=e))
 
         # Fall back on device code flow
         # TODO: make it possible to do other fallback flows too?
@@ -609,6 +854,7 @@ class Connection(RestApiConnection):
                         f" Trying to re-authenticate with the refresh token."
                     )
                     try:
+                        self._get_refresh_token_store().discard_access_token(self.auth.access_token)
                         self.authenticate_oidc_refresh_token(
                             client_id=self.auth.refresh_data.client_id,
                             provider_id=self.auth.refresh_data.provider_id,
@@ -786,15 +1032,42 @@ class Connection(RestApiConnection):
 
         :return: processes_dict: Dict All available processes of the back end.
         """
-        if namespace is None:
-            processes = self._capabilities_cache.get(
-                key=("processes", "backend"),
-                load=lambda: self.get('/processes', expected_status=200).json()["processes"]
-            )
-        else:
-            processes = self.get('/processes/' + namespace, expected_status=200).json()["processes"]
+        processes = self._process_registry.list_processes(namespace=namespace)
         return VisualList("processes", data=processes, parameters={'show-graph': True, 'provide-download': False})
 
+    # Private registry "namespace" key for the user-defined processes (``/process_graphs`` endpoints) of the user,
+    # distinct from any actual process namespace of the back-end.
+    _UDP_NAMESPACE = object()
+
+    def _load_process_listing(self, namespace: Optional[str] = None) -> List[dict]:
+        if namespace is self._UDP_NAMESPACE:
+            path = "/process_graphs"
+        else:
+            path = "/processes" if namespace is None else "/processes/" + namespace
+        return self.get(path, expected_status=200).json()["processes"]
+
+    def _load_process(self, namespace: str, process_id: str) -> dict:
+        if namespace is self._UDP_NAMESPACE:
+            return self.get(f"/process_graphs/{process_id}", expected_status=200).json()
+        return self.get(f"/processes/{namespace}/{process_id}", expected_status=200).json()
+
+    def _get_process_for_validation(self, process_id: str, namespace: Optional[str]) -> dict:
+        """
+        Get process metadata for offline validation:
+        process ids without namespace can also refer to user-defined processes of the user.
+        """
+        try:
+            return self._process_registry.get_process(process_id=process_id, namespace=namespace)
+        except ProcessNotFoundException:
+            if namespace is not None or process_id in self._validation_unknown_processes:
+                raise
+            try:
+                return self._process_registry.get_process(process_id=process_id, namespace=self._UDP_NAMESPACE)
+            except (ProcessNotFoundException, OpenEoApiError) as e:
+                _log.info(f"Failed to look up {process_id!r} in user-defined processes: {e!r}")
+                self._validation_unknown_processes.add(process_id)
+            raise
+
     def describe_process(self, id: str, namespace: str = None) -> dict:
         """
         Returns a single process from the back end.
@@ -804,14 +1077,20 @@ class Connection(RestApiConnection):
 
         :return: The process definition.
         """
+        process = self._process_registry.get_process(process_id=id, namespace=namespace)
+        return VisualDict("process", data=process, parameters={'show-graph': True, 'provide-download': False})
 
-        processes = self.list_processes(namespace)
-        for process in processes:
-            if process["id"] == id:
-                return VisualDict("process", data=process, parameters={'show-graph': True, 'provide-download': False})
+    def describe_process_parameters(self, id: str, namespace: str = None) -> Dict[str, dict]:
+        """
+        Get the JSON schemas of the parameters of a process, keyed on parameter name.
 
-        raise OpenEoClientException("Process does not exist.")
+        :param id: The id of the process.
+        :param namespace: The namespace of the process.
+        :return: mapping of parameter name to parameter schema
 
+        .. versionadded:: 0.13.1
+        """
+        return self._process_registry.get_parameter_schemas(process_id=id, namespace=namespace)
 
     def list_jobs(self) -> List[dict]:
         """
@@ -884,13 +1163,22 @@ class Connection(RestApiConnection):
         """
         return RESTUserDefinedProcess(user_defined_process_id=user_defined_process_id, connection=self)
 
-    def validate_process_graph(self, process_graph: dict) -> List[dict]:
+    def validate_process_graph(self, process_graph: dict, offline: bool = False) -> List[dict]:
         """
         Validate a process graph without executing it.
 
         :param process_graph: (flat) dict representing process graph
+        :param offline: validate client-side against the (cached) process listing of the back-end
+            instead of doing a request to the back-end's validation endpoint.
+            Offline validation only covers basic checks: known processes, required/unknown arguments,
+            basic argument types and node/parameter references.
+            Process ids without namespace are looked up in the predefined and user-defined processes.
         :return: list of errors (dictionaries with "code" and "message" fields)
+
+        .. versionchanged:: 0.13.1 Added ``offline`` argument.
         """
+        if offline:
+            return self._process_graph_validator.validate(process_graph)
         request = {"process_graph": process_graph}
         return self.post(path="/validation", json=request, expected_status=200).json()["errors"]
 
@@ -899,7 +1187,7 @@ class Connection(RestApiConnection):
         # TODO make this a public property (it's also useful outside the Connection class)
         return self.capabilities().api_version_check
 
-    def datacube_from_process(self, process_id: str, namespace: str = None, **kwargs) -> DataCube:
+    def datacube_from_process(self, process_id: str, namespace: str = None, **kwargs) -> 'DataCube':
         """
         Load a data cube from a (custom) process.
 
@@ -909,6 +1197,8 @@ class Connection(RestApiConnection):
         :return: A :py:class:`DataCube`, without valid metadata, as the client is not aware of this custom process.
         """
 
+        from openeo.rest.datacube import DataCube
+
         if self._api_version.at_least("1.0.0"):
             graph = PGNode(process_id, namespace=namespace, arguments=kwargs)
             return DataCube(graph=graph, connection=self)
@@ -916,7 +1206,7 @@ class Connection(RestApiConnection):
             raise OpenEoClientException(
                 "This method requires support for at least version 1.0.0 in the openEO backend.")
 
-    def datacube_from_flat_graph(self, flat_graph: dict, parameters: dict = None) -> DataCube:
+    def datacube_from_flat_graph(self, flat_graph: dict, parameters: dict = None) -> 'DataCube':
         """
         Construct a :py:class:`DataCube` from a flat dictionary representation of a process graph.
 
@@ -940,10 +1230,12 @@ class Connection(RestApiConnection):
 
             flat_graph = flat_graph["process_graph"]
 
+        from openeo.rest.datacube import DataCube
+
         pgnode = PGNode.from_flat_graph(flat_graph=flat_graph, parameters=parameters or {})
         return DataCube(graph=pgnode, connection=self)
 
-    def datacube_from_json(self, src: Union[str, Path], parameters: dict = None) -> DataCube:
+    def datacube_from_json(self, src: Union[str, Path], parameters: dict = None) -> 'DataCube':
         """
         Construct a :py:class:`DataCube` from JSON resource containing (flat) process graph representation.
 
@@ -961,7 +1253,7 @@ class Connection(RestApiConnection):
             properties: Optional[Dict[str, Union[str, PGNode, Callable]]] = None,
             max_cloud_cover: Optional[float] = None,
             fetch_metadata=True,
-    ) -> DataCube:
+    ) -> 'DataCube':
         """
         Load a DataCube by collection id.
 
@@ -977,6 +1269,7 @@ class Connection(RestApiConnection):
             added the ``max_cloud_cover`` argument.
         """
         if self._api_version.at_least("1.0.0"):
+            from openeo.rest.datacube import DataCube
             return DataCube.load_collection(
                 collection_id=collection_id, connection=self,
                 spatial_extent=spatial_extent, temporal_extent=temporal_extent, bands=bands, properties=properties,
@@ -984,6 +1277,7 @@ class Connection(RestApiConnection):
                 fetch_metadata=fetch_metadata,
             )
         else:
+            from openeo.rest.imagecollectionclient import ImageCollectionClient
             return ImageCollectionClient.load_collection(
                 collection_id=collection_id, session=self,
                 spatial_extent=spatial_extent, temporal_extent=temporal_extent, bands=bands
@@ -997,7 +1291,7 @@ class Connection(RestApiConnection):
             spatial_extent: Optional[Dict[str, float]] = None,
             temporal_extent: Optional[List[Union[str, datetime.datetime, datetime.date]]] = None,
             bands: Optional[List[str]] = None,
-    ) -> DataCube:
+    ) -> 'DataCube':
         """
         Loads batch job results by job id from the server-side user workspace.
         The job must have been stored by the authenticated user on the back-end currently connected to.
@@ -1013,6 +1307,7 @@ class Connection(RestApiConnection):
         if self._api_version.below("1.0.0"):
             raise OpenEoClientException(
                 "This method requires support for at least version 1.0.0 in the openEO backend.")
+        from openeo.rest.datacube import DataCube
         return self.datacube_from_process(
             process_id="load_result",
             id=id,
@@ -1071,14 +1366,54 @@ class Connection(RestApiConnection):
         files = self.get('/files', expected_status=200).json()['files']
         return VisualList("data-table", data=files, parameters={'columns': 'files'})
 
-    def create_file(self, path):
+    def create_file(self, path: str) -> UserFile:
         """
-        Creates virtual file
+        Creates virtual file (handle to a file in the user workspace, which is not uploaded yet).
 
+        :param path: path of the file in the user workspace
         :return: file object.
         """
-        # No endpoint just returns a file object.
-        raise NotImplementedError()
+        return UserFile(path, connection=self)
+
+    def upload_file(
+            self, source: Union[str, Path, bytes, BinaryIO], target: Optional[str] = None,
+            chunk_size: Optional[int] = None,
+    ) -> UserFile:
+        """
+        Upload a file to the user workspace, streaming it in chunks.
+
+        :param source: local path, bytes or binary file-like object to upload
+        :param target: path in the user workspace (default: file name of the local path)
+        :param chunk_size: chunk size (in bytes) for reading and sending the content
+        :return: the uploaded file
+
+        .. versionadded:: 0.13.1
+        """
+        if target is None:
+            if not isinstance(source, (str, Path)):
+                raise OpenEoClientException("Target path is required to upload in-memory data.")
+            target = Path(source).name
+        return UserFile(target, connection=self).upload(source, chunk_size=chunk_size)
+
+    @property
+    def geometry_store(self) -> GeometryStore:
+        """
+        Store of geometries in the user workspace, uploaded once (keyed by content hash)
+        and referenced with ``read_vector`` in process graphs.
+
+        .. versionadded:: 0.13.1
+        """
+        if self._geometry_store is None:
+            self._geometry_store = GeometryStore(connection=self)
+        return self._geometry_store
+
+    def _geometry_argument(self, geometry: dict) -> Union[dict, PGNode]:
+        """Replace (large) GeoJSON geometry with a reference to the geometry store, if enabled."""
+        if self.geometry_upload_min_size:
+            data = GeometryStore.serialize(geometry)
+            if len(data) >= self.geometry_upload_min_size:
+                return self.geometry_store.reference(geometry)
+        return geometry
 
     def _build_request_with_process_graph(self, process_graph: Union[dict, Any], **kwargs) -> dict:
         """
@@ -1087,6 +1422,8 @@ class Connection(RestApiConnection):
         """
         result = kwargs
         process_graph = as_flat_graph(process_graph)
+        if self.graph_optimizer:
+            process_graph = self.graph_optimizer.optimize(process_graph)
         if self._api_version.at_least("1.0.0"):
             if "process_graph" not in process_graph:
                 process_graph = {"process_graph": process_graph}
@@ -1117,7 +1454,8 @@ class Connection(RestApiConnection):
 
         if outputfile is not None:
             with Path(outputfile).open(mode="wb") as f:
-                for chunk in response.iter_content(chunk_size=None):
+                # Note: compressed responses (`Content-Encoding` gzip/deflate) are decompressed on the fly.
+                for chunk in response.iter_content(chunk_size=self.download_chunk_size):
                     f.write(chunk)
         else:
             return response.content
@@ -1160,8 +1498,19 @@ class Connection(RestApiConnection):
             # TODO: get rid of this non-standard field? https://github.com/Open-EO/openeo-api/issues/276
             req["job_options"] = additional
 
+        if self.job_index is not None:
+            digest = graph_hash(req.get("process", req.get("process_graph")))
+            job = self.job_index.find_finished(self, digest)
+            if job is not None:
+                _log.info(f"Reusing finished job {job.job_id!r} with identical process graph")
+                return job
         response = self.post("/jobs", json=req, expected_status=201)
+        job = self._job_from_create_response(response)
+        if self.job_index is not None:
+            self.job_index.add(self, digest, job.job_id)
+        return job
 
+    def _job_from_create_response(self, response: Response) -> BatchJob:
         job_id = None
         if "openeo-identifier" in response.headers:
             job_id = response.headers['openeo-identifier'].strip()
@@ -1172,6 +1521,56 @@ class Connection(RestApiConnection):
             raise OpenEoClientException("Job creation response did not contain a valid job id")
         return BatchJob(job_id=job_id, connection=self)
 
+    def build_job_template(
+            self, process_graph: Union[dict, str, Path], parameters: Optional[List[Union[str, Parameter]]] = None,
+            title: Optional[str] = None, description: Optional[str] = None,
+            plan: Optional[str] = None, budget: Optional[float] = None,
+            additional: Optional[dict] = None
+    ) -> GraphTemplate:
+        """
+        Build a (pre-serialized) template of a batch job creation request,
+        to create a lot of batch jobs that only differ in some parameter values
+        (e.g. spatial or temporal extent) with :py:meth:`create_job_from_template`,
+        without rebuilding, flattening and serializing the whole process graph for each job.
+
+        Parameter placeholders can be used in the process graph (e.g. as ``spatial_extent`` argument),
+        but also in ``title`` or ``description``.
+
+        :param process_graph: (flat) dict representing a process graph, or process graph as raw JSON string,
+            or as local file path or URL, with parameter placeholders
+        :param parameters: template parameters (names or :py:class:`~openeo.api.process.Parameter` objects).
+            If not given: all parameters referenced in the process graph (outside of callbacks).
+        :param title: String title of the job
+        :param description: String description of the job
+        :param plan: billing plan
+        :param budget: maximum cost the request is allowed to produce
+        :param additional: additional job options to pass to the backend
+        :return: :py:class:`~openeo.internal.graph_template.GraphTemplate` of the request body
+
+        .. versionadded:: 0.13.1
+        """
+        req = self._build_request_with_process_graph(
+            process_graph=process_graph,
+            **dict_no_none(title=title, description=description, plan=plan, budget=budget)
+        )
+        if additional:
+            req["job_options"] = additional
+        return GraphTemplate(req, parameters=parameters)
+
+    def create_job_from_template(self, template: GraphTemplate, **values) -> BatchJob:
+        """
+        Create a batch job from a job template (see :py:meth:`build_job_template`) and given parameter values.
+
+        :param template: job creation request template
+        :param values: values for the template parameters
+        :return: the created batch job
+
+        .. versionadded:: 0.13.1
+        """
+        body = template.render(**values).encode("utf-8")
+        response = self._post_json_body("/jobs", body=body, expected_status=201)
+        return self._job_from_create_response(response)
+
     def job(self, job_id: str) -> BatchJob:
         """
         Get the job based on the id. The job with the given id should already exist.
@@ -1194,7 +1593,7 @@ class Connection(RestApiConnection):
         """
         return Service(service_id, connection=self)
 
-    def load_disk_collection(self, format: str, glob_pattern: str, options: dict = {}) -> ImageCollectionClient:
+    def load_disk_collection(self, format: str, glob_pattern: str, options: dict = {}) -> 'ImageCollectionClient':
         """
         Loads image data from disk as an ImageCollection.
 
@@ -1205,11 +1604,13 @@ class Connection(RestApiConnection):
         """
 
         if self._api_version.at_least("1.0.0"):
+            from openeo.rest.datacube import DataCube
             return DataCube.load_disk_collection(self, format, glob_pattern, **options)
         else:
+            from openeo.rest.imagecollectionclient import ImageCollectionClient
             return ImageCollectionClient.load_disk_collection(self, format, glob_pattern, **options)
 
-    def as_curl(self, data: Union[dict, DataCube], path="/result", method="POST") -> str:
+    def as_curl(self, data: Union[dict, 'DataCube'], path="/result", method="POST") -> str:
         """
         Build curl command to evaluate given process graph or data cube
         (including authorization and content-type headers).
@@ -8,6 +8,7 @@ be evaluated by an openEO backend.
 
 """
 import datetime
+import functools
 import logging
 import pathlib
 import re
@@ -16,33 +17,35 @@ import warnings
 from builtins import staticmethod
 from typing import List, Dict, Union, Tuple, Optional, Any
 
-import numpy as np
 import requests
-import shapely.geometry
-import shapely.geometry.base
-from shapely.geometry import Polygon, MultiPolygon, mapping
 
 import openeo
 import openeo.processes
 from openeo.api.process import Parameter
+from openeo.config import get_config_option
 from openeo.internal.documentation import openeo_process
 from openeo.internal.graph_building import PGNode, ReduceNode, _FromNodeMixin
 from openeo.internal.processes.builder import get_parameter_names, convert_callable_to_pgnode
 from openeo.internal.warnings import legacy_alias, UserDeprecationWarning, deprecated
 from openeo.metadata import CollectionMetadata, Band, BandDimension, TemporalDimension, SpatialDimension
 from openeo.processes import ProcessBuilder
-from openeo.rest import BandMathException, OperatorException, OpenEoClientException
+from openeo.rest import BandMathException, OperatorException, OpenEoClientException, OpenEoApiError
 from openeo.rest._datacube import _ProcessGraphAbstraction, THIS
 from openeo.rest.job import BatchJob, RESTJob
 from openeo.rest.mlmodel import MlModel
 from openeo.rest.service import Service
 from openeo.rest.udp import RESTUserDefinedProcess
 from openeo.rest.vectorcube import VectorCube
-from openeo.util import get_temporal_extent, dict_no_none, rfc3339, guess_format
+from openeo.util import get_temporal_extent, dict_no_none, rfc3339, guess_format, is_shapely_geometry
 
 if typing.TYPE_CHECKING:
-    # Imports for type checking only (circular import issue at runtime).
+    # Imports for type checking only (circular import issue or slow import at runtime).
     from openeo.rest.connection import Connection
+    from openeo.internal.geometry import GeometryShrinking
+    from openeo.internal.volume import VolumeEstimate
+    import numpy
+    import shapely.geometry
+    import shapely.geometry.base
     import xarray
     from openeo.udf import XarrayDataCube
 
@@ -183,6 +186,29 @@ class UDF:
         return PGNode(process_id="run_udf", arguments=arguments)
 
 
+@functools.lru_cache(maxsize=256)
+def _process_id_callback(process_id: str, parent_parameters: Tuple[str, ...]) -> PGNode:
+    """
+    Build callback node for a simple predefined process (e.g. "mean" as reducer).
+    Result is cached (and shared): should not be modified in place.
+    """
+    process_function = getattr(openeo.processes, process_id, None)
+    if callable(process_function):
+        process_params = get_parameter_names(process_function)
+        # TODO: switch to "Callable" handling here
+    else:
+        # Best effort guess
+        process_params = list(parent_parameters)
+    if parent_parameters == ("x", "y") and (len(process_params) == 1 or process_params[:1] == ["data"]):
+        # Special case: wrap all parent parameters in an array
+        arguments = {process_params[0]: [{"from_parameter": p} for p in parent_parameters]}
+    else:
+        # Only pass parameters that correspond with an arg name
+        common = [p for p in process_params if p in parent_parameters]
+        arguments = {p: {"from_parameter": p} for p in common}
+    return PGNode(process_id=process_id, arguments=arguments)
+
+
 class DataCube(_ProcessGraphAbstraction):
     """
     Class representing a openEO (raster) data cube.
@@ -297,6 +323,10 @@ class DataCube(_ProcessGraphAbstraction):
                 prop: cls._get_callback(pred, parent_parameters=["value"])
                 for prop, pred in properties.items()
             }
+        if metadata and spatial_extent:
+            metadata = metadata.filter_bbox(spatial_extent)
+        if metadata and isinstance(temporal_extent, list):
+            metadata = metadata.filter_temporal(*temporal_extent)
         pg = PGNode(
             process_id='load_collection',
             arguments=arguments
@@ -387,13 +417,17 @@ class DataCube(_ProcessGraphAbstraction):
 
         https://open-eo.github.io/openeo-api/processreference/#filter_temporal
         """
-        return self.process(
+        extent = self._get_temporal_extent(*args, start_date=start_date, end_date=end_date, extent=extent)
+        cube = self.process(
             process_id='filter_temporal',
             arguments={
                 'data': THIS,
-                'extent': self._get_temporal_extent(*args, start_date=start_date, end_date=end_date, extent=extent)
+                'extent': extent
             }
         )
+        if cube.metadata and isinstance(extent, list):
+            cube.metadata = cube.metadata.filter_temporal(*extent)
+        return cube
 
     @openeo_process
     def filter_bbox(
@@ -463,7 +497,7 @@ class DataCube(_ProcessGraphAbstraction):
                 if len(args) > 4:
                     crs = args[4]
             elif len(args) == 1 and (isinstance(args[0], (list, tuple)) and len(args[0]) == 4
-                                     or isinstance(args[0], (dict, shapely.geometry.base.BaseGeometry, Parameter))):
+                                     or isinstance(args[0], (dict, Parameter)) or is_shapely_geometry(args[0])):
                 bbox = args[0]
             else:
                 raise ValueError(args)
@@ -472,7 +506,7 @@ class DataCube(_ProcessGraphAbstraction):
             extent = bbox
         else:
             if bbox:
-                if isinstance(bbox, shapely.geometry.base.BaseGeometry):
+                if is_shapely_geometry(bbox):
                     west, south, east, north = bbox.bounds
                 elif isinstance(bbox, (list, tuple)) and len(bbox) == 4:
                     west, south, east, north = bbox[:4]
@@ -486,13 +520,16 @@ class DataCube(_ProcessGraphAbstraction):
             extent = {'west': west, 'east': east, 'north': north, 'south': south}
             extent.update(dict_no_none(crs=crs, base=base, height=height))
 
-        return self.process(
+        cube = self.process(
             process_id='filter_bbox',
             arguments={
                 'data': THIS,
                 'extent': extent
             }
         )
+        if cube.metadata and isinstance(extent, dict):
+            cube.metadata = cube.metadata.filter_bbox(extent)
+        return cube
 
     @openeo_process
     def filter_spatial(
@@ -881,12 +918,17 @@ class DataCube(_ProcessGraphAbstraction):
 
     def _get_geometry_argument(
             self,
-            geometry: Union[shapely.geometry.base.BaseGeometry, dict, str, pathlib.Path, Parameter, _FromNodeMixin],
+            geometry: Union["shapely.geometry.base.BaseGeometry", dict, str, pathlib.Path, Parameter, _FromNodeMixin],
             valid_geojson_types: List[str],
             crs: str = None,
+            shrinking: Optional["GeometryShrinking"] = None,
     ) -> Union[dict, Parameter, PGNode]:
         """
-        Convert input to a geometry as "geojson" subtype object.
+        Convert input to a geometry as "geojson" subtype object
+        (or a ``read_vector`` node for large geometries uploaded to the connection's geometry store).
+
+        :param shrinking: options to shrink the geometry payload
+            (default: the ``geometry_shrinking`` options of the connection).
         """
         if isinstance(geometry, (str, pathlib.Path)):
             # Assumption: `geometry` is path to polygon is a path to vector file at backend.
@@ -898,8 +940,9 @@ class DataCube(_ProcessGraphAbstraction):
         elif isinstance(geometry, _FromNodeMixin):
             return geometry.from_node()
 
-        if isinstance(geometry, shapely.geometry.base.BaseGeometry):
-            geometry = mapping(geometry)
+        if is_shapely_geometry(geometry):
+            import shapely.geometry
+            geometry = shapely.geometry.mapping(geometry)
         if not isinstance(geometry, dict):
             raise OpenEoClientException("Invalid geometry argument: {g!r}".format(g=geometry))
 
@@ -907,17 +950,54 @@ class DataCube(_ProcessGraphAbstraction):
             raise OpenEoClientException("Invalid geometry type {t!r}, must be one of {s}".format(
                 t=geometry.get("type"), s=valid_geojson_types
             ))
+        if shrinking is None and self._connection is not None:
+            shrinking = self._connection.geometry_shrinking
+        if shrinking is not None:
+            geometry = shrinking.apply(geometry, resolution_tolerance=(
+                self._resolution_tolerance(geometry, crs=crs) if shrinking.simplify == shrinking.RESOLUTION else None
+            ))
         if crs:
             # TODO: don't warn when the crs is Lon-Lat like EPSG:4326?
             warnings.warn("Geometry with non-Lon-Lat CRS {c!r} is only supported by specific back-ends.".format(c=crs))
             # TODO #204 alternative for non-standard CRS in GeoJSON object?
             geometry["crs"] = {"type": "name", "properties": {"name": crs}}
+        if self._connection is not None:
+            return self._connection._geometry_argument(geometry)
         return geometry
 
+    def _resolution_tolerance(self, geometry: dict, crs: Optional[str]) -> Optional[float]:
+        """Half pixel simplification tolerance for geometry (in given CRS), based on the cube resolution."""
+        from openeo.internal.geometry import GeometryShrinking
+        from openeo.util import _normalize_crs
+
+        if self.metadata is None:
+            return None
+        dimensions = [d for d in self.metadata.spatial_dimensions if d.name == "x"]
+        if not dimensions or not dimensions[0].step:
+            return None
+        geometry_degrees = _normalize_crs(crs) == 4326
+        latitude = 0
+        if geometry_degrees:
+            import shapely.geometry
+
+            if geometry["type"] == "FeatureCollection":
+                shapes = [shapely.geometry.shape(f["geometry"]) for f in geometry["features"] if f.get("geometry")]
+            elif geometry["type"] == "Feature":
+                shapes = [shapely.geometry.shape(geometry["geometry"])] if geometry.get("geometry") else []
+            else:
+                shapes = [shapely.geometry.shape(geometry)]
+            if shapes:
+                bounds = shapely.geometry.GeometryCollection(shapes).bounds
+                latitude = (bounds[1] + bounds[3]) / 2
+        return GeometryShrinking.resolution_tolerance(
+            step=dimensions[0].step, step_degrees=_normalize_crs(dimensions[0].crs) == 4326,
+            geometry_degrees=geometry_degrees, latitude=latitude,
+        )
+
     @openeo_process
     def aggregate_spatial(
             self,
-            geometries: Union[shapely.geometry.base.BaseGeometry, dict, str, pathlib.Path, Parameter, "VectorCube"],
+            geometries: Union["shapely.geometry.base.BaseGeometry", dict, str, pathlib.Path, Parameter, "VectorCube"],
             reducer: Union[str, PGNode, typing.Callable],
             target_dimension: Optional[str] = None,
             crs: str = None,
@@ -971,20 +1051,7 @@ class DataCube(_ProcessGraphAbstraction):
             pg = process
         elif isinstance(process, str):
             # Assume given reducer is a simple predefined reduce process_id
-            if process in openeo.processes.__dict__:
-                process_params = get_parameter_names(openeo.processes.__dict__[process])
-                # TODO: switch to "Callable" handling here
-            else:
-                # Best effort guess
-                process_params = parent_parameters
-            if parent_parameters == ["x", "y"] and (len(process_params) == 1 or process_params[:1] == ["data"]):
-                # Special case: wrap all parent parameters in an array
-                arguments = {process_params[0]: [{"from_parameter": p} for p in parent_parameters]}
-            else:
-                # Only pass parameters that correspond with an arg name
-                common = set(process_params).intersection(parent_parameters)
-                arguments = {p: {"from_parameter": p} for p in common}
-            pg = PGNode(process_id=process, arguments=arguments)
+            pg = _process_id_callback(process, parent_parameters=tuple(parent_parameters))
         elif isinstance(process, typing.Callable):
             pg = convert_callable_to_pgnode(process, parent_parameters=parent_parameters)
         elif isinstance(process, UDF):
@@ -1102,7 +1169,7 @@ class DataCube(_ProcessGraphAbstraction):
     # @openeo_process
     def chunk_polygon(
             self,
-            chunks: Union[shapely.geometry.base.BaseGeometry, dict, str, pathlib.Path, Parameter, "VectorCube"],
+            chunks: Union["shapely.geometry.base.BaseGeometry", dict, str, pathlib.Path, Parameter, "VectorCube"],
             process: Union[str, PGNode, typing.Callable],
             mask_value: float = None,
             context: Optional[dict] = None,
@@ -1518,7 +1585,7 @@ class DataCube(_ProcessGraphAbstraction):
     @openeo_process
     def mask_polygon(
             self,
-            mask: Union[shapely.geometry.base.BaseGeometry, dict, str, pathlib.Path, Parameter, "VectorCube"],
+            mask: Union["shapely.geometry.base.BaseGeometry", dict, str, pathlib.Path, Parameter, "VectorCube"],
             srs: str = None,
             replacement=None, inside: bool = None
     ) -> 'DataCube':
@@ -1599,7 +1666,7 @@ class DataCube(_ProcessGraphAbstraction):
 
     @openeo_process
     def apply_kernel(
-            self, kernel: Union[np.ndarray, List[List[float]]], factor=1.0, border=0,
+            self, kernel: Union["numpy.ndarray", List[List[float]]], factor=1.0, border=0,
             replace_invalid=0
     ) -> "DataCube":
         """
@@ -1623,7 +1690,8 @@ class DataCube(_ProcessGraphAbstraction):
         """
         return self.process('apply_kernel', {
             'data': THIS,
-            'kernel': kernel.tolist() if isinstance(kernel, np.ndarray) else kernel,
+            # Convert numpy array (without importing numpy) to list.
+            'kernel': kernel.tolist() if hasattr(kernel, "tolist") else kernel,
             'factor': factor,
             'border': border,
             'replace_invalid': replace_invalid
@@ -1674,7 +1742,7 @@ class DataCube(_ProcessGraphAbstraction):
     ####VIEW methods #######
 
     @deprecated("Use :py:meth:`aggregate_spatial` with reducer ``'mean'``.", version="0.10.0")
-    def polygonal_mean_timeseries(self, polygon: Union[Polygon, MultiPolygon, str]) -> 'DataCube':
+    def polygonal_mean_timeseries(self, polygon: Union["shapely.geometry.Polygon", "shapely.geometry.MultiPolygon", str]) -> 'DataCube':
         """
         Extract a mean time series for the given (multi)polygon. Its points are
         expected to be in the EPSG:4326 coordinate
@@ -1686,7 +1754,7 @@ class DataCube(_ProcessGraphAbstraction):
         return self.aggregate_spatial(geometries=polygon, reducer="mean")
 
     @deprecated("Use :py:meth:`aggregate_spatial` with reducer ``'histogram'``.", version="0.10.0")
-    def polygonal_histogram_timeseries(self, polygon: Union[Polygon, MultiPolygon, str]) -> 'DataCube':
+    def polygonal_histogram_timeseries(self, polygon: Union["shapely.geometry.Polygon", "shapely.geometry.MultiPolygon", str]) -> 'DataCube':
         """
         Extract a histogram time series for the given (multi)polygon. Its points are
         expected to be in the EPSG:4326 coordinate
@@ -1698,7 +1766,7 @@ class DataCube(_ProcessGraphAbstraction):
         return self.aggregate_spatial(geometries=polygon, reducer="histogram")
 
     @deprecated("Use :py:meth:`aggregate_spatial` with reducer ``'median'``.", version="0.10.0")
-    def polygonal_median_timeseries(self, polygon: Union[Polygon, MultiPolygon, str]) -> 'DataCube':
+    def polygonal_median_timeseries(self, polygon: Union["shapely.geometry.Polygon", "shapely.geometry.MultiPolygon", str]) -> 'DataCube':
         """
         Extract a median time series for the given (multi)polygon. Its points are
         expected to be in the EPSG:4326 coordinate
@@ -1710,7 +1778,7 @@ class DataCube(_ProcessGraphAbstraction):
         return self.aggregate_spatial(geometries=polygon, reducer="median")
 
     @deprecated("Use :py:meth:`aggregate_spatial` with reducer ``'sd'``.", version="0.10.0")
-    def polygonal_standarddeviation_timeseries(self, polygon: Union[Polygon, MultiPolygon, str]) -> 'DataCube':
+    def polygonal_standarddeviation_timeseries(self, polygon: Union["shapely.geometry.Polygon", "shapely.geometry.MultiPolygon", str]) -> 'DataCube':
         """
         Extract a time series of standard deviations for the given (multi)polygon. Its points are
         expected to be in the EPSG:4326 coordinate
@@ -1818,13 +1886,16 @@ class DataCube(_ProcessGraphAbstraction):
 
         return self._connection.download(cube.flat_graph(), outputfile)
 
-    def validate(self) -> List[dict]:
+    def validate(self, offline: bool = False) -> List[dict]:
         """
         Validate a process graph without executing it.
 
+        :param offline: validate client-side against the (cached) process listing of the back-end,
+            instead of doing a request to the back-end's validation endpoint
+            (see :py:meth:`Connection.validate_process_graph() <openeo.rest.connection.Connection.validate_process_graph>`).
         :return: list of errors (dictionaries with "code" and "message" fields)
         """
-        return self._connection.validate_process_graph(self.flat_graph())
+        return self._connection.validate_process_graph(self.flat_graph(), offline=offline)
 
     def tiled_viewing_service(self, type: str, **kwargs) -> Service:
         return self._connection.create_service(self.flat_graph(), type=type, **kwargs)
@@ -1856,6 +1927,92 @@ class DataCube(_ProcessGraphAbstraction):
             print=print, max_poll_interval=max_poll_interval, connection_retry_interval=connection_retry_interval
         )
 
+    def estimate_volume(self) -> "VolumeEstimate":
+        """
+        Estimate (client-side) the volume of the input data that will be loaded to evaluate this data cube,
+        based on the ``load_collection`` extents and bands (after pushing down filters like ``filter_bbox``)
+        and the collection metadata (spatial resolution, temporal step, data types).
+
+        This is a rough estimate of the input data, which does not take e.g. masking or cloud cover into account.
+
+        :return: :py:class:`~openeo.internal.volume.VolumeEstimate` with ``pixels``, ``values`` and ``bytes`` counts
+        :raises VolumeEstimationException: if the volume can not be estimated
+            (e.g. parameterized extents or no spatial resolution in the collection metadata)
+
+        .. versionadded:: 0.13.1
+        """
+        from openeo.internal.volume import estimate_volume
+
+        return estimate_volume(self._pg, get_metadata=self._connection.collection_metadata)
+
+    def execute_auto(
+            self, outputfile: Union[str, pathlib.Path], out_format: str = None,
+            max_sync_bytes: Optional[int] = None, sync_timeout: int = 30 * 60,
+            print=print, max_poll_interval=60, connection_retry_interval=30,
+            job_options=None, **format_options
+    ) -> Optional[BatchJob]:
+        """
+        Evaluate the process graph synchronously or as batch job, depending on the estimated data volume
+        (see :py:meth:`estimate_volume`), and download the result.
+
+        Small workloads are processed synchronously (like :py:meth:`download`),
+        with automatic fallback to a batch job (like :py:meth:`execute_batch`)
+        when the synchronous request times out.
+        A batch job is used directly when the estimated volume exceeds the threshold
+        or when it can not be estimated.
+
+        :param outputfile: path of the file to write the result to
+        :param out_format: (optional) format of the result
+        :param max_sync_bytes: maximum estimated volume (in bytes) of input data to process synchronously.
+            Defaults to config option ``connection.max_sync_bytes``, or 1 GiB.
+        :param sync_timeout: timeout (in seconds) for synchronous processing
+        :param job_options: (custom) job options for the batch job
+        :param format_options: parameters for the result format
+        :return: the batch job if one was used, otherwise None
+
+        .. versionadded:: 0.13.1
+        """
+        from openeo.internal.volume import DEFAULT_SYNC_MAX_BYTES, VolumeEstimationException
+
+        if max_sync_bytes is None:
+            max_sync_bytes = int(get_config_option("connection.max_sync_bytes") or DEFAULT_SYNC_MAX_BYTES)
+        if "format" in format_options and not out_format:
+            out_format = format_options.pop("format")
+        if not out_format:
+            out_format = guess_format(outputfile)
+
+        def batch() -> BatchJob:
+            return self.execute_batch(
+                outputfile=outputfile, out_format=out_format, print=print, max_poll_interval=max_poll_interval,
+                connection_retry_interval=connection_retry_interval, job_options=job_options, **format_options
+            )
+
+        try:
+            estimate = self.estimate_volume()
+        except VolumeEstimationException as e:
+            print(f"Using batch job: can not estimate data volume ({e}).")
+            return batch()
+        if estimate.bytes > max_sync_bytes:
+            print(f"Using batch job: estimated data volume {estimate.bytes} bytes exceeds {max_sync_bytes} bytes.")
+            return batch()
+
+        if self.result_node().process_id == "save_result":
+            cube = self
+        else:
+            cube = self.save_result(format=out_format, options=format_options)
+        try:
+            self._connection.download(cube.flat_graph(), outputfile=outputfile, timeout=sync_timeout)
+        except requests.Timeout as e:
+            print(f"Synchronous processing timed out ({e!r}): falling back to batch job.")
+            return batch()
+        except OpenEoApiError as e:
+            # Proxy/gateway errors typically indicate that the request took too long and was killed.
+            if e.http_status_code not in (502, 504):
+                raise
+            print(f"Synchronous processing failed ({e!r}): falling back to batch job.")
+            return batch()
+        return None
+
     def create_job(
             self, out_format=None, title: str = None, description: str = None, plan: str = None, budget=None,
             job_options=None, **format_options
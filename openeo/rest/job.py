@@ -21,6 +21,34 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Batch job statuses of jobs that did not finish (or fail) yet.
+JOB_STATUSES_RUNNING = frozenset({"submitted", "created", "queued", "running"})
+
+
+def soft_error_message(error: Exception) -> Optional[str]:
+    """
+    Description of a "soft" error while polling a job status (e.g. temporary connection glitch),
+    after which polling can just be retried, or None for other errors.
+    """
+    if isinstance(error, requests.ConnectionError):
+        return "Connection error while polling job status: {e}".format(e=error)
+    if isinstance(error, OpenEoApiError) and error.http_status_code == 503:
+        return "Service availability error while polling job status: {e}".format(e=error)
+    return None
+
+
+class SoftErrorCounter:
+    """Counter of soft errors (see :py:func:`soft_error_message`) that fails when there are too many of them."""
+
+    def __init__(self, max_count: int):
+        self.max_count = max_count
+        self.count = 0
+
+    def add(self):
+        self.count += 1
+        if self.count > self.max_count:
+            raise OpenEoClientException("Excessive soft errors")
+
 
 class BatchJob:
     """
@@ -82,6 +110,16 @@ class BatchJob:
         currency = self.connection.capabilities().currency()
         return VisualDict('job-estimate', data=data, parameters={'currency': currency})
 
+    def is_reused(self) -> bool:
+        """
+        Whether this is an existing, already finished job, that was reused
+        instead of creating a new one (see :py:class:`~openeo.rest.jobindex.JobIndex`).
+
+        .. versionadded:: 0.13.1
+        """
+        job_index = getattr(self.connection, "job_index", None)
+        return job_index is not None and job_index.is_reused(self.job_id)
+
     def start_job(self):
         """ Start / queue a job for processing."""
         # POST /jobs/{job_id}/results
@@ -179,8 +217,11 @@ class BatchJob:
             print("{t} Job {i!r}: {m}".format(t=elapsed(), i=self.job_id, m=msg))
 
         # TODO: make `max_poll_interval`, `connection_retry_interval` class constants or instance properties?
-        print_status("send 'start'")
-        self.start_job()
+        if self.is_reused():
+            print_status("reusing finished job with identical process graph")
+        else:
+            print_status("send 'start'")
+            self.start_job()
 
         # TODO: also add  `wait` method so you can track a job that already has started explicitly
         #   or just rename this method to `wait` and automatically do start if not started yet?
@@ -188,35 +229,26 @@ class BatchJob:
         # Start with fast polling.
         poll_interval = min(5, max_poll_interval)
         status = None
-        _soft_error_count = 0
-
-        def soft_error(message: str):
-            """Non breaking error (unless we had too much of them)"""
-            nonlocal _soft_error_count
-            _soft_error_count += 1
-            if _soft_error_count > soft_error_max:
-                raise OpenEoClientException("Excessive soft errors")
-            print_status(message)
-            time.sleep(connection_retry_interval)
+        soft_errors = SoftErrorCounter(max_count=soft_error_max)
 
         while True:
             # TODO: also allow a hard time limit on this infinite poll loop?
             try:
                 job_info = self.describe_job()
-            except requests.ConnectionError as e:
-                soft_error("Connection error while polling job status: {e}".format(e=e))
-                continue
-            except OpenEoApiError as e:
-                if e.http_status_code == 503:
-                    soft_error("Service availability error while polling job status: {e}".format(e=e))
-                    continue
-                else:
+            except (requests.ConnectionError, OpenEoApiError) as e:
+                message = soft_error_message(e)
+                if message is None:
                     raise
+                # Non breaking error (unless we had too much of them)
+                soft_errors.add()
+                print_status(message)
+                time.sleep(connection_retry_interval)
+                continue
 
             status = job_info.get("status", "N/A")
             progress = '{p}%'.format(p=job_info["progress"]) if "progress" in job_info else "N/A"
             print_status("{s} (progress {p})".format(s=status, p=progress))
-            if status not in ('submitted', 'created', 'queued', 'running'):
+            if status not in JOB_STATUSES_RUNNING:
                 break
 
             # Sleep for next poll (and adaptively make polling less frequent)
@@ -278,6 +310,8 @@ class ResultAsset:
         :param target: download target path. Can be an existing folder
             (in which case the filename advertised by backend will be used)
             or full file name. By default, the working directory will be used.
+        :param chunk_size: chunk size (in bytes) for streaming the download.
+            By default, the connection's ``download_chunk_size`` will be used.
         """
         target = Path(target or Path.cwd())
         if target.is_dir():
@@ -286,6 +320,7 @@ class ResultAsset:
         logger.info("Downloading Job result asset {n!r} from {h!s} to {t!s}".format(n=self.name, h=self.href, t=target))
         with target.open("wb") as f:
             response = self._get_response(stream=True)
+            chunk_size = chunk_size or self.job.connection.download_chunk_size
             for block in response.iter_content(chunk_size=chunk_size):
                 f.write(block)
         return target
@@ -0,0 +1,202 @@
+"""
+Local index of finished batch jobs by (canonical) process graph hash,
+to reuse the results of a previously finished identical job instead of recomputing them.
+"""
+import datetime as dt
+import hashlib
+import json
+import logging
+import threading
+import typing
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Union
+
+from openeo.internal.graph_building import PGNode, as_flat_graph
+from openeo.internal.optimizer.base import reference_counts
+from openeo.internal.process_graph_visitor import ProcessGraphVisitException
+from openeo.rest import OpenEoApiError
+from openeo.rest.auth.config import PrivateJsonFile
+from openeo.rest.job import BatchJob
+from openeo.util import rfc3339
+
+if typing.TYPE_CHECKING:
+    # Imports for type checking only (circular import issue at runtime).
+    from openeo.rest.connection import Connection
+
+_log = logging.getLogger(__name__)
+
+
+def graph_hash(process_graph: Union[dict, Any]) -> str:
+    """
+    Hash of the canonical representation of a process graph:
+    independent of key order and (for single output graphs) of the node ids.
+
+    :param process_graph: flat graph (optionally wrapped under a "process_graph" key), or anything
+        with a ``flat_graph`` method (e.g. :py:class:`PGNode` or :py:class:`~openeo.rest.datacube.DataCube`)
+    :return: hex digest
+    """
+    flat = as_flat_graph(process_graph)
+    if isinstance(flat.get("process_graph"), dict) and "process_id" not in flat["process_graph"]:
+        flat = flat["process_graph"]
+    try:
+        node = PGNode.from_flat_graph(flat)
+        # Regenerate node ids, unless that would drop nodes (e.g. multiple `save_result` outputs).
+        if len(reference_counts(node)) == len(flat):
+            flat = node.flat_graph()
+    except ProcessGraphVisitException:
+        pass
+    data = json.dumps(flat, sort_keys=True, separators=(",", ":")).encode("utf8")
+    return hashlib.sha256(data).hexdigest()
+
+
+class JobIndexFile(PrivateJsonFile):
+    """Storage of a :py:class:`JobIndex` in a (private) JSON file."""
+
+    DEFAULT_FILENAME = "job-index.json"
+
+
+class JobIndex:
+    """
+    Local index of process graph hash (see :py:func:`graph_hash`) to batch job id, per back-end,
+    populated from the jobs created through a connection with this index
+    (and optionally from the job listing of the back-end, see :py:meth:`populate`).
+
+    When enabled on a connection (``Connection(job_index=...)``),
+    creating a job for a process graph of which an identical job already finished
+    (and its results did not expire yet) returns that existing job, instead of creating a new one.
+    Note that job options, title, etc. are not taken into account.
+
+    :param path: path of a JSON file to persist the index in (e.g. to share it between sessions or processes),
+        or ``None`` to only keep it in memory.
+
+    .. versionadded:: 0.13.1
+    """
+
+    _FINISHED = "finished"
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        self._file = JobIndexFile(Path(path)) if path is not None else None
+        self._memory: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        # Ids of finished jobs that were returned for reuse (and should not be started again).
+        self._reused: Set[str] = set()
+
+    def __repr__(self):
+        return f"<{type(self).__name__} path={str(self._file.path) if self._file else None!r}>"
+
+    @staticmethod
+    def _backend_key(connection: "Connection") -> str:
+        return connection.root_url.rstrip("/")
+
+    def _entries(self, connection: "Connection") -> Dict[str, str]:
+        """All indexed graph hashes and job ids of the back-end of given connection."""
+        key = self._backend_key(connection)
+        if self._file:
+            entries = self._file.get("backends", key, default=None) or {}
+        else:
+            with self._lock:
+                entries = dict(self._memory.get(key, {}))
+        return {h: j for h, j in entries.items() if j}
+
+    def get(self, connection: "Connection", digest: str) -> Optional[str]:
+        """Job id indexed for given graph hash (if any)."""
+        return self._entries(connection).get(digest)
+
+    def add(self, connection: "Connection", digest: str, job_id: str):
+        """Index job id for given graph hash."""
+        key = self._backend_key(connection)
+        if self._file:
+            self._file.set("backends", key, digest, value=job_id)
+        else:
+            with self._lock:
+                self._memory.setdefault(key, {})[digest] = job_id
+
+    def remove(self, connection: "Connection", digest: str):
+        """Remove given graph hash from the index."""
+        key = self._backend_key(connection)
+        if self._file:
+            self._file.set("backends", key, digest, value=None)
+        else:
+            with self._lock:
+                self._memory.get(key, {}).pop(digest, None)
+
+    @staticmethod
+    def _results_expired(job: BatchJob) -> bool:
+        try:
+            metadata = job.get_results().get_metadata(force=True)
+        except OpenEoApiError as e:
+            _log.info(f"Results of job {job.job_id!r} are not available: {e!r}")
+            return True
+        expires = metadata.get("expires") or metadata.get("properties", {}).get("expires")
+        if expires:
+            try:
+                return rfc3339.parse_datetime(expires) <= dt.datetime.utcnow()
+            except ValueError:
+                _log.warning(f"Failed to parse results expiry {expires!r} of job {job.job_id!r}")
+        return False
+
+    def find_finished(self, connection: "Connection", digest: str) -> Optional[BatchJob]:
+        """
+        Get the finished job for given graph hash, of which the results did not expire yet.
+        Jobs that failed, were deleted or of which the results expired are removed from the index.
+        """
+        job_id = self.get(connection, digest)
+        if job_id is None:
+            return None
+        job = connection.job(job_id)
+        try:
+            status = job.status()
+        except OpenEoApiError as e:
+            _log.info(f"Failed to get status of indexed job {job_id!r}: {e!r}")
+            status = None
+        if status == self._FINISHED and not self._results_expired(job):
+            with self._lock:
+                self._reused.add(job_id)
+            return job
+        if status not in {"created", "queued", "running"}:
+            self.remove(connection, digest)
+        return None
+
+    def is_reused(self, job_id: str) -> bool:
+        """Whether given job was returned for reuse (as already finished job) by this index."""
+        with self._lock:
+            return job_id in self._reused
+
+    def populate(self, connection: "Connection", limit: Optional[int] = None) -> int:
+        """
+        Add the finished jobs from the job listing of the back-end to the index
+        (requires a request per job to get its process graph).
+
+        :param limit: maximum number of (not yet indexed) finished jobs to look up
+        :return: number of added jobs
+        """
+        indexed = set(self._entries(connection).values())
+        added = 0
+        for listed in connection.list_jobs():
+            if listed.get("status") != self._FINISHED or listed.get("id") in indexed:
+                continue
+            if limit is not None and added >= limit:
+                break
+            try:
+                process = connection.job(listed["id"]).describe_job().get("process")
+            except OpenEoApiError as e:
+                _log.warning(f"Failed to describe job {listed['id']!r}: {e!r}")
+                continue
+            if isinstance(process, dict) and isinstance(process.get("process_graph"), dict):
+                self.add(connection, graph_hash(process["process_graph"]), listed["id"])
+                added += 1
+        return added
+
+
+def get_job_index(job_index: Union[bool, str, JobIndex, None]) -> Optional[JobIndex]:
+    """Normalize a "job_index" option (bool, file path or instance) to a :py:class:`JobIndex` (or None)."""
+    if isinstance(job_index, JobIndex):
+        return job_index
+    if isinstance(job_index, str):
+        value = job_index.strip()
+        if value.lower() in {"1", "true", "yes", "on"}:
+            return JobIndex()
+        if value.lower() in {"", "0", "false", "no", "off"}:
+            return None
+        return JobIndex(path=value)
+    return JobIndex() if job_index else None
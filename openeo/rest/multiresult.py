@@ -0,0 +1,199 @@
+"""
+Multiple result cubes (outputs) in a single process graph / batch job,
+so that shared upstream processing (e.g. ``load_collection``) is only done once.
+"""
+import json
+import logging
+import re
+import typing
+from typing import Dict, List, Optional, Tuple, Union
+
+from openeo.internal.graph_building import GraphFlattener, PGNode
+from openeo.rest import OpenEoClientException
+from openeo.rest.job import BatchJob, JobResults, ResultAsset
+
+if typing.TYPE_CHECKING:
+    # Imports for type checking only (circular import issue at runtime).
+    from openeo.rest.connection import Connection
+    from openeo.rest.datacube import DataCube
+
+_log = logging.getLogger(__name__)
+
+# Media types of common output formats (lower case format name), to match result assets with outputs.
+_FORMAT_MEDIA_TYPES = {
+    "gtiff": "image/tiff",
+    "geotiff": "image/tiff",
+    "netcdf": "application/x-netcdf",
+    "json": "application/json",
+    "geojson": "application/geo+json",
+    "csv": "text/csv",
+    "png": "image/png",
+    "jpeg": "image/jpeg",
+    "parquet": "application/parquet",
+}
+
+
+class MultiResult:
+    """
+    Multiple result cubes, built from shared upstream processing (e.g. a common ``load_collection``),
+    to be processed together in a single process graph (with a ``save_result`` node per output),
+    so that the back-end only loads and processes the shared part once.
+
+    Usage example::
+
+        cube = connection.load_collection("SENTINEL2_L2A", ...)
+        ndvi = cube.ndvi()
+        mask = cube.band("SCL") == 4
+        composite = cube.max_time()
+        multi = MultiResult({"ndvi": ndvi, "mask": mask, "composite": composite}, format="GTiff")
+        job = multi.execute_batch(title="NDVI, mask and composite")
+        assets = multi.get_assets(job.get_results())
+        assets["ndvi"][0].download("ndvi.tif")
+
+    Note that the shared upstream nodes are only deduplicated if the cubes are derived
+    from the same cube objects (as in the example above).
+
+    :param cubes: mapping of output names to cubes (or list of cubes, named "output1", "output2", ...).
+        Cubes that don't end with a ``save_result`` node get one with given ``format`` and ``options``.
+    :param format: output format for cubes without ``save_result`` node
+    :param options: output format options for cubes without ``save_result`` node
+    :param filename_prefix: set the output name as ``filename_prefix`` format option
+        (supported by some back-ends) to make the result assets easy to map back to the outputs.
+        Disable this for back-ends that don't support this format option:
+        result assets can then only be mapped back to outputs with a unique output format.
+
+    .. versionadded:: 0.13.1
+    """
+
+    def __init__(
+            self, cubes: Union[Dict[str, "DataCube"], List["DataCube"]], format: str = "GTiff",
+            options: Optional[dict] = None, filename_prefix: bool = True,
+    ):
+        if isinstance(cubes, (list, tuple)):
+            cubes = {f"output{i + 1}": c for i, c in enumerate(cubes)}
+        if not cubes:
+            raise OpenEoClientException("No result cubes given")
+        connections = {id(c.connection) for c in cubes.values()}
+        if len(connections) > 1:
+            raise OpenEoClientException("Result cubes must use the same connection")
+        self._connection: "Connection" = next(iter(cubes.values())).connection
+
+        self._outputs: Dict[str, "DataCube"] = {}
+        for name, cube in cubes.items():
+            if cube.result_node().process_id != "save_result":
+                output_options = dict(options or {})
+                if filename_prefix:
+                    output_options["filename_prefix"] = name
+                cube = cube.save_result(format=format, options=output_options)
+            self._outputs[name] = cube
+        if len({id(c.result_node()) for c in self._outputs.values()}) < len(self._outputs):
+            raise OpenEoClientException("Result cubes must have distinct `save_result` nodes")
+
+    def __repr__(self):
+        return f"<{type(self).__name__} outputs={list(self._outputs)!r}>"
+
+    @property
+    def connection(self) -> "Connection":
+        return self._connection
+
+    @property
+    def outputs(self) -> Dict[str, "DataCube"]:
+        """Mapping of output names to cubes (ending with a ``save_result`` node)."""
+        return dict(self._outputs)
+
+    def result_nodes(self) -> List[PGNode]:
+        """The ``save_result`` nodes of the outputs."""
+        return [c.result_node() for c in self._outputs.values()]
+
+    def flat_graph(self) -> dict:
+        """
+        Get the combined process graph of all outputs in flat dict representation:
+        shared upstream nodes only occur once and each output has its own ``save_result`` node.
+        """
+        return GraphFlattener().flatten_multiple(self.result_nodes())
+
+    def to_json(self, *, indent: Union[int, None] = 2, separators: Optional[Tuple[str, str]] = None) -> str:
+        """Get interoperable JSON representation of the combined process graph."""
+        return json.dumps({"process_graph": self.flat_graph()}, indent=indent, separators=separators)
+
+    def create_job(
+            self, title: Optional[str] = None, description: Optional[str] = None, plan: Optional[str] = None,
+            budget: Optional[float] = None, job_options: Optional[dict] = None,
+    ) -> BatchJob:
+        """
+        Create a single batch job that produces all outputs (the job still has to be started).
+
+        :param title: job title
+        :param description: job description
+        :param plan: billing plan
+        :param budget: maximum cost the job is allowed to produce
+        :param job_options: additional job options to pass to the backend
+        :return: the created batch job
+        """
+        return self._connection.create_job(
+            process_graph=self.flat_graph(),
+            title=title, description=description, plan=plan, budget=budget, additional=job_options,
+        )
+
+    def execute_batch(
+            self, title: Optional[str] = None, description: Optional[str] = None, plan: Optional[str] = None,
+            budget: Optional[float] = None, job_options: Optional[dict] = None,
+            print=print, max_poll_interval: float = 60, connection_retry_interval: float = 30,
+    ) -> BatchJob:
+        """
+        Create a single batch job that produces all outputs, start it and wait for it to finish.
+        Use :py:meth:`get_assets` to get the result assets per output.
+
+        :return: the finished batch job
+        """
+        job = self.create_job(title=title, description=description, plan=plan, budget=budget, job_options=job_options)
+        return job.run_synchronous(
+            print=print, max_poll_interval=max_poll_interval, connection_retry_interval=connection_retry_interval,
+        )
+
+    def _output_format(self, name: str) -> str:
+        return self._outputs[name].result_node().arguments["format"]
+
+    def _match_prefix(self, asset: ResultAsset) -> Optional[str]:
+        """Output whose name is a prefix of the asset name (longest match)."""
+        matches = [
+            name for name in self._outputs
+            if re.match(re.escape(name) + r"([._-]|$)", asset.name)
+        ]
+        return max(matches, key=len) if matches else None
+
+    def _match_media_type(self, asset: ResultAsset) -> Optional[str]:
+        """Output with a (unique) format that matches the media type of the asset."""
+        media_type = (asset.metadata.get("type") or "").split(";")[0].strip().lower()
+        if not media_type:
+            return None
+        matches = [
+            name for name in self._outputs
+            if _FORMAT_MEDIA_TYPES.get(self._output_format(name).lower()) == media_type
+        ]
+        return matches[0] if len(matches) == 1 else None
+
+    def get_assets(self, results: Union[JobResults, BatchJob]) -> Dict[str, List[ResultAsset]]:
+        """
+        Map the result assets of the batch job back to the outputs:
+        based on the asset name (if it starts with the output name, e.g. with ``filename_prefix`` enabled)
+        or the media type of the asset (if only one output has a matching format).
+
+        :param results: results (or the batch job itself) of the job created from this multi-result
+        :return: mapping of output names to lists of result assets
+        """
+        if isinstance(results, BatchJob):
+            results = results.get_results()
+        assets = {name: [] for name in self._outputs}
+        unmatched = []
+        for asset in results.get_assets():
+            name = self._match_prefix(asset) or self._match_media_type(asset)
+            if name is None and len(self._outputs) == 1:
+                name = next(iter(self._outputs))
+            if name is None:
+                unmatched.append(asset.name)
+            else:
+                assets[name].append(asset)
+        if unmatched:
+            _log.warning(f"Could not map result assets {unmatched!r} to outputs {list(self._outputs)!r}")
+        return assets
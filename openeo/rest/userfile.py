@@ -0,0 +1,188 @@
+"""
+Files in the user workspace of a back-end (``/files`` endpoints)
+and a content addressed store of (large) geometries uploaded to it.
+"""
+import hashlib
+import json
+import logging
+import threading
+import typing
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Set, Union
+from urllib.parse import quote
+
+from openeo.internal.graph_building import PGNode
+from openeo.rest import OpenEoApiError, OpenEoClientException
+
+if typing.TYPE_CHECKING:
+    # Imports for type checking only (circular import issue at runtime).
+    from openeo.rest.connection import Connection
+
+_log = logging.getLogger(__name__)
+
+# Default chunk size (in bytes) for streaming uploads.
+DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _iter_chunks(f: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+class _ChunkedBody:
+    """
+    Re-iterable request body that streams a local file or file-like object in chunks,
+    so that the request can be replayed (e.g. after an automatic access token refresh).
+    Local paths are reopened on each iteration, seekable file objects are rewound to their initial position.
+    """
+
+    def __init__(self, source: Union[str, Path, BinaryIO], chunk_size: int):
+        self._source = source
+        self._chunk_size = chunk_size
+        self._start = None
+        self._iterated = False
+        if not isinstance(source, (str, Path)) and getattr(source, "seekable", lambda: False)():
+            self._start = source.tell()
+
+    def __iter__(self) -> Iterator[bytes]:
+        if isinstance(self._source, (str, Path)):
+            with Path(self._source).open("rb") as f:
+                yield from _iter_chunks(f, self._chunk_size)
+            return
+        if self._iterated:
+            if self._start is None:
+                raise OpenEoClientException("Can not replay upload from non-seekable file object.")
+            self._source.seek(self._start)
+        self._iterated = True
+        yield from _iter_chunks(self._source, self._chunk_size)
+
+
+class UserFile:
+    """
+    Handle to a (possibly not yet existing) file in the user workspace of the back-end.
+
+    :param path: path of the file in the user workspace
+    :param connection: connection to the back-end
+    :param metadata: file metadata (e.g. "size" and "modified"), as listed by the back-end
+
+    .. versionadded:: 0.13.1
+    """
+
+    def __init__(self, path: Union[str, PurePosixPath], connection: "Connection", metadata: Optional[dict] = None):
+        self.path = PurePosixPath(path)
+        self.connection = connection
+        self.metadata = metadata or {"path": str(self.path)}
+
+    def __repr__(self):
+        return f"<{type(self).__name__} file={str(self.path)!r}>"
+
+    @property
+    def _api_path(self) -> str:
+        return "/files/" + quote(str(self.path))
+
+    def upload(self, source: Union[str, Path, bytes, BinaryIO], chunk_size: Optional[int] = None) -> "UserFile":
+        """
+        Upload (and overwrite) the file, streaming the content in chunks
+        (with chunked transfer encoding), so that large files don't have to be loaded in memory.
+
+        :param source: local path, bytes or binary file-like object to upload
+        :param chunk_size: chunk size (in bytes) for reading and sending the content
+        :return: the file, with metadata as returned by the back-end
+        """
+        chunk_size = chunk_size or DEFAULT_UPLOAD_CHUNK_SIZE
+        headers = {"Content-Type": "application/octet-stream"}
+        if isinstance(source, bytes):
+            response = self.connection.put(self._api_path, headers=headers, data=source, expected_status=200)
+        else:
+            response = self.connection.put(
+                self._api_path, headers=headers, data=_ChunkedBody(source, chunk_size), expected_status=200
+            )
+        try:
+            self.metadata = response.json()
+        except ValueError:
+            self.metadata = {"path": str(self.path)}
+        return self
+
+    def download(self, target: Union[str, Path, None] = None) -> Path:
+        """
+        Download the file (streaming) to given local path (or directory).
+
+        :param target: local path or directory to download to (default: file name in current directory)
+        :return: path of the downloaded file
+        """
+        target = Path(target or self.path.name)
+        if target.is_dir():
+            target = target / self.path.name
+        response = self.connection.get(self._api_path, stream=True, expected_status=200)
+        with target.open("wb") as f:
+            for chunk in response.iter_content(chunk_size=self.connection.download_chunk_size):
+                f.write(chunk)
+        return target
+
+    def delete(self):
+        """Delete the file from the user workspace."""
+        self.connection.delete(self._api_path, expected_status=204)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.metadata, path=str(self.path))
+
+
+class GeometryStore:
+    """
+    Content addressed store of (large) GeoJSON geometries in the user workspace:
+    each distinct geometry is uploaded once (under a path based on its content hash),
+    and referenced in process graphs with ``read_vector`` instead of being inlined in every request.
+
+    :param connection: connection to the back-end
+    :param prefix: directory in the user workspace to store the geometries in
+
+    .. versionadded:: 0.13.1
+    """
+
+    DEFAULT_PREFIX = "openeo-python-client/geometries"
+
+    def __init__(self, connection: "Connection", prefix: str = DEFAULT_PREFIX):
+        self._connection = connection
+        self._prefix = PurePosixPath(prefix)
+        self._lock = threading.Lock()
+        # Paths that are known to exist in the user workspace (loaded lazily from the file listing).
+        self._existing: Optional[Set[str]] = None
+
+    @staticmethod
+    def serialize(geometry: dict) -> bytes:
+        """Canonical serialization of a GeoJSON dictionary (key order independent)."""
+        return json.dumps(geometry, sort_keys=True, separators=(",", ":")).encode("utf8")
+
+    def path(self, data: bytes) -> PurePosixPath:
+        """Path in the user workspace for serialized geometry."""
+        return self._prefix / (hashlib.sha256(data).hexdigest() + ".geojson")
+
+    def _load_existing(self) -> Set[str]:
+        try:
+            files = self._connection.get("/files", expected_status=200).json()["files"]
+        except OpenEoApiError as e:
+            _log.warning(f"Failed to list user files: {e!r}")
+            return set()
+        return {f["path"] for f in files if isinstance(f, dict) and "path" in f}
+
+    def upload(self, geometry: dict) -> UserFile:
+        """Upload given geometry (if not already in the store) and return its file in the user workspace."""
+        data = self.serialize(geometry)
+        path = self.path(data)
+        with self._lock:
+            if self._existing is None:
+                self._existing = self._load_existing()
+            user_file = UserFile(path, connection=self._connection)
+            if str(path) not in self._existing:
+                _log.info(f"Uploading geometry ({len(data)} bytes) to {str(path)!r}")
+                user_file.upload(data)
+                self._existing.add(str(path))
+        return user_file
+
+    def reference(self, geometry: dict) -> PGNode:
+        """Upload given geometry (if necessary) and build a ``read_vector`` node that loads it."""
+        user_file = self.upload(geometry)
+        return PGNode(process_id="read_vector", arguments={"filename": str(user_file.path)})
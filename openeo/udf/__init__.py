@@ -1,3 +1,7 @@
+import importlib
+import sys
+import typing
+
 from openeo import BaseOpenEoException
 
 
@@ -6,8 +10,40 @@ class OpenEoUdfException(BaseOpenEoException):
 
 
 from openeo.udf.debug import inspect
-from openeo.udf.feature_collection import FeatureCollection
-from openeo.udf.run_code import run_udf_code, execute_local_udf
-from openeo.udf.structured_data import StructuredData
-from openeo.udf.udf_data import UdfData
-from openeo.udf.xarraydatacube import XarrayDataCube
+
+# Lazy loaded on first access (see `__getattr__`), to avoid importing heavy dependencies
+# (numpy, pandas, xarray, shapely, ...) when they are not needed.
+_LAZY_IMPORTS = {
+    "FeatureCollection": "openeo.udf.feature_collection",
+    "run_udf_code": "openeo.udf.run_code",
+    "execute_local_udf": "openeo.udf.run_code",
+    "StructuredData": "openeo.udf.structured_data",
+    "UdfData": "openeo.udf.udf_data",
+    "XarrayDataCube": "openeo.udf.xarraydatacube",
+}
+
+if typing.TYPE_CHECKING:
+    # Imports for type checking and IDE support only.
+    from openeo.udf.feature_collection import FeatureCollection
+    from openeo.udf.run_code import run_udf_code, execute_local_udf
+    from openeo.udf.structured_data import StructuredData
+    from openeo.udf.udf_data import UdfData
+    from openeo.udf.xarraydatacube import XarrayDataCube
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if sys.version_info < (3, 7):
+    # No support for module level `__getattr__` (PEP 562): fall back on eager loading.
+    for _name in _LAZY_IMPORTS:
+        globals()[_name] = __getattr__(_name)
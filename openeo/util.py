@@ -7,13 +7,12 @@ import json
 import logging
 import re
 import sys
+import threading
 import time
 from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Union, Tuple, Callable, Optional
+from typing import Any, Union, Tuple, Callable, Optional, List
 
-import requests
-import shapely.geometry.base
 from deprecated import deprecated
 
 logger = logging.getLogger(__name__)
@@ -449,6 +448,7 @@ def load_json_resource(src: Union[str, Path]) -> dict:
         return json.loads(src)
     elif isinstance(src, str) and re.match(r"^https?://", src, flags=re.I):
         # URL to remote JSON resource
+        import requests
         return requests.get(src).json()
     elif isinstance(src, Path) or (isinstance(src, str) and src.endswith(".json")):
         # Assume source is a local JSON file path
@@ -457,15 +457,101 @@ def load_json_resource(src: Union[str, Path]) -> dict:
 
 
 class LazyLoadCache:
-    """Simple cache that allows to (lazy) load on cache miss."""
+    """
+    Thread-safe cache that allows to (lazy) load on cache miss.
 
-    def __init__(self):
-        self._cache = {}
+    - single-flight loading: concurrent cache misses for the same key
+      trigger only one load, the other threads wait for its result
+    - optional time-to-live (in seconds) of cache entries
+    - optional maximum size, with least-recently-used eviction
+    - hit/miss statistics
+
+    Failed loads (exceptions) are not cached.
+    """
+
+    # Clock function (overridable for testing)
+    _clock = time.monotonic
+
+    def __init__(self, ttl: Optional[float] = None, max_size: Optional[int] = None):
+        self._ttl = ttl
+        self._max_size = max_size
+        # Mapping of key to (value, expiry) tuples, in least-recently-used order.
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        # Per-key locks for single-flight loading.
+        self._load_locks = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _lookup(self, key: Union[str, tuple]) -> Tuple[bool, Any]:
+        """Look up non-expired entry (requires lock)."""
+        if key in self._cache:
+            value, expiry = self._cache[key]
+            if expiry is None or self._clock() < expiry:
+                self._cache.move_to_end(key)
+                return True, value
+            del self._cache[key]
+        return False, None
+
+    def _store(self, key: Union[str, tuple], value: Any):
+        """Store entry and evict least recently used entries if necessary (requires lock)."""
+        expiry = self._clock() + self._ttl if self._ttl is not None else None
+        self._cache[key] = (value, expiry)
+        self._cache.move_to_end(key)
+        if self._max_size is not None:
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+                self._evictions += 1
 
     def get(self, key: Union[str, tuple], load: Callable[[], Any]):
-        if key not in self._cache:
-            self._cache[key] = load()
-        return self._cache[key]
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                self._hits += 1
+                return value
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                # Value might have been loaded by another thread while we were waiting.
+                found, value = self._lookup(key)
+                if found:
+                    self._hits += 1
+                    return value
+                self._misses += 1
+            try:
+                value = load()
+                with self._lock:
+                    self._store(key, value)
+            finally:
+                with self._lock:
+                    if self._load_locks.get(key) is load_lock:
+                        del self._load_locks[key]
+        return value
+
+    def __contains__(self, key: Union[str, tuple]) -> bool:
+        with self._lock:
+            return self._lookup(key)[0]
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def invalidate(self, key: Union[str, tuple]):
+        """Remove entry for given key (if any)."""
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._cache.clear()
+
+    @property
+    def stats(self) -> dict:
+        """Cache statistics: hits, misses, evictions and current size."""
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "evictions": self._evictions, "size": len(self._cache)}
 
 
 def str_truncate(text: str, width: int = 64, ellipsis: str = "...") -> str:
@@ -494,6 +580,16 @@ def in_interactive_mode() -> bool:
     return hasattr(sys, "ps1")
 
 
+def is_shapely_geometry(x: Any) -> bool:
+    """
+    Check if given object is a shapely geometry,
+    without importing shapely (which is relatively slow) if it is not loaded yet:
+    there can not be shapely geometry objects in that case.
+    """
+    shapely_base = sys.modules.get("shapely.geometry.base")
+    return shapely_base is not None and isinstance(x, shapely_base.BaseGeometry)
+
+
 class BBoxDict(dict):
     """
     Dictionary based helper to easily create/work with bounding box dictionaries
@@ -515,7 +611,7 @@ class BBoxDict(dict):
             return cls.from_dict({"crs": crs, **x})
         elif isinstance(x, (list, tuple)):
             return cls.from_sequence(x, crs=crs)
-        elif isinstance(x, shapely.geometry.base.BaseGeometry):
+        elif is_shapely_geometry(x):
             return cls.from_sequence(x.bounds, crs=crs)
         # TODO: support other input? E.g.: WKT string, GeoJson-style dictionary (Polygon, FeatureCollection, ...)
         else:
@@ -573,3 +669,74 @@ def to_bbox_dict(x: Any, *, crs: Optional[str] = None) -> BBoxDict:
     :return: dictionary (subclass) with keys "west", "south", "east", "north", and optionally "crs".
     """
     return BBoxDict.from_any(x=x, crs=crs)
+
+
+def _normalize_crs(crs: Union[str, int, None]) -> Union[str, int]:
+    """Normalize simple CRS representations (e.g. "EPSG:4326", "4326", 4326, None) for comparison."""
+    if crs is None:
+        return 4326
+    if isinstance(crs, str):
+        m = re.match(r"^(?:EPSG:)?(\d+)$", crs.strip(), flags=re.IGNORECASE)
+        if m:
+            return int(m.group(1))
+    return crs
+
+
+def intersect_bboxes(a: dict, b: dict) -> Optional[BBoxDict]:
+    """
+    Intersection of two bounding box dictionaries (having keys "west", "south", "east", "north",
+    and optionally "crs", where a missing CRS means EPSG:4326).
+
+    .. versionadded:: 0.13.1
+
+    :return: intersection (with the CRS field of the first bounding box),
+        or None if the bounding boxes do not overlap.
+    :raises ValueError: if the bounding boxes can not be intersected
+        (e.g. different or complex CRS, non-numeric bounds or additional fields).
+    """
+    for bbox in [a, b]:
+        if not isinstance(bbox, dict) or not set(bbox.keys()).issubset({"west", "south", "east", "north", "crs"}):
+            raise ValueError(f"Unsupported bounding box {bbox!r}")
+    if _normalize_crs(a.get("crs")) != _normalize_crs(b.get("crs")):
+        raise ValueError(f"CRS mismatch: {a.get('crs')!r} != {b.get('crs')!r}")
+    a, b = BBoxDict.from_dict(a), BBoxDict.from_dict(b)
+    bounds = [bbox[k] for bbox in [a, b] for k in ["west", "south", "east", "north"]]
+    if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in bounds):
+        raise ValueError(f"Non-numeric bounds: {a!r}, {b!r}")
+    west, south = max(a["west"], b["west"]), max(a["south"], b["south"])
+    east, north = min(a["east"], b["east"]), min(a["north"], b["north"])
+    if west >= east or south >= north:
+        return None
+    return BBoxDict(west=west, south=south, east=east, north=north, crs=a.get("crs"))
+
+
+def _temporal_sort_key(x: str) -> dt.datetime:
+    d = rfc3339.parse_date_or_datetime(x)
+    return d if isinstance(d, dt.datetime) else dt.datetime.combine(d, dt.time())
+
+
+def intersect_temporal_extents(
+        a: Union[list, tuple], b: Union[list, tuple]
+) -> Optional[List[Union[str, None]]]:
+    """
+    Intersection of two temporal extents: RFC-3339 date (or date-time) pairs ``[start, end]``,
+    where None means open-ended.
+
+    .. versionadded:: 0.13.1
+
+    :return: intersection (as start-end list), or None if the extents do not overlap.
+    :raises ValueError: if the extents can not be intersected (e.g. invalid or non-string dates).
+    """
+    for extent in [a, b]:
+        if not isinstance(extent, (list, tuple)) or len(extent) != 2:
+            raise ValueError(f"Unsupported temporal extent {extent!r}")
+        for x in extent:
+            if x is not None:
+                _temporal_sort_key(x)
+    starts = [s for s in [a[0], b[0]] if s is not None]
+    ends = [e for e in [a[1], b[1]] if e is not None]
+    start = max(starts, key=_temporal_sort_key) if starts else None
+    end = min(ends, key=_temporal_sort_key) if ends else None
+    if start is not None and end is not None and _temporal_sort_key(start) >= _temporal_sort_key(end):
+        return None
+    return [start, end]
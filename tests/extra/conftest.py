@@ -0,0 +1,31 @@
+import pytest
+
+import openeo
+from openeo.rest.connection import Connection
+
+API_URL = "https://oeo.test"
+
+S2_METADATA = {
+    "id": "S2",
+    "cube:dimensions": {
+        "x": {"type": "spatial", "step": 10, "reference_system": 32631},
+        "y": {"type": "spatial", "step": 10, "reference_system": 32631},
+        "t": {"type": "temporal"},
+        "bands": {"type": "bands", "values": ["B02", "B03", "B04", "B08"]},
+    },
+}
+
+
+@pytest.fixture
+def con(requests_mock) -> Connection:
+    requests_mock.get(API_URL + "/", json={"api_version": "1.0.0"})
+    requests_mock.get(API_URL + "/collections/S2", json=S2_METADATA)
+    requests_mock.get(API_URL + "/file_formats", json={
+        "input": {},
+        "output": {
+            "GTiff": {"gis_data_types": ["raster"]},
+            "netCDF": {"gis_data_types": ["raster"]},
+            "JSON": {"gis_data_types": []},
+        },
+    })
+    return openeo.connect(API_URL)
@@ -1,8 +1,16 @@
+import ast
+import operator
 from typing import List, Union
 
+import numpy as np
+import pytest
+import xarray
+
+from openeo.extra.spectral_indices import spectral_indices
 from openeo.extra.spectral_indices import append_and_rescale_indices, compute_and_rescale_indices, \
     compute_indices, append_indices, compute_index, append_index, list_indices, load_indices
 from openeo.rest.datacube import DataCube
+from openeo.udf import XarrayDataCube
 
 
 def _extract_process_nodes(cube: Union[dict, DataCube], process_id: str) -> List[dict]:
@@ -452,3 +460,177 @@ def test_append_index(con):
             "result": True,
         },
     }
+
+
+def test_load_indices_copy():
+    indices = load_indices()
+    indices["NDVI"]["formula"] = "N"
+    del indices["NDWI"]
+    assert load_indices()["NDVI"]["formula"] == "(N - R)/(N + R)"
+    assert "NDWI" in load_indices()
+
+
+def test_compute_indices_shared_subexpressions(con):
+    cube = con.load_collection("Sentinel2")
+    indices = compute_indices(cube, ["NDVI", "NIRv", "DVI"])
+    apply_dim, = _extract_process_nodes(indices, "apply_dimension")
+    assert apply_dim["arguments"]["process"]["process_graph"] == {
+        "arrayelement1": {
+            "process_id": "array_element",
+            "arguments": {"data": {"from_parameter": "data"}, "index": 7},
+        },
+        "arrayelement2": {
+            "process_id": "array_element",
+            "arguments": {"data": {"from_parameter": "data"}, "index": 3},
+        },
+        "subtract1": {
+            "process_id": "subtract",
+            "arguments": {"x": {"from_node": "arrayelement1"}, "y": {"from_node": "arrayelement2"}},
+        },
+        "add1": {
+            "process_id": "add",
+            "arguments": {"x": {"from_node": "arrayelement1"}, "y": {"from_node": "arrayelement2"}},
+        },
+        "divide1": {
+            "process_id": "divide",
+            "arguments": {"x": {"from_node": "subtract1"}, "y": {"from_node": "add1"}},
+        },
+        "multiply1": {
+            "process_id": "multiply",
+            "arguments": {"x": {"from_node": "divide1"}, "y": {"from_node": "arrayelement1"}},
+        },
+        "arraycreate1": {
+            "process_id": "array_create",
+            "arguments": {"data": [
+                {"from_node": "divide1"}, {"from_node": "multiply1"}, {"from_node": "subtract1"},
+            ]},
+            "result": True,
+        },
+    }
+
+
+def test_compute_index_non_arithmetic_formula(con):
+    # Formula with function calls: evaluated as Python expression
+    cube = con.load_collection("Sentinel2")
+    indices = compute_index(cube, "ANIR")
+    apply_dim, = _extract_process_nodes(indices, "apply_dimension")
+    process_ids = {n["process_id"] for n in apply_dim["arguments"]["process"]["process_graph"].values()}
+    assert {"arccos", "clip", "sqrt"}.issubset(process_ids)
+
+
+def _local_cube(bands=("B02", "B04", "B08"), name="SENTINEL2_L2A") -> xarray.DataArray:
+    rng = np.random.default_rng(42)
+    return xarray.DataArray(
+        rng.integers(1, 8000, size=(2, len(bands), 3, 4)).astype(np.int16),
+        dims=["t", "bands", "y", "x"],
+        coords={"t": ["2021-06-01", "2021-06-11"], "bands": list(bands), "y": [1, 2, 3], "x": [1, 2, 3, 4]},
+        name=name,
+    )
+
+
+def _expected_ndvi(array: xarray.DataArray) -> np.ndarray:
+    red = array.sel(bands="B04").values.astype(np.float32)
+    nir = array.sel(bands="B08").values.astype(np.float32)
+    return (nir - red) / (nir + red)
+
+
+def test_compute_index_local():
+    array = _local_cube()
+    result = compute_index(array, "NDVI")
+    assert isinstance(result, xarray.DataArray)
+    assert result.dims == ("t", "bands", "y", "x")
+    assert list(result.bands.values) == ["NDVI"]
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result.sel(bands="NDVI").values, _expected_ndvi(array), rtol=1e-6)
+    assert list(result.t.values) == list(array.t.values)
+
+
+def test_compute_indices_local_xarraydatacube():
+    array = _local_cube()
+    result = compute_indices(XarrayDataCube(array), ["NDVI", "NIRv", "DVI"])
+    assert isinstance(result, XarrayDataCube)
+    result = result.get_array()
+    assert list(result.bands.values) == ["NDVI", "NIRv", "DVI"]
+    ndvi = _expected_ndvi(array)
+    nir = array.sel(bands="B08").values.astype(np.float32)
+    red = array.sel(bands="B04").values.astype(np.float32)
+    np.testing.assert_allclose(result.sel(bands="NIRv").values, ndvi * nir, rtol=1e-5)
+    np.testing.assert_allclose(result.sel(bands="DVI").values, nir - red, rtol=1e-6)
+
+
+def test_append_index_local():
+    array = _local_cube()
+    result = append_index(array, "NDVI")
+    assert list(result.bands.values) == ["B02", "B04", "B08", "NDVI"]
+    np.testing.assert_allclose(result.sel(bands=["B02", "B04", "B08"]).values, array.values)
+    np.testing.assert_allclose(result.sel(bands="NDVI").values, _expected_ndvi(array), rtol=1e-6)
+
+
+def test_append_and_rescale_indices_local():
+    array = _local_cube()
+    index_dict = {
+        "collection": {"input_range": [0, 8000], "output_range": [0, 250]},
+        "indices": {"NDVI": {"input_range": [-1, 1], "output_range": [0, 250]}},
+    }
+    result = append_and_rescale_indices(array, index_dict)
+    assert list(result.bands.values) == ["B02", "B04", "B08", "NDVI"]
+    np.testing.assert_allclose(
+        result.sel(bands="B04").values, array.sel(bands="B04").values / 8000 * 250, rtol=1e-6
+    )
+    np.testing.assert_allclose(result.sel(bands="NDVI").values, (_expected_ndvi(array) + 1) / 2 * 250, rtol=1e-5)
+
+
+def test_compute_indices_local_chunked(monkeypatch):
+    array = _local_cube()
+    expected = compute_indices(array, ["NDVI", "NIRv"])
+    monkeypatch.setattr(spectral_indices, "LOCAL_CHUNK_SIZE", 5)
+    result = compute_indices(array, ["NDVI", "NIRv"])
+    xarray.testing.assert_allclose(result, expected)
+
+
+def test_compute_index_local_collection_id():
+    array = _local_cube(name=None)
+    with pytest.raises(ValueError, match="Could not detect supported satellite platform"):
+        compute_index(array, "NDVI")
+    result = compute_index(array, "NDVI", collection_id="SENTINEL2")
+    np.testing.assert_allclose(result.sel(bands="NDVI").values, _expected_ndvi(array), rtol=1e-6)
+
+
+def test_compute_index_local_missing_band():
+    array = _local_cube(bands=("B02", "B04"))
+    with pytest.raises(NameError):
+        compute_index(array, "NDVI")
+
+
+def test_compute_index_local_non_arithmetic_formula():
+    array = _local_cube(bands=("B04", "B08", "B11"))
+    result = compute_index(array, "ANIR")
+    assert list(result.bands.values) == ["ANIR"]
+    values = result.sel(bands="ANIR").values
+    assert values.shape == (2, 3, 4)
+    assert np.all((values >= 0) & (values <= 1))
+
+
+def test_compute_index_local_without_numexpr(monkeypatch):
+    array = _local_cube()
+    expected = compute_indices(array, ["NDVI", "NIRv"])
+    monkeypatch.setattr(spectral_indices, "numexpr", None)
+    result = compute_indices(array, ["NDVI", "NIRv"])
+    xarray.testing.assert_allclose(result, expected)
+
+
+def test_compile_formula_numeric_literals():
+    assert spectral_indices._compile_formula("2.5 * (N - R)") == (
+        operator.mul, ("const", float, 2.5), (operator.sub, ("var", "N"), ("var", "R"))
+    )
+
+
+def test_expression_tree_legacy_num_node(monkeypatch):
+    """Numeric literals as parsed on Python < 3.8 (`ast.Num` nodes)."""
+
+    class Num(ast.AST):
+        _fields = ("n",)
+
+    monkeypatch.setattr(spectral_indices, "_AST_NUM", Num)
+    node = ast.BinOp(left=Num(n=2), op=ast.Mult(), right=ast.Name(id="N"))
+    assert spectral_indices._expression_tree(node) == (operator.mul, ("const", int, 2), ("var", "N"))
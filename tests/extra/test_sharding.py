@@ -0,0 +1,145 @@
+import json
+import re
+
+import numpy as np
+import pytest
+import shapely.geometry
+
+from openeo.extra.sharding import _hilbert_index, merge_timeseries, shard_features, sharded_aggregate_spatial
+from .conftest import API_URL
+
+
+def _points(coordinates, **properties) -> dict:
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": shapely.geometry.mapping(shapely.geometry.Point(x, y).buffer(0.1)),
+                "properties": {"id": i, **properties},
+            }
+            for i, (x, y) in enumerate(coordinates)
+        ],
+    }
+
+
+# Two clusters of points, in interleaved order.
+CLUSTERED = _points([(0, 0), (100, 100), (1, 0), (101, 100), (0, 1), (100, 101), (1, 1), (101, 101)])
+
+
+def test_hilbert_index():
+    x, y = np.meshgrid(np.arange(8), np.arange(8))
+    d = _hilbert_index(x.ravel(), y.ravel(), bits=3)
+    assert sorted(d) == list(range(64))
+    # Consecutive positions along the curve are neighbouring cells.
+    order = np.argsort(d)
+    assert set(np.abs(np.diff(x.ravel()[order])) + np.abs(np.diff(y.ravel()[order]))) == {1}
+
+
+@pytest.mark.parametrize("ordering", ["hilbert", "grid"])
+def test_shard_features_clustered(ordering):
+    shards = shard_features(CLUSTERED, max_features=4, ordering=ordering)
+    assert [sorted(s.indices) for s in shards] == [[0, 2, 4, 6], [1, 3, 5, 7]]
+    assert [[f["properties"]["id"] for f in s.features["features"]] for s in shards] == [s.indices for s in shards]
+    assert shards[0].bbox == pytest.approx({"west": -0.1, "south": -0.1, "east": 1.1, "north": 1.1})
+    assert shards[1].features["type"] == "FeatureCollection"
+
+
+def test_shard_features_geometry_list():
+    geometries = [shapely.geometry.box(x, 0, x + 1, 1) for x in [5, 0, 6, 1]]
+    shards = shard_features(geometries, max_features=3)
+    assert [len(s.indices) for s in shards] == [3, 1]
+    assert sorted(sum((s.indices for s in shards), [])) == [0, 1, 2, 3]
+    assert shards[0].features["features"][0]["type"] == "Feature"
+    assert shard_features([], max_features=3) == []
+
+
+def test_shard_features_invalid():
+    with pytest.raises(ValueError, match="Invalid ordering"):
+        shard_features(CLUSTERED, ordering="random")
+    with pytest.raises(ValueError, match="Invalid max_features"):
+        shard_features(CLUSTERED, max_features=0)
+
+
+def test_merge_timeseries():
+    shards = shard_features(CLUSTERED, max_features=4)
+    results = [
+        {"2022-01-01": [[float(i)] for i in shards[0].indices]},
+        {"2022-01-01": [[float(i)] for i in shards[1].indices], "2022-01-02": [[]] * 4},
+    ]
+    merged = merge_timeseries(results, shards=shards, feature_count=8)
+    assert merged == {
+        "2022-01-01": [[float(i)] for i in range(8)],
+        "2022-01-02": [[], [], [], [], [], [], [], []],
+    }
+    with pytest.raises(ValueError, match="Shard result has 1 polygons"):
+        merge_timeseries([{"2022-01-01": [[1.0]]}], shards=shards[:1], feature_count=8)
+
+
+class TestShardedAggregateSpatial:
+
+    @staticmethod
+    def _aggregate(request) -> dict:
+        """Fake aggregate_spatial result: value of polygon is its feature "id" (and 10 times that for 2nd date)."""
+        graph = request.json()["process"]["process_graph"]
+        (node,) = [n for n in graph.values() if n["process_id"] == "aggregate_spatial"]
+        ids = [f["properties"]["id"] for f in node["arguments"]["geometries"]["features"]]
+        return {
+            "2022-01-01T00:00:00Z": [[float(i)] for i in ids],
+            "2022-01-02T00:00:00Z": [[10.0 * i] for i in ids],
+        }
+
+    def test_sync(self, con, requests_mock):
+        result = requests_mock.post(API_URL + "/result", json=lambda request, context: self._aggregate(request))
+        cube = con.load_collection("S2", bands=["B04"])
+        df = sharded_aggregate_spatial(cube, CLUSTERED, reducer="mean", max_features=3, max_workers=2)
+        assert result.call_count == 3
+        assert list(df.columns) == list(range(8))
+        assert list(df.iloc[0]) == [float(i) for i in range(8)]
+        assert list(df.iloc[1]) == [10.0 * i for i in range(8)]
+
+    def test_polygon_index(self, con, requests_mock):
+        requests_mock.post(API_URL + "/result", json=lambda request, context: self._aggregate(request))
+        cube = con.load_collection("S2", bands=["B04"])
+        df = sharded_aggregate_spatial(cube, CLUSTERED, reducer="mean", max_features=5, index="polygon")
+        assert list(df.index) == list(range(8))
+        assert list(df.iloc[:, 0]) == [float(i) for i in range(8)]
+
+    def test_batch(self, con, requests_mock):
+        jobs = {}
+
+        def create_job(request, context):
+            job_id = f"j{len(jobs)}"
+            jobs[job_id] = self._aggregate(request)
+            context.status_code = 201
+            context.headers["OpenEO-Identifier"] = job_id
+            return ""
+
+        job_url = re.escape(API_URL) + r"/jobs/(j\d+)"
+        requests_mock.post(API_URL + "/jobs", text=create_job)
+        requests_mock.post(re.compile(job_url + "/results$"), status_code=202)
+        requests_mock.get(
+            re.compile(job_url + "$"),
+            json=lambda request, context: {"id": request.path.split("/")[2], "status": "finished"},
+        )
+        requests_mock.get(
+            re.compile(job_url + "/results$"),
+            json=lambda request, context: {
+                "assets": {
+                    "result.json": {"href": API_URL + "/download/" + request.path.split("/")[2] + "/result.json"}
+                }
+            },
+        )
+        requests_mock.get(
+            re.compile(re.escape(API_URL) + r"/download/(j\d+)/result.json"),
+            text=lambda request, context: json.dumps(jobs[request.path.split("/")[2]]),
+        )
+        cube = con.load_collection("S2", bands=["B04"])
+        df = sharded_aggregate_spatial(cube, CLUSTERED, reducer="mean", max_features=4, mode="batch")
+        assert len(jobs) == 2
+        assert list(df.iloc[0]) == [float(i) for i in range(8)]
+
+    def test_invalid_mode(self, con):
+        cube = con.load_collection("S2", bands=["B04"])
+        with pytest.raises(ValueError, match="Invalid mode"):
+            sharded_aggregate_spatial(cube, CLUSTERED, reducer="mean", mode="magic")
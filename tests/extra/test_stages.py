@@ -0,0 +1,185 @@
+import itertools
+import re
+
+import pytest
+
+import openeo
+from openeo.extra.stages import StagedJobRunner, auto_checkpoints, plan_stages
+from openeo.internal.graph_building import PGNode
+from openeo.rest import OpenEoClientException
+from .conftest import API_URL
+
+UDF_CODE = "def apply_datacube(cube, context):\n    return cube\n"
+
+
+@pytest.fixture
+def graph(con):
+    """Median composite, followed by a UDF and NDVI (with an independent maximum composite branch)."""
+    cube = con.load_collection("S2", bands=["B04", "B08"]).filter_bbox(west=3, south=51, east=4, north=52)
+    composite = cube.reduce_dimension(dimension="t", reducer="median")
+    maximum = cube.reduce_dimension(dimension="t", reducer="max")
+    udf = composite.apply(openeo.UDF(UDF_CODE, runtime="Python")).ndvi()
+    result = udf.merge_cubes(maximum)
+    return {"cube": cube, "composite": composite, "maximum": maximum, "udf": udf, "result": result}
+
+
+def _process_ids(node) -> list:
+    return [n["process_id"] for n in node.flat_graph().values()]
+
+
+def test_plan_stages_no_checkpoints(graph):
+    stages = plan_stages(graph["result"])
+    assert len(stages) == 1
+    assert stages[0].node is graph["result"].result_node()
+    assert stages[0].dependencies == []
+
+
+def test_plan_stages_checkpoints(graph):
+    stages = plan_stages(graph["result"], checkpoints=[graph["composite"], graph["maximum"]])
+    assert [s.name for s in stages] == ["stage1", "stage2", "stage3"]
+    by_node = {id(s.node): s for s in stages}
+    composite = by_node[id(graph["composite"].result_node())]
+    maximum = by_node[id(graph["maximum"].result_node())]
+    final = stages[-1]
+    assert final.node is graph["result"].result_node()
+    assert set(final.dependencies) == {composite, maximum}
+    assert composite.dependencies == [] and maximum.dependencies == []
+
+
+def test_plan_stages_invalid_checkpoint(con, graph):
+    other = con.load_collection("S2").max_time()
+    with pytest.raises(ValueError, match="not part of the process graph"):
+        plan_stages(graph["result"], checkpoints=[other])
+
+
+def test_auto_checkpoints(graph):
+    checkpoints = auto_checkpoints(graph["result"].result_node())
+    # Composite is both a temporal reduction and UDF input; load_collection + filter is too cheap.
+    assert {id(n) for n in checkpoints} == {id(graph["composite"].result_node()), id(graph["maximum"].result_node())}
+    assert len(checkpoints) == 2
+    assert auto_checkpoints(graph["cube"].apply(openeo.UDF(UDF_CODE, runtime="Python")).result_node()) == []
+
+
+def test_auto_checkpoints_final_save_result(graph):
+    node = graph["composite"].result_node()
+    assert auto_checkpoints(node) == []
+    assert auto_checkpoints(PGNode("save_result", data={"from_node": node}, format="GTiff")) == []
+
+
+def test_stage_build(graph):
+    stages = plan_stages(graph["result"], checkpoints=[graph["composite"], graph["maximum"]])
+    node = stages[0].build(job_ids={})
+    assert _process_ids(node) == ["load_collection", "filter_bbox", "reduce_dimension", "save_result"]
+    final = stages[-1]
+    node = final.build(job_ids={"stage1": "j-1", "stage2": "j-2"}, format="netCDF")
+    flat = node.flat_graph()
+    assert sorted(n["arguments"]["id"] for n in flat.values() if n["process_id"] == "load_result") == ["j-1", "j-2"]
+    assert "load_collection" not in _process_ids(node)
+    assert flat["saveresult1"]["arguments"]["format"] == "netCDF"
+    with pytest.raises(OpenEoClientException, match=r"No job ids for input stages \['stage2'\]"):
+        final.build(job_ids={"stage1": "j-1"})
+    # Original graph is not modified
+    assert "load_result" not in _process_ids(graph["result"])
+
+
+class TestStagedJobRunner:
+
+    @pytest.fixture
+    def backend(self, requests_mock):
+        """
+        Fake back-end where jobs finish after 2 status polls
+        (and jobs with "fail" in the title end with "fail_status").
+        """
+        state = {"created": {}, "started": [], "polls": {}, "fail": None, "fail_status": "error"}
+        counter = itertools.count()
+
+        def create_job(request, context):
+            job_id = f"j{next(counter)}"
+            state["created"][job_id] = request.json()
+            context.status_code = 201
+            context.headers["OpenEO-Identifier"] = job_id
+            return ""
+
+        def start_job(request, context):
+            state["started"].append(request.path.split("/")[2])
+            context.status_code = 202
+            return ""
+
+        def describe_job(request, context):
+            job_id = request.path.split("/")[2]
+            state["polls"][job_id] = state["polls"].get(job_id, 0) + 1
+            if state["polls"][job_id] < 2:
+                status = "running"
+            else:
+                failing = state["fail"] and state["fail"] in state["created"][job_id]["title"]
+                status = state["fail_status"] if failing else "finished"
+            return {"id": job_id, "status": status}
+
+        requests_mock.post(API_URL + "/jobs", text=create_job)
+        requests_mock.post(re.compile(re.escape(API_URL) + r"/jobs/j\d+/results"), text=start_job)
+        requests_mock.get(re.compile(re.escape(API_URL) + r"/jobs/j\d+$"), json=describe_job)
+        return state
+
+    @staticmethod
+    def _load_result_ids(request: dict) -> list:
+        graph = request["process"]["process_graph"]
+        return sorted(n["arguments"]["id"] for n in graph.values() if n["process_id"] == "load_result")
+
+    def test_run(self, con, graph, backend):
+        stages = plan_stages(graph["result"], checkpoints=[graph["composite"], graph["maximum"]])
+        runner = StagedJobRunner(max_running_jobs=2, poll_interval=0)
+        jobs = runner.run(con, stages, title="Test")
+        assert runner.status() == {"stage1": "finished", "stage2": "finished", "stage3": "finished"}
+        # Independent stages run in parallel, final stage loads their results.
+        assert backend["started"] == ["j0", "j1", "j2"]
+        assert [r["title"] for r in backend["created"].values()] == ["Test (stage1)", "Test (stage2)", "Test (stage3)"]
+        assert self._load_result_ids(backend["created"]["j2"]) == ["j0", "j1"]
+        assert runner.job_ids() == {"stage1": "j0", "stage2": "j1", "stage3": "j2"}
+        assert jobs[2].job.job_id == "j2"
+
+    def test_resume_after_failure(self, con, graph, backend):
+        stages = plan_stages(graph["result"], checkpoints=[graph["composite"], graph["maximum"]])
+        runner = StagedJobRunner(max_running_jobs=1, poll_interval=0)
+        backend["fail"] = "stage2"
+        runner.run(con, stages, title="Test")
+        assert runner.status() == {"stage1": "finished", "stage2": "error", "stage3": "skipped"}
+
+        # Resume: only rerun failed and skipped stages.
+        backend["fail"] = None
+        runner.run(con, stages, title="Test")
+        assert runner.status() == {"stage1": "finished", "stage2": "finished", "stage3": "finished"}
+        assert backend["started"] == ["j0", "j1", "j2", "j3"]
+        assert self._load_result_ids(backend["created"]["j3"]) == ["j0", "j2"]
+
+    def test_resume_from_job_ids(self, con, graph, backend):
+        stages = plan_stages(graph["result"], checkpoints=[graph["composite"]])
+        runner = StagedJobRunner(poll_interval=0)
+        runner.run(con, stages, job_ids={"stage1": "j-old"})
+        assert backend["started"] == ["j0"]
+        assert self._load_result_ids(backend["created"]["j0"]) == ["j-old"]
+
+    @pytest.mark.parametrize("fail_status", ["canceled", "unknown"])
+    def test_unfinished_input_status(self, con, graph, backend, fail_status):
+        stages = plan_stages(graph["result"], checkpoints=[graph["composite"], graph["maximum"]])
+        runner = StagedJobRunner(max_running_jobs=1, poll_interval=0)
+        backend["fail"] = "stage2"
+        backend["fail_status"] = fail_status
+        runner.run(con, stages, title="Test")
+        assert runner.status() == {"stage1": "finished", "stage2": fail_status, "stage3": "skipped"}
+        assert backend["started"] == ["j0", "j1"]
+
+    def test_status_poll_failure(self, con, graph, backend, requests_mock):
+        stages = plan_stages(graph["result"], checkpoints=[graph["composite"], graph["maximum"]])
+        # Status requests of second stage's job fail (with other than a temporary "service unavailable" error).
+        requests_mock.get(API_URL + "/jobs/j1", status_code=500, json={"code": "Internal", "message": "Oops"})
+        runner = StagedJobRunner(max_running_jobs=2, poll_interval=0)
+        jobs = runner.run(con, stages, title="Test")
+        assert runner.status() == {"stage1": "finished", "stage2": "error", "stage3": "skipped"}
+        assert "Oops" in jobs[1].error
+
+    def test_soft_errors(self, con, graph, backend, requests_mock):
+        stages = plan_stages(graph["result"])
+        requests_mock.get(API_URL + "/jobs/j0", status_code=503, json={"code": "Unavailable", "message": "Busy"})
+        runner = StagedJobRunner(poll_interval=0, soft_error_max=3)
+        with pytest.raises(OpenEoClientException, match="Excessive soft errors"):
+            runner.run(con, stages)
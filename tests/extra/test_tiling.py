@@ -0,0 +1,163 @@
+import itertools
+import re
+
+import pytest
+import shapely.geometry
+
+from openeo.extra.tiling import TiledJobRunner, plan_tiles, tile_cubes, tile_size_from_budget, utm_crs
+from openeo.metadata import CollectionMetadata
+from .conftest import API_URL, S2_METADATA
+
+METADATA = CollectionMetadata(S2_METADATA)
+
+
+def test_utm_crs():
+    assert utm_crs(lon=4.4, lat=51.2) == 32631
+    assert utm_crs(lon=-70.6, lat=-33.4) == 32719
+    assert utm_crs(lon=180, lat=0) == 32660
+
+
+def test_tile_size_from_budget():
+    assert tile_size_from_budget(METADATA, pixel_budget=4 * 1000 * 1000, crs=32631) == 10000
+    assert tile_size_from_budget(METADATA.filter_bands(["B04"]), pixel_budget=1000 * 1000, crs=32632) == 10000
+    with pytest.raises(ValueError, match="does not match tiling CRS"):
+        tile_size_from_budget(METADATA, pixel_budget=1000 * 1000, crs=4326)
+    with pytest.raises(ValueError, match="too small"):
+        tile_size_from_budget(METADATA, pixel_budget=3, crs=32631)
+
+
+def test_plan_tiles_bbox():
+    tiles = plan_tiles({"west": 3.5, "south": 50.2, "east": 5.5, "north": 51}, tile_size=1)
+    assert [(t.col, t.row) for t in tiles] == [(3, 50), (4, 50), (5, 50)]
+    assert tiles[0].core == {"west": 3.5, "south": 50.2, "east": 4, "north": 51, "crs": "EPSG:4326"}
+    assert tiles[1].core == {"west": 4, "south": 50.2, "east": 5, "north": 51, "crs": "EPSG:4326"}
+    assert tiles[0].bbox == tiles[0].core
+    assert tiles[2].name == "tile_5_50"
+
+
+def test_plan_tiles_overlap():
+    tiles = plan_tiles([0, 0, 2000, 1000], tile_size=1000, overlap=20, crs=32631)
+    assert [t.bbox for t in tiles] == [
+        {"west": -20, "south": -20, "east": 1020, "north": 1020, "crs": "EPSG:32631"},
+        {"west": 980, "south": -20, "east": 2020, "north": 1020, "crs": "EPSG:32631"},
+    ]
+
+
+def test_plan_tiles_geometry():
+    # L-shaped polygon: upper right tile does not intersect
+    polygon = shapely.geometry.Polygon([(0, 0), (2, 0), (2, 1), (1, 1), (1, 2), (0, 2)])
+    tiles = plan_tiles(polygon, tile_size=1)
+    assert [(t.col, t.row) for t in tiles] == [(0, 0), (1, 0), (0, 1)]
+    geojson = {"type": "Feature", "geometry": shapely.geometry.mapping(polygon), "properties": {}}
+    assert plan_tiles(geojson, tile_size=1) == tiles
+
+
+def test_plan_tiles_utm():
+    tiles = plan_tiles({"west": 4.0, "south": 51.0, "east": 4.2, "north": 51.1}, tile_size=10000, utm=True)
+    assert len(tiles) > 1
+    assert all(t.bbox["crs"] == "EPSG:32631" for t in tiles)
+    # Grid aligned to multiples of the tile size
+    assert all(t.col * 10000 <= t.core["west"] < t.core["east"] <= (t.col + 1) * 10000 for t in tiles)
+    assert all(t.core["west"] % 10000 == 0 for t in tiles[1:] if t.col != tiles[0].col)
+
+
+def test_plan_tiles_pixel_budget():
+    tiles = plan_tiles(
+        {"west": 4.0, "south": 51.0, "east": 4.2, "north": 51.1}, pixel_budget=4 * 1000 * 1000, metadata=METADATA,
+        utm=True,
+    )
+    assert all(t.core["east"] - t.core["west"] <= 10000 for t in tiles)
+    assert plan_tiles(
+        {"west": 4.0, "south": 51.0, "east": 4.2, "north": 51.1}, tile_size=10000, utm=True
+    ) == tiles
+
+
+def test_plan_tiles_invalid():
+    with pytest.raises(ValueError, match="Either `tile_size` or `pixel_budget`"):
+        plan_tiles([0, 0, 1, 1])
+    with pytest.raises(ValueError, match="Invalid tile size"):
+        plan_tiles([0, 0, 1, 1], tile_size=0)
+
+
+def test_tile_cubes(con):
+    cube = con.load_collection("S2", bands=["B04"])
+    tiles = plan_tiles([0, 0, 2000, 1000], tile_size=1000, crs=32631)
+    cubes = tile_cubes(cube, tiles)
+    assert list(cubes.keys()) == tiles
+    graph = cubes[tiles[1]].flat_graph()
+    assert graph["filterbbox1"]["arguments"]["extent"] == {
+        "west": 1000, "south": 0, "east": 2000, "north": 1000, "crs": "EPSG:32631"
+    }
+
+
+class TestTiledJobRunner:
+
+    @pytest.fixture
+    def backend(self, requests_mock):
+        """Fake back-end where job "j<n>" takes n status polls to finish (or fails for tile "tile_1_0")."""
+        state = {"created": [], "running": set(), "max_running": 0}
+        counter = itertools.count()
+
+        def create_job(request, context):
+            job_id = f"j{next(counter)}"
+            state["created"].append((job_id, request.json()["title"]))
+            context.status_code = 201
+            context.headers["OpenEO-Identifier"] = job_id
+            return ""
+
+        def start_job(request, context):
+            job_id = request.path.split("/")[2]
+            state["running"].add(job_id)
+            state["max_running"] = max(state["max_running"], len(state["running"]))
+            state[job_id] = 0
+            context.status_code = 202
+            return ""
+
+        def describe_job(request, context):
+            job_id = request.path.split("/")[2]
+            state[job_id] += 1
+            title = dict(state["created"])[job_id]
+            if state[job_id] < 2:
+                status = "running"
+            else:
+                status = "error" if "tile_1_0" in title else "finished"
+                state["running"].discard(job_id)
+            return {"id": job_id, "status": status}
+
+        requests_mock.post(API_URL + "/jobs", text=create_job)
+        requests_mock.post(re.compile(re.escape(API_URL) + r"/jobs/j\d+/results"), text=start_job)
+        requests_mock.get(re.compile(re.escape(API_URL) + r"/jobs/j\d+$"), json=describe_job)
+        return state
+
+    def test_run(self, con, backend):
+        cube = con.load_collection("S2", bands=["B04"])
+        tiles = plan_tiles([0, 0, 3000, 2000], tile_size=1000, crs=32631)
+        updates = []
+        runner = TiledJobRunner(max_running_jobs=2, poll_interval=0, on_status=lambda j: updates.append(j.status))
+        jobs = runner.run(tile_cubes(cube, tiles), title="NDVI", out_format="GTiff")
+        assert len(jobs) == 6
+        assert backend["max_running"] == 2
+        assert [t for _, t in backend["created"]] == [f"NDVI ({t.name})" for t in tiles]
+        status = runner.status()
+        assert status[tiles[1]] == "error"
+        assert [s for t, s in status.items() if t != tiles[1]] == ["finished"] * 5
+        assert updates.count("queued") == 6
+        assert jobs[0].job.job_id == "j0"
+
+    def test_run_create_failure(self, con, requests_mock):
+        requests_mock.post(API_URL + "/jobs", status_code=500, json={"code": "Internal", "message": "Nope"})
+        cube = con.load_collection("S2", bands=["B04"])
+        runner = TiledJobRunner(poll_interval=0)
+        jobs = runner.run({"a": cube, "b": cube})
+        assert [j.status for j in jobs] == ["error", "error"]
+        assert "Nope" in jobs[0].error
+        assert jobs[0].job is None
+
+    def test_run_status_failure(self, con, backend, requests_mock):
+        # Status requests of job "j1" fail (with other than a temporary "service unavailable" error).
+        requests_mock.get(API_URL + "/jobs/j1", status_code=500, json={"code": "Internal", "message": "Oops"})
+        cube = con.load_collection("S2", bands=["B04"])
+        runner = TiledJobRunner(max_running_jobs=2, poll_interval=0)
+        jobs = runner.run({"a": cube, "b": cube, "c": cube})
+        assert runner.status() == {"a": "finished", "b": "error", "c": "finished"}
+        assert "Oops" in jobs[1].error
@@ -0,0 +1,43 @@
+import functools
+import math
+import operator
+
+from openeo.internal.graph_building import PGNode
+
+# Reference implementations of (a subset of) math processes, to check semantic equivalence of rewritten graphs.
+_PROCESSES = {
+    "add": lambda x, y: x + y,
+    "subtract": lambda x, y: x - y,
+    "multiply": lambda x, y: x * y,
+    "divide": lambda x, y: x / y,
+    "power": lambda base, p: base ** p,
+    "absolute": lambda x: abs(x),
+    "sqrt": lambda x: math.sqrt(x),
+    "ln": lambda x: math.log(x),
+    "linear_scale_range": lambda x, inputMin, inputMax, outputMin=0, outputMax=1: (
+        (min(max(x, inputMin), inputMax) - inputMin) / (inputMax - inputMin) * (outputMax - outputMin) + outputMin
+    ),
+    "sum": lambda data, ignore_nodata=True: sum(data),
+    "product": lambda data, ignore_nodata=True: functools.reduce(operator.mul, data, 1),
+    "array_element": lambda data, index: data[index],
+    "pi": lambda: math.pi,
+}
+
+
+def evaluate(node: PGNode, parameters: dict):
+    """Simple evaluator of math process graphs (given as result PGNode)."""
+
+    def evaluate_value(value):
+        if isinstance(value, PGNode):
+            return evaluate(value, parameters)
+        elif isinstance(value, dict):
+            if "from_node" in value:
+                return evaluate(value["from_node"], parameters)
+            elif "from_parameter" in value:
+                return parameters[value["from_parameter"]]
+            return {k: evaluate_value(v) for k, v in value.items()}
+        elif isinstance(value, list):
+            return [evaluate_value(v) for v in value]
+        return value
+
+    return _PROCESSES[node.process_id](**evaluate_value(node.arguments))
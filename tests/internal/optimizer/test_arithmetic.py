@@ -0,0 +1,306 @@
+import math
+import random
+
+import pytest
+
+from openeo.internal.graph_building import PGNode
+from openeo.internal.optimizer.arithmetic import (
+    AlgebraicSimplification, AssociativeFlattening, CommonSubexpressionElimination, ConstantFolding
+)
+from openeo.internal.optimizer.base import GraphOptimizer
+from openeo.processes import ProcessBuilder, divide, linear_scale_range, pi, power, sqrt
+from . import evaluate
+
+X = ProcessBuilder({"from_parameter": "x"})
+
+
+def _callback_node(builder: ProcessBuilder) -> PGNode:
+    return builder.pgnode
+
+
+def assert_equivalent(original: PGNode, optimized: PGNode, samples=None):
+    samples = samples or [random.uniform(-100, 100) for _ in range(20)] + [0, 1, -1, 12345.678]
+    for x in samples:
+        assert evaluate(optimized, {"x": x}) == pytest.approx(evaluate(original, {"x": x}), rel=1e-12, abs=1e-12)
+
+
+class TestConstantFolding:
+
+    @pytest.mark.parametrize(["node", "expected"], [
+        (PGNode("add", x=3, y=5), 8),
+        (PGNode("divide", x=1, y=10000), 0.0001),
+        (PGNode("power", base=2, p=10), 1024),
+        (PGNode("sqrt", x=16), 4.0),
+        (PGNode("linear_scale_range", x=5, inputMin=0, inputMax=10), 0.5),
+        (PGNode("linear_scale_range", x=50, inputMin=0, inputMax=10, outputMin=0, outputMax=255), 255),
+        (PGNode("clip", x=-5, min=0, max=3), 0),
+        (PGNode("pi"), math.pi),
+        (PGNode("log", x=100, base=10), 2),
+        (PGNode("absolute", x=-3), 3),
+        (PGNode("sgn", x=-3.5), -1),
+        (PGNode("exp", p=0), 1),
+        (PGNode("ln", x=math.e), 1),
+        (PGNode("floor", x=-2.5), -3),
+        (PGNode("int", x=-2.5), -2),
+        (PGNode("cos", x=0), 1),
+    ])
+    def test_evaluate(self, node, expected):
+        assert ConstantFolding.evaluate(node) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("node", [
+        PGNode("divide", x=1, y=0),
+        PGNode("sqrt", x=-1),
+        PGNode("ln", x=0),
+        PGNode("power", base=-8, p=1 / 3),
+        PGNode("power", base=10, p=400),
+        PGNode("power", base=10.0, p=400),
+        PGNode("add", x=3, y=None),
+        PGNode("add", x=3, y=True),
+        PGNode("add", x=3, y="5"),
+        PGNode("add", x=3),
+        PGNode("add", x=3, y=5, z=3),
+        PGNode("add", x=3, y=5, namespace="custom"),
+        PGNode("add", x=3, y={"from_parameter": "x"}),
+        PGNode("mean", data=[1, 2, 3]),
+    ])
+    def test_evaluate_not_foldable(self, node):
+        assert ConstantFolding.evaluate(node) is None
+
+    def test_fold_subexpressions(self):
+        original = (X * divide(1, 10000) + power(2, 3) * pi()).pgnode
+        optimized = ConstantFolding().run(original)
+        assert optimized.flat_graph() == {
+            "multiply1": {"process_id": "multiply", "arguments": {"x": {"from_parameter": "x"}, "y": 0.0001}},
+            "add1": {
+                "process_id": "add",
+                "arguments": {"x": {"from_node": "multiply1"}, "y": 8 * math.pi},
+                "result": True,
+            },
+        }
+        assert_equivalent(original, optimized)
+
+    def test_root_not_folded(self):
+        original = divide(1, 10000).pgnode
+        assert ConstantFolding().run(original) is original
+
+
+class TestAlgebraicSimplification:
+
+    @pytest.mark.parametrize("expression", [
+        lambda x: x * 1,
+        lambda x: 1 * x,
+        lambda x: x + 0,
+        lambda x: 0 + x,
+        lambda x: x - 0,
+        lambda x: x / 1,
+        lambda x: x ** 1,
+        lambda x: -(-x),
+    ])
+    def test_identities(self, expression):
+        original = (expression(X) + 2).pgnode
+        optimized = AlgebraicSimplification().run(original)
+        assert optimized.flat_graph() == {
+            "add1": {"process_id": "add", "arguments": {"x": {"from_parameter": "x"}, "y": 2}, "result": True},
+        }
+        assert_equivalent(original, optimized)
+
+    @pytest.mark.parametrize("expression", [
+        lambda x: x * 2,
+        lambda x: x + 1,
+        lambda x: 1 - x,
+        lambda x: 1 / x,
+        lambda x: x * 0,
+        lambda x: -x,
+    ])
+    def test_no_simplification(self, expression):
+        original = (expression(X) + 2).pgnode
+        assert AlgebraicSimplification().run(original) is original
+
+    def test_linear_scale_range_chain(self):
+        original = linear_scale_range(
+            linear_scale_range(X, inputMin=-10, inputMax=10, outputMin=0, outputMax=255),
+            inputMin=0, inputMax=255, outputMin=-1, outputMax=1
+        ).pgnode
+        optimized = AlgebraicSimplification().run(original)
+        assert optimized.flat_graph() == {
+            "linearscalerange1": {
+                "process_id": "linear_scale_range",
+                "arguments": {"x": {"from_parameter": "x"}, "inputMin": -10, "inputMax": 10, "outputMin": -1, "outputMax": 1},
+                "result": True,
+            },
+        }
+        assert_equivalent(original, optimized)
+
+    def test_linear_scale_range_chain_default_output(self):
+        original = linear_scale_range(
+            linear_scale_range(X, inputMin=-10, inputMax=10), inputMin=0, inputMax=1, outputMin=0, outputMax=100
+        ).pgnode
+        optimized = AlgebraicSimplification().run(original)
+        assert optimized.arguments == {
+            "x": {"from_parameter": "x"}, "inputMin": -10, "inputMax": 10, "outputMin": 0, "outputMax": 100,
+        }
+        assert_equivalent(original, optimized)
+
+    def test_linear_scale_range_chain_mismatch(self):
+        original = linear_scale_range(
+            linear_scale_range(X, inputMin=-10, inputMax=10, outputMin=0, outputMax=255),
+            inputMin=0, inputMax=100, outputMin=-1, outputMax=1
+        ).pgnode
+        assert AlgebraicSimplification().run(original) is original
+
+
+DATA = ProcessBuilder({"from_parameter": "data"})
+DATA_ARG = {"data": {"from_parameter": "data"}}
+
+
+def _band(index: int) -> ProcessBuilder:
+    return DATA.array_element(index)
+
+
+def _count_processes(node: PGNode, process_id: str) -> int:
+    return sum(1 for n in node.flat_graph().values() if n["process_id"] == process_id)
+
+
+class TestCommonSubexpressionElimination:
+
+    def test_array_element(self):
+        original = ((_band(1) - _band(0)) / (_band(1) + _band(0))).pgnode
+        assert _count_processes(original, "array_element") == 4
+        optimized = CommonSubexpressionElimination().run(original)
+        assert _count_processes(optimized, "array_element") == 2
+        assert evaluate(optimized, {"data": [3, 5]}) == evaluate(original, {"data": [3, 5]})
+
+    def test_nested_subexpressions(self):
+        original = ((_band(0) * 2 + 1) * (_band(0) * 2 + 1)).pgnode
+        optimized = CommonSubexpressionElimination().run(original)
+        assert optimized.flat_graph() == {
+            "arrayelement1": {"process_id": "array_element", "arguments": {**DATA_ARG, "index": 0}},
+            "multiply1": {"process_id": "multiply", "arguments": {"x": {"from_node": "arrayelement1"}, "y": 2}},
+            "add1": {"process_id": "add", "arguments": {"x": {"from_node": "multiply1"}, "y": 1}},
+            "multiply2": {
+                "process_id": "multiply", "arguments": {"x": {"from_node": "add1"}, "y": {"from_node": "add1"}},
+                "result": True,
+            },
+        }
+
+    @pytest.mark.parametrize("expression", [
+        _band(0) + _band(1),
+        _band(0) + _band(1) * 1.0,
+        _band(0) + ProcessBuilder({"from_parameter": "x"}).array_element(0),
+    ])
+    def test_nothing_to_eliminate(self, expression):
+        original = expression.pgnode
+        assert CommonSubexpressionElimination().run(original) is original
+
+    def test_impure_process(self):
+        original = PGNode("add", x={"from_node": PGNode("random")}, y={"from_node": PGNode("random")})
+        assert CommonSubexpressionElimination().run(original) is original
+
+
+class TestAssociativeFlattening:
+
+    @pytest.mark.parametrize(["expression", "expected"], [
+        (
+            _band(0) + _band(1) + _band(2) + _band(3),
+            {"sum": 1, "add": 0},
+        ),
+        (
+            _band(0) * (_band(1) * _band(2)),
+            {"product": 1, "multiply": 0},
+        ),
+        (
+            (_band(0) + 1) + (_band(1) + 2),
+            {"sum": 1, "add": 0},
+        ),
+        (
+            (_band(0) + _band(1)) * (_band(2) + _band(3)) * 2,
+            {"product": 1, "add": 2},
+        ),
+    ])
+    def test_flatten(self, expression, expected):
+        original = expression.pgnode
+        optimized = GraphOptimizer(passes=[AssociativeFlattening()]).optimize(original)
+        for process_id, count in expected.items():
+            assert _count_processes(optimized, process_id) == count
+        for data in [[1, 2, 3, 4], [-1.5, 0, 2.25, 100]]:
+            assert evaluate(optimized, {"data": data}) == pytest.approx(evaluate(original, {"data": data}))
+
+    def test_sum_arguments(self):
+        original = (_band(0) + _band(1) + 1 + _band(2) + 2).pgnode
+        optimized = AssociativeFlattening().run(original)
+        assert optimized.flat_graph() == {
+            "arrayelement1": {"process_id": "array_element", "arguments": {**DATA_ARG, "index": 0}},
+            "arrayelement2": {"process_id": "array_element", "arguments": {**DATA_ARG, "index": 1}},
+            "arrayelement3": {"process_id": "array_element", "arguments": {**DATA_ARG, "index": 2}},
+            "sum1": {
+                "process_id": "sum",
+                "arguments": {
+                    "data": [
+                        {"from_node": "arrayelement1"}, {"from_node": "arrayelement2"},
+                        {"from_node": "arrayelement3"}, 3,
+                    ],
+                    "ignore_nodata": False,
+                },
+                "result": True,
+            },
+        }
+
+    def test_shared_intermediate(self):
+        # Intermediate sum `a + b` is used twice: flattening would calculate it twice.
+        a_b = _band(0) + _band(1)
+        original = ((a_b + _band(2)) * a_b).pgnode
+        assert AssociativeFlattening().run(original) is original
+
+    def test_ignore_nodata_sum_not_flattened(self):
+        original = PGNode("add", x={"from_node": PGNode("sum", data=[1, {"from_parameter": "x"}])}, y=3)
+        assert AssociativeFlattening().run(original) is original
+
+    def test_flat_callback(self):
+        expression = _band(0) + _band(1) + _band(2)
+        graph = {
+            "process_graph": PGNode(
+                "reduce_dimension", data=None, dimension="bands", reducer={"process_graph": expression.pgnode}
+            ).flat_graph()
+        }
+        optimized = GraphOptimizer(passes=[AssociativeFlattening()]).optimize(graph)
+        reducer = optimized["process_graph"]["reducedimension1"]["arguments"]["reducer"]["process_graph"]
+        assert [n["process_id"] for n in reducer.values()] == ["array_element"] * 3 + ["sum"]
+
+
+def test_band_math_default_optimizer():
+    b = [_band(i) for i in range(4)]
+    original = ((b[3] - b[2]) / (b[3] + b[2] + b[1] + b[0]) * b[3] * b[2]).pgnode
+    optimized = GraphOptimizer().optimize(original)
+    assert _count_processes(optimized, "array_element") == 4
+    assert _count_processes(optimized, "sum") == 1
+    assert _count_processes(optimized, "product") == 1
+    for data in [[1, 2, 3, 4], [0.5, -2, 3, 7.25]]:
+        assert evaluate(optimized, {"data": data}) == pytest.approx(evaluate(original, {"data": data}))
+
+
+def test_default_optimizer():
+    original = (linear_scale_range(
+        linear_scale_range(X * 1 + divide(1, 10000) * 0, inputMin=-10, inputMax=10, outputMin=0, outputMax=255),
+        inputMin=0, inputMax=255,
+    ) + sqrt(16) - 4).pgnode
+    optimized = GraphOptimizer().optimize(original)
+    assert optimized.flat_graph() == {
+        "linearscalerange1": {
+            "process_id": "linear_scale_range",
+            "arguments": {"x": {"from_parameter": "x"}, "inputMin": -10, "inputMax": 10, "outputMin": 0, "outputMax": 1},
+        },
+        "add1": {"process_id": "add", "arguments": {"x": {"from_node": "linearscalerange1"}, "y": 4.0}},
+        "subtract1": {"process_id": "subtract", "arguments": {"x": {"from_node": "add1"}, "y": 4}, "result": True},
+    }
+    assert_equivalent(original, optimized)
+
+
+def test_callback_in_datacube_graph():
+    load = PGNode("load_collection", id="S2")
+    apply = PGNode("apply", data=load, process={"process_graph": (X * divide(1, 10000)).pgnode})
+    optimized = GraphOptimizer().optimize(apply)
+    assert optimized.flat_graph()["apply1"]["arguments"]["process"]["process_graph"] == {
+        "multiply1": {
+            "process_id": "multiply", "arguments": {"x": {"from_parameter": "x"}, "y": 0.0001}, "result": True
+        },
+    }
@@ -0,0 +1,171 @@
+import pytest
+
+from openeo.internal.graph_building import PGNode
+from openeo.internal.optimizer.base import GraphOptimizer, NodeRewritePass, get_optimizer, GraphPass
+
+
+class RenameFoo(NodeRewritePass):
+    """Test pass: rename "foo" processes to "bar"."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def rewrite_node(self, node: PGNode):
+        self.calls += 1
+        if node.process_id == "foo":
+            return PGNode("bar", arguments=node.arguments)
+        return node
+
+
+class DropIdentity(NodeRewritePass):
+    """Test pass: replace "identity" processes with their "x" argument."""
+
+    def rewrite_node(self, node: PGNode):
+        if node.process_id == "identity":
+            return node.arguments["x"]
+        return node
+
+
+def test_no_changes():
+    node = PGNode("add", x=PGNode("load", id="S2"), y=3)
+    assert RenameFoo().run(node) is node
+    assert GraphOptimizer(passes=[RenameFoo()]).optimize(node) is node
+
+
+def test_rewrite_no_in_place_changes():
+    load = PGNode("load", id="S2")
+    foo = PGNode("foo", data=load)
+    result = PGNode("save", data=foo, format="GTiff")
+
+    optimized = RenameFoo().run(result)
+    assert optimized is not result
+    assert optimized.flat_graph() == {
+        "load1": {"process_id": "load", "arguments": {"id": "S2"}},
+        "bar1": {"process_id": "bar", "arguments": {"data": {"from_node": "load1"}}},
+        "save1": {"process_id": "save", "arguments": {"data": {"from_node": "bar1"}, "format": "GTiff"}, "result": True},
+    }
+    # Original graph is unchanged
+    assert result.flat_graph() == {
+        "load1": {"process_id": "load", "arguments": {"id": "S2"}},
+        "foo1": {"process_id": "foo", "arguments": {"data": {"from_node": "load1"}}},
+        "save1": {"process_id": "save", "arguments": {"data": {"from_node": "foo1"}, "format": "GTiff"}, "result": True},
+    }
+
+
+def test_rewrite_preserves_node_reuse():
+    load = PGNode("load", id="S2")
+    foo = PGNode("foo", data=load)
+    result = PGNode("merge", cube1=foo, cube2=[PGNode("other", data=foo)])
+    rename = RenameFoo()
+    optimized = rename.run(result)
+    assert rename.calls == 4
+    assert optimized.flat_graph() == {
+        "load1": {"process_id": "load", "arguments": {"id": "S2"}},
+        "bar1": {"process_id": "bar", "arguments": {"data": {"from_node": "load1"}}},
+        "other1": {"process_id": "other", "arguments": {"data": {"from_node": "bar1"}}},
+        "merge1": {
+            "process_id": "merge",
+            "arguments": {"cube1": {"from_node": "bar1"}, "cube2": [{"from_node": "other1"}]},
+            "result": True,
+        },
+    }
+
+
+def test_rewrite_callbacks():
+    callback = PGNode("foo", x={"from_parameter": "x"})
+    result = PGNode("apply", data=PGNode("load", id="S2"), process={"process_graph": callback})
+    optimized = RenameFoo().run(result)
+    assert optimized.flat_graph()["apply1"]["arguments"]["process"] == {
+        "process_graph": {"bar1": {"process_id": "bar", "arguments": {"x": {"from_parameter": "x"}}, "result": True}},
+    }
+
+
+def test_rewrite_flat_callbacks():
+    flat = {
+        "load1": {"process_id": "load", "arguments": {"id": "S2"}},
+        "apply1": {
+            "process_id": "apply",
+            "arguments": {
+                "data": {"from_node": "load1"},
+                "process": {"process_graph": {
+                    "foo1": {"process_id": "foo", "arguments": {"x": {"from_parameter": "x"}}, "result": True},
+                }},
+            },
+            "result": True,
+        },
+    }
+    optimized = GraphOptimizer(passes=[RenameFoo()]).optimize(flat)
+    assert optimized["apply1"]["arguments"]["process"] == {
+        "process_graph": {"bar1": {"process_id": "bar", "arguments": {"x": {"from_parameter": "x"}}, "result": True}},
+    }
+    assert optimized["load1"] == flat["load1"]
+
+
+def test_replace_with_argument_value():
+    load = PGNode("load", id="S2")
+    result = PGNode("save", data=PGNode("identity", x=PGNode("identity", x=load)))
+    optimized = DropIdentity().run(result)
+    assert optimized.flat_graph() == {
+        "load1": {"process_id": "load", "arguments": {"id": "S2"}},
+        "save1": {"process_id": "save", "arguments": {"data": {"from_node": "load1"}}, "result": True},
+    }
+
+
+def test_replace_root():
+    load = PGNode("load", id="S2")
+    assert DropIdentity().run(PGNode("identity", x=load)) is load
+    # Root can not be replaced by a non-node value.
+    root = PGNode("identity", x=3)
+    assert DropIdentity().run(root) is root
+
+
+def test_optimize_wrapped_flat_graph():
+    pg = {"process_graph": {"foo1": {"process_id": "foo", "arguments": {}, "result": True}}, "parameters": []}
+    assert GraphOptimizer(passes=[RenameFoo()]).optimize(pg) == {
+        "process_graph": {"bar1": {"process_id": "bar", "arguments": {}, "result": True}}, "parameters": [],
+    }
+
+
+def test_optimize_multiple_rounds():
+    class FooToBar(NodeRewritePass):
+        def rewrite_node(self, node):
+            return PGNode("bar", arguments=node.arguments) if node.process_id == "foo" else node
+
+    class BarToBaz(NodeRewritePass):
+        def rewrite_node(self, node):
+            return PGNode("baz", arguments=node.arguments) if node.process_id == "bar" else node
+
+    class BazToFoo(NodeRewritePass):
+        # Create an infinite rewrite loop
+        def rewrite_node(self, node):
+            return PGNode("foo", arguments=node.arguments) if node.process_id == "baz" else node
+
+    node = PGNode("foo")
+    assert GraphOptimizer(passes=[BarToBaz(), FooToBar()]).optimize(node).process_id == "baz"
+    optimizer = GraphOptimizer(passes=[FooToBar(), BarToBaz(), BazToFoo()], max_rounds=3)
+    assert optimizer.optimize(node).process_id == "foo"
+
+
+@pytest.mark.parametrize(["optimize", "expected"], [
+    (False, None),
+    (None, None),
+    ("false", None),
+    (True, GraphOptimizer),
+    ("yes", GraphOptimizer),
+])
+def test_get_optimizer(optimize, expected):
+    optimizer = get_optimizer(optimize)
+    if expected is None:
+        assert optimizer is None
+    else:
+        assert isinstance(optimizer, expected)
+        assert [p.name for p in optimizer.passes] == [
+                "ConstantFolding", "AlgebraicSimplification", "FilterPushdown", "CallbackFusion",
+                "CommonSubexpressionElimination", "AssociativeFlattening",
+            ]
+
+
+def test_get_optimizer_custom():
+    optimizer = GraphOptimizer(passes=[RenameFoo()])
+    assert get_optimizer(optimizer) is optimizer
+    assert isinstance(optimizer.passes[0], GraphPass)
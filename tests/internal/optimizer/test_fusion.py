@@ -0,0 +1,147 @@
+from openeo.internal.graph_building import PGNode
+from openeo.internal.optimizer.base import GraphOptimizer
+from openeo.internal.optimizer.fusion import CallbackFusion, compose
+from openeo.processes import ProcessBuilder
+from . import evaluate
+
+X = ProcessBuilder({"from_parameter": "x"})
+DATA = ProcessBuilder({"from_parameter": "data"})
+
+
+def load_collection() -> PGNode:
+    return PGNode("load_collection", id="S2", spatial_extent=None, temporal_extent=None)
+
+
+def _apply(data: PGNode, callback: ProcessBuilder, **kwargs) -> PGNode:
+    return PGNode("apply", data={"from_node": data}, process={"process_graph": callback.pgnode}, **kwargs)
+
+
+def _apply_dimension(data: PGNode, callback: ProcessBuilder, dimension="t", **kwargs) -> PGNode:
+    return PGNode(
+        "apply_dimension", data={"from_node": data}, process={"process_graph": callback.pgnode}, dimension=dimension,
+        **kwargs
+    )
+
+
+def _reduce(data: PGNode, callback: ProcessBuilder, dimension="bands") -> PGNode:
+    return PGNode("reduce_dimension", data={"from_node": data}, reducer={"process_graph": callback.pgnode},
+                  dimension=dimension)
+
+
+def _optimize(node: PGNode) -> PGNode:
+    return GraphOptimizer(passes=[CallbackFusion()]).optimize_node(node)
+
+
+def test_compose():
+    outer = (X * 2 + X).pgnode
+    inner = (X + 1).pgnode
+    composed = compose(outer, parameter="x", inner=inner)
+    for x in [0, 1, -3.5, 100]:
+        assert evaluate(composed, {"x": x}) == evaluate(outer, {"x": evaluate(inner, {"x": x})})
+    # Original callbacks are untouched
+    assert evaluate(outer, {"x": 3}) == 9
+
+
+def test_compose_nested_callback():
+    outer = PGNode("array_apply", data={"from_parameter": "data"}, process={
+        "process_graph": PGNode("add", x={"from_parameter": "x"}, y={"from_parameter": "data"})
+    })
+    assert compose(outer, parameter="data", inner=(DATA + 1).pgnode) is None
+
+
+class TestCallbackFusion:
+
+    def test_apply_apply(self):
+        node = _apply(_apply(load_collection(), X + 1), X * 2)
+        result = _optimize(node)
+        assert result.flat_graph() == {
+            "loadcollection1": {
+                "process_id": "load_collection",
+                "arguments": {"id": "S2", "spatial_extent": None, "temporal_extent": None},
+            },
+            "apply1": {
+                "process_id": "apply",
+                "arguments": {
+                    "data": {"from_node": "loadcollection1"},
+                    "process": {"process_graph": {
+                        "add1": {"process_id": "add", "arguments": {"x": {"from_parameter": "x"}, "y": 1}},
+                        "multiply1": {
+                            "process_id": "multiply",
+                            "arguments": {"x": {"from_node": "add1"}, "y": 2},
+                            "result": True,
+                        },
+                    }},
+                },
+                "result": True,
+            },
+        }
+
+    def test_apply_chain(self):
+        node = _apply(_apply(_apply(_apply(load_collection(), X + 1), X * 2), X.absolute()), X - 3)
+        result = _optimize(node)
+        assert result.process_id == "apply"
+        assert result.arguments["data"]["from_node"].process_id == "load_collection"
+        callback = result.arguments["process"]["process_graph"]
+        for x in [-10, 0, 3.5]:
+            assert evaluate(callback, {"x": x}) == abs((x + 1) * 2) - 3
+
+    def test_apply_flat_callbacks(self):
+        graph = {"process_graph": _apply(_apply(load_collection(), X + 1), X * 2).flat_graph()}
+        result = GraphOptimizer(passes=[CallbackFusion()]).optimize(graph)
+        assert set(result["process_graph"].keys()) == {"loadcollection1", "apply1"}
+
+    def test_apply_apply_with_context(self):
+        node = _apply(_apply(load_collection(), X + 1, context=5), X * 2)
+        assert _optimize(node) is node
+        node = _apply(_apply(load_collection(), X + 1), X * 2, context=5)
+        assert _optimize(node) is node
+
+    def test_shared_inner(self):
+        inner = _apply(load_collection(), X + 1)
+        node = PGNode("merge_cubes", cube1={"from_node": _apply(inner, X * 2)}, cube2={"from_node": inner})
+        assert _optimize(node) is node
+
+    def test_reduce_apply_dimension(self):
+        inner = _apply_dimension(load_collection(), DATA.sort(), dimension="t")
+        node = _reduce(inner, DATA.array_element(0) + DATA.array_element(1), dimension="t")
+        result = _optimize(node)
+        assert result.process_id == "reduce_dimension"
+        assert result.arguments["dimension"] == "t"
+        assert result.arguments["data"]["from_node"].process_id == "load_collection"
+
+    def test_reduce_apply_dimension_other_dimension(self):
+        inner = _apply_dimension(load_collection(), DATA.sort(), dimension="t")
+        node = _reduce(inner, DATA.array_element(0), dimension="bands")
+        assert _optimize(node) is node
+
+    def test_reduce_apply_dimension_target_dimension(self):
+        inner = _apply_dimension(load_collection(), DATA.sort(), dimension="t", target_dimension="t2")
+        node = _reduce(inner, DATA.array_element(0), dimension="t")
+        assert _optimize(node) is node
+
+    def test_apply_dimension_apply_dimension(self):
+        node = _apply_dimension(_apply_dimension(load_collection(), DATA.sort()), DATA.sort())
+        assert _optimize(node) is node
+
+    def test_apply_reduce(self):
+        reduced = _reduce(load_collection(), DATA.array_element(1) - DATA.array_element(0))
+        node = _apply(reduced, X * 2)
+        result = _optimize(node)
+        assert result.process_id == "reduce_dimension"
+        assert result.arguments["dimension"] == "bands"
+        reducer = result.arguments["reducer"]["process_graph"]
+        assert evaluate(reducer, {"data": [3, 5]}) == 4
+
+    def test_apply_reduce_parameter_capture(self):
+        # "data" in the apply callback refers to a parameter of a parent process (e.g. user-defined process),
+        # it should not be captured by the "data" parameter of the reducer.
+        reduced = _reduce(load_collection(), DATA.array_element(0))
+        node = _apply(reduced, X + DATA)
+        assert _optimize(node) is node
+
+    def test_namespaced(self):
+        inner = PGNode("apply", data={"from_node": load_collection()}, process={"process_graph": (X + 1).pgnode},
+                       namespace="custom")
+        node = _apply(inner, X * 2)
+        assert _optimize(node) is node
+
@@ -0,0 +1,187 @@
+import pytest
+
+from openeo.internal.graph_building import PGNode
+from openeo.internal.optimizer.base import GraphOptimizer
+from openeo.internal.optimizer.pushdown import FilterPushdown
+
+BBOX = {"west": 3, "south": 51, "east": 4, "north": 52}
+
+
+def load_collection(**kwargs) -> PGNode:
+    arguments = {"id": "S2", "spatial_extent": None, "temporal_extent": None}
+    arguments.update(kwargs)
+    return PGNode("load_collection", arguments=arguments)
+
+
+def _apply(data: PGNode) -> PGNode:
+    callback = PGNode("absolute", x={"from_parameter": "x"})
+    return PGNode("apply", data={"from_node": data}, process={"process_graph": callback})
+
+
+def _filter(process_id: str, data: PGNode, **kwargs) -> PGNode:
+    return PGNode(process_id, data={"from_node": data}, **kwargs)
+
+
+def _optimize(node: PGNode) -> PGNode:
+    return GraphOptimizer(passes=[FilterPushdown()]).optimize_node(node)
+
+
+class TestFilterPushdown:
+
+    def test_filter_bbox(self):
+        node = _filter("filter_bbox", load_collection(), extent=BBOX)
+        result = _optimize(node)
+        assert result.flat_graph() == {
+            "loadcollection1": {
+                "process_id": "load_collection",
+                "arguments": {"id": "S2", "spatial_extent": BBOX, "temporal_extent": None},
+                "result": True,
+            }
+        }
+
+    def test_filter_bbox_intersect(self):
+        lc = load_collection(spatial_extent={"west": 3.5, "south": 50, "east": 5, "north": 51.5, "crs": "EPSG:4326"})
+        result = _optimize(_filter("filter_bbox", lc, extent=BBOX))
+        assert result.process_id == "load_collection"
+        assert result.arguments["spatial_extent"] == {
+            "west": 3.5, "south": 51, "east": 4, "north": 51.5, "crs": "EPSG:4326"
+        }
+
+    @pytest.mark.parametrize("extent", [
+        {"west": 10, "south": 51, "east": 11, "north": 52},
+        {"west": 3, "south": 51, "east": 4, "north": 52, "crs": 32631},
+        {"from_parameter": "bbox"},
+        {"type": "Polygon", "coordinates": [[[3, 51], [4, 51], [4, 52], [3, 51]]]},
+    ])
+    def test_filter_bbox_no_pushdown(self, extent):
+        node = _filter("filter_bbox", load_collection(spatial_extent=BBOX), extent=extent)
+        assert _optimize(node) is node
+
+    def test_filter_temporal(self):
+        lc = load_collection(temporal_extent=["2021-01-01", "2022-01-01"])
+        result = _optimize(_filter("filter_temporal", lc, extent=["2021-06-01", None]))
+        assert result.process_id == "load_collection"
+        assert result.arguments["temporal_extent"] == ["2021-06-01", "2022-01-01"]
+
+    @pytest.mark.parametrize(["kwargs", "extent"], [
+        ({}, ["2025-01-01", "2026-01-01"]),
+        ({}, {"from_parameter": "dates"}),
+        ({}, ["2021-06-01", "tomorrow"]),
+        ({"dimension": "t"}, ["2021-06-01", "2021-09-01"]),
+    ])
+    def test_filter_temporal_no_pushdown(self, kwargs, extent):
+        lc = load_collection(temporal_extent=["2021-01-01", "2022-01-01"])
+        node = _filter("filter_temporal", lc, extent=extent, **kwargs)
+        assert _optimize(node) is node
+
+    def test_filter_bands(self):
+        result = _optimize(_filter("filter_bands", load_collection(bands=["B02", "B03", "B04"]), bands=["B04", "B02"]))
+        assert result.process_id == "load_collection"
+        assert result.arguments["bands"] == ["B04", "B02"]
+
+    @pytest.mark.parametrize("kwargs", [
+        {"bands": ["B08"]},
+        {"wavelengths": [[0.4, 0.5]]},
+        {"bands": ["B02"], "wavelengths": [[0.4, 0.5]]},
+    ])
+    def test_filter_bands_no_pushdown(self, kwargs):
+        node = _filter("filter_bands", load_collection(bands=["B02", "B03", "B04"]), **kwargs)
+        assert _optimize(node) is node
+
+    def test_through_pixelwise_processes(self):
+        lc = load_collection(bands=["B02", "B03", "B04"])
+        node = _filter("filter_bands", _apply(_filter("filter_bbox", _apply(lc), extent=BBOX)), bands=["B03"])
+        node = PGNode("save_result", data={"from_node": node}, format="GTiff")
+        result = _optimize(node)
+        assert result.flat_graph() == {
+            "loadcollection1": {
+                "process_id": "load_collection",
+                "arguments": {"id": "S2", "spatial_extent": BBOX, "temporal_extent": None, "bands": ["B03"]},
+            },
+            "apply1": {
+                "process_id": "apply",
+                "arguments": {
+                    "data": {"from_node": "loadcollection1"},
+                    "process": {"process_graph": {"absolute1": {
+                        "process_id": "absolute", "arguments": {"x": {"from_parameter": "x"}}, "result": True
+                    }}},
+                },
+            },
+            "apply2": {
+                "process_id": "apply",
+                "arguments": {
+                    "data": {"from_node": "apply1"},
+                    "process": {"process_graph": {"absolute2": {
+                        "process_id": "absolute", "arguments": {"x": {"from_parameter": "x"}}, "result": True
+                    }}},
+                },
+            },
+            "saveresult1": {
+                "process_id": "save_result",
+                "arguments": {"data": {"from_node": "apply2"}, "format": "GTiff"},
+                "result": True,
+            },
+        }
+        # Original graph is untouched
+        assert node.arguments["data"]["from_node"].process_id == "filter_bands"
+
+    def test_not_through_other_processes(self):
+        lc = load_collection()
+        reduced = PGNode("reduce_dimension", data={"from_node": lc}, dimension="t", reducer={
+            "process_graph": PGNode("mean", data={"from_parameter": "data"})
+        })
+        node = _filter("filter_temporal", reduced, extent=["2021-06-01", "2021-09-01"])
+        assert _optimize(node) is node
+
+    def test_not_through_spatial_neighborhood(self):
+        kernel = PGNode("apply_kernel", data={"from_node": load_collection()}, kernel=[[1, 1], [1, 1]])
+        node = _filter("filter_bbox", kernel, extent=BBOX)
+        assert _optimize(node) is node
+        node = _filter("filter_temporal", kernel, extent=["2021-06-01", "2021-09-01"])
+        assert _optimize(node).arguments["data"]["from_node"].arguments["temporal_extent"] == [
+            "2021-06-01", "2021-09-01"
+        ]
+
+    def test_shared_load_collection(self):
+        lc = load_collection()
+        filtered = _filter("filter_bbox", lc, extent=BBOX)
+        node = PGNode("merge_cubes", cube1={"from_node": filtered}, cube2={"from_node": lc})
+        assert _optimize(node) is node
+
+    def test_shared_intermediate(self):
+        applied = _apply(load_collection())
+        filtered = _filter("filter_bbox", applied, extent=BBOX)
+        node = PGNode("merge_cubes", cube1={"from_node": filtered}, cube2={"from_node": applied})
+        assert _optimize(node) is node
+
+    def test_shared_filter(self):
+        filtered = _filter("filter_bbox", load_collection(), extent=BBOX)
+        node = PGNode("merge_cubes", cube1={"from_node": filtered}, cube2={"from_node": filtered})
+        result = _optimize(node)
+        assert result.arguments["cube1"] == result.arguments["cube2"]
+        lc = result.arguments["cube1"]["from_node"]
+        assert lc.process_id == "load_collection"
+        assert lc.arguments["spatial_extent"] == BBOX
+
+    def test_multiple_filters_bottom_up(self):
+        lc = load_collection(bands=["B02", "B03", "B04"])
+        node = _filter("filter_bands", _filter("filter_bands", lc, bands=["B02", "B04"]), bands=["B04"])
+        result = _optimize(node)
+        assert result.process_id == "load_collection"
+        assert result.arguments["bands"] == ["B04"]
+
+    def test_blocked_by_lower_filter(self):
+        lc = load_collection(bands=["B02", "B03", "B04"])
+        lower = _filter("filter_bands", lc, bands=["B08"])
+        node = _filter("filter_bands", lower, bands=["B02"])
+        assert _optimize(node) is node
+
+    def test_namespaced(self):
+        node = PGNode("filter_bbox", data={"from_node": load_collection()}, extent=BBOX, namespace="custom")
+        assert _optimize(node) is node
+
+    def test_default_optimizer(self):
+        node = _filter("filter_temporal", load_collection(), extent=["2021-06-01", "2021-09-01"])
+        result = GraphOptimizer().optimize_node(node)
+        assert result.process_id == "load_collection"
+        assert result.arguments["temporal_extent"] == ["2021-06-01", "2021-09-01"]
@@ -1,5 +1,6 @@
 import logging
 import re
+import types
 
 import pytest
 
@@ -204,3 +205,96 @@ class TestConvertCallableToPgnode:
         result = convert_callable_to_pgnode(callback, parent_parameters=["x", "y"])
         assert isinstance(result, PGNode)
         assert result.flat_graph() == expected
+
+
+_SCALE = 2
+_BANDS = ["B02", "B03"]
+
+
+class TestConvertCallableToPgnodeCache:
+
+    def test_cached(self):
+        def callback(x, factor=_SCALE):
+            return openeo.processes.multiply(x, factor)
+
+        first = convert_callable_to_pgnode(callback, parent_parameters=["x"])
+        assert convert_callable_to_pgnode(callback, parent_parameters=["x"]) is first
+        assert first.flat_graph() == {
+            "multiply1": {"process_id": "multiply", "arguments": {"x": {"from_parameter": "x"}, "y": 2}, "result": True}
+        }
+
+    def test_cache_per_parent_parameters(self):
+        callback = lambda x: x + 1  # noqa: E731
+        a = convert_callable_to_pgnode(callback, parent_parameters=["x"])
+        b = convert_callable_to_pgnode(callback, parent_parameters=["data"])
+        assert a is not b
+        assert convert_callable_to_pgnode(callback, parent_parameters=["data"]) is b
+        assert b.arguments["x"] == {"from_parameter": "data"}
+
+    def test_closure_rebinding(self):
+        offset = 1
+        callback = lambda x: x + offset  # noqa: E731
+        assert convert_callable_to_pgnode(callback, parent_parameters=["x"]).arguments["y"] == 1
+        offset = 100
+        assert convert_callable_to_pgnode(callback, parent_parameters=["x"]).arguments["y"] == 100
+        assert offset == 100
+
+    def test_global_rebinding(self):
+        global _SCALE
+
+        def callback(x):
+            return x * _SCALE
+
+        assert convert_callable_to_pgnode(callback, parent_parameters=["x"]).arguments["y"] == 2
+        try:
+            _SCALE = 3
+            assert convert_callable_to_pgnode(callback, parent_parameters=["x"]).arguments["y"] == 3
+        finally:
+            _SCALE = 2
+
+    def test_mutable_references_not_cached(self):
+        def callback(data):
+            return data.array_element(label=_BANDS[-1])
+
+        first = convert_callable_to_pgnode(callback, parent_parameters=["data"])
+        assert first.arguments["label"] == "B03"
+        _BANDS.append("B04")
+        try:
+            second = convert_callable_to_pgnode(callback, parent_parameters=["data"])
+        finally:
+            _BANDS.pop()
+        assert second.arguments["label"] == "B04"
+
+    def test_nested_function_reference(self):
+        def helper(x):
+            return x * _SCALE
+
+        def callback(x):
+            return helper(x) + 1
+
+        first = convert_callable_to_pgnode(callback, parent_parameters=["x"])
+        assert convert_callable_to_pgnode(callback, parent_parameters=["x"]) is first
+
+        def helper(x):
+            return x * len(_BANDS)
+
+        assert convert_callable_to_pgnode(callback, parent_parameters=["x"]) is not first
+
+    def test_module_attribute_not_cached(self):
+        cfg = types.ModuleType("cfg")
+        cfg.factor = 2
+        callback = lambda x: x * cfg.factor  # noqa: E731
+        assert convert_callable_to_pgnode(callback, parent_parameters=["x"]).arguments["y"] == 2
+        cfg.factor = 3
+        assert convert_callable_to_pgnode(callback, parent_parameters=["x"]).arguments["y"] == 3
+
+    def test_class_attribute_not_cached(self):
+        class Config:
+            factor = 2
+
+        def callback(x):
+            return x * Config.factor
+
+        assert convert_callable_to_pgnode(callback, parent_parameters=["x"]).arguments["y"] == 2
+        Config.factor = 3
+        assert convert_callable_to_pgnode(callback, parent_parameters=["x"]).arguments["y"] == 3
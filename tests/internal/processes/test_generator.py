@@ -1,7 +1,10 @@
+import re
 from io import StringIO
 from textwrap import dedent
 
-from openeo.internal.processes.generator import PythonRenderer, generate_process_py, collect_processes
+from openeo.internal.processes.generator import PythonRenderer, generate_process_py, collect_processes, \
+    generate_process_table_py, render_process_spec
+from openeo.internal.processes.builder import get_parameter_names
 from openeo.internal.processes.parse import Process
 from tests import get_test_resource
 
@@ -229,3 +232,50 @@ def test_generate_process_py():
     assert "    def add(self, y) -> 'ProcessBuilder':" in lines
     assert "def incr(x) -> ProcessBuilder:" in lines
     assert "def add(x, y) -> ProcessBuilder:" in lines
+
+
+def test_render_process_spec():
+    process = Process.from_dict({
+        "id": "incr",
+        "description": "Increment a value",
+        "summary": "Increment a value",
+        "parameters": [
+            {"name": "x", "description": "value", "schema": {"type": "integer"}},
+            {"name": "i", "description": "increment", "schema": {"type": "integer"}, "default": 1},
+            {"name": "m", "description": "max", "schema": {"type": "integer"}, "optional": True},
+        ],
+        "returns": {"description": "incremented value", "schema": {"type": "integer"}}
+    })
+    assert render_process_spec(process) == dedent('''\
+        (
+            'incr',
+            'Increment a value',
+            (
+                ('x', 'value'),
+                ('i', 'increment', 1),
+                ('m', 'max', UNSET),
+            ),
+            'incremented value',
+        ),''')
+
+
+def test_generate_process_table_py():
+    processes = collect_processes([get_test_resource("data/processes/1.0")])
+    output = StringIO()
+    generate_process_table_py(processes, output=output)
+    src = output.getvalue()
+    assert "class ProcessBuilder(ProcessBuilderBase, LazyProcessMethods):" in src.split("\n")
+    assert "def cos(" not in src
+
+    # Generated module should be functional
+    module = {"__name__": "generated_processes"}
+    # Only a subset of the processes is available in test resources: drop operator process loading.
+    src = re.sub(r"^add, subtract, .*$", "", src, flags=re.MULTILINE)
+    exec(src, module)
+    assert module["__getattr__"]("cos").__module__ == "generated_processes"
+    assert get_parameter_names(module["__getattr__"]("add")) == ["x", "y"]
+    x = module["ProcessBuilder"]({"from_parameter": "x"})
+    assert x.cos().flat_graph() == {
+        "cos1": {"process_id": "cos", "arguments": {"x": {"from_parameter": "x"}}, "result": True},
+    }
+    assert sorted(module["__all__"]) == ["ProcessBuilder", "add", "cos", "process"]
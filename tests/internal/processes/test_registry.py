@@ -0,0 +1,84 @@
+import pytest
+
+from openeo.internal.processes.registry import ProcessRegistry, ProcessNotFoundException
+from openeo.rest import OpenEoApiError
+
+
+class _Loader:
+    def __init__(self, listings: dict, processes: dict = None):
+        self.listings = listings
+        self.processes = processes or {}
+        self.calls = []
+
+    def load_listing(self, namespace):
+        self.calls.append(("listing", namespace))
+        return self.listings[namespace]
+
+    def load_process(self, namespace, process_id):
+        self.calls.append(("process", namespace, process_id))
+        if (namespace, process_id) not in self.processes:
+            raise OpenEoApiError(http_status_code=404, code="ProcessUnsupported", message="nope")
+        return self.processes[(namespace, process_id)]
+
+
+ADD = {"id": "add", "parameters": [{"name": "x", "schema": {"type": "number"}}, {"name": "y", "schema": {}}]}
+MASK = {"id": "mask", "parameters": []}
+
+
+class TestProcessRegistry:
+
+    def test_list_processes(self):
+        loader = _Loader({None: [ADD, MASK], "foo": [MASK]})
+        registry = ProcessRegistry(load_listing=loader.load_listing)
+        assert registry.list_processes() == [ADD, MASK]
+        assert registry.list_processes() == [ADD, MASK]
+        assert registry.list_processes(namespace="foo") == [MASK]
+        assert registry.list_processes(namespace="foo") == [MASK]
+        assert loader.calls == [("listing", None), ("listing", "foo")]
+
+    def test_get_process(self):
+        loader = _Loader({None: [ADD, MASK]})
+        registry = ProcessRegistry(load_listing=loader.load_listing)
+        assert registry.get_process("add") == ADD
+        assert registry.get_process("mask") == MASK
+        assert loader.calls == [("listing", None)]
+        with pytest.raises(ProcessNotFoundException, match="Process does not exist: 'nope'"):
+            registry.get_process("nope")
+        assert loader.calls == [("listing", None)]
+
+    def test_get_process_namespace_single_fetch(self):
+        loader = _Loader({"foo": [ADD, MASK]}, processes={("foo", "add"): ADD})
+        registry = ProcessRegistry(load_listing=loader.load_listing, load_process=loader.load_process)
+        assert registry.get_process("add", namespace="foo") == ADD
+        assert registry.get_process("add", namespace="foo") == ADD
+        assert loader.calls == [("process", "foo", "add")]
+
+    def test_get_process_namespace_fallback_to_listing(self):
+        loader = _Loader({"foo": [ADD, MASK]}, processes={})
+        registry = ProcessRegistry(load_listing=loader.load_listing, load_process=loader.load_process)
+        assert registry.get_process("mask", namespace="foo") == MASK
+        assert loader.calls == [("process", "foo", "mask"), ("listing", "foo")]
+        # Listing is loaded now: no more single process fetches.
+        assert registry.get_process("add", namespace="foo") == ADD
+        with pytest.raises(ProcessNotFoundException, match="namespace 'foo'"):
+            registry.get_process("nope", namespace="foo")
+        assert loader.calls == [("process", "foo", "mask"), ("listing", "foo")]
+
+    def test_has_process(self):
+        registry = ProcessRegistry(load_listing=_Loader({None: [ADD]}).load_listing)
+        assert registry.has_process("add")
+        assert not registry.has_process("mask")
+
+    def test_get_parameter_schemas(self):
+        registry = ProcessRegistry(load_listing=_Loader({None: [ADD, MASK]}).load_listing)
+        assert registry.get_parameters("add") == ADD["parameters"]
+        assert registry.get_parameter_schemas("add") == {"x": {"type": "number"}, "y": {}}
+        assert registry.get_parameter_schemas("mask") == {}
+
+    def test_clear(self):
+        loader = _Loader({None: [ADD]})
+        registry = ProcessRegistry(load_listing=loader.load_listing)
+        registry.get_process("add")
+        registry.clear()
+        registry.get_process("add")
+        assert loader.calls == [("listing", None), ("listing", None)]
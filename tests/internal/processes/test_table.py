@@ -0,0 +1,118 @@
+import inspect
+
+import pytest
+
+import openeo.processes
+from openeo.internal.processes.builder import ProcessBuilderBase, UNSET, get_parameter_names
+from openeo.internal.processes.table import ProcessSpec, ProcessTable, LazyProcessMethods, build_function
+from openeo.processes import ProcessBuilder
+
+
+def _process(process_id, **kwargs):
+    return (process_id, kwargs)
+
+
+INCR = ProcessSpec(
+    id="incr", summary="Increment a value",
+    parameters=(("x", "value"), ("i", "increment", 1), ("m", "max", UNSET)),
+    returns="incremented value",
+)
+
+
+def test_process_spec_from_metadata():
+    spec = ProcessSpec.from_metadata({
+        "id": "incr",
+        "summary": "Increment a value",
+        "parameters": [
+            {"name": "x", "description": "value", "schema": {}},
+            {"name": "i", "description": "increment", "schema": {}, "default": 1},
+            {"name": "m", "description": "max", "schema": {}, "optional": True, "default": 5},
+        ],
+        "returns": {"description": "incremented value", "schema": {}},
+    })
+    assert spec == INCR
+
+
+def test_build_function():
+    incr = build_function(INCR, process=_process, module="foo.bar")
+    assert incr.__name__ == "incr"
+    assert incr.__module__ == "foo.bar"
+    assert get_parameter_names(incr) == ["x", "i", "m"]
+    assert str(inspect.signature(incr)).startswith("(x, i=1, m=")
+    assert incr(3) == ("incr", {"x": 3, "i": 1, "m": UNSET})
+    assert incr(3, m=5) == ("incr", {"x": 3, "i": 1, "m": 5})
+    assert incr.__doc__ == "Increment a value\n\n:param x: value\n:param i: increment\n:param m: max\n\n:return: incremented value"
+
+
+def test_build_function_oo_mode():
+    incr = build_function(INCR, process=_process, oo_mode=True, qualname_prefix="Foo.")
+    assert incr.__qualname__ == "Foo.incr"
+    assert get_parameter_names(incr) == ["self", "i", "m"]
+    assert incr("s", 2) == ("incr", {"x": "s", "i": 2, "m": UNSET})
+    assert ":param self: value" in incr.__doc__
+
+
+def test_build_function_keyword_and_no_params():
+    and_ = build_function(
+        ProcessSpec("and", "And", (("x", "x"), ("y", "y")), "x and y"), process=_process
+    )
+    assert and_.__name__ == "and_"
+    assert and_(1, 2) == ("and", {"x": 1, "y": 2})
+    pi = build_function(ProcessSpec("pi", "Pi", (), "pi"), process=_process, oo_mode=True)
+    assert get_parameter_names(pi) == ["self"]
+    assert pi("s") == ("pi", {})
+
+
+def test_process_table_lazy_and_cached():
+    table = ProcessTable([INCR, ("pi", "Pi", (), "pi")], process=_process)
+    assert len(table) == 2
+    assert "incr" in table
+    assert "foo" not in table
+    assert table.names() == ["incr", "pi"]
+    assert table._functions == {}
+    incr = table.get_function("incr")
+    assert table.get_function("incr") is incr
+    assert table.get_method("incr") is not incr
+    with pytest.raises(KeyError):
+        table.get_function("foo")
+
+
+def test_process_table_add_from_metadata():
+    table = ProcessTable([], process=_process)
+    table.add_from_metadata([
+        {"id": "custom_ndvi", "summary": "NDVI", "parameters": [{"name": "data", "description": "cube"}]},
+        {"id": "not-valid", "summary": "Invalid name", "parameters": []},
+    ])
+    assert table.names() == ["custom_ndvi"]
+    assert table.get_function("custom_ndvi")(data=1) == ("custom_ndvi", {"data": 1})
+
+
+def test_lazy_process_methods():
+    class Builder(ProcessBuilderBase, LazyProcessMethods):
+        pass
+
+    Builder._process_table = ProcessTable([INCR], process=Builder.process, class_name="Builder")
+
+    assert "incr" not in Builder.__dict__
+    b = Builder({"from_parameter": "x"})
+    assert b.incr(i=2).flat_graph() == {
+        "incr1": {"process_id": "incr", "arguments": {"x": {"from_parameter": "x"}, "i": 2}, "result": True}
+    }
+    assert "incr" in Builder.__dict__
+    assert get_parameter_names(Builder.incr) == ["self", "i", "m"]
+    assert "incr" in dir(b)
+    with pytest.raises(AttributeError, match="has no attribute 'foo'"):
+        _ = b.foo
+    with pytest.raises(AttributeError):
+        _ = Builder.foo
+
+
+def test_processes_module_lazy():
+    assert "absolute" in openeo.processes.__all__
+    assert "absolute" in dir(openeo.processes)
+    assert get_parameter_names(openeo.processes.absolute) == ["x"]
+    assert get_parameter_names(ProcessBuilder.absolute) == ["self"]
+    assert get_parameter_names(openeo.processes.and_) == ["x", "y"]
+    assert openeo.processes.absolute.__module__ == "openeo.processes"
+    with pytest.raises(AttributeError, match="has no attribute 'foobar'"):
+        _ = openeo.processes.foobar
@@ -0,0 +1,224 @@
+import pytest
+
+from openeo.internal.processes.registry import ProcessRegistry
+from openeo.internal.processes.validation import ProcessGraphValidator
+
+PROCESSES = [
+    {
+        "id": "load_collection",
+        "parameters": [
+            {"name": "id", "schema": {"type": "string"}},
+            {"name": "spatial_extent", "schema": [{"type": "object"}, {"type": "null"}]},
+            {"name": "temporal_extent", "schema": [{"type": "array"}, {"type": "null"}]},
+            {"name": "bands", "schema": [{"type": "array"}, {"type": "null"}], "optional": True},
+        ],
+    },
+    {
+        "id": "apply",
+        "parameters": [
+            {"name": "data", "schema": {"type": "object", "subtype": "raster-cube"}},
+            {
+                "name": "process",
+                "schema": {
+                    "type": "object", "subtype": "process-graph",
+                    "parameters": [{"name": "x", "schema": {}}, {"name": "context", "schema": {}}],
+                },
+            },
+            {"name": "context", "schema": {"description": "Any data type."}, "optional": True},
+        ],
+    },
+    {
+        "id": "multiply",
+        "parameters": [
+            {"name": "x", "schema": {"type": ["number", "null"]}},
+            {"name": "y", "schema": {"type": ["number", "null"]}},
+        ],
+    },
+    {
+        "id": "linear_scale_range",
+        "parameters": [
+            {"name": "x", "schema": {"type": ["number", "null"]}},
+            {"name": "inputMin", "schema": {"type": "number"}},
+            {"name": "inputMax", "schema": {"type": "number"}},
+            {"name": "outputMin", "schema": {"type": "number"}, "default": 0},
+        ],
+    },
+]
+
+
+@pytest.fixture
+def validator() -> ProcessGraphValidator:
+    registry = ProcessRegistry(load_listing=lambda namespace: PROCESSES if namespace is None else [])
+    return ProcessGraphValidator(
+        get_process=lambda process_id, namespace: registry.get_process(process_id=process_id, namespace=namespace)
+    )
+
+
+def _load_collection(**kwargs) -> dict:
+    return {
+        "process_id": "load_collection",
+        "arguments": {"id": "S2", "spatial_extent": None, "temporal_extent": None, **kwargs},
+    }
+
+
+def _apply(callback: dict, **kwargs) -> dict:
+    return {
+        "process_id": "apply",
+        "arguments": {"data": {"from_node": "lc"}, "process": {"process_graph": callback}, **kwargs},
+        "result": True,
+    }
+
+
+def _multiply(x, y, result=True) -> dict:
+    return {"process_id": "multiply", "arguments": {"x": x, "y": y}, "result": result}
+
+
+def test_valid(validator):
+    pg = {
+        "lc": _load_collection(bands=["B02"]),
+        "ap": _apply({"m": _multiply({"from_parameter": "x"}, 2)}),
+    }
+    assert validator.validate(pg) == []
+
+
+def test_unknown_process(validator):
+    pg = {"lc": _load_collection(), "foo": {"process_id": "foo", "arguments": {}, "result": True}}
+    assert validator.validate(pg) == [
+        {"code": "ProcessUnsupported", "message": "Process 'foo' is not supported (node 'foo')."},
+    ]
+
+
+def test_unknown_process_namespace(validator):
+    pg = {"foo": {"process_id": "foo", "namespace": "bar", "arguments": {}, "result": True}}
+    assert validator.validate(pg) == [
+        {"code": "ProcessUnsupported", "message": "Process 'foo' (namespace 'bar') is not supported (node 'foo')."},
+    ]
+
+
+def test_missing_and_unknown_arguments(validator):
+    pg = {"lc": {"process_id": "load_collection", "arguments": {"id": "S2", "color": "red"}, "result": True}}
+    assert validator.validate(pg) == [
+        {
+            "code": "ProcessArgumentRequired",
+            "message": "Process 'load_collection' parameter 'spatial_extent' is required (node 'lc').",
+        },
+        {
+            "code": "ProcessArgumentRequired",
+            "message": "Process 'load_collection' parameter 'temporal_extent' is required (node 'lc').",
+        },
+        {
+            "code": "ProcessArgumentUnsupported",
+            "message": "Process 'load_collection' does not support argument 'color' (node 'lc').",
+        },
+    ]
+
+
+def test_argument_with_default_not_required(validator):
+    pg = {
+        "lsr": {
+            "process_id": "linear_scale_range",
+            "arguments": {"x": 3, "inputMin": 0, "inputMax": 10},
+            "result": True,
+        }
+    }
+    assert validator.validate(pg) == []
+
+
+@pytest.mark.parametrize(["value", "valid"], [
+    (2, True),
+    (2.5, True),
+    (None, True),
+    ("2", False),
+    (True, False),
+    ([2], False),
+])
+def test_argument_type(validator, value, valid):
+    pg = {"m": _multiply(3, value)}
+    errors = validator.validate(pg)
+    if valid:
+        assert errors == []
+    else:
+        assert errors == [{
+            "code": "ProcessArgumentInvalid",
+            "message": f"Invalid value type {type(value).__name__!r} for argument 'y' of node 'm'.",
+        }]
+
+
+def test_dangling_from_node(validator):
+    pg = {"m1": _multiply({"from_node": "m0"}, [{"from_node": "m2"}], result=True)}
+    errors = validator.validate(pg)
+    assert {"code": "ProcessGraphInvalid", "message": "Reference to non-existing node 'm0' in argument 'x' of node 'm1'."} in errors
+    assert {"code": "ProcessGraphInvalid", "message": "Reference to non-existing node 'm2' in argument 'y' of node 'm1'."} in errors
+
+
+def test_result_nodes(validator):
+    pg = {"m1": _multiply(1, 2, result=False), "m2": _multiply(3, 4, result=False)}
+    assert validator.validate(pg) == [{
+        "code": "ProcessGraphInvalid",
+        "message": "Process graph should have exactly one result node, but found 0.",
+    }]
+
+
+def test_from_parameter_unchecked_by_default(validator):
+    pg = {"m": _multiply({"from_parameter": "foo"}, 2)}
+    assert validator.validate(pg) == []
+
+
+def test_from_parameter_undefined(validator):
+    pg = {"m": _multiply({"from_parameter": "foo"}, {"from_parameter": "bar"})}
+    assert validator.validate(pg, parameters=["foo"]) == [{
+        "code": "ProcessParameterUndefined",
+        "message": "Reference to undefined parameter 'bar' in argument 'y' of node 'm'.",
+    }]
+
+
+def test_udp_parameters(validator):
+    udp = {
+        "id": "double",
+        "parameters": [{"name": "foo", "schema": {}}],
+        "process_graph": {"m": _multiply({"from_parameter": "foo"}, {"from_parameter": "bar"})},
+    }
+    assert [e["code"] for e in validator.validate(udp)] == ["ProcessParameterUndefined"]
+
+
+def test_callback(validator):
+    pg = {
+        "lc": _load_collection(),
+        "ap": _apply({
+            "m1": _multiply({"from_parameter": "x"}, {"from_parameter": "size"}, result=False),
+            "m2": _multiply({"from_node": "m1"}, {"from_node": "m3"}),
+            "foo": {"process_id": "foo", "arguments": {}},
+        }),
+    }
+    errors = validator.validate(pg, parameters=[])
+    assert errors == [
+        {
+            "code": "ProcessParameterUndefined",
+            "message": "Reference to undefined parameter 'size' in argument 'y' of node 'm1' (callback 'process' of node 'ap').",
+        },
+        {
+            "code": "ProcessGraphInvalid",
+            "message": "Reference to non-existing node 'm3' in argument 'y' of node 'm2' (callback 'process' of node 'ap').",
+        },
+        {
+            "code": "ProcessUnsupported",
+            "message": "Process 'foo' is not supported (node 'foo' (callback 'process' of node 'ap')).",
+        },
+    ]
+    errors = validator.validate(pg, parameters=["size"])
+    assert [e["code"] for e in errors] == ["ProcessGraphInvalid", "ProcessUnsupported"]
+
+
+def test_signature_caching(validator):
+    calls = []
+
+    def get_process(process_id, namespace):
+        calls.append(process_id)
+        return PROCESSES[2]
+
+    validator = ProcessGraphValidator(get_process=get_process)
+    pg = {"m1": _multiply(1, 2, result=False), "m2": _multiply({"from_node": "m1"}, 2)}
+    for _ in range(3):
+        assert validator.validate(pg) == []
+    assert len(validator._signatures) == 1
+    assert calls == ["multiply"] * 6
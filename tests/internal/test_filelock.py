@@ -0,0 +1,128 @@
+import multiprocessing
+import os
+import stat
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from openeo.internal.filelock import FileLock, get_file_lock, get_lock_path
+
+
+def test_get_lock_path(tmp_path):
+    path = tmp_path / "data.json"
+    lock_path = get_lock_path(path)
+    assert lock_path.name.startswith("data.json.")
+    assert lock_path.suffix == ".lock"
+    assert lock_path.parent != tmp_path
+    assert get_lock_path(path) == lock_path
+    assert get_lock_path(tmp_path / "other.json") != lock_path
+
+
+def test_get_file_lock_same_object(tmp_path):
+    assert get_file_lock(tmp_path / "data.json") is get_file_lock(tmp_path / "data.json")
+    assert get_file_lock(tmp_path / "data.json") is not get_file_lock(tmp_path / "other.json")
+
+
+def test_reentrant(tmp_path):
+    lock = FileLock(tmp_path / "my.lock")
+    with lock:
+        with lock:
+            assert lock.path.exists()
+    with lock:
+        pass
+
+
+def test_threads(tmp_path):
+    lock = FileLock(tmp_path / "my.lock")
+    active = []
+    overlaps = []
+
+    def work():
+        for _ in range(5):
+            with lock:
+                if active:
+                    overlaps.append(True)
+                active.append(True)
+                time.sleep(0.001)
+                active.pop()
+
+    threads = [threading.Thread(target=work) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert overlaps == []
+
+
+def _increment(path, lock_path, n):
+    lock = FileLock(lock_path)
+    for _ in range(n):
+        with lock:
+            value = int(path.read_text())
+            path.write_text(str(value + 1))
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="Requires 'fork' start method")
+def test_processes(tmp_path):
+    path = tmp_path / "counter.txt"
+    path.write_text("0")
+    ctx = multiprocessing.get_context("fork")
+    processes = [
+        ctx.Process(target=_increment, kwargs={"path": path, "lock_path": tmp_path / "counter.lock", "n": 20})
+        for _ in range(4)
+    ]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+    assert path.read_text() == "80"
+
+
+@pytest.fixture
+def tmp_locks_dir(tmp_path, monkeypatch) -> Path:
+    """Use separate temp dir for lock directory."""
+    tmp_dir = tmp_path / "tmp"
+    tmp_dir.mkdir()
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_dir))
+    user = str(os.getuid()) if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    return tmp_dir / f"openeo-locks-{user}"
+
+
+def test_get_lock_path_private_dir(tmp_path, tmp_locks_dir):
+    lock_path = get_lock_path(tmp_path / "data.json")
+    assert lock_path.parent == tmp_locks_dir
+    if hasattr(os, "getuid"):
+        assert stat.S_IMODE(tmp_locks_dir.stat().st_mode) & 0o077 == 0
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="Requires POSIX permissions")
+def test_get_lock_path_not_private_mode(tmp_path, tmp_locks_dir, caplog):
+    tmp_locks_dir.mkdir()
+    tmp_locks_dir.chmod(0o777)
+    lock_path = get_lock_path(tmp_path / "data.json")
+    assert lock_path.parent == tmp_path
+    assert lock_path.name.startswith(".data.json.")
+    assert "is not private" in caplog.text
+    with FileLock(lock_path):
+        assert lock_path.exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="Requires POSIX permissions")
+def test_get_lock_path_not_private_owner(tmp_path, tmp_locks_dir, monkeypatch):
+    tmp_locks_dir.mkdir(mode=0o700)
+    uid = os.getuid()
+    monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+    # Note: user specific directory name changes too: create it for the "other" user.
+    other_dir = tmp_locks_dir.parent / f"openeo-locks-{uid + 1}"
+    other_dir.mkdir(mode=0o700)
+    assert get_lock_path(tmp_path / "data.json").parent == tmp_path
+
+
+def test_get_lock_path_symlink(tmp_path, tmp_locks_dir):
+    target = tmp_path / "elsewhere"
+    target.mkdir(mode=0o700)
+    tmp_locks_dir.symlink_to(target)
+    assert get_lock_path(tmp_path / "data.json").parent == tmp_path
@@ -0,0 +1,113 @@
+import json
+
+import pytest
+import shapely.geometry
+
+from openeo.internal.geometry import (
+    GeometryShrinking, drop_properties, meters_per_degree, quantize_coordinates, simplify_geometries
+)
+
+POLYGON = {
+    "type": "Polygon",
+    "coordinates": [[[3.123456789, 51.1], [3.2, 51.100000001], [3.2, 51.2], [3.1234567, 51.2], [3.123456789, 51.1]]],
+}
+
+FEATURES = {
+    "type": "FeatureCollection",
+    "features": [
+        {"type": "Feature", "geometry": POLYGON, "properties": {"id": 1, "name": "a", "notes": "x" * 100}},
+        {"type": "Feature", "geometry": {"type": "Point", "coordinates": [3.0000001, 51.0000001]},
+         "properties": {"id": 2}},
+    ],
+}
+
+
+def test_quantize_coordinates():
+    result = quantize_coordinates(POLYGON, decimals=3)
+    assert result == {
+        "type": "Polygon",
+        "coordinates": [[[3.123, 51.1], [3.2, 51.1], [3.2, 51.2], [3.123, 51.2], [3.123, 51.1]]],
+    }
+    # Input is untouched
+    assert POLYGON["coordinates"][0][0] == [3.123456789, 51.1]
+
+
+def test_quantize_coordinates_drop_duplicates():
+    line = {"type": "LineString", "coordinates": [[0.0001, 0], [0.0002, 0], [1, 1]]}
+    assert quantize_coordinates(line, decimals=2) == {"type": "LineString", "coordinates": [[0.0, 0], [1, 1]]}
+    # Keep duplicates if dropping would make the ring invalid
+    tiny = {"type": "Polygon", "coordinates": [[[0, 0], [0.001, 0], [0.001, 0.001], [0, 0]]]}
+    assert quantize_coordinates(tiny, decimals=1)["coordinates"] == [[[0, 0], [0.0, 0], [0.0, 0.0], [0, 0]]]
+
+
+def test_quantize_coordinates_feature_collection():
+    result = quantize_coordinates(FEATURES, decimals=2)
+    assert result["features"][0]["properties"] == FEATURES["features"][0]["properties"]
+    assert result["features"][1]["geometry"] == {"type": "Point", "coordinates": [3.0, 51.0]}
+
+
+def test_simplify_geometries():
+    # Densely sampled circle
+    circle = shapely.geometry.mapping(shapely.geometry.Point(0, 0).buffer(1, 256))
+    result = simplify_geometries({"type": "Feature", "geometry": circle, "properties": {"a": 1}}, tolerance=0.01)
+    assert result["properties"] == {"a": 1}
+    simplified = shapely.geometry.shape(result["geometry"])
+    assert len(result["geometry"]["coordinates"][0]) < len(circle["coordinates"][0]) / 4
+    assert simplified.is_valid
+    assert simplified.hausdorff_distance(shapely.geometry.shape(circle)) <= 0.01
+    # JSON-style lists
+    assert isinstance(result["geometry"]["coordinates"], list)
+
+
+def test_drop_properties():
+    result = drop_properties(FEATURES)
+    assert [f["properties"] for f in result["features"]] == [{}, {}]
+    result = drop_properties(FEATURES, keep=["id"])
+    assert [f["properties"] for f in result["features"]] == [{"id": 1}, {"id": 2}]
+    assert drop_properties(POLYGON) == POLYGON
+
+
+class TestGeometryShrinking:
+
+    def test_default_noop(self):
+        assert GeometryShrinking().apply(FEATURES) == FEATURES
+
+    def test_apply(self):
+        shrinking = GeometryShrinking(decimals=2, drop_properties=["id"])
+        result = shrinking.apply(FEATURES)
+        assert [f["properties"] for f in result["features"]] == [{"id": 1}, {"id": 2}]
+        assert result["features"][0]["geometry"]["coordinates"] == [
+            [[3.12, 51.1], [3.2, 51.1], [3.2, 51.2], [3.12, 51.2], [3.12, 51.1]]
+        ]
+        assert len(json.dumps(result)) < len(json.dumps(FEATURES)) * 0.7
+
+    def test_simplify_resolution(self):
+        circle = shapely.geometry.mapping(shapely.geometry.Point(0, 0).buffer(1, 256))
+        shrinking = GeometryShrinking(simplify="resolution")
+        # No known resolution: no simplification
+        assert len(shrinking.apply(circle)["coordinates"][0]) == len(circle["coordinates"][0])
+        assert len(shrinking.apply(circle, resolution_tolerance=0.01)["coordinates"][0]) < 100
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            GeometryShrinking(simplify="lots")
+
+    @pytest.mark.parametrize(["step_degrees", "geometry_degrees", "latitude", "expected"], [
+        (False, False, 0, 5),
+        (True, True, 0, 5),
+        (False, True, 0, 5 / 111320),
+        (False, True, 60, 10 / 111320),
+        (True, False, 0, 5 * 111320),
+    ])
+    def test_resolution_tolerance(self, step_degrees, geometry_degrees, latitude, expected):
+        tolerance = GeometryShrinking.resolution_tolerance(
+            step=10, step_degrees=step_degrees, geometry_degrees=geometry_degrees, latitude=latitude
+        )
+        assert tolerance == pytest.approx(expected)
+
+
+def test_meters_per_degree():
+    assert meters_per_degree() == 111320
+    assert meters_per_degree(60) == pytest.approx(55660)
+    assert meters_per_degree(-60) == pytest.approx(55660)
+    assert meters_per_degree(90) == pytest.approx(1113.2)
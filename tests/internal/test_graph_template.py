@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+from openeo.api.process import Parameter
+from openeo.internal.graph_building import PGNode
+from openeo.internal.graph_template import GraphTemplate
+from openeo.rest import OpenEoClientException
+
+BBOX = {"west": 3, "south": 51, "east": 4, "north": 52}
+
+
+def _graph(spatial_extent, temporal_extent) -> dict:
+    load = PGNode("load_collection", id="S2", spatial_extent=spatial_extent, temporal_extent=temporal_extent)
+    apply = PGNode("apply", data={"from_node": load}, process={
+        "process_graph": PGNode("add", x={"from_parameter": "x"}, y={"from_parameter": "offset"})
+    })
+    return PGNode("save_result", data={"from_node": apply}, format="GTiff").flat_graph()
+
+
+def test_render_flat_graph():
+    flat_graph = _graph(spatial_extent={"from_parameter": "bbox"}, temporal_extent=Parameter("dates", "Dates"))
+    template = GraphTemplate(flat_graph)
+    assert template.parameters == ["bbox", "dates"]
+    rendered = template.render(bbox=BBOX, dates=["2021-06-01", "2021-09-01"])
+    assert isinstance(rendered, str)
+    expected = PGNode.from_flat_graph(flat_graph, parameters={
+        "bbox": BBOX, "dates": ["2021-06-01", "2021-09-01"]
+    }).flat_graph()
+    assert json.loads(rendered) == expected
+    assert rendered == json.dumps(expected)
+
+
+def test_render_callbacks_untouched():
+    flat_graph = _graph(spatial_extent={"from_parameter": "bbox"}, temporal_extent=None)
+    template = GraphTemplate(flat_graph, parameters=["bbox", "x", "offset"])
+    assert template.render_dict(bbox=BBOX)["apply1"]["arguments"]["process"] == {"process_graph": {"add1": {
+        "process_id": "add", "arguments": {"x": {"from_parameter": "x"}, "y": {"from_parameter": "offset"}},
+        "result": True,
+    }}}
+
+
+def test_render_request_body():
+    body = {
+        "title": {"from_parameter": "title"},
+        "process": {"process_graph": _graph(spatial_extent={"from_parameter": "bbox"}, temporal_extent=None)},
+        "job_options": {"memory": "2G"},
+    }
+    template = GraphTemplate(body)
+    assert template.parameters == ["bbox", "title"]
+    result = template.render_dict(bbox=BBOX, title="Job 1")
+    assert result["title"] == "Job 1"
+    assert result["process"]["process_graph"]["loadcollection1"]["arguments"]["spatial_extent"] == BBOX
+    assert result["job_options"] == {"memory": "2G"}
+
+
+def test_render_repeated_parameter():
+    template = GraphTemplate({"add1": {"process_id": "add", "arguments": {
+        "x": {"from_parameter": "a"}, "y": {"from_parameter": "a"}
+    }, "result": True}})
+    assert template.render_dict(a=3)["add1"]["arguments"] == {"x": 3, "y": 3}
+
+
+def test_non_template_parameters():
+    flat_graph = _graph(spatial_extent={"from_parameter": "bbox"}, temporal_extent={"from_parameter": "dates"})
+    template = GraphTemplate(flat_graph, parameters=["bbox"])
+    assert template.render_dict(bbox=BBOX)["loadcollection1"]["arguments"] == {
+        "id": "S2", "spatial_extent": BBOX, "temporal_extent": {"from_parameter": "dates"}
+    }
+
+
+def test_parameter_default():
+    flat_graph = _graph(spatial_extent={"from_parameter": "bbox"}, temporal_extent={"from_parameter": "dates"})
+    template = GraphTemplate(flat_graph, parameters=[
+        Parameter("bbox", "Bounding box"), Parameter("dates", "Dates", default=["2021-01-01", None])
+    ])
+    arguments = template.render_dict(bbox=BBOX)["loadcollection1"]["arguments"]
+    assert arguments["temporal_extent"] == ["2021-01-01", None]
+    arguments = template.render_dict(bbox=BBOX, dates=["2022-01-01", None])["loadcollection1"]["arguments"]
+    assert arguments["temporal_extent"] == ["2022-01-01", None]
+
+
+def test_missing_and_unknown_values():
+    template = GraphTemplate(_graph(spatial_extent={"from_parameter": "bbox"}, temporal_extent=None))
+    with pytest.raises(OpenEoClientException, match="No value for template parameter 'bbox'"):
+        template.render()
+    with pytest.raises(OpenEoClientException, match=r"Unknown template parameter\(s\): \['bbx'\]"):
+        template.render(bbox=BBOX, bbx=BBOX)
+
+
+def test_undeclared_parameter_object():
+    with pytest.raises(OpenEoClientException, match="'title' is not a template parameter"):
+        GraphTemplate({"title": Parameter("title", "Title"), "process_graph": {}}, parameters=["bbox"])
+
+
+def test_special_values():
+    template = GraphTemplate({"foo1": {"process_id": "foo", "arguments": {
+        "text": "é\"\n{\"from_parameter\": \"p\"}", "p": {"from_parameter": "p"}, "nan": None,
+    }, "result": True}})
+    value = {"name": "Ünïcode \"quoted\"", "list": [1.5, True, None]}
+    assert template.render_dict(p=value)["foo1"]["arguments"] == {
+        "text": "é\"\n{\"from_parameter\": \"p\"}", "p": value, "nan": None,
+    }
@@ -0,0 +1,106 @@
+import pytest
+
+from openeo.internal.graph_building import PGNode
+from openeo.internal.volume import (
+    VolumeEstimate, VolumeEstimationException, estimate_load_collection, estimate_volume
+)
+from openeo.metadata import CollectionMetadata
+
+S2 = CollectionMetadata({
+    "id": "S2",
+    "cube:dimensions": {
+        "x": {"type": "spatial", "step": 10, "reference_system": 32631, "extent": [500000, 600000]},
+        "y": {"type": "spatial", "step": 10, "reference_system": 32631, "extent": [5600000, 5700000]},
+        "t": {"type": "temporal", "extent": ["2017-01-01", None], "step": "P5D"},
+        "bands": {"type": "bands", "values": ["B02", "B03", "B04", "B08"]},
+    },
+    "summaries": {"raster:bands": [
+        {"name": "B02", "data_type": "uint16"}, {"name": "B03", "data_type": "uint16"},
+        {"name": "B04", "data_type": "uint16"}, {"name": "B08", "data_type": "uint16"},
+    ]},
+})
+
+DEM = CollectionMetadata({
+    "id": "DEM",
+    "cube:dimensions": {
+        "x": {"type": "spatial", "step": 0.001},
+        "y": {"type": "spatial", "step": 0.001},
+    },
+})
+
+
+def test_estimate_load_collection_projected():
+    estimate = estimate_load_collection({
+        "spatial_extent": {"west": 500000, "south": 5600000, "east": 501000, "north": 5602000, "crs": 32631},
+        "temporal_extent": ["2021-06-01", "2021-07-01"],
+        "bands": ["B04", "B08"],
+    }, metadata=S2)
+    # 100x200 pixels, 6 observations, 2 bands, 2 bytes per value
+    assert estimate == VolumeEstimate(pixels=100 * 200 * 6, values=100 * 200 * 6 * 2, bytes=100 * 200 * 6 * 2 * 2)
+
+
+def test_estimate_load_collection_lonlat_extent():
+    estimate = estimate_load_collection({
+        "spatial_extent": {"west": 3.0, "south": 51.0, "east": 3.1, "north": 51.1},
+        "temporal_extent": ["2021-06-01", "2021-06-02"],
+        "bands": ["B04"],
+    }, metadata=S2)
+    # ~700m x 1113m at 10m resolution
+    assert 700 * 1100 < estimate.pixels < 710 * 1115
+    assert estimate.bytes == 2 * estimate.values
+
+
+def test_estimate_load_collection_geojson_extent():
+    polygon = {"type": "Polygon", "coordinates": [[[0, 0], [0.01, 0], [0.01, 0.02], [0, 0]]]}
+    estimate = estimate_load_collection({"spatial_extent": polygon}, metadata=DEM)
+    assert estimate == VolumeEstimate(pixels=10 * 20, values=10 * 20, bytes=10 * 20 * 4)
+
+
+def test_estimate_load_collection_default_extent():
+    estimate = estimate_load_collection({"temporal_extent": ["2021-01-01", "2021-01-11"]}, metadata=S2)
+    assert estimate.pixels == 10000 * 10000 * 2
+    assert estimate.values == estimate.pixels * 4
+
+
+@pytest.mark.parametrize(["arguments", "message"], [
+    ({"spatial_extent": {"from_parameter": "bbox"}}, "Unsupported spatial extent"),
+    ({"temporal_extent": {"from_parameter": "dates"}}, "Unsupported temporal extent"),
+    ({"bands": {"from_parameter": "bands"}}, "Unsupported bands"),
+])
+def test_estimate_load_collection_unsupported(arguments, message):
+    with pytest.raises(VolumeEstimationException, match=message):
+        estimate_load_collection(arguments, metadata=S2)
+
+
+def test_estimate_load_collection_no_resolution():
+    metadata = CollectionMetadata({"cube:dimensions": {"x": {"type": "spatial"}, "y": {"type": "spatial"}}})
+    with pytest.raises(VolumeEstimationException, match="No spatial resolution"):
+        estimate_load_collection({"spatial_extent": {"west": 0, "south": 0, "east": 1, "north": 1}}, metadata)
+
+
+def test_estimate_volume_filter_pushdown():
+    load = PGNode(
+        "load_collection", id="S2", spatial_extent=None, temporal_extent=["2021-06-01", "2021-06-02"], bands=["B04"]
+    )
+    node = PGNode("filter_bbox", data={"from_node": load}, extent={
+        "west": 500000, "south": 5600000, "east": 501000, "north": 5601000, "crs": 32631
+    })
+    estimate = estimate_volume(node, get_metadata={"S2": S2}.__getitem__)
+    assert estimate == VolumeEstimate(pixels=100 * 100, values=100 * 100, bytes=100 * 100 * 2)
+
+
+def test_estimate_volume_multiple_collections():
+    s2 = PGNode("load_collection", id="S2", spatial_extent={
+        "west": 500000, "south": 5600000, "east": 501000, "north": 5601000, "crs": 32631
+    }, temporal_extent=["2021-06-01", "2021-06-02"], bands=["B04"])
+    dem = PGNode("load_collection", id="DEM", spatial_extent={"west": 0, "south": 0, "east": 0.1, "north": 0.1})
+    node = PGNode("merge_cubes", cube1={"from_node": s2}, cube2={"from_node": dem})
+    estimate = estimate_volume(node, get_metadata={"S2": S2, "DEM": DEM}.__getitem__)
+    assert estimate.pixels == 100 * 100 + 100 * 100
+    assert estimate.bytes == 100 * 100 * 2 + 100 * 100 * 4
+
+
+def test_estimate_volume_load_result():
+    node = PGNode("load_result", id="j-123")
+    with pytest.raises(VolumeEstimationException):
+        estimate_volume(node, get_metadata={}.__getitem__)
@@ -0,0 +1,207 @@
+import numpy
+import pytest
+import xarray
+
+from openeo.internal.graph_building import PGNode
+from openeo.local import LocalExecutor, LocalProcessingException, list_processes
+from openeo.metadata import CollectionMetadata
+from openeo.rest.datacube import DataCube
+from openeo.udf.xarraydatacube import XarrayDataCube
+
+BANDS = ["B02", "B04", "B08"]
+
+
+@pytest.fixture
+def s2() -> xarray.DataArray:
+    t = numpy.array(["2021-06-01", "2021-06-11", "2021-06-21"], dtype="datetime64[ns]")
+    data = numpy.arange(3 * 3 * 4 * 5, dtype=float).reshape((3, 3, 4, 5))
+    return xarray.DataArray(
+        data, dims=["t", "bands", "y", "x"],
+        coords={"t": t, "bands": BANDS, "y": [53.0, 52.0, 51.0, 50.0], "x": [3.0, 4.0, 5.0, 6.0, 7.0]},
+    )
+
+
+@pytest.fixture
+def executor(s2) -> LocalExecutor:
+    return LocalExecutor(collections={"S2": s2})
+
+
+METADATA = CollectionMetadata({"cube:dimensions": {
+    "x": {"type": "spatial", "axis": "x"},
+    "y": {"type": "spatial", "axis": "y"},
+    "t": {"type": "temporal"},
+    "bands": {"type": "bands", "values": BANDS},
+}})
+
+
+def _load(bands=BANDS, **kwargs) -> DataCube:
+    cube = DataCube.load_collection("S2", connection=None, fetch_metadata=False, bands=bands, **kwargs)
+    return DataCube(graph=cube._pg, connection=None, metadata=METADATA.filter_bands(bands))
+
+
+def test_list_processes():
+    processes = list_processes()
+    for p in ["add", "array_element", "reduce_dimension", "apply", "apply_dimension", "merge_cubes",
+              "filter_bbox", "filter_temporal", "filter_bands", "linear_scale_range"]:
+        assert p in processes
+
+
+def test_load_collection(executor, s2):
+    result = executor.evaluate(_load())
+    xarray.testing.assert_equal(result, s2)
+
+
+def test_load_collection_file(s2, tmp_path):
+    path = tmp_path / "s2.json"
+    XarrayDataCube(s2).save_to_file(path)
+    result = LocalExecutor(collections={"S2": path}).evaluate(_load(bands=["B04"]))
+    assert list(result.bands.values) == ["B04"]
+    numpy.testing.assert_allclose(result.transpose(*s2.dims).values, s2.sel(bands=["B04"]).values)
+
+
+def test_load_collection_filters(executor, s2):
+    cube = _load(
+        bands=["B08", "B02"], spatial_extent={"west": 4, "south": 51, "east": 5.5, "north": 52},
+        temporal_extent=["2021-06-05", "2021-06-21"],
+    )
+    result = executor.evaluate(cube)
+    assert list(result.bands.values) == ["B08", "B02"]
+    assert list(result.x.values) == [4.0, 5.0]
+    assert list(result.y.values) == [52.0, 51.0]
+    assert list(result.t.values) == [numpy.datetime64("2021-06-11")]
+
+
+def test_band_math(executor, s2):
+    cube = _load()
+    red = cube.band("B04")
+    nir = cube.band("B08")
+    ndvi = (nir - red) / (nir + red)
+    result = executor.evaluate(ndvi)
+    expected = (s2.sel(bands="B08") - s2.sel(bands="B04")) / (s2.sel(bands="B08") + s2.sel(bands="B04"))
+    xarray.testing.assert_allclose(result, expected.drop_vars("bands", errors="ignore"))
+    assert result.dims == ("t", "y", "x")
+
+
+def test_apply(executor, s2):
+    cube = _load().apply(lambda x: (x * 2 + 1).linear_scale_range(0, 100, 0, 1))
+    result = executor.evaluate(cube)
+    expected = (numpy.clip(s2 * 2 + 1, 0, 100)) / 100
+    xarray.testing.assert_allclose(result, expected)
+
+
+def test_apply_comparison(executor, s2):
+    cube = _load().apply(lambda x: (x > 50).if_(x, 0))
+    result = executor.evaluate(cube)
+    xarray.testing.assert_allclose(result, xarray.where(s2 > 50, s2, 0))
+
+
+@pytest.mark.parametrize(["reducer", "expected"], [
+    ("mean", lambda a: a.mean("t")),
+    ("max", lambda a: a.max("t")),
+    ("sd", lambda a: a.std("t", ddof=1)),
+    (lambda data: data.min() + data.max(), lambda a: a.min("t") + a.max("t")),
+])
+def test_reduce_dimension(executor, s2, reducer, expected):
+    cube = _load().reduce_dimension(dimension="t", reducer=reducer)
+    result = executor.evaluate(cube)
+    xarray.testing.assert_allclose(result, expected(s2))
+
+
+def test_reduce_dimension_nodata(executor, s2):
+    s2[0, 0, 0, 0] = numpy.nan
+    result = executor.evaluate(_load().reduce_dimension(dimension="t", reducer="mean"))
+    assert result[0, 0, 0] == (s2[1, 0, 0, 0] + s2[2, 0, 0, 0]) / 2
+
+
+def test_apply_dimension(executor, s2):
+    cube = _load().apply_dimension(dimension="bands", process=lambda data: data * 10)
+    result = executor.evaluate(cube)
+    xarray.testing.assert_allclose(result, s2 * 10)
+
+
+def test_apply_dimension_array_create(executor, s2):
+    def callback(data):
+        from openeo.processes import array_create
+        b04 = data.array_element(1)
+        b08 = data.array_element(2)
+        return array_create([(b08 - b04) / (b08 + b04), b08 * 2])
+
+    cube = _load().apply_dimension(dimension="bands", process=callback).rename_labels("bands", ["NDVI", "B08x2"])
+    result = executor.evaluate(cube)
+    assert result.dims == ("t", "bands", "y", "x")
+    assert list(result.bands.values) == ["NDVI", "B08x2"]
+    b04, b08 = s2.sel(bands="B04"), s2.sel(bands="B08")
+    numpy.testing.assert_allclose(result.sel(bands="NDVI").values, ((b08 - b04) / (b08 + b04)).values)
+    numpy.testing.assert_allclose(result.sel(bands="B08x2").values, (b08 * 2).values)
+
+
+def test_filter_processes(executor, s2):
+    cube = _load().filter_bands(["B04"]).filter_temporal("2021-06-01", "2021-06-12")
+    cube = cube.filter_bbox(west=5, east=7, south=50, north=51)
+    result = executor.evaluate(cube)
+    xarray.testing.assert_equal(result, s2.isel(t=[0, 1], bands=[1], y=[2, 3], x=[2, 3, 4]))
+
+
+def test_merge_cubes_bands(executor, s2):
+    cube = _load(bands=["B02"]).merge_cubes(_load(bands=["B04", "B08"]))
+    result = executor.evaluate(cube)
+    xarray.testing.assert_equal(result, s2)
+
+
+def test_merge_cubes_overlap_resolver(executor, s2):
+    cube = _load().merge_cubes(_load().apply(lambda x: x * 3), overlap_resolver="max")
+    result = executor.evaluate(cube)
+    xarray.testing.assert_allclose(result, s2 * 3)
+
+
+def test_merge_cubes_overlap_without_resolver(executor):
+    with pytest.raises(LocalProcessingException, match="overlap resolver"):
+        executor.evaluate(_load().merge_cubes(_load()))
+
+
+def test_parameters(executor, s2):
+    graph = PGNode("apply", data={"from_node": PGNode("load_collection", id="S2")}, process={
+        "process_graph": PGNode("multiply", x={"from_parameter": "x"}, y={"from_parameter": "factor"})
+    })
+    result = executor.evaluate({"process_graph": graph.flat_graph()}, parameters={"factor": 3})
+    xarray.testing.assert_allclose(result, s2 * 3)
+    with pytest.raises(LocalProcessingException, match="No value for parameter 'factor'"):
+        executor.evaluate(graph)
+
+
+def test_unsupported_process(executor):
+    with pytest.raises(LocalProcessingException, match="Process 'resample_spatial' is not supported"):
+        executor.evaluate(_load().resample_spatial(resolution=10))
+
+
+def test_unknown_collection(executor):
+    with pytest.raises(LocalProcessingException, match="Collection 'S3' is not available"):
+        executor.evaluate(DataCube.load_collection("S3", connection=None, fetch_metadata=False))
+
+
+def test_invalid_arguments(executor):
+    graph = PGNode("add", x=1, z=2)
+    with pytest.raises(LocalProcessingException, match="Invalid arguments for process 'add'"):
+        executor.evaluate(graph)
+
+
+def test_math_scalars(executor):
+    graph = PGNode("linear_scale_range", x={"from_node": PGNode("add", x=3, y=4)}, inputMin=0, inputMax=10)
+    assert executor.evaluate(graph) == pytest.approx(0.7)
+
+
+@pytest.mark.parametrize(["x", "y", "expected"], [
+    (27, 5, 2),
+    (-27, 5, 3),
+    (27, -5, -3),
+    (-27, -5, -2),
+    (3.5, -2, -0.5),
+])
+def test_mod_sign_of_divisor(executor, x, y, expected):
+    assert executor.evaluate(PGNode("mod", x=x, y=y)) == pytest.approx(expected)
+
+
+def test_mod_array(executor):
+    array = xarray.DataArray(numpy.array([-27, -3, 3, 27]), dims=["x"])
+    result = executor.evaluate(PGNode("mod", x={"from_parameter": "a"}, y=5), parameters={"a": array})
+    assert list(result.values) == [3, 2, 3, 2]
@@ -0,0 +1,122 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+from openeo.rest import OpenEoClientException
+from openeo.rest.auth.auth import OidcBearerAuth, BearerAuth, BasicBearerAuth
+from .test_oidc import OidcMock
+
+
+def _jwt(**payload) -> str:
+    return OidcMock._jwt_encode(header={}, payload=payload)
+
+
+def test_bearer_auth():
+    auth = BearerAuth(bearer="b3ar3r")
+    req = auth(requests.Request())
+    assert req.headers["Authorization"] == "Bearer b3ar3r"
+
+
+def test_basic_bearer_auth():
+    auth = BasicBearerAuth(access_token="4cc35")
+    req = auth(requests.Request())
+    assert req.headers["Authorization"] == "Bearer basic//4cc35"
+
+
+class TestOidcBearerAuth:
+
+    @pytest.fixture
+    def clock(self):
+        now = [1000]
+        with mock.patch.object(OidcBearerAuth, "_clock", new=mock.Mock(side_effect=lambda: now[0])):
+            yield now
+
+    def test_basic(self):
+        auth = OidcBearerAuth(provider_id="oi", access_token="4cc35")
+        req = auth(requests.Request())
+        assert req.headers["Authorization"] == "Bearer oidc/oi/4cc35"
+        assert auth.expires_at is None
+        assert not auth.should_refresh()
+
+    def test_expires_at(self):
+        auth = OidcBearerAuth(provider_id="oi", access_token=_jwt(sub="john", exp=1234))
+        assert auth.expires_at == 1234
+
+    def test_proactive_refresh(self, clock):
+        tokens = iter([_jwt(t="t2", exp=2000), _jwt(t="t3", exp=3000)])
+        refresher = mock.Mock(side_effect=lambda: next(tokens))
+        token1 = _jwt(t="t1", exp=1100)
+        auth = OidcBearerAuth(provider_id="oi", access_token=token1, refresher=refresher, refresh_margin=60)
+
+        req = auth(requests.Request())
+        assert req.headers["Authorization"] == "Bearer oidc/oi/" + token1
+        assert refresher.call_count == 0
+
+        clock[0] = 1050
+        req = auth(requests.Request())
+        assert req.headers["Authorization"] == "Bearer oidc/oi/" + _jwt(t="t2", exp=2000)
+        assert auth.expires_at == 2000
+        assert refresher.call_count == 1
+
+        clock[0] = 1500
+        auth(requests.Request())
+        assert refresher.call_count == 1
+
+        clock[0] = 2500
+        req = auth(requests.Request())
+        assert req.headers["Authorization"] == "Bearer oidc/oi/" + _jwt(t="t3", exp=3000)
+        assert refresher.call_count == 2
+
+    def test_no_refresher(self, clock):
+        auth = OidcBearerAuth(provider_id="oi", access_token=_jwt(t="t1", exp=900))
+        assert not auth.should_refresh()
+        assert not auth.refresh()
+
+    @pytest.mark.parametrize("exception", [
+        OpenEoClientException("No refresh token"),
+        requests.ConnectionError("Connection refused"),
+        requests.Timeout("Read timed out"),
+    ])
+    def test_refresh_failure(self, clock, caplog, exception):
+        refresher = mock.Mock(side_effect=exception)
+        token1 = _jwt(t="t1", exp=1010)
+        auth = OidcBearerAuth(provider_id="oi", access_token=token1, refresher=refresher)
+        req = auth(requests.Request())
+        assert req.headers["Authorization"] == "Bearer oidc/oi/" + token1
+        assert refresher.call_count == 1
+        assert "Failed to proactively refresh OIDC access token" in caplog.text
+
+        # No new attempt before retry interval.
+        clock[0] += 10
+        auth(requests.Request())
+        assert refresher.call_count == 1
+
+        clock[0] += OidcBearerAuth.REFRESH_RETRY_INTERVAL
+        auth(requests.Request())
+        assert refresher.call_count == 2
+
+    def test_single_flight(self, clock):
+        def refresher():
+            # Give other threads time to pile up on the lock.
+            time.sleep(0.1)
+            return _jwt(t="t2", exp=5000)
+
+        refresher = mock.Mock(side_effect=refresher)
+        auth = OidcBearerAuth(provider_id="oi", access_token=_jwt(t="t1", exp=1010), refresher=refresher)
+
+        headers = []
+
+        def do_request():
+            headers.append(auth(requests.Request()).headers["Authorization"])
+
+        threads = [threading.Thread(target=do_request) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert refresher.call_count == 1
+        assert headers == ["Bearer oidc/oi/" + _jwt(t="t2", exp=5000)] * 8
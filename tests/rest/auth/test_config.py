@@ -1,10 +1,13 @@
 import json
+import multiprocessing
+import time
 from unittest import mock
 
 import pytest
 
 import openeo.rest.auth.config
 from openeo.rest.auth.config import RefreshTokenStore, AuthConfig, PrivateJsonFile
+from .test_oidc import OidcMock
 
 
 class TestPrivateJsonFile:
@@ -65,6 +68,44 @@ class TestPrivateJsonFile:
         private.remove()
         assert not private.path.exists()
 
+    def test_in_memory_cache(self, tmp_path):
+        private = PrivateJsonFile(tmp_path)
+        private.set("foo", "bar", value=42)
+        with mock.patch("json.load", wraps=json.load) as json_load:
+            assert private.get("foo", "bar") == 42
+            assert private.get("foo", "bar") == 42
+            assert private.load() == {"foo": {"bar": 42}}
+            assert json_load.call_count == 1
+            # Returned data should not leak into cache
+            private.load()["foo"]["bar"] = 666
+            assert private.get("foo", "bar") == 42
+            # Changes by other instance (e.g. other process) should be picked up.
+            other = PrivateJsonFile(tmp_path)
+            other.set("foo", "bar", value=123)
+            assert json_load.call_count == 2
+            assert private.get("foo", "bar") == 123
+            assert json_load.call_count == 3
+
+    def test_concurrent_updates(self, tmp_path):
+        n_processes, n_increments = 4, 10
+        ctx = multiprocessing.get_context("fork")
+        processes = [
+            ctx.Process(target=_increment_private_json_file, args=(tmp_path, n_increments))
+            for _ in range(n_processes)
+        ]
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join()
+        assert PrivateJsonFile(tmp_path).get("counter") == n_processes * n_increments
+
+
+def _increment_private_json_file(path, n: int):
+    private = PrivateJsonFile(path)
+    for _ in range(n):
+        with private.lock():
+            private.set("counter", value=private.get("counter", default=0) + 1)
+
 
 class TestAuthConfig:
 
@@ -158,3 +199,53 @@ class TestRefreshTokenStorage:
         r = RefreshTokenStore(path=tmp_path)
         r.set_refresh_token("foo", "bar", "ih6zdaT0k3n")
         assert r.get_refresh_token("foo", "bar") == "ih6zdaT0k3n"
+
+    def test_set_refresh_token_keeps_other_entries(self, tmp_path):
+        r = RefreshTokenStore(path=tmp_path)
+        r.set_refresh_token("foo", "bar", "ih6zdaT0k3n")
+        r.set_refresh_token("foo", "baz", "4n07h3r")
+        r.set_refresh_token("https://oidc.test/", "bar", "d1ff3r3n7")
+        assert r.get_refresh_token("foo", "bar") == "ih6zdaT0k3n"
+        assert r.get_refresh_token("foo", "baz") == "4n07h3r"
+        assert r.get_refresh_token("https://oidc.test", "bar") == "d1ff3r3n7"
+
+    def test_get_set_access_token(self, tmp_path):
+        r = RefreshTokenStore(path=tmp_path)
+        assert r.get_access_token("foo", "bar") is None
+        r.set_refresh_token("foo", "bar", "ih6zdaT0k3n")
+        r.set_access_token("foo", "bar", "4cc355", expires_at=time.time() + 1000)
+        assert r.get_access_token("foo", "bar") == "4cc355"
+        assert r.get_access_token("foo", "baz") is None
+        assert r.get_access_token("foo", "bar", min_validity=2000) is None
+        assert r.get_refresh_token("foo", "bar") == "ih6zdaT0k3n"
+        # New refresh token resets cached access token
+        r.set_refresh_token("foo", "bar", "n3wr3fr35h")
+        assert r.get_access_token("foo", "bar") is None
+
+    def test_access_token_expired(self, tmp_path):
+        r = RefreshTokenStore(path=tmp_path)
+        r.set_access_token("foo", "bar", "4cc355", expires_at=time.time() + 30)
+        assert r.get_access_token("foo", "bar") is None
+        assert r.get_access_token("foo", "bar", min_validity=10) == "4cc355"
+
+    def test_set_access_token_from_jwt(self, tmp_path):
+        r = RefreshTokenStore(path=tmp_path)
+        token = OidcMock._jwt_encode(header={}, payload={"exp": time.time() + 1000})
+        r.set_access_token("foo", "bar", token)
+        assert r.get_access_token("foo", "bar") == token
+
+    def test_set_access_token_unknown_expiry(self, tmp_path):
+        r = RefreshTokenStore(path=tmp_path)
+        r.set_access_token("foo", "bar", "4cc355")
+        assert r.get_access_token("foo", "bar") is None
+        assert not r.path.exists()
+
+    def test_discard_access_token(self, tmp_path):
+        r = RefreshTokenStore(path=tmp_path)
+        r.set_refresh_token("foo", "bar", "ih6zdaT0k3n")
+        r.set_access_token("foo", "bar", "4cc355", expires_at=time.time() + 1000)
+        r.discard_access_token("0th3r")
+        assert r.get_access_token("foo", "bar") == "4cc355"
+        r.discard_access_token("4cc355")
+        assert r.get_access_token("foo", "bar") is None
+        assert r.get_refresh_token("foo", "bar") == "ih6zdaT0k3n"
@@ -3,6 +3,7 @@ import contextlib
 import json
 import logging
 import re
+import time
 import urllib.parse
 import urllib.parse
 from io import BytesIO
@@ -19,7 +20,7 @@ import openeo.rest.auth.oidc
 from openeo.rest.auth.oidc import QueuingRequestHandler, drain_queue, HttpServerThread, OidcAuthCodePkceAuthenticator, \
     OidcClientCredentialsAuthenticator, OidcResourceOwnerPasswordAuthenticator, OidcClientInfo, OidcProviderInfo, \
     OidcDeviceAuthenticator, random_string, OidcRefreshTokenAuthenticator, PkceCode, OidcException, \
-    DefaultOidcClientGrant
+    DefaultOidcClientGrant, jwt_decode, jwt_get_expiration
 from openeo.util import dict_no_none
 
 DEVICE_CODE_POLL_INTERVAL = 2
@@ -246,6 +247,29 @@ def test_oidc_client_info_uess_device_flow_pkce_support(requests_mock):
         assert client_info.guess_device_flow_pkce_support() is expected
 
 
+def test_jwt_decode_urlsafe():
+    # Payload with characters that are encoded differently in base64 and base64url
+    payload = {"sub": "?>?>", "exp": 1234}
+    token = OidcMock._jwt_encode(header={"alg": "none"}, payload=payload)
+    assert "_" in token or "-" in token
+    assert jwt_decode(token) == ({"alg": "none"}, payload)
+
+
+@pytest.mark.parametrize(["payload", "expected"], [
+    ({"sub": "john", "exp": 1234}, 1234),
+    ({"sub": "john", "exp": 1234.5}, 1234.5),
+    ({"sub": "john"}, None),
+])
+def test_jwt_get_expiration(payload, expected):
+    token = OidcMock._jwt_encode(header={}, payload=payload)
+    assert jwt_get_expiration(token) == expected
+
+
+@pytest.mark.parametrize("token", ["", "f00b6r", "foo.bar.baz"])
+def test_jwt_get_expiration_invalid(token):
+    assert jwt_get_expiration(token) is None
+
+
 class OidcMock:
     """
     Mock object to test OIDC flows
@@ -262,6 +286,7 @@ class OidcMock:
             state: dict = None,
             scopes_supported: List[str] = None,
             device_code_flow_support: bool = True,
+            access_token_lifetime: Optional[float] = None,
     ):
         self.requests_mock = requests_mock
         self.oidc_discovery_url = oidc_discovery_url
@@ -276,6 +301,7 @@ class OidcMock:
         self.device_code_endpoint = provider_root_url + "/device_code" if device_code_flow_support else None
         self.state = state or {}
         self.scopes_supported = scopes_supported or ["openid", "email", "profile"]
+        self.access_token_lifetime = access_token_lifetime
 
         self.requests_mock.get(oidc_discovery_url, text=json.dumps(dict_no_none({
             # Rudimentary OpenID Connect discovery document
@@ -443,7 +469,10 @@ class OidcMock:
         """Build JSON serialized access/id/refresh token response (and store tokens for use in assertions)"""
         access_token = self._jwt_encode(
             header={},
-            payload=dict_no_none(sub=sub, name=name, nonce=self.state.get("nonce"), _uuid=uuid.uuid4().hex),
+            payload=dict_no_none(
+                sub=sub, name=name, nonce=self.state.get("nonce"), _uuid=uuid.uuid4().hex,
+                exp=time.time() + self.access_token_lifetime if self.access_token_lifetime else None,
+            ),
         )
         res = {"access_token": access_token}
 
@@ -6,6 +6,7 @@ Unit tests specifically for 1.0.0-style DataCube
 import collections
 import copy
 import io
+import json
 import pathlib
 import re
 import textwrap
@@ -18,6 +19,7 @@ import shapely.geometry
 import openeo.metadata
 import openeo.processes
 from openeo.api.process import Parameter
+from openeo.internal.geometry import GeometryShrinking
 from openeo.internal.graph_building import PGNode
 from openeo.internal.process_graph_visitor import ProcessGraphVisitException
 from openeo.internal.warnings import UserDeprecationWarning
@@ -298,6 +300,42 @@ def test_aggregate_spatial_with_crs(con100: Connection, recwarn):
     }
 
 
+def test_aggregate_spatial_geometry_shrinking(con100: Connection):
+    con100.geometry_shrinking = GeometryShrinking(decimals=2, drop_properties=True)
+    features = {"type": "FeatureCollection", "features": [{
+        "type": "Feature", "properties": {"name": "field 1", "crop": "maize"},
+        "geometry": shapely.geometry.mapping(shapely.geometry.box(3.12345, 51.12345, 3.23456, 51.23456)),
+    }]}
+    cube = con100.load_collection("S2").aggregate_spatial(geometries=features, reducer="mean")
+    geometries = cube.flat_graph()["aggregatespatial1"]["arguments"]["geometries"]
+    assert geometries == {"type": "FeatureCollection", "features": [{
+        "type": "Feature", "properties": {},
+        "geometry": {"type": "Polygon", "coordinates": [
+            [[3.23, 51.12], [3.23, 51.23], [3.12, 51.23], [3.12, 51.12], [3.23, 51.12]]
+        ]},
+    }]}
+    # Original is untouched
+    assert features["features"][0]["properties"] == {"name": "field 1", "crop": "maize"}
+
+
+def test_mask_polygon_simplify_resolution(con100: Connection, requests_mock):
+    metadata = copy.deepcopy(DEFAULT_S2_METADATA)
+    metadata["cube:dimensions"]["x"].update(step=10, reference_system=32631)
+    requests_mock.get(API_URL + "/collections/S2STEP", json=metadata)
+    con100.geometry_shrinking = GeometryShrinking(simplify="resolution")
+    # Circle with vertices every ~3 meter
+    circle = shapely.geometry.Point(500000, 5600000).buffer(1000, 512)
+    cube = con100.load_collection("S2STEP").mask_polygon(circle, srs="EPSG:32631")
+    mask = cube.flat_graph()["maskpolygon1"]["arguments"]["mask"]
+    simplified = shapely.geometry.shape(mask)
+    assert len(simplified.exterior.coords) < len(circle.exterior.coords) / 4
+    assert simplified.hausdorff_distance(circle) <= 5
+    # No resolution metadata: no simplification
+    cube = con100.load_collection("S2").mask_polygon(circle, srs="EPSG:32631")
+    mask = cube.flat_graph()["maskpolygon1"]["arguments"]["mask"]
+    assert len(mask["coordinates"][0]) == len(circle.exterior.coords)
+
+
 def test_aggregate_spatial_target_dimension(con100: Connection):
     img = con100.load_collection("S2")
     polygon = shapely.geometry.box(0, 0, 1, 1)
@@ -804,6 +842,26 @@ def test_reduce_dimension(con100):
         }}
 
 
+def test_reduce_dimension_shared_callback(con100):
+    s2 = con100.load_collection("S2")
+    x = s2.reduce_dimension(dimension="bands", reducer="mean")
+    y = s2.reduce_dimension(dimension="t", reducer="mean")
+    # Callback node of simple predefined process is cached and shared
+    assert x._pg.arguments["reducer"]["process_graph"] is y._pg.arguments["reducer"]["process_graph"]
+    merged = x.merge_cubes(y)
+    callbacks = [
+        n["arguments"]["reducer"] for n in merged.flat_graph().values() if n["process_id"] == "reduce_dimension"
+    ]
+    assert callbacks == [
+        {"process_graph": {"mean1": {
+            "process_id": "mean", "arguments": {"data": {"from_parameter": "data"}}, "result": True
+        }}},
+        {"process_graph": {"mean2": {
+            "process_id": "mean", "arguments": {"data": {"from_parameter": "data"}}, "result": True
+        }}},
+    ]
+
+
 def test_reduce_dimension_binary(con100):
     s2 = con100.load_collection("S2")
     reducer = PGNode(
@@ -1631,6 +1689,72 @@ def test_to_json_compact(con100):
     assert ndvi.to_json(indent=None, separators=(",", ":")) == expected
 
 
+def test_to_json_optimize(con100):
+    cube = con100.load_collection("S2").apply(lambda x: x * 1 / 10000 + 0)
+    assert "multiply" in cube.to_json()
+    expected = {
+        "loadcollection1": {
+            "process_id": "load_collection",
+            "arguments": {"id": "S2", "spatial_extent": None, "temporal_extent": None},
+        },
+        "apply1": {
+            "process_id": "apply",
+            "arguments": {
+                "data": {"from_node": "loadcollection1"},
+                "process": {"process_graph": {
+                    "divide1": {
+                        "process_id": "divide",
+                        "arguments": {"x": {"from_parameter": "x"}, "y": 10000},
+                        "result": True,
+                    },
+                }},
+            },
+            "result": True,
+        },
+    }
+    assert json.loads(cube.to_json(optimize=True)) == {"process_graph": expected}
+    assert cube.flat_graph(optimize=True) == expected
+    # Original cube is not affected
+    assert "multiply" in cube.to_json()
+
+
+def test_flat_graph_optimize_filter_pushdown(con100):
+    cube = con100.load_collection("S2", temporal_extent=["2021-01-01", "2022-01-01"])
+    cube = cube.apply(lambda x: x.absolute()).filter_bands(["B04", "B08"])
+    cube = cube.filter_temporal("2021-06-01", "2021-09-01").filter_bbox(west=3, south=51, east=4, north=52)
+    flat = cube.flat_graph(optimize=True)
+    assert [n["process_id"] for n in flat.values()] == ["load_collection", "apply"]
+    assert flat["loadcollection1"]["arguments"] == {
+        "id": "S2",
+        "spatial_extent": {"west": 3, "south": 51, "east": 4, "north": 52},
+        "temporal_extent": ["2021-06-01", "2021-09-01"],
+        "bands": ["B04", "B08"],
+    }
+
+
+def test_flat_graph_optimize_callback_fusion(con100):
+    cube = con100.load_collection("S2")
+    b4 = cube.band("B04")
+    b8 = cube.band("B08")
+    # Band math followed by non-band-math operations (apply).
+    result = ((b8 - b4) / (b8 + b4)).linear_scale_range(-1, 1, 0, 100).apply(lambda x: x.absolute())
+    assert [n["process_id"] for n in result.flat_graph().values()].count("apply") >= 1
+    flat = result.flat_graph(optimize=True)
+    assert [n["process_id"] for n in flat.values()] == ["load_collection", "reduce_dimension"]
+    reducer = flat["reducedimension1"]["arguments"]["reducer"]["process_graph"]
+    assert {n["process_id"] for n in reducer.values()} == {
+        "array_element", "subtract", "add", "divide", "linear_scale_range", "absolute"
+    }
+
+def test_filter_metadata(con100):
+    cube = con100.load_collection("S2", temporal_extent=["2021-01-01", "2022-01-01"])
+    assert cube.metadata.temporal_dimension.extent == ["2021-01-01", "2022-01-01"]
+    cube = cube.filter_temporal("2021-06-01", "2023-01-01")
+    assert cube.metadata.temporal_dimension.extent == ["2021-06-01", "2022-01-01"]
+    cube = cube.filter_bbox(west=3, south=51, east=4, north=52)
+    assert [(d.name, d.extent) for d in cube.metadata.spatial_dimensions] == [("x", [3, 4]), ("y", [51, 52])]
+
+
 def test_print_json_default(con100, capsys):
     ndvi = con100.load_collection("S2").ndvi()
     ndvi.print_json()
@@ -2092,6 +2216,85 @@ def test_validation(con100, requests_mock):
     assert m.call_count == 1
 
 
+def test_validation_offline(con100, requests_mock):
+    m_validation = requests_mock.post(API_URL + "/validation", json={"errors": []})
+    m_processes = requests_mock.get(API_URL + "/processes", json={"processes": [
+        {"id": "load_collection", "parameters": [
+            {"name": "id", "schema": {"type": "string"}},
+            {"name": "spatial_extent", "schema": [{"type": "object"}, {"type": "null"}]},
+            {"name": "temporal_extent", "schema": [{"type": "array"}, {"type": "null"}]},
+        ]},
+    ]})
+
+    requests_mock.get(API_URL + "/process_graphs/save_result", status_code=404, json={"code": "ProcessGraphNotFound"})
+    requests_mock.get(API_URL + "/process_graphs", json={"processes": []})
+
+    cube = con100.load_collection("S2")
+    assert cube.validate(offline=True) == []
+    errors = cube.save_result(format="GTiff").validate(offline=True)
+    assert errors == [
+        {"code": "ProcessUnsupported", "message": "Process 'save_result' is not supported (node 'saveresult1')."}
+    ]
+    assert (m_validation.call_count, m_processes.call_count) == (0, 1)
+
+
+_LOAD_COLLECTION = {"id": "load_collection", "parameters": [
+    {"name": "id", "schema": {"type": "string"}},
+    {"name": "spatial_extent", "schema": [{"type": "object"}, {"type": "null"}]},
+    {"name": "temporal_extent", "schema": [{"type": "array"}, {"type": "null"}]},
+]}
+
+
+def test_validation_offline_user_defined_process(con100, requests_mock):
+    requests_mock.get(API_URL + "/processes", json={"processes": [_LOAD_COLLECTION]})
+    m_udp = requests_mock.get(API_URL + "/process_graphs/my_udp", json={
+        "id": "my_udp",
+        "parameters": [
+            {"name": "data", "schema": {"type": "object"}},
+            {"name": "factor", "schema": {"type": "number"}},
+        ],
+    })
+    requests_mock.get(API_URL + "/process_graphs/nope", status_code=404, json={"code": "ProcessGraphNotFound"})
+    m_listing = requests_mock.get(API_URL + "/process_graphs", json={"processes": [{"id": "my_udp"}]})
+
+    cube = con100.load_collection("S2")
+    assert cube.process("my_udp", data=cube, factor=2).validate(offline=True) == []
+    errors = cube.process("my_udp", data=cube, factor="2", foo=3).validate(offline=True)
+    assert [e["code"] for e in errors] == ["ProcessArgumentUnsupported", "ProcessArgumentInvalid"]
+    assert cube.process("nope", data=cube).validate(offline=True) == [
+        {"code": "ProcessUnsupported", "message": "Process 'nope' is not supported (node 'nope1')."}
+    ]
+    assert (m_udp.call_count, m_listing.call_count) == (1, 1)
+    # Negative result is cached.
+    cube.process("nope", data=cube).validate(offline=True)
+    assert (m_udp.call_count, m_listing.call_count) == (1, 1)
+
+
+def test_validation_offline_user_defined_processes_unavailable(con100, requests_mock):
+    requests_mock.get(API_URL + "/processes", json={"processes": [_LOAD_COLLECTION]})
+    m_udp = requests_mock.get(
+        API_URL + "/process_graphs/my_udp", status_code=401, json={"code": "AuthenticationRequired"}
+    )
+    cube = con100.load_collection("S2").process("my_udp", data=THIS)
+    for _ in range(3):
+        assert cube.validate(offline=True) == [
+            {"code": "ProcessUnsupported", "message": "Process 'my_udp' is not supported (node 'myudp1')."}
+        ]
+    # Failed lookup is not repeated.
+    assert m_udp.call_count == 1
+
+
+def test_validation_offline_user_namespace(con100, requests_mock):
+    """Actual "user" namespace of the back-end is not confused with user-defined processes."""
+    requests_mock.get(API_URL + "/processes", json={"processes": [_LOAD_COLLECTION]})
+    m_namespace = requests_mock.get(API_URL + "/processes/user", json={"processes": [{"id": "foo", "parameters": []}]})
+    m_udps = requests_mock.get(API_URL + "/process_graphs", json={"processes": [{"id": "bar", "parameters": []}]})
+    assert [p["id"] for p in con100.list_processes(namespace="user")] == ["foo"]
+    cube = con100.load_collection("S2").process("foo", namespace="user")
+    assert cube.validate(offline=True) == []
+    assert (m_namespace.call_count, m_udps.call_count) == (1, 0)
+
+
 def test_flatten_dimensions(con100):
     s2 = con100.load_collection("S2")
     cube = s2.flatten_dimensions(dimensions=["t", "bands"], target_dimension="features")
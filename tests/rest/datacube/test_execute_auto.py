@@ -0,0 +1,97 @@
+import pytest
+import requests
+
+from openeo.internal.volume import VolumeEstimationException
+from openeo.rest import OpenEoApiError
+from .conftest import API_URL
+
+S2_STEP_METADATA = {
+    "id": "S2STEP",
+    "cube:dimensions": {
+        "x": {"type": "spatial", "step": 10, "reference_system": 32631},
+        "y": {"type": "spatial", "step": 10, "reference_system": 32631},
+        "t": {"type": "temporal", "step": "P5D"},
+        "bands": {"type": "bands", "values": ["B04", "B08"]},
+    },
+    "summaries": {"raster:bands": [{"name": "B04", "data_type": "uint16"}, {"name": "B08", "data_type": "uint16"}]},
+}
+
+BBOX = {"west": 500000, "south": 5600000, "east": 501000, "north": 5601000, "crs": 32631}
+
+
+@pytest.fixture
+def cube(con100, requests_mock):
+    requests_mock.get(API_URL + "/collections/S2STEP", json=S2_STEP_METADATA)
+    return con100.load_collection("S2STEP", temporal_extent=["2021-06-01", "2021-06-11"], bands=["B04"])
+
+
+@pytest.fixture
+def batch_backend(requests_mock):
+    requests_mock.post(API_URL + "/jobs", status_code=201, headers={"OpenEO-Identifier": "j-123"})
+    requests_mock.post(API_URL + "/jobs/j-123/results", status_code=202)
+    requests_mock.get(API_URL + "/jobs/j-123", json={"status": "finished"})
+    requests_mock.get(API_URL + "/jobs/j-123/results", json={
+        "assets": {"out.tiff": {"href": API_URL + "/jobs/j-123/files/out.tiff"}}
+    })
+    requests_mock.get(API_URL + "/jobs/j-123/files/out.tiff", content=b"batch result")
+    return requests_mock
+
+
+def test_estimate_volume(cube):
+    estimate = cube.filter_bbox(bbox=BBOX).estimate_volume()
+    assert estimate.pixels == 100 * 100 * 2
+    assert estimate.bytes == 100 * 100 * 2 * 2
+
+
+def test_estimate_volume_unknown(con100):
+    with pytest.raises(VolumeEstimationException):
+        con100.load_collection("S2").estimate_volume()
+
+
+def test_execute_auto_sync(cube, requests_mock, tmp_path):
+    result = requests_mock.post(API_URL + "/result", content=b"sync result")
+    path = tmp_path / "out.tiff"
+    job = cube.filter_bbox(bbox=BBOX).execute_auto(path, print=lambda m: None)
+    assert job is None
+    assert path.read_bytes() == b"sync result"
+    graph = result.last_request.json()["process"]["process_graph"]
+    assert graph["saveresult1"]["arguments"]["format"] == "GTiff"
+
+
+def test_execute_auto_batch_threshold(cube, batch_backend, tmp_path):
+    result = batch_backend.post(API_URL + "/result", content=b"sync result")
+    path = tmp_path / "out.tiff"
+    messages = []
+    job = cube.filter_bbox(bbox=BBOX).execute_auto(path, max_sync_bytes=1000, print=messages.append)
+    assert job.job_id == "j-123"
+    assert path.read_bytes() == b"batch result"
+    assert not result.called
+    assert "Using batch job: estimated data volume 40000 bytes exceeds 1000 bytes." in messages
+
+
+def test_execute_auto_batch_unknown_volume(cube, batch_backend, tmp_path):
+    result = batch_backend.post(API_URL + "/result", content=b"sync result")
+    path = tmp_path / "out.tiff"
+    job = cube.execute_auto(path, print=lambda m: None)
+    assert job.job_id == "j-123"
+    assert not result.called
+
+
+@pytest.mark.parametrize("sync_response", [
+    {"exc": requests.exceptions.ReadTimeout},
+    {"status_code": 502, "text": "<html>Proxy Error</html>"},
+    {"status_code": 504, "json": {"code": "GatewayTimeout", "message": "Timeout"}},
+])
+def test_execute_auto_sync_fallback(cube, batch_backend, tmp_path, sync_response):
+    result = batch_backend.post(API_URL + "/result", **sync_response)
+    path = tmp_path / "out.tiff"
+    job = cube.filter_bbox(bbox=BBOX).execute_auto(path, print=lambda m: None)
+    assert result.called
+    assert job.job_id == "j-123"
+    assert path.read_bytes() == b"batch result"
+
+
+def test_execute_auto_sync_error(cube, requests_mock, tmp_path):
+    requests_mock.post(API_URL + "/result", status_code=400, json={"code": "Invalid", "message": "Nope"})
+    with pytest.raises(OpenEoApiError, match="Nope"):
+        cube.filter_bbox(bbox=BBOX).execute_auto(tmp_path / "out.tiff", print=lambda m: None)
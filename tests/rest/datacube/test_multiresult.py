@@ -0,0 +1,108 @@
+import logging
+
+import pytest
+
+from openeo.internal.graph_building import GraphFlattener, PGNode
+from openeo.internal.optimizer.base import GraphOptimizer
+from openeo.rest import OpenEoClientException
+from openeo.rest.multiresult import MultiResult
+from .conftest import API_URL
+
+
+@pytest.fixture
+def cubes(con100):
+    cube = con100.load_collection("S2", bands=["B04", "B08"])
+    return {
+        "ndvi": cube.ndvi(),
+        "composite": cube.max_time(),
+        "red": cube.filter_bands(["B04"]).save_result(format="netCDF"),
+    }
+
+
+def test_flatten_multiple():
+    shared = PGNode("load_collection", id="S2")
+    a = PGNode("save_result", data={"from_node": PGNode("ndvi", data={"from_node": shared})}, format="GTiff")
+    b = PGNode("save_result", data={"from_node": shared}, format="netCDF")
+    assert GraphFlattener().flatten_multiple([a, b]) == {
+        "loadcollection1": {"process_id": "load_collection", "arguments": {"id": "S2"}},
+        "ndvi1": {"process_id": "ndvi", "arguments": {"data": {"from_node": "loadcollection1"}}},
+        "saveresult1": {"process_id": "save_result", "arguments": {"data": {"from_node": "ndvi1"}, "format": "GTiff"}},
+        "saveresult2": {
+            "process_id": "save_result", "arguments": {"data": {"from_node": "loadcollection1"}, "format": "netCDF"},
+            "result": True,
+        },
+    }
+    with pytest.raises(ValueError, match="No nodes"):
+        GraphFlattener().flatten_multiple([])
+
+
+def test_flat_graph_shared_load_collection(cubes):
+    multi = MultiResult(cubes, format="GTiff")
+    graph = multi.flat_graph()
+    assert [n["process_id"] for n in graph.values()].count("load_collection") == 1
+    save_results = {k: n for k, n in graph.items() if n["process_id"] == "save_result"}
+    assert [n["arguments"]["format"] for n in save_results.values()] == ["GTiff", "GTiff", "netCDF"]
+    assert [k for k, n in graph.items() if n.get("result")] == ["saveresult3"]
+    assert list(multi.outputs) == ["ndvi", "composite", "red"]
+    assert '"saveresult1"' in multi.to_json()
+
+
+def test_list_of_cubes(con100):
+    cube = con100.load_collection("S2")
+    multi = MultiResult([cube.ndvi(), cube.max_time()])
+    assert list(multi.outputs) == ["output1", "output2"]
+
+
+def test_filename_prefix(cubes):
+    multi = MultiResult(cubes)
+    options = [n.arguments["options"] for n in multi.result_nodes()]
+    assert options == [{"filename_prefix": "ndvi"}, {"filename_prefix": "composite"}, {}]
+
+
+def test_filename_prefix_disabled(cubes):
+    multi = MultiResult(cubes, filename_prefix=False)
+    options = [n.arguments["options"] for n in multi.result_nodes()]
+    assert options == [{}, {}, {}]
+
+
+def test_invalid(con100, cubes):
+    with pytest.raises(OpenEoClientException, match="No result cubes"):
+        MultiResult({})
+    saved = cubes["ndvi"].save_result()
+    with pytest.raises(OpenEoClientException, match="distinct `save_result` nodes"):
+        MultiResult({"a": saved, "b": saved})
+
+
+def test_optimizer_keeps_multiple_outputs(cubes, caplog):
+    caplog.set_level(logging.INFO)
+    graph = MultiResult(cubes).flat_graph()
+    assert GraphOptimizer().optimize(graph) is graph
+    assert "multiple output nodes" in caplog.text
+
+
+def test_create_job_and_get_assets(con100, cubes, requests_mock):
+    def create_job(request, context):
+        graph = request.json()["process"]["process_graph"]
+        assert [n["process_id"] for n in graph.values()].count("load_collection") == 1
+        assert [n["process_id"] for n in graph.values()].count("save_result") == 3
+        context.status_code = 201
+        context.headers["OpenEO-Identifier"] = "j-123"
+        return ""
+
+    requests_mock.post(API_URL + "/jobs", text=create_job)
+    requests_mock.get(API_URL + "/jobs/j-123/results", json={"assets": {
+        "ndvi_2022-01-01.tif": {"href": API_URL + "/a1", "type": "image/tiff; application=geotiff"},
+        "ndvi_2022-01-02.tif": {"href": API_URL + "/a2", "type": "image/tiff; application=geotiff"},
+        "composite.tif": {"href": API_URL + "/a3", "type": "image/tiff; application=geotiff"},
+        "openEO.nc": {"href": API_URL + "/a4", "type": "application/x-netcdf"},
+        "other.tif": {"href": API_URL + "/a5", "type": "image/tiff"},
+    }})
+    multi = MultiResult(cubes)
+    job = multi.create_job(title="Multi")
+    assert job.job_id == "j-123"
+    assets = multi.get_assets(job)
+    assert {name: [a.name for a in a_list] for name, a_list in assets.items()} == {
+        "ndvi": ["ndvi_2022-01-01.tif", "ndvi_2022-01-02.tif"],
+        "composite": ["composite.tif"],
+        "red": ["openEO.nc"],
+    }
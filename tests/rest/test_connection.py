@@ -1,9 +1,11 @@
+import concurrent.futures
 import json
 import logging
 import os
 import random
 import re
 import textwrap
+import time
 import typing
 import unittest.mock as mock
 import zlib
@@ -14,10 +16,13 @@ import requests.auth
 import requests_mock
 
 import openeo
+from openeo.api.process import Parameter
 from openeo.capabilities import ComparableVersion
 from openeo.internal.graph_building import PGNode
+from openeo.internal.optimizer.base import GraphOptimizer
 from openeo.rest import OpenEoClientException, OpenEoApiError, OpenEoRestError
-from openeo.rest.auth.auth import NullAuth, BearerAuth
+from openeo.rest.auth.auth import NullAuth, BearerAuth, OidcBearerAuth
+from openeo.rest.auth.config import RefreshTokenStore
 from openeo.rest.auth.oidc import OidcException
 from openeo.rest.connection import Connection, RestApiConnection, connect, paginate
 from openeo.util import ContextTimer
@@ -1497,6 +1502,86 @@ def test_authenticate_oidc_auto_refresh_expired_access_token_initial_refresh_tok
     }
 
 
+def test_authenticate_oidc_proactive_refresh_access_token(requests_mock, refresh_token_store, caplog):
+    requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+    client_id = "myclient"
+    initial_refresh_token = "r3fr35h!"
+    requests_mock.get(API_URL + 'credentials/oidc', json={
+        "providers": [{"id": "oi", "issuer": "https://oidc.test", "title": "example", "scopes": ["openid"]}]
+    })
+    oidc_mock = OidcMock(
+        requests_mock=requests_mock,
+        expected_grant_type="refresh_token",
+        expected_client_id=client_id,
+        oidc_discovery_url="https://oidc.test/.well-known/openid-configuration",
+        expected_fields={"refresh_token": initial_refresh_token},
+        access_token_lifetime=1000,
+    )
+    _setup_get_me_handler(requests_mock=requests_mock, oidc_mock=oidc_mock)
+    caplog.set_level(logging.INFO)
+
+    conn = Connection(API_URL, refresh_token_store=refresh_token_store)
+    conn.authenticate_oidc_refresh_token(refresh_token=initial_refresh_token, client_id=client_id)
+    access_token1 = oidc_mock.state["access_token"]
+    assert conn.describe_account()["_used_access_token"] == access_token1
+    assert [h["grant_type"] for h in oidc_mock.grant_request_history] == ["refresh_token"]
+
+    # Access token is about to expire: should be refreshed before doing request.
+    with mock.patch.object(OidcBearerAuth, "_clock", new=mock.Mock(return_value=time.time() + 990)):
+        oidc_mock.invalidate_access_token()
+        assert conn.describe_account()["_used_access_token"] == oidc_mock.state["access_token"]
+    assert oidc_mock.state["access_token"] != access_token1
+    assert [h["grant_type"] for h in oidc_mock.grant_request_history] == ["refresh_token", "refresh_token"]
+    assert "Proactively refreshed OIDC access token" in caplog.text
+    assert "TokenInvalid" not in caplog.text
+
+
+def test_authenticate_oidc_refresh_token_shared_access_token_cache(requests_mock, refresh_token_store, caplog):
+    requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+    client_id = "myclient"
+    refresh_token = "r3fr35h!"
+    requests_mock.get(API_URL + 'credentials/oidc', json={
+        "providers": [{"id": "oi", "issuer": "https://oidc.test", "title": "example", "scopes": ["openid"]}]
+    })
+    oidc_mock = OidcMock(
+        requests_mock=requests_mock,
+        expected_grant_type="refresh_token",
+        expected_client_id=client_id,
+        oidc_discovery_url="https://oidc.test/.well-known/openid-configuration",
+        expected_fields={"refresh_token": refresh_token},
+        access_token_lifetime=1000,
+    )
+    _setup_get_me_handler(requests_mock=requests_mock, oidc_mock=oidc_mock)
+    refresh_token_store.set_refresh_token(issuer="https://oidc.test", client_id=client_id, refresh_token=refresh_token)
+    caplog.set_level(logging.INFO)
+
+    # First connection does refresh token flow and caches access token.
+    conn1 = Connection(API_URL, refresh_token_store=refresh_token_store)
+    conn1.authenticate_oidc_refresh_token(client_id=client_id)
+    access_token = oidc_mock.state["access_token"]
+    assert conn1.describe_account()["_used_access_token"] == access_token
+    assert [h["grant_type"] for h in oidc_mock.grant_request_history] == ["refresh_token"]
+    assert refresh_token_store.get_access_token(issuer="https://oidc.test", client_id=client_id) == access_token
+
+    # Other connections (e.g. in other processes) reuse the cached access token.
+    for authenticate in [
+        lambda c: c.authenticate_oidc_refresh_token(client_id=client_id),
+        lambda c: c.authenticate_oidc(client_id=client_id),
+    ]:
+        conn = Connection(API_URL, refresh_token_store=RefreshTokenStore(path=refresh_token_store.path))
+        authenticate(conn)
+        assert conn.describe_account()["_used_access_token"] == access_token
+        assert [h["grant_type"] for h in oidc_mock.grant_request_history] == ["refresh_token"]
+    assert "Using cached OIDC access token" in caplog.text
+
+    # Rejected access token is dropped from cache.
+    oidc_mock.invalidate_access_token()
+    conn.describe_account()
+    assert [h["grant_type"] for h in oidc_mock.grant_request_history] == ["refresh_token", "refresh_token"]
+    new_access_token = refresh_token_store.get_access_token(issuer="https://oidc.test", client_id=client_id)
+    assert new_access_token not in [None, access_token]
+
+
 @pytest.mark.parametrize(["invalidate"], [
     (False,),
     (True,),
@@ -1844,6 +1929,22 @@ def test_list_processes(requests_mock):
     assert m.call_count == 1
 
 
+def test_list_processes_concurrent(requests_mock):
+    requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+    processes = [{"id": "add"}, {"id": "mask"}]
+
+    def get_processes(request, context):
+        time.sleep(0.1)
+        return {"processes": processes}
+
+    m = requests_mock.get(API_URL + "processes", json=get_processes)
+    conn = Connection(API_URL)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: conn.describe_process("mask"), range(8)))
+    assert results == [{"id": "mask"}] * 8
+    assert m.call_count == 1
+
+
 def test_list_processes_error(requests_mock):
     requests_mock.get(API_URL, json={"api_version": "1.0.0"})
     conn = Connection(API_URL)
@@ -1877,6 +1978,27 @@ def test_list_processes_namespace(requests_mock):
     conn = Connection(API_URL)
     assert conn.list_processes(namespace="foo") == processes
     assert m.call_count == 1
+    # Check caching
+    assert conn.list_processes(namespace="foo") == processes
+    assert m.call_count == 1
+
+
+def test_describe_process_namespace(requests_mock):
+    requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+    add = {"id": "add", "parameters": [{"name": "x", "schema": {"type": "number"}}]}
+    mask = {"id": "mask"}
+    m_add = requests_mock.get(API_URL + "processes/foo/add", json=add)
+    m_mask = requests_mock.get(API_URL + "processes/foo/mask", status_code=404, json={"code": "NotFound"})
+    m_list = requests_mock.get(API_URL + "processes/foo", json={"processes": [add, mask]})
+    conn = Connection(API_URL)
+    assert conn.describe_process("add", namespace="foo") == add
+    assert conn.describe_process_parameters("add", namespace="foo") == {"x": {"type": "number"}}
+    assert (m_add.call_count, m_mask.call_count, m_list.call_count) == (1, 0, 0)
+    assert conn.describe_process("mask", namespace="foo") == mask
+    assert (m_add.call_count, m_mask.call_count, m_list.call_count) == (1, 1, 1)
+    with pytest.raises(OpenEoClientException, match="Process does not exist"):
+        conn.describe_process("nope", namespace="foo")
+    assert (m_add.call_count, m_mask.call_count, m_list.call_count) == (1, 1, 1)
 
 
 def test_get_job(requests_mock):
@@ -2045,6 +2167,147 @@ def test_download_content_encoding(requests_mock, tmp_path, content_encoding, co
         assert f.read() == tiff_data
 
 
+@pytest.mark.parametrize(["content_encoding", "compress"], [
+    ("gzip", _gzip_compress),
+    ("deflate", _deflate_compress),
+])
+def test_download_content_encoding_chunked(requests_mock, tmp_path, content_encoding, compress):
+    requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+    tiff_data = bytes(random.randrange(0, 8) for _ in range(100000))
+    requests_mock.post(
+        API_URL + "result", content=compress(tiff_data), headers={"Content-Encoding": content_encoding}
+    )
+    conn = Connection(API_URL, download_chunk_size=1000)
+    output = tmp_path / "result.tiff"
+    conn.download(graph={}, outputfile=output)
+    with output.open("rb") as f:
+        assert f.read() == tiff_data
+
+
+def _decompress_request_body(request) -> dict:
+    encoding = request.headers.get("Content-Encoding")
+    body = request.body
+    if encoding == "gzip":
+        body = zlib.decompress(body, wbits=16 + zlib.MAX_WBITS)
+    elif encoding == "deflate":
+        body = zlib.decompress(body)
+    return json.loads(body)
+
+
+class TestOptimizeProcessGraphs:
+
+    @pytest.fixture
+    def process_graph(self) -> dict:
+        return {
+            "divide1": {"process_id": "divide", "arguments": {"x": 1, "y": 10000}},
+            "foo1": {"process_id": "foo", "arguments": {"scale": {"from_node": "divide1"}}, "result": True},
+        }
+
+    def test_default_no_optimization(self, requests_mock, process_graph):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        m = requests_mock.post(API_URL + "result", content=b"ok")
+        conn = Connection(API_URL)
+        assert conn.graph_optimizer is None
+        conn.download(process_graph)
+        assert m.last_request.json() == {"process": {"process_graph": process_graph}}
+
+    @pytest.mark.parametrize("optimize", [True, "GraphOptimizer"])
+    def test_optimize(self, requests_mock, process_graph, optimize):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        m = requests_mock.post(API_URL + "result", content=b"ok")
+        if optimize == "GraphOptimizer":
+            optimize = GraphOptimizer()
+        conn = Connection(API_URL, optimize_process_graphs=optimize)
+        conn.download(process_graph)
+        assert m.last_request.json() == {"process": {"process_graph": {
+            "foo1": {"process_id": "foo", "arguments": {"scale": 0.0001}, "result": True},
+        }}}
+
+    def test_optimize_from_config(self, requests_mock, process_graph, custom_client_config):
+        custom_client_config.write_text("[Connection]\noptimize_process_graphs = true\n")
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        m = requests_mock.post(API_URL + "jobs", status_code=201, headers={"OpenEO-Identifier": "j-123"})
+        conn = Connection(API_URL)
+        conn.create_job(process_graph)
+        assert m.last_request.json()["process"]["process_graph"] == {
+            "foo1": {"process_id": "foo", "arguments": {"scale": 0.0001}, "result": True},
+        }
+
+    def test_optimize_invalid_graph(self, requests_mock, caplog):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        m = requests_mock.post(API_URL + "result", content=b"ok")
+        conn = Connection(API_URL, optimize_process_graphs=True)
+        conn.download({"foo1": {"process_id": "foo", "arguments": {}}})
+        assert m.last_request.json() == {"process": {"process_graph": {"foo1": {"process_id": "foo", "arguments": {}}}}}
+        assert "Skipping optimization of invalid process graph" in caplog.text
+
+
+class TestRequestCompression:
+
+    @pytest.fixture
+    def large_process_graph(self) -> dict:
+        coordinates = [[[i / 100, i / 100 + 1] for i in range(1000)]]
+        return {"foo1": {"process_id": "foo", "arguments": {"geometry": coordinates}, "result": True}}
+
+    def test_default_no_compression(self, requests_mock, large_process_graph):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        m = requests_mock.post(API_URL + "result", content=b"ok")
+        conn = Connection(API_URL)
+        conn.download(large_process_graph)
+        assert "Content-Encoding" not in m.last_request.headers
+        assert m.last_request.json() == {"process": {"process_graph": large_process_graph}}
+
+    @pytest.mark.parametrize("request_compression", ["gzip", "deflate"])
+    def test_compression(self, requests_mock, large_process_graph, request_compression):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        m = requests_mock.post(API_URL + "result", content=b"ok")
+        conn = Connection(API_URL, request_compression=request_compression)
+        assert conn.download(large_process_graph) == b"ok"
+        request = m.last_request
+        assert request.headers["Content-Encoding"] == request_compression
+        assert request.headers["Content-Type"] == "application/json"
+        assert len(request.body) < len(json.dumps(large_process_graph))
+        assert _decompress_request_body(request) == {"process": {"process_graph": large_process_graph}}
+
+    def test_compression_small_body(self, requests_mock):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        m = requests_mock.post(API_URL + "result", content=b"ok")
+        conn = Connection(API_URL, request_compression="gzip")
+        conn.download({"add": {"process_id": "add", "arguments": {"x": 3, "y": 5}, "result": True}})
+        assert "Content-Encoding" not in m.last_request.headers
+
+    def test_compression_from_config(self, requests_mock, large_process_graph, custom_client_config):
+        custom_client_config.write_text("[Connection]\nrequest_compression = gzip\n")
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        m = requests_mock.post(API_URL + "result", content=b"ok")
+        conn = Connection(API_URL)
+        conn.download(large_process_graph)
+        assert m.last_request.headers["Content-Encoding"] == "gzip"
+
+    def test_compression_unsupported_by_backend(self, requests_mock, large_process_graph, caplog):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+
+        def post_result(request, context):
+            if "Content-Encoding" in request.headers:
+                context.status_code = 415
+                return json.dumps({"code": "UnsupportedMediaType", "message": "No compression please"})
+            return "ok"
+
+        m = requests_mock.post(API_URL + "result", text=post_result)
+        conn = Connection(API_URL, request_compression="gzip")
+        assert conn.download(large_process_graph) == b"ok"
+        assert [r.headers.get("Content-Encoding") for r in m.request_history] == ["gzip", None]
+        assert "disabling request compression" in caplog.text
+        # Compression stays disabled afterwards.
+        assert conn.download(large_process_graph) == b"ok"
+        assert [r.headers.get("Content-Encoding") for r in m.request_history] == ["gzip", None, None]
+
+    def test_invalid_compression(self, requests_mock):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        with pytest.raises(OpenEoClientException, match="Unsupported request compression 'zip'"):
+            Connection(API_URL, request_compression="zip")
+
+
 def test_paginate_basic(requests_mock):
     requests_mock.get(API_URL, json={"api_version": "1.0.0"})
     requests_mock.get(
@@ -2526,3 +2789,100 @@ class TestExecute:
         conn = Connection(API_URL)
         job = conn.create_job(url)
         assert job.job_id == "j-123"
+
+
+class TestJobTemplate:
+
+    def test_create_jobs_from_template(self, requests_mock):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        posted = []
+
+        def post_jobs(request, context):
+            assert request.headers["Content-Type"] == "application/json"
+            posted.append(request.json())
+            context.headers["OpenEO-Identifier"] = "j-{n}".format(n=len(posted))
+
+        requests_mock.post(API_URL + "jobs", status_code=201, text=post_jobs)
+
+        conn = Connection(API_URL)
+        bbox = Parameter("bbox", "Bounding box")
+        pg = PGNode("load_collection", id="S2", spatial_extent=bbox, temporal_extent=["2021-06-01", "2021-09-01"])
+        template = conn.build_job_template(
+            pg, parameters=[bbox, "title"], title={"from_parameter": "title"}, additional={"memory": "2G"}
+        )
+        assert template.parameters == ["bbox", "title"]
+
+        job1 = conn.create_job_from_template(template, bbox={"west": 1, "south": 2, "east": 3, "north": 4}, title="A")
+        job2 = conn.create_job_from_template(template, bbox={"west": 5, "south": 6, "east": 7, "north": 8}, title="B")
+        assert (job1.job_id, job2.job_id) == ("j-1", "j-2")
+        assert posted == [
+            {
+                "title": "A",
+                "process": {"process_graph": {"loadcollection1": {
+                    "process_id": "load_collection",
+                    "arguments": {
+                        "id": "S2", "spatial_extent": {"west": 1, "south": 2, "east": 3, "north": 4},
+                        "temporal_extent": ["2021-06-01", "2021-09-01"],
+                    },
+                    "result": True,
+                }}},
+                "job_options": {"memory": "2G"},
+            },
+            {
+                "title": "B",
+                "process": {"process_graph": {"loadcollection1": {
+                    "process_id": "load_collection",
+                    "arguments": {
+                        "id": "S2", "spatial_extent": {"west": 5, "south": 6, "east": 7, "north": 8},
+                        "temporal_extent": ["2021-06-01", "2021-09-01"],
+                    },
+                    "result": True,
+                }}},
+                "job_options": {"memory": "2G"},
+            },
+        ]
+
+    def test_template_request_compression(self, requests_mock, caplog):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        bodies = []
+
+        def post_jobs(request, context):
+            if request.headers.get("Content-Encoding") == "deflate":
+                if len(bodies) == 1:
+                    # Back-end stops supporting compression after the first job.
+                    context.status_code = 415
+                    return json.dumps({"code": "UnsupportedMediaType", "message": "No compression please"})
+                bodies.append(_decompress_request_body(request))
+            else:
+                bodies.append(request.json())
+            assert request.headers["Content-Type"] == "application/json"
+            context.status_code = 201
+            context.headers["OpenEO-Identifier"] = "j-{n}".format(n=len(bodies))
+            return ""
+
+        m = requests_mock.post(API_URL + "jobs", text=post_jobs)
+        conn = Connection(API_URL, request_compression="deflate")
+        geometry = {"type": "Polygon", "coordinates": {"from_parameter": "coordinates"}}
+        pg = PGNode("load_collection", id="S2", spatial_extent=geometry, temporal_extent=None)
+        template = conn.build_job_template(pg)
+        coordinates = [[[i / 100, i / 100 + 1] for i in range(1000)]]
+
+        job1 = conn.create_job_from_template(template, coordinates=coordinates)
+        job2 = conn.create_job_from_template(template, coordinates=coordinates)
+        assert (job1.job_id, job2.job_id) == ("j-1", "j-2")
+        assert [r.headers.get("Content-Encoding") for r in m.request_history] == ["deflate", "deflate", None]
+        assert "disabling request compression" in caplog.text
+        assert bodies[0] == bodies[1]
+        assert bodies[0]["process"]["process_graph"]["loadcollection1"]["arguments"]["spatial_extent"] == {
+            "type": "Polygon", "coordinates": coordinates,
+        }
+
+    def test_template_missing_value(self, requests_mock):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        post_mock = requests_mock.post(API_URL + "jobs", status_code=201)
+        conn = Connection(API_URL)
+        pg = PGNode("load_collection", id="S2", spatial_extent={"from_parameter": "bbox"}, temporal_extent=None)
+        template = conn.build_job_template(pg)
+        with pytest.raises(OpenEoClientException, match="No value for template parameter 'bbox'"):
+            conn.create_job_from_template(template)
+        assert post_mock.call_count == 0
@@ -0,0 +1,173 @@
+import itertools
+import re
+
+import pytest
+
+from openeo.internal.graph_building import PGNode
+from openeo.rest.connection import Connection
+from openeo.rest.jobindex import JobIndex, get_job_index, graph_hash
+
+API_URL = "https://oeo.test"
+
+GRAPH = {
+    "lc": {"process_id": "load_collection", "arguments": {"id": "S2"}},
+    "sr": {"process_id": "save_result", "arguments": {"data": {"from_node": "lc"}, "format": "GTiff"}, "result": True},
+}
+
+
+def test_graph_hash_canonical():
+    renamed = {
+        "saveresult1": {
+            "result": True, "process_id": "save_result", "arguments": {"format": "GTiff", "data": {"from_node": "x"}}
+        },
+        "x": {"arguments": {"id": "S2"}, "process_id": "load_collection"},
+    }
+    assert graph_hash(GRAPH) == graph_hash(renamed)
+    assert graph_hash(GRAPH) == graph_hash({"process_graph": GRAPH})
+    assert graph_hash(GRAPH) == graph_hash(PGNode.from_flat_graph(GRAPH))
+    other = {**GRAPH, "lc": {"process_id": "load_collection", "arguments": {"id": "S1"}}}
+    assert graph_hash(GRAPH) != graph_hash(other)
+
+
+def test_graph_hash_multiple_outputs():
+    extra = {"process_id": "save_result", "arguments": {"data": {"from_node": "lc"}, "format": "netCDF"}}
+    assert graph_hash({**GRAPH, "sr2": extra}) != graph_hash(GRAPH)
+
+
+def test_get_job_index(tmp_path):
+    assert get_job_index(None) is None
+    assert get_job_index(False) is None
+    assert get_job_index("false") is None
+    assert isinstance(get_job_index(True), JobIndex)
+    assert isinstance(get_job_index("yes"), JobIndex)
+    index = JobIndex()
+    assert get_job_index(index) is index
+    assert repr(get_job_index(str(tmp_path / "index.json"))).endswith("index.json'>")
+
+
+class TestJobReuse:
+
+    @pytest.fixture
+    def backend(self, requests_mock):
+        """Fake back-end where created jobs are finished immediately."""
+        state = {"created": [], "started": [], "status": {}, "results": {}}
+        counter = itertools.count()
+        job_url = re.escape(API_URL) + r"/jobs/(j\d+)"
+
+        def create_job(request, context):
+            job_id = f"j{next(counter)}"
+            state["created"].append(job_id)
+            state["status"][job_id] = "created"
+            context.status_code = 201
+            context.headers["OpenEO-Identifier"] = job_id
+            return ""
+
+        def start_job(request, context):
+            job_id = request.path.split("/")[2]
+            state["started"].append(job_id)
+            state["status"][job_id] = "finished"
+            context.status_code = 202
+            return ""
+
+        def get_results(request, context):
+            job_id = request.path.split("/")[2]
+            if job_id in state["results"]:
+                return state["results"][job_id]
+            return {"assets": {"out.tif": {"href": f"{API_URL}/download/{job_id}"}}}
+
+        requests_mock.get(API_URL + "/", json={"api_version": "1.0.0"})
+        requests_mock.post(API_URL + "/jobs", text=create_job)
+        requests_mock.post(re.compile(job_url + "/results$"), text=start_job)
+        requests_mock.get(re.compile(job_url + "/results$"), json=get_results)
+        requests_mock.get(
+            re.compile(job_url + "$"),
+            json=lambda request, context: {
+                "id": request.path.split("/")[2], "status": state["status"][request.path.split("/")[2]]
+            },
+        )
+        return state
+
+    def test_no_index_by_default(self, backend):
+        con = Connection(API_URL)
+        assert con.job_index is None
+        con.create_job(GRAPH)
+        con.create_job(GRAPH)
+        assert backend["created"] == ["j0", "j1"]
+
+    def test_reuse_finished_job(self, backend):
+        con = Connection(API_URL, job_index=True)
+        job = con.create_job(GRAPH)
+        assert not job.is_reused()
+        # Not finished yet: create a new job.
+        job = con.create_job(GRAPH)
+        job.start_and_wait(print=lambda m: None, max_poll_interval=0)
+        assert backend["created"] == ["j0", "j1"]
+
+        reused = con.create_job(GRAPH)
+        assert reused.job_id == "j1"
+        assert reused.is_reused()
+        # No restart of reused job.
+        reused.run_synchronous(print=lambda m: None, max_poll_interval=0)
+        assert backend["started"] == ["j1"]
+        assert reused.get_results().get_asset().href == API_URL + "/download/j1"
+
+        # Different graph: new job.
+        con.create_job({**GRAPH, "lc": {"process_id": "load_collection", "arguments": {"id": "S1"}}})
+        assert backend["created"] == ["j0", "j1", "j2"]
+
+    def test_failed_job_not_reused(self, backend):
+        con = Connection(API_URL, job_index=True)
+        con.create_job(GRAPH)
+        backend["status"]["j0"] = "error"
+        assert con.create_job(GRAPH).job_id == "j1"
+        backend["status"]["j1"] = "finished"
+        assert con.create_job(GRAPH).job_id == "j1"
+
+    def test_expired_results(self, backend):
+        con = Connection(API_URL, job_index=True)
+        con.create_job(GRAPH)
+        backend["status"]["j0"] = "finished"
+        backend["results"]["j0"] = {"assets": {}, "expires": "2000-01-01T00:00:00Z"}
+        assert con.create_job(GRAPH).job_id == "j1"
+        backend["status"]["j1"] = "finished"
+        backend["results"]["j1"] = {"assets": {}, "expires": "2100-01-01T00:00:00Z"}
+        assert con.create_job(GRAPH).job_id == "j1"
+
+    def test_persistent_index(self, backend, tmp_path):
+        path = tmp_path / "job-index.json"
+        con = Connection(API_URL, job_index=str(path))
+        con.create_job(GRAPH)
+        backend["status"]["j0"] = "finished"
+        # New session with the same index file.
+        con = Connection(API_URL, job_index=JobIndex(path=path))
+        assert con.create_job(GRAPH).job_id == "j0"
+        assert backend["created"] == ["j0"]
+
+    def test_populate(self, backend, requests_mock):
+        requests_mock.get(API_URL + "/jobs", json={"jobs": [
+            {"id": "old1", "status": "finished"},
+            {"id": "old2", "status": "error"},
+        ]})
+        requests_mock.get(
+            API_URL + "/jobs/old1", json={"id": "old1", "status": "finished", "process": {"process_graph": GRAPH}}
+        )
+        requests_mock.get(API_URL + "/jobs/old1/results", json={"assets": {}})
+        con = Connection(API_URL, job_index=True)
+        assert con.job_index.populate(con) == 1
+        assert con.job_index.populate(con) == 0
+        job = con.create_job(GRAPH)
+        assert job.job_id == "old1"
+        assert backend["created"] == []
+
+    def test_datacube_execute_batch(self, backend, requests_mock, tmp_path):
+        requests_mock.get(API_URL + "/collections/S2", json={"id": "S2"})
+        requests_mock.get(API_URL + "/file_formats", json={"output": {"GTiff": {"gis_data_types": ["raster"]}}})
+        requests_mock.get(re.compile(re.escape(API_URL) + r"/download/j\d+"), content=b"tiff data")
+        con = Connection(API_URL, job_index=True)
+        cube = con.load_collection("S2")
+        cube.execute_batch(tmp_path / "a.tif", print=lambda m: None, max_poll_interval=0)
+        job = cube.execute_batch(tmp_path / "b.tif", print=lambda m: None, max_poll_interval=0)
+        assert job.job_id == "j0"
+        assert backend["created"] == ["j0"]
+        assert backend["started"] == ["j0"]
+        assert (tmp_path / "b.tif").read_bytes() == b"tiff data"
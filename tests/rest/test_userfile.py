@@ -0,0 +1,224 @@
+import io
+import json
+import re
+
+import pytest
+
+import openeo
+from openeo.rest import OpenEoClientException
+from openeo.rest.connection import Connection
+from openeo.rest.userfile import GeometryStore, UserFile
+from .auth.test_cli import refresh_token_store
+from .auth.test_oidc import OidcMock
+
+API_URL = "https://oeo.test"
+FILES_URL = re.compile(re.escape(API_URL) + r"/files/.+")
+
+
+def _body(request) -> bytes:
+    """Request body as bytes (also for streamed/chunked bodies)."""
+    body = request.body
+    if isinstance(body, bytes):
+        return body
+    return b"".join(body)
+
+
+@pytest.fixture
+def con100(requests_mock):
+    requests_mock.get(API_URL + "/", json={"api_version": "1.0.0"})
+    requests_mock.get(API_URL + "/collections/S2", json={
+        "cube:dimensions": {"bands": {"type": "bands", "values": ["B02", "B03"]}}
+    })
+    return openeo.connect(API_URL)
+
+
+class TestUserFile:
+
+    def test_create_file(self, con100):
+        f = con100.create_file("data/polygons.geojson")
+        assert isinstance(f, UserFile)
+        assert str(f.path) == "data/polygons.geojson"
+        assert f.to_dict() == {"path": "data/polygons.geojson"}
+
+    def test_upload_path_chunked(self, con100, requests_mock, tmp_path):
+        source = tmp_path / "polygons.geojson"
+        source.write_bytes(b"0123456789" * 10)
+        bodies = []
+
+        def put(request, context):
+            assert request.headers["Content-Type"] == "application/octet-stream"
+            bodies.append(list(request.body))
+            return {"path": "polygons.geojson", "size": 100}
+
+        requests_mock.put(API_URL + "/files/polygons.geojson", json=put)
+        f = con100.upload_file(source, chunk_size=30)
+        assert str(f.path) == "polygons.geojson"
+        assert f.metadata == {"path": "polygons.geojson", "size": 100}
+        assert bodies == [[b"0123456789" * 3] * 3 + [b"0123456789"]]
+
+    def test_upload_file_object(self, con100, requests_mock):
+        upload = requests_mock.put(API_URL + "/files/dir/data%20file.bin", json={"path": "dir/data file.bin"})
+        con100.upload_file(io.BytesIO(b"hello world"), target="dir/data file.bin")
+        assert _body(upload.last_request) == b"hello world"
+
+    @pytest.fixture
+    def oidc_con(self, requests_mock, refresh_token_store):
+        """Connection with refresh token based OIDC auth, where the access token can be invalidated."""
+        requests_mock.get(API_URL + "/", json={"api_version": "1.0.0"})
+        requests_mock.get(API_URL + "/credentials/oidc", json={
+            "providers": [{"id": "oi", "issuer": "https://oidc.test", "title": "example", "scopes": ["openid"]}]
+        })
+        oidc_mock = OidcMock(
+            requests_mock=requests_mock,
+            expected_grant_type="refresh_token",
+            expected_client_id="myclient",
+            oidc_discovery_url="https://oidc.test/.well-known/openid-configuration",
+            expected_fields={"refresh_token": "r3fr35h!"},
+        )
+        con = Connection(API_URL, refresh_token_store=refresh_token_store)
+        con.authenticate_oidc_refresh_token(refresh_token="r3fr35h!", client_id="myclient", store_refresh_token=True)
+        return con, oidc_mock
+
+    @pytest.mark.parametrize("use_path", [True, False])
+    def test_upload_retry_after_token_refresh(self, oidc_con, requests_mock, tmp_path, use_path):
+        con, oidc_mock = oidc_con
+        source = tmp_path / "data.bin"
+        source.write_bytes(b"0123456789" * 10)
+        bodies = []
+
+        def put(request, context):
+            # Consume the streamed body, like an actual transport would.
+            bodies.append(_body(request))
+            if request.headers["Authorization"] != "Bearer oidc/oi/" + oidc_mock.state["access_token"]:
+                context.status_code = 403
+                return {"code": "TokenInvalid", "message": "Invalid token"}
+            return {"path": "data.bin"}
+
+        requests_mock.put(API_URL + "/files/data.bin", json=put)
+        oidc_mock.invalidate_access_token()
+        if use_path:
+            con.upload_file(source, chunk_size=30)
+        else:
+            with source.open("rb") as f:
+                con.upload_file(f, target="data.bin", chunk_size=30)
+        assert [h["grant_type"] for h in oidc_mock.grant_request_history] == ["refresh_token", "refresh_token"]
+        assert bodies == [b"0123456789" * 10] * 2
+
+    def test_upload_retry_non_seekable(self, oidc_con, requests_mock):
+        con, oidc_mock = oidc_con
+
+        class Stream(io.RawIOBase):
+            def __init__(self):
+                self._data = io.BytesIO(b"hello world")
+
+            def readable(self):
+                return True
+
+            def read(self, size=-1):
+                return self._data.read(size)
+
+        def put(request, context):
+            _body(request)
+            context.status_code = 403
+            return {"code": "TokenInvalid", "message": "Invalid token"}
+
+        requests_mock.put(API_URL + "/files/data.bin", json=put)
+        oidc_mock.invalidate_access_token()
+        with pytest.raises(OpenEoClientException, match="Can not replay upload from non-seekable file object"):
+            con.upload_file(Stream(), target="data.bin")
+
+    def test_upload_in_memory_without_target(self, con100):
+        with pytest.raises(OpenEoClientException, match="Target path is required"):
+            con100.upload_file(b"hello")
+
+    def test_download(self, con100, requests_mock, tmp_path):
+        requests_mock.get(API_URL + "/files/dir/data.txt", content=b"hello world")
+        path = con100.create_file("dir/data.txt").download(tmp_path)
+        assert path == tmp_path / "data.txt"
+        assert path.read_bytes() == b"hello world"
+
+    def test_delete(self, con100, requests_mock):
+        delete = requests_mock.delete(API_URL + "/files/data.txt", status_code=204)
+        con100.create_file("data.txt").delete()
+        assert delete.called
+
+
+POLYGON = {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]}
+
+
+class TestGeometryStore:
+
+    @pytest.fixture
+    def files(self, requests_mock):
+        """Fake user workspace."""
+        files = {}
+
+        def put(request, context):
+            path = request.path[len("/files/"):]
+            files[path] = _body(request)
+            return {"path": path, "size": len(files[path])}
+
+        requests_mock.get(API_URL + "/files", json=lambda r, c: {
+            "files": [{"path": p, "size": len(d)} for p, d in files.items()], "links": []
+        })
+        requests_mock.put(FILES_URL, json=put)
+        return files
+
+    def test_upload_once(self, con100, files, requests_mock):
+        store = GeometryStore(con100, prefix="geoms")
+        f1 = store.upload(POLYGON)
+        f2 = store.upload(json.loads(json.dumps(POLYGON)))
+        assert f1.path == f2.path
+        assert str(f1.path).startswith("geoms/") and str(f1.path).endswith(".geojson")
+        assert len(files) == 1
+        assert json.loads(files[str(f1.path)]) == POLYGON
+        assert sum(r.method == "PUT" for r in requests_mock.request_history) == 1
+
+    def test_key_order_independent(self, con100, files):
+        store = GeometryStore(con100)
+        reordered = {"coordinates": POLYGON["coordinates"], "type": "Polygon"}
+        assert store.upload(POLYGON).path == store.upload(reordered).path
+
+    def test_existing_file(self, con100, files, requests_mock):
+        GeometryStore(con100).upload(POLYGON)
+        # New store (e.g. new session): geometry already in workspace
+        store = GeometryStore(con100)
+        store.upload(POLYGON)
+        assert sum(r.method == "PUT" for r in requests_mock.request_history) == 1
+
+    def test_reference(self, con100, files):
+        node = GeometryStore(con100, prefix="g").reference(POLYGON)
+        assert node.process_id == "read_vector"
+        assert node.arguments["filename"] in {f"{p}" for p in files}
+
+
+class TestGeometryUpload:
+
+    @pytest.fixture
+    def files(self, requests_mock):
+        requests_mock.get(API_URL + "/files", json={"files": [], "links": []})
+        return requests_mock.put(FILES_URL, json={})
+
+    def test_disabled_by_default(self, con100, files):
+        cube = con100.load_collection("S2").mask_polygon(POLYGON)
+        assert cube.flat_graph()["maskpolygon1"]["arguments"]["mask"] == POLYGON
+        assert not files.called
+
+    def test_large_geometry(self, requests_mock, files):
+        requests_mock.get(API_URL + "/", json={"api_version": "1.0.0"})
+        requests_mock.get(API_URL + "/collections/S2", json={
+            "cube:dimensions": {"bands": {"type": "bands", "values": ["B02", "B03"]}}
+        })
+        con = Connection(API_URL, geometry_upload_min_size=50)
+        small = {"type": "Point", "coordinates": [1, 2]}
+        cube = con.load_collection("S2").mask_polygon(POLYGON).aggregate_spatial(small, "mean")
+        graph = cube.flat_graph()
+        assert graph["readvector1"]["process_id"] == "read_vector"
+        path = graph["readvector1"]["arguments"]["filename"]
+        assert path.startswith(GeometryStore.DEFAULT_PREFIX + "/")
+        assert graph["maskpolygon1"]["arguments"]["mask"] == {"from_node": "readvector1"}
+        assert graph["aggregatespatial1"]["arguments"]["geometries"] == small
+        assert files.call_count == 1
+        # Reuse without new upload
+        con.load_collection("S2").mask_polygon(POLYGON)
+        assert files.call_count == 1
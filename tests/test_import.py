@@ -0,0 +1,54 @@
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+HEAVY_MODULES = ["numpy", "pandas", "xarray", "shapely", "openeo.processes", "openeo.rest.datacube"]
+
+
+def _loaded_modules_after(code: str) -> set:
+    """Run given import code in a fresh interpreter and list which of the heavy modules got loaded."""
+    script = textwrap.dedent(
+        f"""
+        import sys
+        {code}
+        print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))
+        """
+    )
+    output = subprocess.check_output([sys.executable, "-c", script], universal_newlines=True)
+    return set(m for m in output.strip().split(",") if m)
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import openeo",
+        "import openeo; openeo.__version__",
+        "import openeo.rest.connection",
+        "from openeo import connect",
+        "from openeo.udf import inspect",
+    ],
+)
+def test_import_does_not_load_heavy_modules(code):
+    assert _loaded_modules_after(code) == set()
+
+
+def test_lazy_attributes():
+    import openeo
+
+    assert openeo.DataCube.__module__ == "openeo.rest.datacube"
+    assert openeo.connect.__module__ == "openeo.rest.connection"
+    assert openeo.processes.__name__ == "openeo.processes"
+    assert "DataCube" in dir(openeo)
+    with pytest.raises(AttributeError, match="has no attribute 'foobar'"):
+        _ = openeo.foobar
+
+
+def test_lazy_udf_attributes():
+    import openeo.udf
+
+    assert openeo.udf.XarrayDataCube.__module__ == "openeo.udf.xarraydatacube"
+    assert "UdfData" in dir(openeo.udf)
+    with pytest.raises(AttributeError):
+        _ = openeo.udf.foobar
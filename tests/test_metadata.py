@@ -538,6 +538,63 @@ def test_metadata_drop_dimension():
         metadata.drop_dimension("x")
 
 
+def test_metadata_filter_temporal():
+    metadata = CollectionMetadata({
+        "cube:dimensions": {
+            "t": {"type": "temporal", "extent": ["2020-01-01T00:00:00Z", None]},
+            "bands": {"type": "bands", "values": ["B2", "B3"]},
+        }
+    })
+    new = metadata.filter_temporal("2021-06-01", "2021-09-01")
+    assert metadata.temporal_dimension.extent == ["2020-01-01T00:00:00Z", None]
+    assert new.temporal_dimension == TemporalDimension(name="t", extent=["2021-06-01", "2021-09-01"])
+    assert new.band_dimension.band_names == ["B2", "B3"]
+
+    new = metadata.filter_temporal("2010-01-01", "2021-09-01")
+    assert new.temporal_dimension.extent == ["2020-01-01T00:00:00Z", "2021-09-01"]
+
+    # Not intersecting or unsupported: no change
+    assert metadata.filter_temporal("2010-01-01", "2011-01-01") is metadata
+    assert metadata.filter_temporal("yesterday", None) is metadata
+
+
+def test_metadata_filter_temporal_no_temporal_dimension():
+    metadata = CollectionMetadata({"cube:dimensions": {"x": {"type": "spatial"}}})
+    assert metadata.filter_temporal("2021-06-01", "2021-09-01") is metadata
+
+
+def test_metadata_filter_bbox():
+    metadata = CollectionMetadata({
+        "cube:dimensions": {
+            "x": {"type": "spatial", "extent": [-180, 180]},
+            "y": {"type": "spatial", "extent": [-56, 83]},
+            "t": {"type": "temporal"},
+        }
+    })
+    new = metadata.filter_bbox({"west": 3, "south": 51, "east": 4, "north": 52})
+    assert [(d.name, d.extent) for d in metadata.spatial_dimensions] == [("x", [-180, 180]), ("y", [-56, 83])]
+    assert [(d.name, d.extent) for d in new.spatial_dimensions] == [("x", [3, 4]), ("y", [51, 52])]
+    assert new.dimension_names() == ["x", "y", "t"]
+
+    new = metadata.filter_bbox({"west": 3, "south": 80, "east": 4, "north": 90, "crs": "EPSG:4326"})
+    assert [(d.name, d.extent) for d in new.spatial_dimensions] == [("x", [3, 4]), ("y", [80, 83])]
+
+    # Different CRS: no change
+    new = metadata.filter_bbox({"west": 600000, "south": 5600000, "east": 610000, "north": 5610000, "crs": 32631})
+    assert [(d.name, d.extent) for d in new.spatial_dimensions] == [("x", [-180, 180]), ("y", [-56, 83])]
+
+
+def test_metadata_filter_bbox_unknown_extent():
+    metadata = CollectionMetadata({
+        "cube:dimensions": {
+            "x": {"type": "spatial", "reference_system": 32631},
+            "y": {"type": "spatial", "reference_system": 32631},
+        }
+    })
+    new = metadata.filter_bbox({"west": 600000, "south": 5600000, "east": 610000, "north": 5610000, "crs": 32631})
+    assert [(d.name, d.extent) for d in new.spatial_dimensions] == [("x", [600000, 610000]), ("y", [5600000, 5610000])]
+
+
 def test_metadata_subclass():
     class MyCollectionMetadata(CollectionMetadata):
         def __init__(self, metadata: dict, dimensions: List[Dimension] = None, bbox=None):
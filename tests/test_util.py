@@ -3,6 +3,8 @@ import logging
 import os
 import pathlib
 import re
+import threading
+import time
 import unittest.mock as mock
 from datetime import datetime, date
 from typing import List, Union
@@ -11,7 +13,8 @@ import pytest
 
 from openeo.util import first_not_none, get_temporal_extent, TimingLogger, ensure_list, ensure_dir, dict_no_none, \
     deep_get, DeepKeyError, Rfc3339, rfc3339, deep_set, \
-    LazyLoadCache, guess_format, ContextTimer, str_truncate, to_bbox_dict, BBoxDict, repr_truncate
+    LazyLoadCache, guess_format, ContextTimer, str_truncate, to_bbox_dict, BBoxDict, repr_truncate, \
+    intersect_bboxes, intersect_temporal_extents
 
 
 def test_rfc3339_date():
@@ -508,6 +511,90 @@ class TestLazyLoadCache:
         assert cache.get("foo", load) == 5
         assert cache.get("foo", load) == 5
 
+    def test_contains(self):
+        cache = LazyLoadCache()
+        assert "foo" not in cache
+        cache.get("foo", load=lambda: 4)
+        assert "foo" in cache
+        assert ("foo", "bar") not in cache
+
+    def test_stats(self):
+        cache = LazyLoadCache()
+        assert cache.stats == {"hits": 0, "misses": 0, "evictions": 0, "size": 0}
+        cache.get("foo", load=lambda: 4)
+        cache.get("foo", load=lambda: 4)
+        cache.get("bar", load=lambda: 5)
+        cache.get("foo", load=lambda: 4)
+        assert cache.stats == {"hits": 2, "misses": 2, "evictions": 0, "size": 2}
+
+    def test_load_failure_not_cached(self):
+        cache = LazyLoadCache()
+
+        def fail():
+            raise RuntimeError("nope")
+
+        with pytest.raises(RuntimeError):
+            cache.get("foo", load=fail)
+        assert "foo" not in cache
+        assert cache.get("foo", load=lambda: 4) == 4
+
+    def test_ttl(self):
+        load = iter([2, 3, 5, 8, 13]).__next__
+        with mock.patch.object(LazyLoadCache, "_clock", new=iter([10, 12, 14, 19, 20, 22]).__next__):
+            cache = LazyLoadCache(ttl=5)
+            # Store at time 10 (expiry 15)
+            assert cache.get("foo", load) == 2
+            # Lookup at 12
+            assert cache.get("foo", load) == 2
+            # Lookup at 14
+            assert cache.get("foo", load) == 2
+            # Lookup at 19 (miss), double check (miss) at 20, store at 22.
+            assert cache.get("foo", load) == 3
+
+    def test_max_size(self):
+        cache = LazyLoadCache(max_size=2)
+        cache.get("a", load=lambda: 1)
+        cache.get("b", load=lambda: 2)
+        # Use "a", so that "b" is least recently used.
+        cache.get("a", load=lambda: 111)
+        cache.get("c", load=lambda: 3)
+        assert len(cache) == 2
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats["evictions"] == 1
+
+    def test_invalidate_and_clear(self):
+        cache = LazyLoadCache()
+        cache.get("a", load=lambda: 1)
+        cache.get("b", load=lambda: 2)
+        cache.invalidate("a")
+        cache.invalidate("nope")
+        assert "a" not in cache
+        assert "b" in cache
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_single_flight(self):
+        cache = LazyLoadCache()
+        calls = []
+
+        def load():
+            calls.append(threading.get_ident())
+            time.sleep(0.1)
+            return 42
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get("foo", load))) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == [42] * 8
+        assert len(calls) == 1
+        assert cache.stats["misses"] == 1
+        assert cache.stats["hits"] == 7
+
 
 def test_str_truncate():
     assert str_truncate("hello world") == "hello world"
@@ -599,3 +686,62 @@ class TestBBoxDict:
     def test_to_bbox_dict_from_geometry(self):
         geometry = shapely.geometry.Polygon([(4, 2), (7, 4), (5, 8), (3, 3), (4, 2)])
         assert to_bbox_dict(geometry) == {"west": 3, "south": 2, "east": 7, "north": 8}
+
+
+class TestIntersectBBoxes:
+
+    def test_basic(self):
+        a = {"west": 1, "south": 2, "east": 5, "north": 6}
+        b = {"west": 3, "south": 1, "east": 8, "north": 4}
+        assert intersect_bboxes(a, b) == {"west": 3, "south": 2, "east": 5, "north": 4}
+        assert intersect_bboxes(a, a) == a
+
+    def test_crs(self):
+        a = {"west": 1, "south": 2, "east": 5, "north": 6, "crs": "EPSG:4326"}
+        b = {"west": 3, "south": 1, "east": 8, "north": 4, "crs": 4326}
+        assert intersect_bboxes(a, b) == {"west": 3, "south": 2, "east": 5, "north": 4, "crs": "EPSG:4326"}
+        assert intersect_bboxes(b, a) == {"west": 3, "south": 2, "east": 5, "north": 4, "crs": 4326}
+        del a["crs"]
+        assert intersect_bboxes(a, b) == {"west": 3, "south": 2, "east": 5, "north": 4}
+
+    def test_disjoint(self):
+        a = {"west": 1, "south": 2, "east": 5, "north": 6}
+        assert intersect_bboxes(a, {"west": 6, "south": 2, "east": 8, "north": 6}) is None
+        assert intersect_bboxes(a, {"west": 5, "south": 2, "east": 8, "north": 6}) is None
+
+    @pytest.mark.parametrize("other", [
+        {"west": 1, "south": 2, "east": 5, "north": 6, "crs": 32631},
+        {"west": 1, "south": 2, "east": 5, "north": 6, "base": 0},
+        {"west": 1, "south": 2, "east": 5, "north": {"from_parameter": "north"}},
+        {"type": "Polygon", "coordinates": []},
+        [1, 2, 5, 6],
+    ])
+    def test_invalid(self, other):
+        with pytest.raises(ValueError):
+            intersect_bboxes({"west": 1, "south": 2, "east": 5, "north": 6}, other)
+
+
+class TestIntersectTemporalExtents:
+
+    @pytest.mark.parametrize(["a", "b", "expected"], [
+        (["2021-01-01", "2022-01-01"], ["2021-06-01", "2023-01-01"], ["2021-06-01", "2022-01-01"]),
+        (["2021-01-01", None], [None, "2021-06-01"], ["2021-01-01", "2021-06-01"]),
+        ([None, None], ["2021-01-01", None], ["2021-01-01", None]),
+        (["2021-01-01T12:00:00Z", "2022-01-01"], ["2021-01-01", "2021-06-01"], ["2021-01-01T12:00:00Z", "2021-06-01"]),
+        (("2021-01-01", "2022-01-01"), ("2021-06-01", "2023-01-01"), ["2021-06-01", "2022-01-01"]),
+    ])
+    def test_basic(self, a, b, expected):
+        assert intersect_temporal_extents(a, b) == expected
+
+    def test_disjoint(self):
+        assert intersect_temporal_extents(["2021-01-01", "2022-01-01"], ["2022-01-01", "2023-01-01"]) is None
+
+    @pytest.mark.parametrize("other", [
+        ["2021-01-01"],
+        ["2021-01-01", "tomorrow"],
+        [{"from_parameter": "start"}, None],
+        {"from_parameter": "extent"},
+    ])
+    def test_invalid(self, other):
+        with pytest.raises(ValueError):
+            intersect_temporal_extents(["2021-01-01", "2022-01-01"], other)